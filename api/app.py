@@ -1,8 +1,11 @@
+import time
+_inicio_importacao = time.perf_counter()
+
+import click
 from flask import Flask, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_mail import Mail
-from flask_migrate import Migrate
 from dotenv import load_dotenv
 import os
 from extensions import db, login_manager, mail
@@ -10,17 +13,32 @@ from sqlalchemy import inspect
 from flask import jsonify, request
 from flask_cors import CORS
 import logging
+from utils.inicializacao import RelatorioInicializacao
+from utils.json_provider import JSONProvider
 
 
 
 # Carrega as variáveis de ambiente do arquivo .env
 load_dotenv()
 
+_IMPORTACAO_MS = round((time.perf_counter() - _inicio_importacao) * 1000, 1)
+
+
 def create_app():
+    """
+    Cria a aplicação no caminho rápido dos workers. A criação das tabelas e do admin
+    fica em `flask init-db` (ou INIT_DB_ON_STARTUP=true) e os dados iniciais em
+    `flask seed`. Os tempos de cada fase vão para app.extensions['inicializacao'].
+    """
+    relatorio = RelatorioInicializacao(_IMPORTACAO_MS)
+    # Comandos do CLI (flask ...) também chamam create_app, mas não servem requisições
+    em_cli = click.get_current_context(silent=True) is not None
+
     # Mude a configuração do static_url_path para vazio
     app = Flask(__name__, static_folder="static/", static_url_path="")
     
     app.url_map.strict_slashes = False  # Permite rotas com e sem barra no final
+    app.json = JSONProvider(app)  # jsonify/get_json com orjson e datas em ISO 8601 (utils/json_provider.py)
     
     CORS(app)  # Permite CORS para todas as rotas que começam com /backend
     # Configurações do aplicativo
@@ -38,18 +56,46 @@ def create_app():
     app.config['UPLOAD_FOLDER'] = 'uploads'  # Diretório para salvar as imagens
     app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'webp'}  # Extensões permitidas
     app.config['PERFIL_DE_SAUDE'] = os.getenv('PERFIL_DE_SAUDE')
+    app.config['ADMIN_METRICS_INTERVALO'] = int(os.getenv('ADMIN_METRICS_INTERVALO', 60))  # Segundos; 0 desliga a atualização em segundo plano
+    app.config['CID_SEARCH_ORCAMENTO_MS'] = int(os.getenv('CID_SEARCH_ORCAMENTO_MS', 50))  # Tempo máximo da busca aproximada de CIDs
+    app.config['INIT_DB_ON_STARTUP'] = os.getenv('INIT_DB_ON_STARTUP') == 'true'  # create_all + admin a cada boot (antigo comportamento)
+    # Índice de CIDs: 'background' (thread após o boot), 'startup' (no boot) ou 'lazy' (na primeira busca)
+    app.config['CID_INDEX_WARMUP'] = os.getenv('CID_INDEX_WARMUP', 'lazy' if os.getenv('FLASK_ENV') == 'testing' else 'background')
+    # Contagem de SQL por requisição, cabeçalho Server-Timing e alerta de N+1 (utils/instrumentacao_sql.py)
+    app.config['SQL_INSTRUMENTACAO'] = os.getenv('SQL_INSTRUMENTACAO', 'true') == 'true'
+    app.config['SQL_N_MAIS_1_LIMITE'] = int(os.getenv('SQL_N_MAIS_1_LIMITE', 5))  # Repetições do mesmo formato de SQL
+    app.config['SQL_RESUMO_INTERVALO'] = int(os.getenv('SQL_RESUMO_INTERVALO', 300))  # Segundos; 0 desliga o resumo no log
+    app.config['PERFIL_CACHE_TTL'] = int(os.getenv('PERFIL_CACHE_TTL', 30))  # Segundos; cache de perfis do usuário (utils/perfis.py)
+    # Hash de senhas num pool de processos (utils/senhas.py): parâmetros no formato do werkzeug e processos por worker
+    app.config['SENHA_HASH_METODO'] = os.getenv('SENHA_HASH_METODO', 'scrypt:32768:8:1')
+    app.config['SENHA_WORKERS'] = int(os.getenv('SENHA_WORKERS', min(4, os.cpu_count() or 1)))
+    app.config['SENHA_TIMEOUT'] = float(os.getenv('SENHA_TIMEOUT', 5))  # Espera máxima pelo pool de senhas; depois o login responde 503
+    # Métricas do Prometheus (utils/metricas.py); a rota /backend/metrics só existe com METRICAS_TOKEN
+    # definido e exige esse token. METRICAS_DIR soma os workers do gunicorn
+    app.config['METRICAS'] = os.getenv('METRICAS', 'true') == 'true'
+    app.config['METRICAS_DIR'] = os.getenv('METRICAS_DIR')
+    app.config['METRICAS_TOKEN'] = os.getenv('METRICAS_TOKEN')
 
     # Cria o diretório de upload se não existir
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-    db.init_app(app)
-    login_manager.init_app(app)
-    mail.init_app(app)  # Inicializa o Flask-Mail com o app
+    with relatorio.fase('extensoes'):
+        db.init_app(app)
+        login_manager.init_app(app)
+        mail.init_app(app)  # Inicializa o Flask-Mail com o app
 
-    
-    
-    #inicializa o flask migrate
-    migrate = Migrate(app, db)
+        # O Flask-Migrate (e o alembic que ele importa) só serve aos comandos `flask db`:
+        # os workers não pagam a importação
+        if em_cli:
+            from flask_migrate import Migrate
+            migrate = Migrate(app, db)
+
+        if app.config['SQL_INSTRUMENTACAO']:
+            from utils import instrumentacao_sql
+            instrumentacao_sql.registrar(app)
+        if app.config['METRICAS']:
+            from utils import metricas
+            metricas.registrar(app)
     # Configuração de logging
     logging.basicConfig(level=logging.DEBUG,
                         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -59,50 +105,70 @@ def create_app():
     
     
 
-    with app.app_context():
-        from extensions import init_db
-        init_db()  # Inicializa o banco e cria usuário admin
+    if app.config['INIT_DB_ON_STARTUP']:
+        with relatorio.fase('banco'), app.app_context():
+            from extensions import init_db
+            init_db()  # Inicializa o banco e cria usuário admin
 
     # Registrar blueprints
-    from routes.user import user_bp
-    from routes.profissional_saude import profissional_saude_bp
-    from routes.paciente import paciente_bp
-    from routes.colaborador import colaborador_bp
-    from routes.questionario import questionario_bp
-    from routes.sessoes import sessoes_bp
-    from routes.perguntas import perguntas_bp
-    from routes.alternativas import alternativas_bp
-    from routes.bateria_testes import bateria_testes_bp
-    from routes._populate import populate_bp
-    from routes.medico import medico_bp
-    from routes.avaliacao import avaliacao_bp
-    from routes.unidade_saude import unidade_saude_bp
-    from routes.laudo import laudo_bp
-    from routes.exames import exame_bp
-    
-    app.register_blueprint(user_bp, url_prefix='/backend/user', name='user_bp')
-    app.register_blueprint(profissional_saude_bp, url_prefix='/backend/profissionais_saude', name='profissional_saude_bp')
-    app.register_blueprint(paciente_bp, url_prefix='/backend/pacientes', name='paciente_bp')
-    app.register_blueprint(colaborador_bp, url_prefix='/backend/colaboradores', name='colaborador_bp')
-    app.register_blueprint(questionario_bp, url_prefix='/backend/questionario', name='questionario_bp')
-    app.register_blueprint(sessoes_bp, url_prefix='/backend/sessoes', name='sessoes_bp')
-    app.register_blueprint(perguntas_bp, url_prefix='/backend/perguntas', name='perguntas_bp')
-    app.register_blueprint(alternativas_bp, url_prefix='/backend/alternativas', name='alternativas_bp')
-    app.register_blueprint(bateria_testes_bp, url_prefix='/backend/baterias_testes', name='bateria_testes_bp')
-    app.register_blueprint(populate_bp, url_prefix='/backend/populate', name='populate_bp')
-    app.register_blueprint(medico_bp, url_prefix='/backend/medicos', name='medico_bp')
-    app.register_blueprint(avaliacao_bp, url_prefix='/backend/avaliacoes', name='avaliacao_bp')
-    app.register_blueprint(unidade_saude_bp, url_prefix='/backend/unidades_saude', name='unidade_saude_bp')
-    app.register_blueprint(laudo_bp, url_prefix='/backend/laudos', name='laudo_bp')
-    app.register_blueprint(exame_bp, url_prefix='/backend/exames', name='exame_bp')
+    with relatorio.fase('rotas'):
+        from routes.user import user_bp
+        from routes.profissional_saude import profissional_saude_bp
+        from routes.paciente import paciente_bp
+        from routes.colaborador import colaborador_bp
+        from routes.questionario import questionario_bp
+        from routes.sessoes import sessoes_bp
+        from routes.perguntas import perguntas_bp
+        from routes.alternativas import alternativas_bp
+        from routes.bateria_testes import bateria_testes_bp
+        from routes._populate import populate_bp
+        from routes.medico import medico_bp
+        from routes.avaliacao import avaliacao_bp
+        from routes.unidade_saude import unidade_saude_bp
+        from routes.laudo import laudo_bp
+        from routes.exames import exame_bp
+
+        app.register_blueprint(user_bp, url_prefix='/backend/user', name='user_bp')
+        app.register_blueprint(profissional_saude_bp, url_prefix='/backend/profissionais_saude', name='profissional_saude_bp')
+        app.register_blueprint(paciente_bp, url_prefix='/backend/pacientes', name='paciente_bp')
+        app.register_blueprint(colaborador_bp, url_prefix='/backend/colaboradores', name='colaborador_bp')
+        app.register_blueprint(questionario_bp, url_prefix='/backend/questionario', name='questionario_bp')
+        app.register_blueprint(sessoes_bp, url_prefix='/backend/sessoes', name='sessoes_bp')
+        app.register_blueprint(perguntas_bp, url_prefix='/backend/perguntas', name='perguntas_bp')
+        app.register_blueprint(alternativas_bp, url_prefix='/backend/alternativas', name='alternativas_bp')
+        app.register_blueprint(bateria_testes_bp, url_prefix='/backend/baterias_testes', name='bateria_testes_bp')
+        app.register_blueprint(populate_bp, url_prefix='/backend/populate', name='populate_bp')
+        app.register_blueprint(medico_bp, url_prefix='/backend/medicos', name='medico_bp')
+        app.register_blueprint(avaliacao_bp, url_prefix='/backend/avaliacoes', name='avaliacao_bp')
+        app.register_blueprint(unidade_saude_bp, url_prefix='/backend/unidades_saude', name='unidade_saude_bp')
+        app.register_blueprint(laudo_bp, url_prefix='/backend/laudos', name='laudo_bp')
+        app.register_blueprint(exame_bp, url_prefix='/backend/exames', name='exame_bp')
     
  
+    # Comandos de CLI (flask backfill-scores, ...)
+    with relatorio.fase('comandos'):
+        from commands import register_commands
+        register_commands(app)
+
+    from utils import cid_index
+    if app.config['CID_INDEX_WARMUP'] == 'startup':
+        with relatorio.fase('indice_cids'), app.app_context():
+            try:
+                cid_index.carregar()  # Índice da busca de CIDs (get_cid_by_description)
+            except Exception as e:
+                logger.warning(f"Índice de CIDs não carregado na inicialização: {e}")
+    elif app.config['CID_INDEX_WARMUP'] == 'background' and not em_cli:
+        cid_index.aquecer_em_segundo_plano(app)
+
     @app.route('/backend/hello', methods=['GET'])
     def hello():
         """
         Rota simples para teste.
         """
         return jsonify({'message': 'Hello, world!'}), 200
+
+    app.extensions['inicializacao'] = relatorio.concluir()
+    logger.info(relatorio.resumo())
         
     return app
 
@@ -117,4 +183,7 @@ def list_routes(app):
 
 if __name__ == '__main__':
     app = create_app()
+    with app.app_context():
+        from extensions import init_db
+        init_db()  # No servidor de desenvolvimento o banco é preparado a cada execução
     app.run(debug=True)
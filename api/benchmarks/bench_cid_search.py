@@ -0,0 +1,70 @@
+"""
+Benchmark da busca de CIDs em memória (get_cid_by_description e cid_search).
+
+Monta o índice a partir de fixtures/cids.json (o catálogo carregado na tabela
+cids por `flask load-cids`) e mede o tempo de construção e a latência das buscas exatas, das
+aproximadas (com erros de digitação) e das respostas vindas do cache.
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_cid_search.py [caminho_do_cids.json]
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cid_catalogo import CAMINHO_PADRAO  # noqa: E402
+from utils.cid_index import IndiceCID  # noqa: E402
+
+EXATAS = ['colera', 'diabetes mellitus', 'transtorno depressivo', 'F32', 'f32.1', 'neoplasia maligna',
+          'fratura do femur', 'insuficiencia cardiaca', 'hipertensao', 'ansiedade']
+APROXIMADAS = ['esquisofrenia', 'esquisofr', 'diabets melitus', 'depresivo recorente', 'tuberculose pulmunar',
+               'artrite reumatoid', 'insuficiencia cardiaka', 'pneunonia', 'hipertenssao', 'ansiedad generalisada']
+
+
+def medir(indice, consultas, fuzzy, repeticoes=20):
+    tempos = []
+    for _ in range(repeticoes):
+        for consulta in consultas:
+            indice._cache.clear()
+            inicio = time.perf_counter()
+            indice.pesquisar(consulta, limite=50, fuzzy=fuzzy)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return statistics.median(tempos), tempos[int(len(tempos) * 0.99) - 1], tempos[-1]
+
+
+def main():
+    caminho = sys.argv[1] if len(sys.argv) > 1 else CAMINHO_PADRAO
+    with open(caminho, encoding='utf-8') as arquivo:
+        cids = json.load(arquivo)
+    linhas = [(cid['cid'], cid['descricao'], cid['unidecode_descricao']) for cid in cids]
+
+    inicio = time.perf_counter()
+    indice = IndiceCID(linhas)
+    construcao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    indice._estruturas_aproximadas()
+    construcao_aproximada = time.perf_counter() - inicio
+    print(f"{len(indice)} CIDs; índice exato em {construcao * 1000:.0f} ms, "
+          f"SymSpell ({len(indice._corretor)} palavras) em {construcao_aproximada * 1000:.0f} ms")
+
+    for nome, consultas, fuzzy in (('exata', EXATAS, False), ('aproximada', APROXIMADAS, True)):
+        mediana, p99, maximo = medir(indice, consultas, fuzzy)
+        print(f"busca {nome:<10}: mediana {mediana:.2f} ms, p99 {p99:.2f} ms, máx {maximo:.2f} ms")
+
+    for consulta in APROXIMADAS:
+        indice.pesquisar(consulta, limite=50, fuzzy=True)
+    inicio = time.perf_counter()
+    for _ in range(1000):
+        for consulta in APROXIMADAS:
+            indice.pesquisar(consulta, limite=50, fuzzy=True)
+    por_busca = (time.perf_counter() - inicio) / (1000 * len(APROXIMADAS)) * 1e6
+    print(f"busca em cache  : {por_busca:.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark de GET /backend/questionario/<id>/distribuicao (GROUP BY sobre respostas_itens).
+
+Cria um banco SQLite temporário com um questionário e N baterias completas já
+normalizadas, e mede o tempo das consultas de agregação e da montagem da resposta.
+As demais variáveis (SECRET_KEY, MAIL_PORT, ...) vêm do .env, como na aplicação.
+Para medir contra o MySQL, defina DATABASE_URL antes de executar (o banco será populado!).
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_distribuicao.py [quantidade_de_baterias]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+import ulid  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Alternativa, BateriaTestes, Paciente, Pergunta, Questionario, RespostaItem, Sessao  # noqa: E402
+from utils import questionario_cache, respostas_itens  # noqa: E402
+
+
+def popular(quantidade, perguntas=20, alternativas=5, pacientes=2000, seed=42):
+    rnd = random.Random(seed)
+    questionario = Questionario(titulo='Benchmark', descricao='Benchmark', versao='1.0')
+    db.session.add(questionario)
+    db.session.flush()
+    sessao = Sessao(questionario_id=questionario.id, titulo='Sessão', ordem=1)
+    db.session.add(sessao)
+    db.session.flush()
+
+    opcoes = {}
+    for p in range(perguntas):
+        pergunta = Pergunta(sessao_id=sessao.id, texto=f'Pergunta {p}', tipo_resposta='escala_likert_5', ordem=p)
+        db.session.add(pergunta)
+        db.session.flush()
+        opcoes[pergunta.id] = []
+        for a in range(alternativas):
+            alternativa = Alternativa(pergunta_id=pergunta.id, texto=f'Alternativa {a}', valor=a, ordem=a)
+            db.session.add(alternativa)
+            db.session.flush()
+            opcoes[pergunta.id].append((alternativa.id, float(a)))
+
+    paciente_ids = [str(ulid.ULID()) for _ in range(pacientes)]
+    db.session.execute(insert(Paciente), [
+        {'id': pid, 'nome': f'Paciente {i}', 'cpf': f'{i:011d}', 'data_nascimento': date(1990, 1, 1)}
+        for i, pid in enumerate(paciente_ids)
+    ])
+
+    for inicio in range(0, quantidade, 5000):
+        baterias, itens = [], []
+        for _ in range(inicio, min(inicio + 5000, quantidade)):
+            bateria_id = str(ulid.ULID())
+            respostas = {pid: rnd.choice(alts) for pid, alts in opcoes.items()}
+            data_aplicacao = date(2024, 1, 1) + timedelta(days=rnd.randrange(365))
+            baterias.append({
+                'id': bateria_id,
+                'paciente_id': rnd.choice(paciente_ids),
+                'questionario_id': questionario.id,
+                'data_aplicacao': data_aplicacao,
+                'respostas': {pid: alt_id for pid, (alt_id, _) in respostas.items()},
+                'is_completo': True
+            })
+            itens.extend(
+                {'bateria_id': bateria_id, 'pergunta_id': pid, 'alternativa_id': alt_id,
+                 'questionario_id': questionario.id, 'valor': valor,
+                 'is_completo': True, 'data_aplicacao': data_aplicacao}
+                for pid, (alt_id, valor) in respostas.items()
+            )
+        db.session.execute(insert(BateriaTestes), baterias)
+        db.session.execute(insert(RespostaItem), itens)
+    db.session.commit()
+    return questionario.id
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = create_app()
+    with app.app_context():
+        inicio = time.perf_counter()
+        questionario_id = popular(quantidade)
+        print(f"População: {quantidade} baterias em {time.perf_counter() - inicio:.1f} s")
+
+        snapshot = questionario_cache.obter_snapshot(questionario_id)
+        for descricao, filtros in (
+            ('sem filtros', {}),
+            ('1º semestre', {'data_inicio': date(2024, 1, 1), 'data_fim': date(2024, 6, 30)}),
+        ):
+            inicio = time.perf_counter()
+            totais, linhas = respostas_itens.contagens_por_alternativa(questionario_id, **filtros)
+            respostas_itens.montar_agregado(snapshot, totais, linhas)
+            print(f"Distribuição ({descricao}): {totais['baterias']} baterias em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
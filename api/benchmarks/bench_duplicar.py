@@ -0,0 +1,150 @@
+"""
+Benchmark de POST /backend/questionario/duplicate/<id> (utils/questionario_copia.py).
+
+Carrega num banco SQLite temporário o maior questionário de fixtures/questionario.json
+(em quantidade de perguntas), com regras de visibilidade sintéticas, e compara a
+cópia em lote com a cópia original (um flush por sessão e por pergunta), medindo o
+tempo e a quantidade de comandos SQL de cada uma.
+As demais variáveis (SECRET_KEY, MAIL_PORT, ...) vêm do .env, como na aplicação.
+Para medir contra o MySQL, defina DATABASE_URL antes de executar (o banco será populado!).
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_duplicar.py [repeticoes]
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Alternativa, Pergunta, Questionario, Sessao  # noqa: E402
+from utils import questionario_cache, questionario_copia  # noqa: E402
+
+CAMINHO_FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'questionario.json')
+
+
+def maior_questionario():
+    with open(CAMINHO_FIXTURE, encoding='utf-8') as arquivo:
+        questionarios = json.load(arquivo)['questionarios']
+    return max(questionarios, key=lambda q: sum(len(s['perguntas']) for s in q['sessoes']))
+
+
+def popular(dados):
+    """
+    Grava o questionário da fixture; cada sessão a partir da segunda ganha regras
+    apontando para a primeira pergunta da sessão anterior.
+    """
+    questionario = Questionario(
+        titulo=dados['titulo'], descricao=dados['descricao'], versao=dados['versao'],
+        fontes_literatura=dados['fontes_literatura'], is_active=dados['is_active']
+    )
+    for dados_sessao in dados['sessoes']:
+        sessao = Sessao(titulo=dados_sessao['titulo'], descricao=dados_sessao.get('descricao'), ordem=dados_sessao['ordem'])
+        for dados_pergunta in dados_sessao['perguntas']:
+            pergunta = Pergunta(
+                texto=dados_pergunta['texto'], tipo_resposta=dados_pergunta['tipo_resposta'],
+                metodo_pontuacao=dados_pergunta.get('metodo_pontuacao'), ordem=dados_pergunta['ordem'],
+                is_obrigatoria=dados_pergunta.get('is_obrigatoria', True)
+            )
+            pergunta.alternativas = [
+                Alternativa(texto=a['texto'], valor=a['valor'], ordem=a['ordem']) for a in dados_pergunta['alternativas']
+            ]
+            sessao.perguntas.append(pergunta)
+        questionario.sessoes.append(sessao)
+    db.session.add(questionario)
+    db.session.flush()
+
+    anterior = None
+    for sessao in questionario.sessoes:
+        if anterior is not None and anterior.perguntas:
+            alvo = anterior.perguntas[0]
+            sessao.regras_visibilidade = [
+                {'tipo_regra': 'RESPOSTA_ESPECIFICA', 'pergunta_alvo_id': alvo.id,
+                 'respostas_necessarias_ids': [a.id for a in alvo.alternativas[:1]], 'logica_respostas': 'OR'},
+                {'tipo_regra': 'FAIXA_DE_PONTUACAO', 'perguntas_para_calculo_ids': [p.id for p in anterior.perguntas],
+                 'pontuacao_minima_exigida': 0, 'pontuacao_maxima_exigida': 10}
+            ]
+        anterior = sessao
+    db.session.commit()
+    return questionario.id
+
+
+def copiar_por_linha(arvore, titulo):
+    """
+    Cópia como era feita antes: objetos do ORM e um flush por sessão e por pergunta.
+    """
+    novo = Questionario(titulo=titulo, descricao=arvore['descricao'], versao='bench',
+                        fontes_literatura=arvore['fontes_literatura'], is_active=arvore['is_active'])
+    db.session.add(novo)
+    db.session.flush()
+    for dados_sessao in arvore['sessoes']:
+        sessao = Sessao(questionario_id=novo.id, titulo=dados_sessao['titulo'], descricao=dados_sessao['descricao'],
+                        ordem=dados_sessao['ordem'], regras_visibilidade=dados_sessao['regras_visibilidade'])
+        db.session.add(sessao)
+        db.session.flush()
+        for dados_pergunta in dados_sessao['perguntas']:
+            pergunta = Pergunta(sessao_id=sessao.id, texto=dados_pergunta['texto'], tipo_resposta=dados_pergunta['tipo_resposta'],
+                                metodo_pontuacao=dados_pergunta['metodo_pontuacao'], ordem=dados_pergunta['ordem'])
+            db.session.add(pergunta)
+            db.session.flush()
+            for dados_alternativa in dados_pergunta['alternativas']:
+                db.session.add(Alternativa(pergunta_id=pergunta.id, texto=dados_alternativa['texto'],
+                                           valor=dados_alternativa['valor'], ordem=dados_alternativa['ordem']))
+    db.session.flush()
+
+
+def medir(questionario_id, funcao, repeticoes):
+    """
+    Mediana do tempo de `repeticoes` cópias (com o commit) e comandos SQL da última.
+    """
+    comandos = []
+
+    def contar(*args):
+        comandos.append(1)
+
+    event.listen(db.engine, 'before_cursor_execute', contar)
+    tempos = []
+    try:
+        for i in range(repeticoes):
+            arvore = questionario_cache.obter_snapshot(questionario_id).arvore
+            comandos.clear()
+            inicio = time.perf_counter()
+            funcao(arvore, f'Cópia {i}')
+            db.session.commit()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', contar)
+    return statistics.median(tempos), len(comandos)
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        dados = maior_questionario()
+        questionario_id = popular(dados)
+        arvore = questionario_cache.obter_snapshot(questionario_id).arvore
+        perguntas = sum(len(s['perguntas']) for s in arvore['sessoes'])
+        alternativas = sum(len(p['alternativas']) for s in arvore['sessoes'] for p in s['perguntas'])
+        print(f"'{dados['titulo'][:60]}': {len(arvore['sessoes'])} sessões, {perguntas} perguntas, {alternativas} alternativas")
+
+        for nome, funcao in (
+            ('flush por linha', copiar_por_linha),
+            ('em lote', lambda arvore, titulo: questionario_copia.copiar_arvore(arvore, titulo=titulo, versao='bench')),
+        ):
+            mediana, comandos = medir(questionario_id, funcao, repeticoes)
+            print(f"{nome:<16}: mediana {mediana:.1f} ms, {comandos} comandos SQL na última cópia")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark da inicialização de um worker (importação de app + create_app).
+
+Cada medida roda num processo Python novo, como um worker do gunicorn recém-criado,
+e lê o relatório de app.extensions['inicializacao'] (utils/inicializacao.py).
+Mostra a mediana do tempo de importação, de cada fase e do total, e a memória
+residente ao fim do boot.
+As variáveis (DATABASE_URL, SECRET_KEY, MAIL_PORT, ...) vêm do ambiente ou do .env,
+como na aplicação.
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_inicializacao.py [repeticoes]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PASTA_API = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEDIR = '''
+import json, logging, time
+inicio = time.perf_counter()
+import app
+aplicacao = app.create_app()
+relatorio = aplicacao.extensions['inicializacao'].to_json()
+relatorio['processo_ms'] = (time.perf_counter() - inicio) * 1000
+print('RELATORIO ' + json.dumps(relatorio))
+'''
+
+
+def medir():
+    saida = subprocess.run(
+        [sys.executable, '-c', MEDIR], cwd=PASTA_API, capture_output=True, text=True, check=True
+    ).stdout
+    linha = next(linha for linha in saida.splitlines() if linha.startswith('RELATORIO '))
+    return json.loads(linha[len('RELATORIO '):])
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    medidas = [medir() for _ in range(repeticoes)]
+
+    def mediana(chave):
+        valores = [m[chave] for m in medidas if m.get(chave) is not None]
+        return statistics.median(valores) if valores else float('nan')
+
+    print(f"{repeticoes} processos (medianas):")
+    print(f"  importação de app : {mediana('importacao_ms'):7.0f} ms")
+    for fase in medidas[0]['fases_ms']:
+        print(f"  {fase:<18}: {statistics.median(m['fases_ms'][fase] for m in medidas):7.0f} ms")
+    print(f"  create_app        : {mediana('total_ms'):7.0f} ms")
+    print(f"  total do processo : {mediana('processo_ms'):7.0f} ms")
+    rss = mediana('rss_bytes')
+    print(f"  RSS após o boot   : {rss / 2 ** 20:7.0f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark da serialização das respostas (utils/json_provider.py): orjson contra o
+módulo json da biblioteca padrão, nos cinco endpoints de payload maior:
+- GET /backend/avaliacoes/estatisticas/<id>
+- GET /backend/questionario/detailed
+- GET /backend/avaliacoes/paciente/<paciente_id>
+- GET /backend/avaliacoes/por_medico/<medico_id>
+- GET /backend/baterias_testes/avaliacao/<avaliacao_id>
+
+Cria um banco SQLite temporário com questionários completos e um paciente com várias
+avaliações respondidas, faz uma requisição a cada endpoint para capturar o objeto
+passado ao jsonify e mede só a serialização (app.json.response) com cada backend.
+As demais variáveis (SECRET_KEY, MAIL_PORT, ...) vêm do .env, como na aplicação.
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_json.py [avaliacoes] [repeticoes]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+import ulid  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import (  # noqa: E402
+    Alternativa, Avaliacao, BateriaTestes, Medico, Paciente, Pergunta, Questionario, Sessao, TipoPagamentoEnum, User
+)
+from utils import json_provider  # noqa: E402
+from utils.auth import emitir_token  # noqa: E402
+
+
+def popular(avaliacoes, questionarios=10, sessoes=4, perguntas=10, alternativas=5, seed=42):
+    db.create_all()
+    rnd = random.Random(seed)
+    linhas = {modelo: [] for modelo in (Questionario, Sessao, Pergunta, Alternativa)}
+    opcoes = {}
+    for q in range(questionarios):
+        questionario_id = str(ulid.ULID())
+        linhas[Questionario].append({'id': questionario_id, 'titulo': f'Questionário {q}', 'descricao': 'Benchmark' * 10, 'versao': '1.0'})
+        opcoes[questionario_id] = {}
+        for s in range(sessoes):
+            sessao_id = str(ulid.ULID())
+            linhas[Sessao].append({'id': sessao_id, 'questionario_id': questionario_id, 'titulo': f'Sessão {s}', 'ordem': s})
+            for p in range(perguntas):
+                pergunta_id = str(ulid.ULID())
+                linhas[Pergunta].append({'id': pergunta_id, 'sessao_id': sessao_id, 'texto': f'Pergunta {p} da sessão {s}',
+                                         'tipo_resposta': 'escala_likert_5', 'ordem': p})
+                opcoes[questionario_id][pergunta_id] = []
+                for a in range(alternativas):
+                    alternativa_id = str(ulid.ULID())
+                    linhas[Alternativa].append({'id': alternativa_id, 'pergunta_id': pergunta_id, 'texto': f'Alternativa {a}',
+                                                'valor': a, 'ordem': a})
+                    opcoes[questionario_id][pergunta_id].append(alternativa_id)
+    for modelo, valores in linhas.items():
+        db.session.execute(insert(modelo), valores)
+
+    medico = Medico(nome='Médico', crm='123456', especialidade='Clínica')
+    paciente = Paciente(nome='Paciente', cpf='12345678901', data_nascimento=date(1990, 1, 1))
+    db.session.add_all([medico, paciente])
+    db.session.flush()
+    primeira = None
+    for a in range(avaliacoes):
+        avaliacao = Avaliacao(paciente_id=paciente.id, medico_id=medico.id, data_inicio=date(2024, 1, 1) + timedelta(days=a),
+                              pago=True, valor_cobranca=150.0, tipo_pagamento=TipoPagamentoEnum.pix)
+        db.session.add(avaliacao)
+        db.session.flush()
+        primeira = primeira or avaliacao.id
+        db.session.execute(insert(BateriaTestes), [
+            {'id': str(ulid.ULID()), 'paciente_id': paciente.id, 'avaliacao_id': avaliacao.id, 'questionario_id': questionario_id,
+             'data_aplicacao': avaliacao.data_inicio, 'is_completo': True,
+             'respostas': {pergunta_id: rnd.choice(alts) for pergunta_id, alts in opcoes[questionario_id].items()}}
+            for questionario_id in opcoes
+        ])
+    admin = User(email='admin@example.com', role='admin', is_active=True)
+    db.session.add(admin)
+    db.session.commit()
+    return emitir_token(admin), primeira, paciente.id, medico.id
+
+
+def medir(funcao, repeticoes):
+    funcao()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main():
+    avaliacoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    app = create_app()
+    with app.app_context():
+        token, avaliacao_id, paciente_id, medico_id = popular(avaliacoes)
+
+    endpoints = [
+        f'/backend/avaliacoes/estatisticas/{avaliacao_id}',
+        '/backend/questionario/detailed/1/10',
+        f'/backend/avaliacoes/paciente/{paciente_id}',
+        f'/backend/avaliacoes/por_medico/{medico_id}',
+        f'/backend/baterias_testes/avaliacao/{avaliacao_id}',
+    ]
+
+    # Captura o objeto que cada rota passa ao jsonify
+    capturados = {}
+    response = app.json.response
+
+    def capturar(*args, **kwargs):
+        capturados['obj'] = app.json._prepare_response_obj(args, kwargs)
+        return response(*args, **kwargs)
+
+    client = app.test_client()
+    print(f"{avaliacoes} avaliações, {repeticoes} repetições (ms por serialização):")
+    with mock.patch.object(app.json, 'response', capturar):
+        payloads = []
+        for url in endpoints:
+            resposta = client.get(url, headers={'Authorization': f'Bearer {token}'})
+            assert resposta.status_code == 200, (url, resposta.status_code)
+            payloads.append((url, capturados['obj'], len(resposta.data)))
+
+    with app.app_context():
+        for url, obj, tamanho in payloads:
+            com_orjson = medir(lambda: app.json.response(obj), repeticoes)
+            with mock.patch.object(json_provider, 'orjson', None):
+                sem_orjson = medir(lambda: app.json.response(obj), repeticoes)
+            print(f"  {url.split('/backend')[1][:40]:40s} {tamanho / 1024:7.0f} KB  "
+                  f"json {sem_orjson:7.2f}  orjson {com_orjson:6.2f}  ({sem_orjson / com_orjson:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark do motor de pontuação vetorizado (utils/pontuacao.py) contra o laço
+por bateria usado originalmente em _build_detailed_bateria_json.
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_pontuacao.py [quantidade_de_baterias]
+"""
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pontuacao import TIPOS_RESPOSTA_GRAFICAVEIS, QuestionarioCompilado  # noqa: E402
+
+
+def gerar_arvore(qtd_sessoes=6, perguntas_por_sessao=10, alternativas_por_pergunta=5):
+    """
+    Gera a árvore sintética de um questionário: sessões Likert graficáveis e uma
+    sessão de texto livre (não graficável).
+    """
+    arvore = {'id': 'Q', 'sessoes': []}
+    for s in range(qtd_sessoes):
+        sessao = {'id': f'S{s}', 'perguntas': []}
+        for p in range(perguntas_por_sessao):
+            sessao['perguntas'].append({
+                'id': f'S{s}P{p}',
+                'texto': f'Pergunta {p}',
+                'tipo_resposta': 'escala_likert_5',
+                'alternativas': [
+                    {'id': f'S{s}P{p}A{a}', 'texto': f'Alternativa {a}', 'valor': float(a)}
+                    for a in range(alternativas_por_pergunta)
+                ]
+            })
+        arvore['sessoes'].append(sessao)
+    arvore['sessoes'].append({
+        'id': 'TEXTO',
+        'perguntas': [{'id': 'TEXTO_P0', 'texto': 'Observações', 'tipo_resposta': 'texto_livre', 'alternativas': []}]
+    })
+    return arvore
+
+
+def gerar_respostas(arvore, quantidade, seed=42):
+    """
+    Gera dicts `respostas` aleatórios, com ~10% das perguntas sem resposta.
+    """
+    rnd = random.Random(seed)
+    lista = []
+    for _ in range(quantidade):
+        respostas = {}
+        for sessao in arvore['sessoes']:
+            for pergunta in sessao['perguntas']:
+                if pergunta['alternativas'] and rnd.random() > 0.1:
+                    respostas[pergunta['id']] = rnd.choice(pergunta['alternativas'])['id']
+        lista.append(respostas)
+    return lista
+
+
+def pontuar_laco(arvore, respostas, tipos_graficaveis=TIPOS_RESPOSTA_GRAFICAVEIS):
+    """
+    Implementação de referência: o laço original (por bateria) de
+    _build_detailed_bateria_json, reduzido ao cálculo de estatisticas_sessao.
+    """
+    resultado = {}
+    for sessao in arvore['sessoes']:
+        perguntas = sessao['perguntas']
+        if not perguntas:
+            continue
+        primeiro_tipo = perguntas[0]['tipo_resposta']
+        if not (all(p['tipo_resposta'] == primeiro_tipo for p in perguntas)
+                and primeiro_tipo in tipos_graficaveis
+                and all(p['alternativas'] for p in perguntas)):
+            continue
+
+        soma_obtida = 0.0
+        soma_maxima = 0.0
+        pontuacoes = []
+        respondidas = 0
+        for pergunta in perguntas:
+            selecionada_id = respostas.get(str(pergunta['id']))
+            valor_escolhido = None
+            if selecionada_id:
+                escolhida = next(
+                    (alt for alt in pergunta['alternativas'] if str(alt['id']) == str(selecionada_id)), None
+                )
+                if escolhida:
+                    valor_escolhido = escolhida['valor']
+            valores = [alt['valor'] for alt in pergunta['alternativas'] if alt['valor'] is not None]
+            soma_maxima += float(max(valores)) if valores else 0.0
+            if valor_escolhido is not None:
+                soma_obtida += float(valor_escolhido)
+                pontuacoes.append(float(valor_escolhido))
+                respondidas += 1
+
+        moda = []
+        if pontuacoes:
+            contagem = Counter(pontuacoes)
+            maxima = max(contagem.values())
+            moda = [k for k, v in contagem.items() if v == maxima]
+
+        resultado[sessao['id']] = {
+            "total_pontuacao_obtida": soma_obtida,
+            "total_pontuacao_maxima_possivel": soma_maxima,
+            "media_pontuacao_obtida_por_pergunta_respondida": (soma_obtida / respondidas) if respondidas > 0 else 0.0,
+            "moda_pontuacao_obtida_nas_perguntas": moda,
+            "percentual_aproveitamento": (soma_obtida / soma_maxima * 100) if soma_maxima > 0 else 0.0
+        }
+    return resultado
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    retorno = funcao()
+    return retorno, time.perf_counter() - inicio
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    arvore = gerar_arvore()
+    lista_respostas = gerar_respostas(arvore, quantidade)
+
+    esperado, tempo_laco = cronometrar(lambda: [pontuar_laco(arvore, r) for r in lista_respostas])
+    compilado, tempo_compilacao = cronometrar(lambda: QuestionarioCompilado(arvore))
+    resultado, tempo_lote = cronometrar(lambda: compilado.pontuar_lote(lista_respostas))
+    obtido = [compilado.estatisticas(resultado, i) for i in range(quantidade)]
+
+    divergencias = sum(1 for a, b in zip(esperado, obtido) if a != b)
+
+    print(f"Baterias: {quantidade} | sessões pontuáveis: {len(compilado.sessao_ids)} | perguntas: {len(compilado.pergunta_ids)}")
+    print(f"Laço por bateria:       {tempo_laco * 1000:9.1f} ms")
+    print(f"Compilação (1x/versão): {tempo_compilacao * 1000:9.1f} ms")
+    print(f"Lote vetorizado:        {tempo_lote * 1000:9.1f} ms  ({tempo_laco / tempo_lote:.1f}x)")
+    print(f"Divergências: {divergencias}")
+    return 1 if divergencias else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
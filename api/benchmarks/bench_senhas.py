@@ -0,0 +1,51 @@
+"""
+Benchmark de vazão do hash de senhas (utils/senhas.py): um núcleo, no próprio
+processo, contra gerar_hashes no pool de processos com 1..N workers.
+
+O tempo de criação do pool fica de fora (um hash de aquecimento antes da medida).
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_senhas.py [senhas] [metodo]
+    ex.: python benchmarks/bench_senhas.py 64 scrypt:32768:8:1
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+from utils import senhas  # noqa: E402
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    metodo = sys.argv[2] if len(sys.argv) > 2 else senhas.METODO_PADRAO
+    senhas.METODO_PADRAO = metodo
+    lista = [f'senha-{i}' for i in range(quantidade)]
+    nucleos = os.cpu_count() or 1
+
+    inicio = time.perf_counter()
+    for senha in lista:
+        generate_password_hash(senha, metodo)
+    base = quantidade / (time.perf_counter() - inicio)
+    print(f"{quantidade} senhas, {metodo}, {nucleos} núcleos:")
+    print(f"  sequencial no processo : {base:7.1f} hashes/s")
+
+    workers = 1
+    while True:
+        senhas.WORKERS_PADRAO = workers
+        senhas.gerar_hashes(['aquecimento'] * workers)
+        inicio = time.perf_counter()
+        senhas.gerar_hashes(lista)
+        vazao = quantidade / (time.perf_counter() - inicio)
+        print(f"  pool com {workers:2d} processo(s) : {vazao:7.1f} hashes/s ({vazao / base:.1f}x)")
+        senhas.encerrar()
+        if workers >= nucleos:
+            break
+        workers = min(workers * 2, nucleos)
+
+
+if __name__ == '__main__':
+    main()
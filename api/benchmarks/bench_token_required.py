@@ -0,0 +1,70 @@
+"""
+Benchmark do custo do decorator token_required (utils/auth.py) com e sem o cache
+de tokens decodificados.
+
+A view decorada é chamada diretamente dentro de um contexto de requisição, para
+medir só o decorator. O custo por chamada é convertido no tempo de CPU gasto por
+segundo a 1.000 requisições/s.
+
+Uso (a partir da pasta api/):
+    python benchmarks/bench_token_required.py [chamadas]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bench_token.db')}")
+os.environ.setdefault('SECRET_KEY', 'bench')
+os.environ.setdefault('MAIL_PORT', '25')
+
+import jwt  # noqa: E402
+
+from app import create_app  # noqa: E402
+from utils import auth  # noqa: E402
+from utils.auth import token_required  # noqa: E402
+
+REQUISICOES_POR_SEGUNDO = 1000
+
+
+@token_required(roles=['admin', 'profissional_saude'])
+def view():
+    return None
+
+
+def medir(app, token, chamadas):
+    with app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+        view()  # aquece (e guarda no cache, se ligado)
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            view()
+        return (time.perf_counter() - inicio) / chamadas
+
+
+def main():
+    chamadas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = create_app()
+    token = jwt.encode(
+        {'user_id': '01HZX', 'role': 'admin', 'exp': datetime.now(timezone.utc) + timedelta(hours=12)},
+        app.config['SECRET_KEY'], algorithm='HS256'
+    )
+
+    # Sem cache: toda chamada passa por jwt.decode, como antes
+    sem_cache = mock.patch.object(auth._tokens, 'get', return_value=None)
+    with sem_cache:
+        por_chamada_sem = medir(app, token, chamadas)
+    auth.limpar_cache()
+    por_chamada_com = medir(app, token, chamadas)
+
+    print(f"{chamadas} chamadas:")
+    for nome, por_chamada in (('jwt.decode a cada vez', por_chamada_sem), ('cache de tokens', por_chamada_com)):
+        cpu = por_chamada * REQUISICOES_POR_SEGUNDO * 1000
+        print(f"  {nome:<22}: {por_chamada * 1e6:6.1f} µs/chamada, {cpu:5.1f} ms de CPU por segundo a {REQUISICOES_POR_SEGUNDO} req/s")
+    print(f"  ganho: {por_chamada_sem / por_chamada_com:.1f}x; cache: {auth.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""
+Comandos de linha de comando da aplicação (flask <comando>).
+"""
+import click
+from flask.cli import with_appcontext
+
+from extensions import db
+
+
+def _iterar_em_lotes(consulta, coluna_id, tamanho_lote):
+    """
+    Percorre uma consulta ORM em lotes ordenados pelo id (paginação por chave),
+    sem carregar a tabela inteira em memória.
+    """
+    ultimo_id = None
+    while True:
+        lote_consulta = consulta.order_by(coluna_id)
+        if ultimo_id is not None:
+            lote_consulta = lote_consulta.filter(coluna_id > ultimo_id)
+        lote = lote_consulta.limit(tamanho_lote).all()
+        if not lote:
+            break
+        ultimo_id = getattr(lote[-1], coluna_id.key)
+        yield lote
+
+
+@click.command('backfill-scores')
+@click.option('--questionario-id', default=None, help='Recalcula apenas as baterias deste questionário.')
+@click.option('--tamanho-lote', default=500, show_default=True, help='Baterias por transação.')
+@click.option('--desatualizadas', is_flag=True,
+              help='Recalcula apenas as baterias sem linhas na versao_pontuacao atual do questionário.')
+@with_appcontext
+def backfill_scores(questionario_id, tamanho_lote, desatualizadas):
+    """
+    Recalcula a tabela bateria_scores para as baterias existentes.
+    """
+    from sqlalchemy import select
+
+    from models import BateriaTestes, Questionario
+    from utils import bateria_scores
+
+    if desatualizadas:
+        if questionario_id:
+            questionario_ids = [questionario_id]
+        else:
+            questionario_ids = db.session.scalars(select(Questionario.id)).all()
+        consultas = [
+            bateria_scores.consulta_desatualizadas(qid, versao)
+            for qid, versao in bateria_scores.versoes_atuais(questionario_ids).items()
+        ]
+    else:
+        consulta = BateriaTestes.query.filter(BateriaTestes.respostas.isnot(None))
+        if questionario_id:
+            consulta = consulta.filter(BateriaTestes.questionario_id == questionario_id)
+        consultas = [consulta]
+
+    total_baterias = 0
+    total_linhas = 0
+    for consulta in consultas:
+        for lote in _iterar_em_lotes(consulta, BateriaTestes.id, tamanho_lote):
+            total_linhas += bateria_scores.materializar(lote)
+            db.session.commit()
+            total_baterias += len(lote)
+            db.session.expunge_all()
+            click.echo(f'{total_baterias} baterias processadas ({total_linhas} linhas)')
+
+    click.echo(f'Concluído: {total_baterias} baterias, {total_linhas} linhas em bateria_scores.')
+
+
+@click.command('explode-respostas')
+@click.option('--questionario-id', default=None, help='Normaliza apenas as baterias deste questionário.')
+@click.option('--tamanho-lote', default=500, show_default=True, help='Baterias por transação.')
+@with_appcontext
+def explode_respostas(questionario_id, tamanho_lote):
+    """
+    Migra o JSON BateriaTestes.respostas das baterias existentes para a tabela respostas_itens.
+    """
+    from models import BateriaTestes
+    from utils import respostas_itens
+
+    consulta = BateriaTestes.query.filter(BateriaTestes.respostas.isnot(None))
+    if questionario_id:
+        consulta = consulta.filter(BateriaTestes.questionario_id == questionario_id)
+
+    total_baterias = 0
+    total_linhas = 0
+    for lote in _iterar_em_lotes(consulta, BateriaTestes.id, tamanho_lote):
+        total_linhas += respostas_itens.sincronizar(lote)
+        db.session.commit()
+        total_baterias += len(lote)
+        db.session.expunge_all()
+        click.echo(f'{total_baterias} baterias processadas ({total_linhas} linhas)')
+
+    click.echo(f'Concluído: {total_baterias} baterias, {total_linhas} linhas em respostas_itens.')
+
+
+@click.command('rebuild-percentis')
+@click.option('--questionario-id', default=None, help='Reconstrói apenas os sketches deste questionário.')
+@click.option('--tamanho-lote', default=5000, show_default=True, help='Linhas de bateria_scores lidas por vez.')
+@with_appcontext
+def rebuild_percentis(questionario_id, tamanho_lote):
+    """
+    Reconstrói os sketches de percentil populacional a partir de bateria_scores.
+    Roda todas as noites em `flask manutencao-noturna`, corrigindo o desvio de baterias
+    alteradas depois de concluídas.
+    """
+    from utils import percentis
+
+    totais = percentis.reconstruir(questionario_id, tamanho_lote)
+    db.session.commit()
+    click.echo(f'Concluído: {len(totais)} sessões, {sum(totais.values())} pontuações nos sketches.')
+
+
+@click.command('manutencao-noturna')
+@click.option('--horario', default='03:00', show_default=True, help='Horário local (HH:MM) da execução diária.')
+@click.option('--uma-vez', is_flag=True, help='Executa uma única vez, imediatamente, e sai.')
+@click.pass_context
+@with_appcontext
+def manutencao_noturna(ctx, horario, uma_vez):
+    """
+    Repontua as baterias com linhas de bateria_scores desatualizadas e depois reconstrói
+    os sketches de percentil (backfill-scores --desatualizadas e rebuild-percentis).
+    Sem --uma-vez, fica em execução e repete todos os dias no horário informado; o
+    contêiner da API o inicia em segundo plano (ver Dockerfile).
+    """
+    import time
+    from datetime import datetime, timedelta
+
+    from flask import current_app
+
+    try:
+        hora = datetime.strptime(horario, '%H:%M')
+    except ValueError:
+        raise click.BadParameter('use o formato HH:MM', param_hint='--horario')
+
+    while True:
+        if not uma_vez:
+            agora = datetime.now()
+            proxima = agora.replace(hour=hora.hour, minute=hora.minute, second=0, microsecond=0)
+            if proxima <= agora:
+                proxima += timedelta(days=1)
+            time.sleep((proxima - agora).total_seconds())
+        try:
+            ctx.invoke(backfill_scores, desatualizadas=True)
+            ctx.invoke(rebuild_percentis)
+        except Exception:
+            db.session.rollback()
+            if uma_vez:
+                raise
+            # Uma noite com erro não derruba o agendamento; tenta de novo na próxima
+            current_app.logger.exception('Falha na manutenção noturna')
+        finally:
+            db.session.remove()
+        if uma_vez:
+            break
+        # Entre uma noite e outra as conexões do pool ficariam ociosas por 24 h
+        db.engine.dispose()
+
+
+@click.command('rebuild-rollups')
+@click.option('--profissional-id', default=None, help='Reconstrói apenas os rollups deste profissional.')
+@click.option('--tamanho-lote', default=5000, show_default=True, help='Linhas de baterias_testes lidas por vez.')
+@with_appcontext
+def rebuild_rollups(profissional_id, tamanho_lote):
+    """
+    Reconstrói os rollups diários do dashboard dos profissionais a partir de baterias_testes.
+    Necessário na implantação e recomendado todas as noites (cron).
+    """
+    from utils import rollups
+
+    total_linhas = rollups.reconstruir(profissional_id, tamanho_lote)
+    db.session.commit()
+    click.echo(f'Concluído: {total_linhas} linhas em rollups_profissional_dia.')
+
+
+@click.command('rebuild-busca-pessoas')
+@click.option('--tamanho-lote', default=2000, show_default=True, help='Pessoas lidas por vez.')
+@with_appcontext
+def rebuild_busca_pessoas(tamanho_lote):
+    """
+    Reconstrói a tabela de busca de pessoas por nome (pessoas_busca e seus trigramas).
+    Necessário na implantação e depois de escritas feitas fora do ORM.
+    """
+    from utils import busca_pessoas
+
+    total = busca_pessoas.reconstruir(tamanho_lote)
+    db.session.commit()
+    click.echo(f'Concluído: {total} pessoas indexadas.')
+
+
+@click.command('load-cids')
+@click.option('--arquivo', default=None, help='Arquivo JSON com os CIDs (padrão: fixtures/cids.json).')
+@click.option('--tamanho-lote', default=1000, show_default=True, help='CIDs gravados por transação.')
+@click.option('--forcar', is_flag=True, help='Carrega mesmo que o arquivo não tenha mudado.')
+@with_appcontext
+def load_cids(arquivo, tamanho_lote, forcar):
+    """
+    Carrega (ou atualiza) o catálogo de CIDs a partir do arquivo JSON.
+    """
+    from utils import cid_catalogo
+
+    resumo = cid_catalogo.carregar_cids(arquivo, tamanho_lote, forcar)
+    if resumo['status'] == 'inalterado':
+        click.echo(f"Arquivo sem alterações desde a última carga (checksum {resumo['checksum'][:12]}).")
+        return
+    click.echo(
+        f"Concluído: {resumo['lidos']} CIDs lidos, {resumo['inseridos']} inseridos, "
+        f"{resumo['atualizados']} atualizados, {resumo['ignorados']} ignorados."
+    )
+
+
+@click.command('import-questionarios')
+@click.argument('arquivos', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@with_appcontext
+def import_questionarios(arquivos):
+    """
+    Importa questionários de arquivos JSON (padrão: fixtures/questionario.json).
+    """
+    from utils import questionario_import
+
+    relatorio = questionario_import.importar_arquivos(list(arquivos) or None)
+    for erro in relatorio['erros']:
+        click.echo(f"Questionário {erro['posicao'] + 1} ({erro['titulo']}) ignorado:", err=True)
+        for mensagem in erro['erros']:
+            click.echo(f"  - {mensagem}", err=True)
+    linhas = relatorio['linhas']
+    click.echo(
+        f"Concluído: {relatorio['importados']} questionários importados, {relatorio['existentes']} já existentes, "
+        f"{relatorio['invalidos']} inválidos; {linhas['sessoes']} sessões, {linhas['perguntas']} perguntas, "
+        f"{linhas['alternativas']} alternativas em {relatorio['segundos']:.2f} s "
+        f"({relatorio['linhas_por_segundo']:.0f} linhas/s)."
+    )
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """
+    Cria as tabelas que faltam e o usuário admin padrão, se não existir.
+    """
+    from extensions import init_db
+
+    init_db()
+    click.echo("Banco inicializado.")
+
+
+@click.command('seed')
+@click.option('--sem-questionarios', is_flag=True, help='Não importa fixtures/questionario.json.')
+@click.option('--sem-cids', is_flag=True, help='Não carrega fixtures/cids.json.')
+@with_appcontext
+def seed(sem_questionarios, sem_cids):
+    """
+    Inicializa o banco e carrega os dados iniciais (questionários e catálogo de CIDs).
+    Pode ser repetido: o que já foi carregado é pulado.
+    """
+    import time
+
+    from extensions import init_db
+    from utils import cid_catalogo, questionario_import
+
+    def banco():
+        init_db()
+        return 'tabelas e admin verificados'
+
+    def questionarios():
+        relatorio = questionario_import.importar_arquivos()
+        return (f"{relatorio['importados']} importados, {relatorio['existentes']} já existentes, "
+                f"{relatorio['invalidos']} inválidos")
+
+    def cids():
+        resumo = cid_catalogo.carregar_cids()
+        return f"{resumo['status']}, {resumo['inseridos']} inseridos, {resumo['atualizados']} atualizados"
+
+    etapas = [('init-db', banco)]
+    if not sem_questionarios:
+        etapas.append(('questionários', questionarios))
+    if not sem_cids:
+        etapas.append(('CIDs', cids))
+    for nome, executar in etapas:
+        inicio = time.perf_counter()
+        mensagem = executar()
+        click.echo(f"{nome}: {mensagem} ({time.perf_counter() - inicio:.2f} s)")
+
+
+@click.command('startup-report')
+@with_appcontext
+def startup_report():
+    """
+    Mostra os tempos da inicialização da aplicação (create_app) neste processo.
+    """
+    from flask import current_app
+
+    relatorio = current_app.extensions['inicializacao']
+    click.echo(relatorio.resumo())
+
+
+def register_commands(app):
+    """
+    Registra os comandos no CLI do Flask.
+    """
+    app.cli.add_command(backfill_scores)
+    app.cli.add_command(explode_respostas)
+    app.cli.add_command(rebuild_percentis)
+    app.cli.add_command(manutencao_noturna)
+    app.cli.add_command(rebuild_rollups)
+    app.cli.add_command(rebuild_busca_pessoas)
+    app.cli.add_command(load_cids)
+    app.cli.add_command(import_questionarios)
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(seed)
+    app.cli.add_command(startup_report)
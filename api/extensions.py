@@ -1,7 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_mail import Mail
-from werkzeug.security import generate_password_hash
 from datetime import datetime, timezone
 import ulid
 
@@ -14,6 +13,7 @@ def init_db():
     Inicializa o banco de dados e cria um usuário admin se não existir
     """
     from models import User, Colaborador
+    from utils import senhas
 
     # Cria todas as tabelas
     db.create_all()
@@ -25,7 +25,7 @@ def init_db():
         admin = User(
             id=str(ulid.ULID()),
             email='admin@admin.com',
-            password_hash=generate_password_hash('admin'),
+            password_hash=senhas.gerar_hash('admin'),
             role='admin',
             is_active=True,
             created_at=datetime.now(timezone.utc),
@@ -40,3 +40,8 @@ def init_db():
         except Exception as e:
             db.session.rollback()
             print(f"Erro ao criar usuário admin: {e}")
+
+    # Tabelas derivadas que o create_all acabou de criar vazias num banco já populado
+    from utils import busca_pessoas, rollups
+    if busca_pessoas.preencher_se_vazia() + rollups.preencher_se_vazia():
+        db.session.commit()
@@ -35,7 +35,7 @@ expected_pergunta = {
 
 expected_alternativa = {
     "texto": str,
-    "valor": float,
+    "valor": int | float,
     "ordem": int
 }
 
@@ -95,21 +95,22 @@ def load_json_with_line_numbers(filepath):
             idx += 1
     return data
 
-# Caminho relativo ao diretório do script
-script_dir = os.path.dirname(__file__)
-json_path = os.path.join(script_dir, 'questionario.json')
+if __name__ == '__main__':
+    # Caminho relativo ao diretório do script
+    script_dir = os.path.dirname(__file__)
+    json_path = os.path.join(script_dir, 'questionario.json')
 
-# Carregar o arquivo JSON com informações de linha
-with open(json_path, 'r', encoding='utf-8') as file:
-    data = json.load(file)
+    # Carregar o arquivo JSON com informações de linha
+    with open(json_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
 
-# Validar cada questionário
-for i, questionario in enumerate(data.get("questionarios", [])):
-    print(f"Validando questionário {i + 1}...")
-    errors = validate_questionario(questionario)
-    if errors:
-        print(f"Erros encontrados no questionário {i + 1}:")
-        for error in errors:
-            print(f"  - {error}")
-    else:
-        print(f"Questionário {i + 1} está válido.")
\ No newline at end of file
+    # Validar cada questionário
+    for i, questionario in enumerate(data.get("questionarios", [])):
+        print(f"Validando questionário {i + 1}...")
+        errors = validate_questionario(questionario)
+        if errors:
+            print(f"Erros encontrados no questionário {i + 1}:")
+            for error in errors:
+                print(f"  - {error}")
+        else:
+            print(f"Questionário {i + 1} está válido.")
\ No newline at end of file
@@ -1,6 +1,7 @@
 from faker import Faker
 from models import User, Medico
 from extensions import db
+from utils import senhas
 from datetime import datetime, timezone
 import ulid
 
@@ -13,7 +14,7 @@ def gerar_email(nome_completo):
     return f"{partes[0]}_{partes[1]}_{partes[2]}@faker.com"
 
 def popular_medicos(qtd=20):
-    for _ in range(qtd):
+    for password_hash in senhas.gerar_hashes(['faker'] * qtd):
         nome = fake.name()
         email = gerar_email(nome)
         crm = fake.unique.numerify(text='######')
@@ -27,7 +28,7 @@ def popular_medicos(qtd=20):
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc)
         )
-        user.set_password('faker')
+        user.password_hash = password_hash
         db.session.add(user)
         db.session.flush()  # Garante user.id
 
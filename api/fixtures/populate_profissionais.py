@@ -1,6 +1,7 @@
 from faker import Faker
 from models import User, ProfissionalSaude
 from extensions import db
+from utils import senhas
 from datetime import datetime, timezone
 import ulid
 
@@ -13,7 +14,7 @@ def gerar_email(nome_completo):
     return f"{partes[0]}_{partes[1]}_{partes[2]}@faker.com"
 
 def popular_profissionais(qtd=10):
-    for _ in range(qtd):
+    for password_hash in senhas.gerar_hashes(['faker'] * qtd):
         nome = fake.name()
         email = gerar_email(nome)
         cpf = fake.unique.cpf().replace('.', '').replace('-', '')
@@ -39,7 +40,7 @@ def popular_profissionais(qtd=10):
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc)
         )
-        user.set_password('faker')
+        user.password_hash = password_hash
         db.session.add(user)
         db.session.flush()  # Garante user.id
 
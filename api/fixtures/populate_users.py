@@ -1,6 +1,7 @@
 from faker import Faker
 from models import User, Paciente
 from extensions import db
+from utils import senhas
 from datetime import datetime, timezone
 import ulid
 import logging
@@ -123,8 +124,9 @@ def popular_pacientes(qtd=500):
     # [(user_obj, paciente_data_dict), ...]
     user_paciente_mapping = [] 
 
-    logger.info("Fase 2: Preparando objetos User para inserção em lote.")
-    for data_item in pacientes_data_list:
+    logger.info("Fase 2: Preparando objetos User para inserção em lote (hashes das senhas em paralelo).")
+    hashes = senhas.gerar_hashes(data_item["user_data"]["password"] for data_item in pacientes_data_list)
+    for data_item, password_hash in zip(pacientes_data_list, hashes):
         user = User(
             email=data_item["user_data"]["email"],
             role=data_item["user_data"]["role"],
@@ -132,7 +134,7 @@ def popular_pacientes(qtd=500):
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc)
         )
-        user.set_password(data_item["user_data"]["password"])
+        user.password_hash = password_hash
         users_to_insert.append(user)
         user_paciente_mapping.append((user, data_item["paciente_data"]))
 
@@ -0,0 +1,31 @@
+"""
+Configuração do gunicorn, lida automaticamente da pasta de trabalho (ver Dockerfile).
+
+Os workers gravam suas métricas em METRICAS_DIR para que /backend/metrics some todos
+eles (utils/metricas.py). A pasta é esvaziada quando o servidor sobe, e os arquivos de
+cada worker que termina são juntados ao arquivo agregado.
+"""
+import os
+import tempfile
+
+os.environ.setdefault('METRICAS_DIR', os.path.join(tempfile.gettempdir(), 'questionario-metricas'))
+
+
+def on_starting(server):
+    from utils import metricas
+    metricas.limpar_diretorio(os.environ['METRICAS_DIR'])
+
+
+def worker_exit(server, worker):
+    # Última gravação do worker, com o que chegou depois da gravação periódica
+    from utils import metricas
+    metricas.gravar()
+
+
+def child_exit(server, worker):
+    # Roda no processo mestre: uma falha de disco não pode derrubá-lo
+    from utils import metricas
+    try:
+        metricas.incorporar_processo(os.environ['METRICAS_DIR'], worker.pid)
+    except OSError:
+        server.log.exception('Falha ao juntar as métricas do worker %s', worker.pid)
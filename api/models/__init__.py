@@ -1,14 +1,14 @@
 from sqlalchemy import (
     JSON, Column, Integer, String, Text, Float,
     ForeignKey, Date, DateTime, Boolean, func,
-    Enum as SQLAlchemyEnum
+    Enum as SQLAlchemyEnum, Index, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone, timedelta # Adicionado timedelta
 import ulid
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-import jwt
+from utils import senhas
+from utils.auth import descartar_token_emitido
 import enum # Importar enum
 
 class TipoPagamentoEnum(enum.Enum):
@@ -19,7 +19,6 @@ class TipoPagamentoEnum(enum.Enum):
 # Removido: from app import create_app # Geralmente não é necessário em models.py
 from extensions import db # Assumindo que db está em extensions.py
 from dotenv import load_dotenv # Adicionado
-import os # Adicionado
 
 load_dotenv() # Adicionado
 
@@ -62,45 +61,29 @@ class User(UserMixin, db.Model):
 
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        # Hash no pool de processos, com os parâmetros de SENHA_HASH_METODO (utils/senhas.py)
+        self.password_hash = senhas.gerar_hash(password)
+        # O token reaproveitado pelo login (emitir_token) deixa de valer para a senha antiga
+        descartar_token_emitido(self)
 
     def check_password(self, password):
-        if self.password_hash is None: # Adicionado para evitar erro se password_hash for None
-            return False
-        return check_password_hash(self.password_hash, password)
+        return senhas.verificar_senha(self.password_hash, password)
 
     def __repr__(self):
         return f"<User(email='{self.email}')>"
 
     def to_json(self):
-        secret_key = os.getenv('SECRET_KEY')
-        token = None
-        if self.id and secret_key: # Adicionado verificação de secret_key
-            try:
-                token = jwt.encode(
-                    {
-                        'id': self.id,
-                        'email': self.email,
-                        'exp': datetime.now(timezone.utc) + timedelta(hours=12),
-                        'role': self.role,
-                    },
-                    secret_key,
-                    algorithm='HS256'
-                )
-            except Exception as e:
-                # Logar o erro seria uma boa prática aqui
-                print(f"Erro ao gerar token JWT para user {self.id}: {e}")
-                token = None
-
-
+        """
+        Perfil do usuário, sem token: o token só é emitido no login e ao definir a
+        senha (utils.auth.emitir_token).
+        """
         return {
             'id': self.id,
             'email': self.email,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'role': self.role,
-            'token': token
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'role': self.role
         }
 
 
@@ -142,8 +125,8 @@ class ProfissionalSaude(db.Model):
             'enderecos': self.enderecos,
             'telefone': self.telefone,
             'perfil': self.perfil, # Adicionado perfil ao to_json
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -184,13 +167,13 @@ class Paciente(db.Model):
         return {
             'id': self.id,
             'nome': self.nome,
-            'data_nascimento': self.data_nascimento.isoformat() if self.data_nascimento else None,
+            'data_nascimento': self.data_nascimento,
             'telefone': self.telefone,
             'cpf': self.cpf,
             'enderecos': self.enderecos,
             'user_id': self.user_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -227,8 +210,8 @@ class Colaborador(db.Model):
             'cpf': self.cpf,
             'funcao': self.funcao,
             'user_id': self.user_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -266,8 +249,8 @@ class Questionario(db.Model):
             'versao': self.versao,
             'fontes_literatura': self.fontes_literatura,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -302,8 +285,8 @@ class Sessao(db.Model):
             'descricao': self.descricao,
             'ordem': self.ordem,
             'regras_visibilidade': self.regras_visibilidade,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         if include_perguntas:
             json_sessao['perguntas'] = [pergunta.to_json(include_alternativas=True) for pergunta in self.perguntas] # Adicionado include_alternativas
@@ -343,8 +326,8 @@ class Pergunta(db.Model):
             'metodo_pontuacao': self.metodo_pontuacao,
             'ordem': self.ordem,
             'is_obrigatoria': self.is_obrigatoria,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         if include_alternativas:
             data['alternativas'] = [alt.to_json() for alt in self.alternativas]
@@ -374,13 +357,17 @@ class Alternativa(db.Model):
             'texto': self.texto,
             'valor': self.valor,
             'ordem': self.ordem,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
 class BateriaTestes(db.Model):
     __tablename__ = 'baterias_testes'
+    __table_args__ = (
+        # baterias de um conjunto de questionários, das mais recentes às mais antigas
+        Index('ix_baterias_testes_questionario_data', 'questionario_id', 'data_aplicacao', 'id'),
+    )
 
     id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
     profissional_saude_id = Column(String(26), ForeignKey('profissionais_saude.id', ondelete='CASCADE'), nullable=True) # SQL permite NULL
@@ -400,6 +387,8 @@ class BateriaTestes(db.Model):
     colaborador = relationship("Colaborador", back_populates="baterias_testes")
     questionario = relationship("Questionario", back_populates="baterias_testes")
     avaliacao = relationship("Avaliacao", back_populates="baterias_testes")
+    scores = relationship("BateriaScore", back_populates="bateria", cascade="all, delete-orphan", passive_deletes=True)
+    itens_resposta = relationship("RespostaItem", back_populates="bateria", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<BateriaTestes(paciente_id='{self.paciente_id}', questionario_id='{self.questionario_id}')>"
@@ -411,13 +400,183 @@ class BateriaTestes(db.Model):
             'paciente_id': self.paciente_id,
             'colaborador_id': self.colaborador_id,
             'questionario_id': self.questionario_id,
-            'data_aplicacao': self.data_aplicacao.isoformat() if self.data_aplicacao else None,
+            'data_aplicacao': self.data_aplicacao,
             'observacoes': self.observacoes,
             'respostas': self.respostas if self.respostas is not None else {}, # Ajustado para retornar {} se None
             'is_completo': self.is_completo,
             'avaliacao_id': self.avaliacao_id, # Adicionado avaliacao_id
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+
+class BateriaScore(db.Model):
+    """
+    Pontuação materializada de uma sessão graficável de uma bateria de testes
+    (uma linha por bateria x sessão). Escrita junto com as respostas; ver utils/bateria_scores.py.
+    """
+    __tablename__ = 'bateria_scores'
+    __table_args__ = (
+        UniqueConstraint('bateria_id', 'sessao_id', name='uq_bateria_scores_bateria_sessao'),
+        Index('ix_bateria_scores_questionario_sessao', 'questionario_id', 'sessao_id'),
+    )
+
+    id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
+    bateria_id = Column(String(26), ForeignKey('baterias_testes.id', ondelete='CASCADE'), nullable=False)
+    sessao_id = Column(String(26), ForeignKey('sessoes.id', ondelete='CASCADE'), nullable=False)
+    questionario_id = Column(String(26), ForeignKey('questionarios.id', ondelete='CASCADE'), nullable=False)
+    versao_pontuacao = Column(String(32), nullable=True) # QuestionarioCompilado.versao_pontuacao usada no cálculo
+    pontuacao_obtida = Column(Float, nullable=False, default=0.0)
+    pontuacao_maxima = Column(Float, nullable=False, default=0.0)
+    media = Column(Float, nullable=False, default=0.0)
+    moda = Column(JSON, nullable=True)
+    percentual = Column(Float, nullable=False, default=0.0)
+    perguntas_respondidas = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    bateria = relationship("BateriaTestes", back_populates="scores")
+
+    def __repr__(self):
+        return f"<BateriaScore(bateria_id='{self.bateria_id}', sessao_id='{self.sessao_id}', percentual={self.percentual})>"
+
+    def to_json(self):
+        return {
+            'id': self.id,
+            'bateria_id': self.bateria_id,
+            'sessao_id': self.sessao_id,
+            'questionario_id': self.questionario_id,
+            'pontuacao_obtida': self.pontuacao_obtida,
+            'pontuacao_maxima': self.pontuacao_maxima,
+            'media': self.media,
+            'moda': self.moda if self.moda is not None else [],
+            'percentual': self.percentual,
+            'perguntas_respondidas': self.perguntas_respondidas,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+    def estatisticas_sessao(self):
+        """
+        Retorna a linha no formato de `estatisticas_sessao` usado pelo relatório de estatísticas.
+        """
+        return {
+            "total_pontuacao_obtida": self.pontuacao_obtida,
+            "total_pontuacao_maxima_possivel": self.pontuacao_maxima,
+            "media_pontuacao_obtida_por_pergunta_respondida": self.media,
+            "moda_pontuacao_obtida_nas_perguntas": self.moda if self.moda is not None else [],
+            "percentual_aproveitamento": self.percentual
+        }
+
+
+class SketchPontuacao(db.Model):
+    """
+    Sketch de quantis (KLL, ver utils/quantis.py) do percentual de aproveitamento de uma
+    sessão, entre as baterias completas do questionário. Atualizado quando uma bateria
+    é concluída e reconstruído pelo comando `flask rebuild-percentis`; ver utils/percentis.py.
+    """
+    __tablename__ = 'sketches_pontuacao'
+    __table_args__ = (
+        UniqueConstraint('questionario_id', 'sessao_id', name='uq_sketches_pontuacao_questionario_sessao'),
+    )
+
+    id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
+    questionario_id = Column(String(26), ForeignKey('questionarios.id', ondelete='CASCADE'), nullable=False)
+    sessao_id = Column(String(26), ForeignKey('sessoes.id', ondelete='CASCADE'), nullable=False)
+    sketch = Column(JSON, nullable=False)
+    total_baterias = Column(Integer, nullable=False, default=0)
+    reconstruido_em = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<SketchPontuacao(questionario_id='{self.questionario_id}', sessao_id='{self.sessao_id}', total_baterias={self.total_baterias})>"
+
+    def to_json(self):
+        return {
+            'id': self.id,
+            'questionario_id': self.questionario_id,
+            'sessao_id': self.sessao_id,
+            'total_baterias': self.total_baterias,
+            'reconstruido_em': self.reconstruido_em,
+            'updated_at': self.updated_at
+        }
+
+
+class RespostaItem(db.Model):
+    """
+    Versão normalizada de BateriaTestes.respostas: uma linha por pergunta respondida
+    com uma alternativa. Mantida em sincronia pelas rotas de escrita das baterias;
+    ver utils/respostas_itens.py.
+    is_completo, data_aplicacao e avaliacao_id são cópias da bateria, para que os
+    filtros de coorte não precisem de JOIN com baterias_testes; o índice de coorte
+    segue a ordem do GROUP BY e cobre os filtros, dispensando ordenação temporária.
+    """
+    __tablename__ = 'respostas_itens'
+    __table_args__ = (
+        Index('ix_respostas_itens_pergunta_alternativa', 'pergunta_id', 'alternativa_id'),
+        Index(
+            'ix_respostas_itens_coorte',
+            'questionario_id', 'pergunta_id', 'alternativa_id', 'is_completo', 'data_aplicacao'
+        ),
+    )
+
+    bateria_id = Column(String(26), ForeignKey('baterias_testes.id', ondelete='CASCADE'), primary_key=True)
+    pergunta_id = Column(String(26), ForeignKey('perguntas.id', ondelete='CASCADE'), primary_key=True)
+    alternativa_id = Column(String(26), ForeignKey('alternativas.id', ondelete='CASCADE'), nullable=False)
+    questionario_id = Column(String(26), ForeignKey('questionarios.id', ondelete='CASCADE'), nullable=False)
+    valor = Column(Float, nullable=True)
+    is_completo = Column(Boolean, nullable=False, default=False)
+    data_aplicacao = Column(Date, nullable=True)
+    avaliacao_id = Column(String(26), nullable=True, index=True)
+
+    bateria = relationship("BateriaTestes", back_populates="itens_resposta")
+
+    def __repr__(self):
+        return f"<RespostaItem(bateria_id='{self.bateria_id}', pergunta_id='{self.pergunta_id}', alternativa_id='{self.alternativa_id}')>"
+
+    def to_json(self):
+        return {
+            'bateria_id': self.bateria_id,
+            'pergunta_id': self.pergunta_id,
+            'alternativa_id': self.alternativa_id,
+            'questionario_id': self.questionario_id,
+            'valor': self.valor,
+            'is_completo': self.is_completo,
+            'data_aplicacao': self.data_aplicacao,
+            'avaliacao_id': self.avaliacao_id
+        }
+
+
+class RollupProfissionalDia(db.Model):
+    """
+    Agregado diário das baterias de um profissional de saúde, por data_aplicacao:
+    baterias criadas, baterias completas e um sketch HyperLogLog dos pacientes
+    distintos. Mantido a cada escrita de BateriaTestes; ver utils/rollups.py.
+    """
+    __tablename__ = 'rollups_profissional_dia'
+    __table_args__ = (
+        UniqueConstraint('profissional_saude_id', 'dia', name='uq_rollups_profissional_dia'),
+    )
+
+    id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
+    profissional_saude_id = Column(String(26), ForeignKey('profissionais_saude.id', ondelete='CASCADE'), nullable=False)
+    dia = Column(Date, nullable=False)
+    baterias_criadas = Column(Integer, nullable=False, default=0)
+    baterias_completas = Column(Integer, nullable=False, default=0)
+    pacientes_hll = Column(JSON, nullable=True)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<RollupProfissionalDia(profissional_saude_id='{self.profissional_saude_id}', dia='{self.dia}')>"
+
+    def to_json(self):
+        return {
+            'id': self.id,
+            'profissional_saude_id': self.profissional_saude_id,
+            'dia': self.dia,
+            'baterias_criadas': self.baterias_criadas,
+            'baterias_completas': self.baterias_completas,
+            'updated_at': self.updated_at
         }
 
 
@@ -446,13 +605,17 @@ class Medico(db.Model):
             'nome': self.nome,
             'crm': self.crm,
             'especialidade': self.especialidade,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
 class UnidadeSaude(db.Model):
     __tablename__ = 'unidades_saude'
+    __table_args__ = (
+        # filter_by_name em modo cursor pagina por (nome, id)
+        Index('ix_unidades_saude_nome', 'nome', 'id'),
+    )
 
     id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
     nome = Column(String(100), nullable=False)
@@ -483,8 +646,8 @@ class UnidadeSaude(db.Model):
             'cnpj': self.cnpj,
             'telefone': self.telefone,
             'email': self.email,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class Avaliacao(db.Model):
@@ -530,7 +693,7 @@ class Avaliacao(db.Model):
         return {
             'id': self.id,
             'paciente_id': self.paciente_id,
-            'data_inicio': self.data_inicio.isoformat() if self.data_inicio else None,
+            'data_inicio': self.data_inicio,
             'unidade_saude_id': self.unidade_saude_id,
             'medico_id': self.medico_id, # Adicionado medico_id
             'fechada': self.fechada,
@@ -538,8 +701,8 @@ class Avaliacao(db.Model):
             'valor_cobranca': self.valor_cobranca,
             'pago': self.pago,
             'tipo_pagamento': self.tipo_pagamento.name if self.tipo_pagamento else None, # Retorna o nome da chave (ex: 'pix')
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 # Tabela de associação para Laudo e CID
@@ -581,12 +744,12 @@ class Laudo(db.Model):
             'medico_id': self.medico_id,
             'paciente_id': self.paciente_id,
             'avaliacao_id': self.avaliacao_id, # Adicionado avaliacao_id
-            'data': self.data.isoformat() if self.data else None,
+            'data': self.data,
             'parecer': self.parecer,
             'abordagem_terapeutica': self.abordagem_terapeutica,
             'cids': [cid.to_json() for cid in self.cids], # Adicionado CIDs
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -613,6 +776,58 @@ class CID(db.Model):
 
 # Removida a classe CID_Laudo aninhada, pois foi substituída pela tabela de associação cid_laudos_table
 
+
+class CargaCatalogo(db.Model):
+    """
+    Última carga de um catálogo a partir de arquivo (ex.: 'cids'), com o checksum do
+    arquivo carregado; ver utils/cid_catalogo.py.
+    """
+    __tablename__ = 'cargas_catalogo'
+
+    nome = Column(String(50), primary_key=True)
+    checksum = Column(String(64), nullable=False)
+    total = Column(Integer, nullable=False, default=0)
+    carregado_em = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<CargaCatalogo(nome='{self.nome}', checksum='{self.checksum}', total={self.total})>"
+
+
+class PessoaBusca(db.Model):
+    """
+    Nome normalizado (sem acentos, minúsculo) de cada paciente, médico, colaborador e
+    profissional de saúde, para a busca de pessoas por nome. Mantida pelo listener de
+    utils/busca_pessoas.py e reconstruída pelo comando `flask rebuild-busca-pessoas`.
+    """
+    __tablename__ = 'pessoas_busca'
+    __table_args__ = (
+        UniqueConstraint('papel', 'entidade_id', name='uq_pessoas_busca_papel_entidade'),
+        Index('ix_pessoas_busca_papel_nome', 'papel', 'nome_normalizado', 'id'),
+        Index('ix_pessoas_busca_nome', 'nome_normalizado', 'id'),
+    )
+
+    id = Column(String(26), primary_key=True, default=lambda: str(ulid.ULID()))
+    papel = Column(String(20), nullable=False)  # paciente, medico, colaborador ou profissional_saude
+    entidade_id = Column(String(26), nullable=False)
+    user_id = Column(String(26), nullable=True)
+    nome = Column(String(100), nullable=False)
+    nome_normalizado = Column(String(100), nullable=False)
+
+    def __repr__(self):
+        return f"<PessoaBusca(papel='{self.papel}', entidade_id='{self.entidade_id}', nome='{self.nome}')>"
+
+
+class PessoaBuscaTrigrama(db.Model):
+    """
+    Trigramas do nome normalizado de cada pessoa (índice invertido da busca por trecho do
+    nome). O papel faz parte da chave para que a busca de um papel leia só as suas linhas.
+    """
+    __tablename__ = 'pessoas_busca_trigramas'
+
+    trigrama = Column(String(3), primary_key=True)
+    papel = Column(String(20), primary_key=True)
+    pessoa_busca_id = Column(String(26), ForeignKey('pessoas_busca.id', ondelete='CASCADE'), primary_key=True)
+
 class Exame(db.Model):
     __tablename__ = 'exames'
 
@@ -637,6 +852,6 @@ class Exame(db.Model):
             'paciente_id': self.paciente_id,
             'marcado_para_delecao': self.marcado_para_delecao,
             'tamanho_pdf': self.tamanho_pdf,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 from models import Alternativa
 from extensions import db
 from utils.auth import token_required
+from utils import questionario_cache
 alternativas_bp = Blueprint('alternativas', __name__)
 
 @alternativas_bp.route('/', methods=['GET'])
@@ -135,6 +136,12 @@ def update_alternativas_batch():
         allowed_fields = {"id", "pergunta_id", "texto", "valor", "ordem"}
         mappings = [{ key: alt[key] for key in alt if key in allowed_fields } for alt in data ]
         db.session.bulk_update_mappings(Alternativa, mappings)
+        # bulk_update_mappings não passa pelo flush da sessão: avisa o cache de questionários
+        questionario_cache.marcar_alterados(
+            db.session,
+            pergunta_ids=[m.get('pergunta_id') for m in mappings],
+            alternativa_ids=[m.get('id') for m in mappings]
+        )
         db.session.commit()
         return jsonify({'message': 'Alternativas atualizadas com sucesso'}), 200
     except Exception as e:
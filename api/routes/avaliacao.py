@@ -3,12 +3,12 @@ from flask import Blueprint, request, jsonify
 from models import Alternativa, Avaliacao, BateriaTestes, Paciente, Pergunta, Questionario, Sessao, UnidadeSaude, Medico, TipoPagamentoEnum
 from extensions import db
 from datetime import datetime
+from utils import bateria_scores, percentis, pontuacao, questionario_cache
 from utils.auth import token_required
 from sqlalchemy.orm import joinedload, selectinload
 import os
 from flask import current_app # Adicionado para current_app.config
 from sqlalchemy import exc
-from collections import Counter
 avaliacao_bp = Blueprint('avaliacoes', __name__, url_prefix='/avaliacoes')
 
 # Rota para criar uma nova avaliação
@@ -276,121 +276,77 @@ FROM avaliacoes LEFT OUTER JOIN medicos AS medicos_1 ON medicos_1.id = avaliacoe
 WHERE avaliacoes.paciente_id = %(paciente_id_1)s]
 [parameters: {'paciente_id_1': '01JW4VTCTBPM7R21Y4K56FKS4R'}]
 (Background on this error at: https://sqlalche.me/e/20/e3q8)"""
-def _build_detailed_bateria_json(bateria_obj, tipos_graficaveis_validos, app_config):
+def _build_detailed_bateria_json(bateria_obj, snapshot_questionario, app_config, estatisticas_por_sessao=None):
     """
     Constrói o JSON detalhado para um objeto BateriaTestes.
-    Esta função encapsula a lógica que você forneceu.
+    snapshot_questionario é o Snapshot do questionário (utils/questionario_cache.py) ou None.
+    estatisticas_por_sessao ({sessao_id: estatisticas_sessao}) normalmente vem de
+    bateria_scores; se não for informado, é calculado pelo motor vetorizado (utils/pontuacao.py).
     """
     bateria_json = bateria_obj.to_json()
     
-    if bateria_obj.questionario:
-        bateria_json['questionario'] = bateria_obj.questionario.to_json()
-        respostas = bateria_obj.respostas if bateria_obj.respostas else {}
-        
-        sessoes_list_para_bateria = []
-        for sessao_obj in bateria_obj.questionario.sessoes:
-            # Inicializar acumuladores para estatísticas da sessão
-            soma_pont_obtida_sessao = 0.0
-            soma_pont_max_sessao = 0.0
-            lista_pontuacoes_obtidas_sessao = []
-            perguntas_respondidas_com_valor_count = 0
-            
-            is_sessao_plotavel = False
-            if sessao_obj.perguntas:
-                primeiro_tipo_resposta_sessao = sessao_obj.perguntas[0].tipo_resposta
-                todas_perguntas_mesmo_tipo = all(
-                    p.tipo_resposta == primeiro_tipo_resposta_sessao for p in sessao_obj.perguntas
-                )
-                tipo_uniforme_e_graficavel = primeiro_tipo_resposta_sessao in tipos_graficaveis_validos
-                todas_perguntas_tem_alternativas = all(p.alternativas for p in sessao_obj.perguntas)
-
-                if todas_perguntas_mesmo_tipo and tipo_uniforme_e_graficavel and todas_perguntas_tem_alternativas:
-                    is_sessao_plotavel = True
-
-            perguntas_list_para_sessao = []
-            for pergunta_obj in sessao_obj.perguntas:
-                alternativa_selecionada_id = respostas.get(str(pergunta_obj.id))
-                alternativa_selecionada_texto = None
-                alternativa_selecionada_valor = None
-
-                if alternativa_selecionada_id and pergunta_obj.alternativas:
-                    alt_escolhida = next(
-                        (alt for alt in pergunta_obj.alternativas if str(alt.id) == str(alternativa_selecionada_id)),
-                        None
-                    )
-                    if alt_escolhida:
-                        alternativa_selecionada_texto = alt_escolhida.texto
-                        alternativa_selecionada_valor = alt_escolhida.valor
-                
-                pergunta_info = {
-                    "pergunta_id": str(pergunta_obj.id),
-                    "pergunta_texto": pergunta_obj.texto,
-                    "tipo_resposta": pergunta_obj.tipo_resposta,
-                    "resposta_id": alternativa_selecionada_id,
-                    "resposta_texto": alternativa_selecionada_texto,
-                    "resposta_valor_escolhido": alternativa_selecionada_valor,
-                    "alternativas_disponiveis": [
-                        {"alternativa_id": alt.id, "texto": alt.texto, "valor": alt.valor}
-                        for alt in pergunta_obj.alternativas
-                    ]
-                }
-
-                if is_sessao_plotavel and \
-                   pergunta_obj.tipo_resposta in tipos_graficaveis_validos and \
-                   pergunta_obj.alternativas:
-                    
-                    valores_alt_pergunta = [alt.valor for alt in pergunta_obj.alternativas if alt.valor is not None]
-                    pontuacao_maxima_pergunta = float(max(valores_alt_pergunta)) if valores_alt_pergunta else 0.0
-                    pergunta_info["pontuacao_maxima_possivel_pergunta"] = pontuacao_maxima_pergunta
-                    soma_pont_max_sessao += pontuacao_maxima_pergunta
-
-                    if alternativa_selecionada_valor is not None:
-                        soma_pont_obtida_sessao += float(alternativa_selecionada_valor)
-                        lista_pontuacoes_obtidas_sessao.append(float(alternativa_selecionada_valor))
-                        perguntas_respondidas_com_valor_count += 1
-                    
-                    # Estatísticas por alternativa da pergunta
-                    estatisticas_alternativas_pergunta = []
-                    for alt_obj_stats in pergunta_obj.alternativas:
-                        contagem_abs = 1 if alternativa_selecionada_id and alt_obj_stats.id == alternativa_selecionada_id else 0
-                        # Para uma única avaliação, a relativa é 100% se escolhida, 0% caso contrário.
-                        contagem_rel = 100.0 if contagem_abs == 1 else 0.0 
-                        estatisticas_alternativas_pergunta.append({
-                            "alternativa_id": alt_obj_stats.id,
-                            "alternativa_texto": alt_obj_stats.texto,
-                            "valor": alt_obj_stats.valor,
-                            "contagem_absoluta": contagem_abs,
-                            "contagem_relativa_percentual": contagem_rel 
-                        })
-                    pergunta_info["estatisticas_alternativas_pergunta"] = estatisticas_alternativas_pergunta
-
-                perguntas_list_para_sessao.append(pergunta_info)
-            
-            sessao_info_para_bateria = sessao_obj.to_json()
-            sessao_info_para_bateria['perguntas_com_respostas'] = perguntas_list_para_sessao
-            sessao_info_para_bateria['is_plotavel'] = is_sessao_plotavel
-
-            if is_sessao_plotavel:
-                moda_pontuacao = []
-                if lista_pontuacoes_obtidas_sessao:
-                    count = Counter(lista_pontuacoes_obtidas_sessao)
-                    if count: # Garante que o contador não está vazio
-                        max_freq = max(count.values())
-                        moda_pontuacao = [k for k, v in count.items() if v == max_freq]
-
-                sessao_info_para_bateria['estatisticas_sessao'] = {
-                    "total_pontuacao_obtida": soma_pont_obtida_sessao,
-                    "total_pontuacao_maxima_possivel": soma_pont_max_sessao,
-                    "media_pontuacao_obtida_por_pergunta_respondida": (soma_pont_obtida_sessao / perguntas_respondidas_com_valor_count) if perguntas_respondidas_com_valor_count > 0 else 0.0,
-                    "moda_pontuacao_obtida_nas_perguntas": moda_pontuacao,
-                    "percentual_aproveitamento": (soma_pont_obtida_sessao / soma_pont_max_sessao * 100) if soma_pont_max_sessao > 0 else 0.0
-                }
-
-            sessoes_list_para_bateria.append(sessao_info_para_bateria)
-        bateria_json['sessoes_detalhadas'] = sessoes_list_para_bateria
-    else:
+    if not snapshot_questionario:
         bateria_json['questionario'] = None
         bateria_json['sessoes_detalhadas'] = []
+        return bateria_json
+
+    arvore = snapshot_questionario.arvore
+    compilado = pontuacao.obter_compilado(snapshot_questionario)
+    respostas = bateria_obj.respostas if bateria_obj.respostas else {}
+    if estatisticas_por_sessao is None:
+        estatisticas_por_sessao = compilado.pontuar(respostas)
+
+    bateria_json['questionario'] = questionario_cache.sem_filhos(arvore, 'sessoes')
+    sessoes_list_para_bateria = []
+    for sessao_obj in arvore['sessoes']:
+        is_sessao_plotavel = sessao_obj['id'] in estatisticas_por_sessao
+
+        perguntas_list_para_sessao = []
+        for pergunta_obj in sessao_obj['perguntas']:
+            alternativa_selecionada_id = respostas.get(str(pergunta_obj['id']))
+            alt_escolhida = compilado.alternativa_escolhida(pergunta_obj['id'], alternativa_selecionada_id)
+
+            pergunta_info = {
+                "pergunta_id": str(pergunta_obj['id']),
+                "pergunta_texto": pergunta_obj['texto'],
+                "tipo_resposta": pergunta_obj['tipo_resposta'],
+                "resposta_id": alternativa_selecionada_id,
+                "resposta_texto": alt_escolhida['texto'] if alt_escolhida else None,
+                "resposta_valor_escolhido": alt_escolhida['valor'] if alt_escolhida else None,
+                "alternativas_disponiveis": [
+                    {"alternativa_id": alt['id'], "texto": alt['texto'], "valor": alt['valor']}
+                    for alt in pergunta_obj['alternativas']
+                ]
+            }
+
+            if is_sessao_plotavel:
+                coluna = compilado.indice_pergunta[str(pergunta_obj['id'])]
+                pergunta_info["pontuacao_maxima_possivel_pergunta"] = float(compilado.maximo_pergunta[coluna])
+
+                # Estatísticas por alternativa da pergunta
+                # Para uma única avaliação, a relativa é 100% se escolhida, 0% caso contrário.
+                estatisticas_alternativas_pergunta = []
+                for alt_obj_stats in pergunta_obj['alternativas']:
+                    contagem_abs = 1 if alternativa_selecionada_id and alt_obj_stats['id'] == alternativa_selecionada_id else 0
+                    estatisticas_alternativas_pergunta.append({
+                        "alternativa_id": alt_obj_stats['id'],
+                        "alternativa_texto": alt_obj_stats['texto'],
+                        "valor": alt_obj_stats['valor'],
+                        "contagem_absoluta": contagem_abs,
+                        "contagem_relativa_percentual": 100.0 if contagem_abs == 1 else 0.0
+                    })
+                pergunta_info["estatisticas_alternativas_pergunta"] = estatisticas_alternativas_pergunta
+
+            perguntas_list_para_sessao.append(pergunta_info)
+        
+        sessao_info_para_bateria = questionario_cache.sem_filhos(sessao_obj, 'perguntas')
+        sessao_info_para_bateria['perguntas_com_respostas'] = perguntas_list_para_sessao
+        sessao_info_para_bateria['is_plotavel'] = is_sessao_plotavel
+        if is_sessao_plotavel:
+            sessao_info_para_bateria['estatisticas_sessao'] = estatisticas_por_sessao[sessao_obj['id']]
+
+        sessoes_list_para_bateria.append(sessao_info_para_bateria)
+    bateria_json['sessoes_detalhadas'] = sessoes_list_para_bateria
     return bateria_json
 
 @avaliacao_bp.route('/estatisticas/<avaliacao_id>', methods=['GET'])
@@ -403,11 +359,7 @@ def get_avaliacao_estatisticas_laudo(avaliacao_id):
     """
     try:
         avaliacao = Avaliacao.query.options(
-            selectinload(Avaliacao.baterias_testes)
-                .selectinload(BateriaTestes.questionario)
-                .selectinload(Questionario.sessoes)
-                .selectinload(Sessao.perguntas)
-                .selectinload(Pergunta.alternativas),
+            selectinload(Avaliacao.baterias_testes),
             joinedload(Avaliacao.paciente)
         ).options(joinedload(Avaliacao.medico)).get(avaliacao_id) # Adicionado joinedload para Medico
 
@@ -422,7 +374,7 @@ def get_avaliacao_estatisticas_laudo(avaliacao_id):
             "avaliacao_id": avaliacao.id,
             "fechada": avaliacao.fechada,
             "paciente_nome": avaliacao.paciente.nome,
-            "data_avaliacao": avaliacao.data_inicio.isoformat() if avaliacao.data_inicio else None,
+            "data_avaliacao": avaliacao.data_inicio,
             "paciente_id": avaliacao.paciente.id, # Mantido para compatibilidade, mas o objeto completo estará disponível
             "perfil_de_saude_detalhado": None, 
             "outras_baterias": [],
@@ -430,17 +382,6 @@ def get_avaliacao_estatisticas_laudo(avaliacao_id):
             "medico": avaliacao.medico.to_json() if avaliacao.medico else None       # Adicionado objeto Medico completo
         }
 
-        # Definindo os tipos de resposta que consideramos graficáveis
-        TIPOS_RESPOSTA_GRAFICAVEIS_VALIDOS = [
-            'booleano', 
-            'escala_likert_3', 
-            'escala_likert_4', 
-            'escala_likert_5',
-            'escala_likert_10', # Adicionado conforme padrão comum
-            'multipla_escolha_unica', # Adicionado conforme padrão comum
-            'escolha_personalizada' # Mantido, assumindo que 'personalizado' aqui se refere a uma escolha com alternativas
-        ]
-
         titulo_perfil_saude_config = current_app.config.get('PERFIL_DE_SAUDE') # Ajustado para PERFIL_DE_SAUDE_TITULO se essa for a chave correta
         
         # 1. Buscar e processar a bateria "Perfil de Saúde" para o paciente desta avaliação
@@ -450,27 +391,38 @@ def get_avaliacao_estatisticas_laudo(avaliacao_id):
             
             if perfil_de_saude_questionario:
                 # Depois, buscar a BateriaTestes associada a este paciente e a este questionário
-                # É importante carregar as relações para que _build_detailed_bateria_json funcione corretamente
-                perfil_de_saude_bateria_obj = BateriaTestes.query.options(
-                    selectinload(BateriaTestes.questionario)
-                        .selectinload(Questionario.sessoes)
-                        .selectinload(Sessao.perguntas)
-                        .selectinload(Pergunta.alternativas)
-                ).filter_by(
+                perfil_de_saude_bateria_obj = BateriaTestes.query.filter_by(
                     paciente_id=avaliacao.paciente_id,
                     questionario_id=perfil_de_saude_questionario.id
                 ).order_by(BateriaTestes.data_aplicacao.desc()).first() # Pega a mais recente, caso haja múltiplas
 
                 if perfil_de_saude_bateria_obj:
+                    snapshots_perfil = questionario_cache.obter_snapshots([perfil_de_saude_bateria_obj.questionario_id])
+                    estatisticas_perfil = bateria_scores.estatisticas_por_bateria([perfil_de_saude_bateria_obj], snapshots_perfil)
+                    percentis.anexar_percentis([perfil_de_saude_bateria_obj], estatisticas_perfil)
                     payload['perfil_de_saude_detalhado'] = _build_detailed_bateria_json(
                         perfil_de_saude_bateria_obj, 
-                        TIPOS_RESPOSTA_GRAFICAVEIS_VALIDOS, 
-                        current_app.config
+                        snapshots_perfil.get(perfil_de_saude_bateria_obj.questionario_id),
+                        current_app.config,
+                        estatisticas_perfil.get(perfil_de_saude_bateria_obj.id)
                     )
 
         # 2. Processar as baterias que estão diretamente ligadas à 'avaliacao' atual
+        # As árvores dos questionários vêm do cache versionado (uma única consulta de versões)
+        # e as pontuações das sessões, das linhas pré-calculadas em bateria_scores;
+        # o percentil populacional de cada sessão vem dos sketches de utils/percentis.py
+        snapshots = questionario_cache.obter_snapshots(
+            [bateria.questionario_id for bateria in avaliacao.baterias_testes]
+        )
+        estatisticas = bateria_scores.estatisticas_por_bateria(avaliacao.baterias_testes, snapshots)
+        percentis.anexar_percentis(avaliacao.baterias_testes, estatisticas)
         for bateria_da_avaliacao_obj in avaliacao.baterias_testes:
-            bateria_detalhada_json = _build_detailed_bateria_json(bateria_da_avaliacao_obj, TIPOS_RESPOSTA_GRAFICAVEIS_VALIDOS, current_app.config)
+            bateria_detalhada_json = _build_detailed_bateria_json(
+                bateria_da_avaliacao_obj,
+                snapshots.get(bateria_da_avaliacao_obj.questionario_id),
+                current_app.config,
+                estatisticas.get(bateria_da_avaliacao_obj.id)
+            )
             payload['outras_baterias'].append(bateria_detalhada_json)
         
         return jsonify(payload), 200
@@ -3,11 +3,37 @@ from models import Alternativa, BateriaTestes, Pergunta, ProfissionalSaude, Paci
 from extensions import db
 from datetime import datetime
 from utils.auth import token_required
-from sqlalchemy import exc
-from dateutil.relativedelta import relativedelta
+from utils import bateria_scores, percentis, questionario_busca, questionario_cache, respostas_itens, rollups
+from sqlalchemy import exc, func, select
+import ulid
 
 bateria_testes_bp = Blueprint('baterias_testes', 'baterias_testes')
 
+
+def _dados_das_baterias(baterias):
+    """
+    Carrega de uma vez os dados exibidos junto de uma lista de baterias: os
+    questionários por id, a quantidade de perguntas de cada um e o nome dos
+    profissionais por id. São três consultas, qualquer que seja o número de baterias.
+    """
+    questionario_ids = {b.questionario_id for b in baterias if b.questionario_id}
+    profissional_ids = {b.profissional_saude_id for b in baterias if b.profissional_saude_id}
+    questionarios, qtd_perguntas, nomes_profissionais = {}, {}, {}
+    if questionario_ids:
+        questionarios = {q.id: q for q in Questionario.query.filter(Questionario.id.in_(questionario_ids))}
+        qtd_perguntas = dict(db.session.execute(
+            select(Sessao.questionario_id, func.count(Pergunta.id))
+            .join(Pergunta, Pergunta.sessao_id == Sessao.id)
+            .where(Sessao.questionario_id.in_(questionario_ids))
+            .group_by(Sessao.questionario_id)
+        ).all())
+    if profissional_ids:
+        nomes_profissionais = dict(db.session.execute(
+            select(ProfissionalSaude.id, ProfissionalSaude.nome).where(ProfissionalSaude.id.in_(profissional_ids))
+        ).all())
+    return questionarios, qtd_perguntas, nomes_profissionais
+
+
 # Rota para listar todas as baterias de testes
 @bateria_testes_bp.route('', methods=['GET'])
 @token_required(roles=['admin', 'profissional_saude'])
@@ -44,6 +70,11 @@ def create_bateria_teste():
             is_completo=data.get('is_completo', False)
         )
         db.session.add(bateria)
+        db.session.flush()
+        if bateria.respostas:
+            bateria_scores.materializar([bateria])
+            respostas_itens.sincronizar([bateria])
+            percentis.registrar_conclusoes([bateria])
         db.session.commit()
         return jsonify(bateria.to_json()), 201
     except Exception as e:
@@ -76,8 +107,15 @@ def complete_bateria_teste(id):
             return jsonify({'error': 'Bateria de testes não encontrada'}), 404
 
         # Atualiza o status da bateria para completo
+        ja_completa = bateria.is_completo
         bateria.is_completo = True
         bateria.respostas = data.get('respostas', bateria.respostas)
+        # Pontuações por sessão e respostas normalizadas gravadas na mesma transação das respostas
+        bateria_scores.materializar([bateria])
+        respostas_itens.sincronizar([bateria])
+        if not ja_completa:
+            # Só a conclusão alimenta os sketches de percentil; ver utils/percentis.py
+            percentis.registrar_conclusoes([bateria])
         
         db.session.commit()
         return jsonify(bateria.to_json()), 200
@@ -98,8 +136,10 @@ def update_bateria_teste_respostas(id):
         if not bateria:
             return jsonify({'error': 'Bateria de testes não encontrada'}), 404
 
-        # Atualiza apenas as respostas
+        # Atualiza apenas as respostas (e as tabelas derivadas, na mesma transação)
         bateria.respostas = data.get('respostas', bateria.respostas)
+        bateria_scores.materializar([bateria])
+        respostas_itens.sincronizar([bateria])
         
         db.session.commit()
         return jsonify(bateria.to_json()), 200
@@ -139,40 +179,16 @@ def get_baterias_by_paciente(paciente_id):
       }]
     """
     baterias = BateriaTestes.query.filter_by(paciente_id=paciente_id).all()
+    questionarios, qtd_perguntas, nomes_profissionais = _dados_das_baterias(baterias)
     result = []
     for bateria in baterias:
-        # Busca a instância do questionário associado à bateria
-        questionario = Questionario.query.get(bateria.questionario_id)
-        # Carrega o questionário completo com sessões e perguntas
-        qtd_perguntas = 0
-        nome_profissional = None
-        if bateria.profissional_saude_id:
-            profissional = ProfissionalSaude.query.get(bateria.profissional_saude_id)
-            if profissional:
-                nome_profissional = profissional.nome
-        try:
-            questionario_completo = Questionario.query.options(
-                db.joinedload(Questionario.sessoes)
-                  .joinedload(Sessao.perguntas)
-            ).get(bateria.questionario_id)
-
-            if questionario_completo is None:
-                raise Exception("Questionário não encontrado")
-
-            for sessao in questionario_completo.sessoes:
-                for pergunta in sessao.perguntas:
-                    qtd_perguntas += 1
-        except Exception as e:
-            print(f"Erro ao carregar questionário: {e}")
-            return jsonify({'error': 'Erro ao carregar questionário'}), 500
+        questionario = questionarios.get(bateria.questionario_id)
         if questionario:
             result.append({
                 'bateria': bateria.to_json(),
-                'qtd_perguntas': qtd_perguntas,
+                'qtd_perguntas': qtd_perguntas.get(questionario.id, 0),
                 'questionario': questionario.to_json(),
-                'nome_profissional': nome_profissional
-                
-                
+                'nome_profissional': nomes_profissionais.get(bateria.profissional_saude_id)
             })
     return jsonify(result), 200
 
@@ -246,6 +262,7 @@ def batch_save_baterias_testes():
             data_aplicacao = datetime.strptime(item['data_aplicacao'], '%Y-%m-%d').date()
 
             bateria = BateriaTestes(
+                id=str(ulid.ULID()),  # Gerado aqui para materializar pontuações e respostas no mesmo lote
                 profissional_saude_id=profissional_saude_id,
                 paciente_id=item['paciente_id'],
                 colaborador_id=item.get('colaborador_id'),
@@ -258,7 +275,13 @@ def batch_save_baterias_testes():
             
             baterias.append(bateria)
 
-        db.session.bulk_save_objects(baterias)
+        # add_all (e não bulk_save_objects) para que o flush atualize os rollups do dashboard
+        db.session.add_all(baterias)
+        db.session.flush()
+        baterias_com_respostas = [bateria for bateria in baterias if bateria.respostas]
+        bateria_scores.materializar(baterias_com_respostas)
+        respostas_itens.sincronizar(baterias_com_respostas)
+        percentis.registrar_conclusoes(baterias_com_respostas)
         db.session.commit()
         return jsonify({'message': 'Baterias de testes salvas com sucesso'}), 201
     except exc.SQLAlchemyError as e:
@@ -331,30 +354,12 @@ def get_bateria_teste_completo(id):
     if not bateria:
         return jsonify({'error': 'Bateria de testes não encontrada'}), 404
 
-    questionario = Questionario.query.get(bateria.questionario_id)
-    if not questionario:
+    snapshot = questionario_cache.obter_snapshot(bateria.questionario_id)
+    if not snapshot:
         return jsonify({'error': 'Questionário não encontrado'}), 404
 
-    # Carrega as sessões do questionário, juntamente com as perguntas e alternativas
-    sessoes = Sessao.query.filter_by(questionario_id=questionario.id).all()
-    sessoes_json = []
-    for sessao in sessoes:
-        perguntas = Pergunta.query.filter_by(sessao_id=sessao.id).all()
-        perguntas_json = []
-        for pergunta in perguntas:
-            alternativas = Alternativa.query.filter_by(pergunta_id=pergunta.id).all()
-            alternativas_json = [alternativa.to_json() for alternativa in alternativas]
-            
-            pergunta_json = pergunta.to_json()
-            pergunta_json['alternativas'] = alternativas_json
-            perguntas_json.append(pergunta_json)
-        
-        sessao_json = sessao.to_json()
-        sessao_json['perguntas'] = perguntas_json
-        sessoes_json.append(sessao_json)
-
-    questionario_json = questionario.to_json()
-    questionario_json['sessoes'] = sessoes_json
+    # Árvore completa (sessões, perguntas e alternativas) vinda do cache versionado
+    questionario_json = snapshot.arvore
 
     response = {
         'bateria': bateria.to_json(),
@@ -378,44 +383,36 @@ def get_baterias_by_profissional_id(profissional_id):
 @token_required(roles=['admin', 'profissional_saude'])
 def dashboard_profissional(profissional_id):
     """
-    Conta quantos pacientes têm pelo menos uma bateria de testes associada ao profissional de saúde.
-    Fornece estatísticas importantes para o dashboard.
+    Fornece estatísticas importantes para o dashboard do profissional de saúde:
+    totais de baterias (abertas e do mês corrente) e pacientes distintos atendidos
+    em cada um dos últimos 6 meses. Lido dos rollups diários (utils/rollups.py);
+    a lista de baterias fica em /dashboard_profissional/<profissional_id>/baterias.
     """
-    baterias_profissional = BateriaTestes.query.filter_by(profissional_saude_id=profissional_id).all()
-
-    # Total de baterias e baterias abertas
-    numero_total_baterias = len(baterias_profissional)
-    numero_total_baterias_abertas = len([bateria for bateria in baterias_profissional if not bateria.is_completo])
-
-    # IDs de pacientes únicos conectados ao profissional
-    pacientes_ids = {bateria.paciente_id for bateria in baterias_profissional}
-    qtd_pacientes = len(pacientes_ids)
-
-    # Evolução de pacientes conectados nos últimos 6 meses
-    hoje = datetime.now().date()
-    pacientes_por_mes = []
-    for i in range(6):
-        inicio_mes = (hoje - relativedelta(months=i)).replace(day=1)
-        fim_mes = (inicio_mes + relativedelta(months=1)) - relativedelta(days=1)
-        pacientes_mes = {bateria.paciente_id for bateria in baterias_profissional if inicio_mes <= bateria.data_aplicacao <= fim_mes}
-        pacientes_por_mes.append({
-            'mes': inicio_mes.strftime('%Y-%m'),
-            'qtd_pacientes': len(pacientes_mes)
-        })
+    try:
+        return jsonify(rollups.resumo_profissional(profissional_id)), 200
+    except Exception as e:
+        print(f"Erro ao montar o dashboard do profissional {profissional_id}: {e}")
+        return jsonify({'error': str(e)}), 500
 
-    # Inverter a ordem para exibir do mês mais antigo ao mais recente
-    pacientes_por_mes.reverse()
 
-    return jsonify({
-        'numero_total_baterias': numero_total_baterias,
-        'numero_total_baterias_abertas': numero_total_baterias_abertas,
-        'numero_total_baterias_por_profissional': numero_total_baterias,
-        'numero_total_baterias_abertas_por_profissional': numero_total_baterias_abertas,
-        'numero_baterias_ultimo_mes': len([bateria for bateria in baterias_profissional if bateria.data_aplicacao >= hoje.replace(day=1)]),
-        'numero_baterias_abertas_ultimo_mes': len([bateria for bateria in baterias_profissional if bateria.data_aplicacao >= hoje.replace(day=1) and not bateria.is_completo]),
-        'evolucao_pacientes': pacientes_por_mes,
-        'baterias_profissional': [bateria.to_json() for bateria in baterias_profissional],
-    }), 200
+@bateria_testes_bp.route('/dashboard_profissional/<profissional_id>/baterias', methods=['GET'])
+@bateria_testes_bp.route('/dashboard_profissional/<profissional_id>/baterias/<int:page>/<int:len>', methods=['GET'])
+@token_required(roles=['admin', 'profissional_saude'])
+def get_baterias_dashboard_profissional(profissional_id, page=1, len=10):
+    """
+    Lista paginada das baterias do profissional (mais recentes primeiro), que antes
+    vinha inteira no payload do dashboard.
+    """
+    try:
+        baterias = BateriaTestes.query.filter_by(profissional_saude_id=profissional_id).order_by(
+            BateriaTestes.data_aplicacao.desc(), BateriaTestes.id.desc()
+        ).paginate(page=page, per_page=len, error_out=False)
+        return jsonify({
+            'items': [bateria.to_json() for bateria in baterias.items],
+            'totalPages': baterias.pages
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
 #incluir no arquivo de produção
 
@@ -460,24 +457,28 @@ def get_baterias_by_nome_paciente(nome_paciente):
     
 
 @bateria_testes_bp.route('/titulo_descricao_questionario/<criterio>', methods=['GET'])
+@bateria_testes_bp.route('/titulo_descricao_questionario/<criterio>/<int:page>/<int:len>', methods=['GET'])
 @token_required(roles=['admin', 'profissional_saude'])
-def get_baterias_by_titulo_descricao_questionario(criterio):
+def get_baterias_by_titulo_descricao_questionario(criterio, page=None, len=10):
     """
-    Lista todas as baterias de testes de um grupo de questionários com um mesma substring no título ou descrição.
+    Lista as baterias de testes dos questionários encontrados pelo título ou descrição
+    (busca textual de utils/questionario_busca.py), das mais recentes às mais antigas.
+    A ordenação é feita no banco; com /<page>/<len> a resposta é paginada ({items, totalPages}).
     """
-    
-    questionarios = Questionario.query.filter(
-        (Questionario.titulo.ilike(f'%{criterio}%')) | 
-        (Questionario.descricao.ilike(f'%{criterio}%'))
-    ).all()
-    if not questionarios:
+    questionarios_ids = questionario_busca.buscar(criterio)
+    if not questionarios_ids:
         return jsonify({'error': 'Nenhum questionário encontrado com esse critério'}), 404
-    
-    questionarios_ids = [questionario.id for questionario in questionarios]
-    
-    baterias = BateriaTestes.query.filter(BateriaTestes.questionario_id.in_(questionarios_ids)).all()
-    baterias.sort(key=lambda x: x.data_aplicacao, reverse=True)
-    return jsonify([bateria.to_json() for bateria in baterias]), 200
+
+    baterias = BateriaTestes.query.filter(BateriaTestes.questionario_id.in_(questionarios_ids)).order_by(
+        BateriaTestes.data_aplicacao.desc(), BateriaTestes.id.desc()
+    )
+    if page is None:
+        return jsonify([bateria.to_json() for bateria in baterias]), 200
+    pagina = baterias.paginate(page=page, per_page=len, error_out=False)
+    return jsonify({
+        'items': [bateria.to_json() for bateria in pagina.items],
+        'totalPages': pagina.pages
+    }), 200
 
     
 
@@ -490,32 +491,14 @@ def get_baterias_by_avaliacao(avaliacao_id):
     Lista todas as baterias de testes de um avaliação especifica.
     """
     baterias = BateriaTestes.query.filter_by(avaliacao_id=avaliacao_id).all()
+    questionarios, qtd_perguntas, nomes_profissionais = _dados_das_baterias(baterias)
     result = []
     for bateria in baterias:
-        questionario = None
-        qtd_perguntas = 0
-        nome_profissional = None
-
-        if bateria.questionario_id:
-            questionario_obj = Questionario.query.options(
-                db.joinedload(Questionario.sessoes).joinedload(Sessao.perguntas)
-            ).get(bateria.questionario_id)
-            if questionario_obj:
-                questionario = questionario_obj.to_json() # Usar to_json() do modelo
-                for sessao_obj in questionario_obj.sessoes:
-                    qtd_perguntas += len(sessao_obj.perguntas)
-        
-        if bateria.profissional_saude_id:
-            profissional = ProfissionalSaude.query.get(bateria.profissional_saude_id)
-            if profissional:
-                nome_profissional = profissional.nome
-
+        questionario = questionarios.get(bateria.questionario_id)
         bateria_json = bateria.to_json()
-
-        bateria_json['questionario'] = questionario
-        bateria_json['qtd_perguntas'] = qtd_perguntas
-        bateria_json['nome_profissional'] = nome_profissional
-        
+        bateria_json['questionario'] = questionario.to_json() if questionario else None
+        bateria_json['qtd_perguntas'] = qtd_perguntas.get(bateria.questionario_id, 0) if questionario else 0
+        bateria_json['nome_profissional'] = nomes_profissionais.get(bateria.profissional_saude_id)
         result.append(bateria_json)
-        
+
     return jsonify(result), 200
\ No newline at end of file
@@ -5,6 +5,7 @@ from utils.mail import send_confirmation_email_and_set_password
 from extensions import db
 import jwt
 from utils.auth import token_required
+from utils import busca_pessoas, paginacao
 
 colaborador_bp = Blueprint('colaboradores', __name__)
 @colaborador_bp.route('/', methods=['GET'])
@@ -12,6 +13,8 @@ colaborador_bp = Blueprint('colaboradores', __name__)
 @token_required(roles=['admin', 'profissional_saude', 'colaborador'])
 def get_colaboradores_paginated(page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(Colaborador.query, [Colaborador.id], Colaborador.to_json, limite=len)
         page = int(page)
         len = int(len)
         colaboradores = Colaborador.query.paginate(page=page, per_page=len, error_out=False)
@@ -162,12 +165,7 @@ def get_colaborador_by_email(email):
 @token_required(roles=['admin', 'profissional_saude', 'colaborador'])
 def get_colaboradores_by_name(name, page=1, len=10):
     try:
-        page = int(page)
-        len = int(len)
-        colaboradores = Colaborador.query.filter(Colaborador.nome.ilike(f'%{name}%')).paginate(
-            page=page, per_page=len, error_out=False
-        )
-        return jsonify([colaborador.to_json() for colaborador in colaboradores.items]), 200
+        return busca_pessoas.filtrar_por_nome(Colaborador, name, int(page), int(len))
     except Exception as e:
         print(e)
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
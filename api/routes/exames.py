@@ -228,7 +228,10 @@ def download_all_avaliacao_exames(avaliacao_id):
     exames = Exame.query.filter_by(avaliacao_id=avaliacao_id).all()
     if not exames:
         abort(404, description="Nenhum exame encontrado para esta avaliação.")
-    paciente = Paciente.query.get(exames[0].paciente_id)
+    # Pacientes dos exames numa única consulta (em vez de um get por exame)
+    paciente_ids = {exame.paciente_id for exame in exames if exame.paciente_id}
+    pacientes = {p.id: p for p in Paciente.query.filter(Paciente.id.in_(paciente_ids))} if paciente_ids else {}
+    paciente = pacientes.get(exames[0].paciente_id)
     avaliacao = Avaliacao.query.get(exames[0].avaliacao_id)
     if not paciente or not avaliacao:
         abort(500, description="Dados de paciente ou avaliação não encontrados para os exames.")
@@ -246,7 +249,7 @@ def download_all_avaliacao_exames(avaliacao_id):
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for exame in exames:
                 # Para o nome do arquivo dentro do ZIP, precisamos do nome do paciente e data do exame
-                paciente_do_exame_obj = Paciente.query.get(exame.paciente_id)
+                paciente_do_exame_obj = pacientes.get(exame.paciente_id)
                 nome_paciente_formatado_zip = paciente_do_exame_obj.nome.upper().replace(' ', '_') if paciente_do_exame_obj else "PACIENTE_DESCONHECIDO"
                 data_exame_formatada_zip = exame.created_at.strftime('%Y%m%d')
 
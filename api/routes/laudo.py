@@ -3,8 +3,8 @@ from flask import Blueprint, request, jsonify
 from models import CID, BateriaTestes, Laudo, Paciente, Medico, User, Avaliacao # Adicionado Avaliacao
 from extensions import db
 from utils.auth import token_required
+from utils import cid_index, paginacao
 from flask import current_app
-import unidecode
 import os # Adicionado import do os aqui
 from utils.security import encrypt_data_for_qr, decrypt_data_from_qr, generate_qr_code_base64
 from sqlalchemy.orm import joinedload
@@ -81,6 +81,8 @@ def create_laudo():
 @token_required(roles=['admin', 'medico', 'paciente'])
 def get_laudos(page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(Laudo.query, [Laudo.id], Laudo.to_json, limite=len)
         page = int(page)
         len = int(len)
         pagination = Laudo.query.paginate(page=page, per_page=len, error_out=False)
@@ -221,16 +223,48 @@ def get_laudo_by_avaliacao(avaliacao_id):
         current_app.logger.error(f"Erro ao obter laudo para avaliação {avaliacao_id}. Erro: {str(e)}", exc_info=True)
         return jsonify({'error': str(e)}), 500
         
+def _limite_da_busca():
+    """
+    ?limit= das buscas de CID, entre 1 e cid_index.LIMITE_MAXIMO; None se inválido.
+    """
+    try:
+        limite = int(request.args.get('limit', cid_index.LIMITE_PADRAO))
+    except ValueError:
+        return None
+    return limite if 1 <= limite <= cid_index.LIMITE_MAXIMO else None
+
+
 @laudo_bp.route('/get_cid_by_description/<string:substring>', methods=['GET'])
 def get_cid_by_description(substring):
+    limite = _limite_da_busca()
+    if limite is None:
+        return jsonify({'error': f'limit deve ser um número inteiro entre 1 e {cid_index.LIMITE_MAXIMO}'}), 400
     try:
-        cids = CID.query.filter(CID.unidecode_descricao.contains(unidecode.unidecode(substring.lower()))).all()
-        return jsonify([cid.to_json() for cid in cids]), 200
+        # Busca no índice em memória (trigramas + prefixo do código), sem consultar o banco
+        return jsonify(cid_index.buscar(substring, limite)), 200
     except Exception as e:
         current_app.logger.error(f"Erro ao obter CIDs com substring {substring}. Erro: {str(e)}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
+@laudo_bp.route('/cid_search', methods=['GET'])
+def cid_search():
+    """
+    Autocomplete de CIDs: ?q=<texto ou código>&limit=<n>&fuzzy=1 (tolerante a erros de digitação).
+    """
+    consulta = request.args.get('q', '')
+    fuzzy = request.args.get('fuzzy') in ('1', 'true')
+    limite = _limite_da_busca()
+    if limite is None:
+        return jsonify({'error': f'limit deve ser um número inteiro entre 1 e {cid_index.LIMITE_MAXIMO}'}), 400
+    try:
+        orcamento_ms = current_app.config.get('CID_SEARCH_ORCAMENTO_MS', cid_index.ORCAMENTO_PADRAO_MS)
+        return jsonify(cid_index.pesquisar(consulta, limite, fuzzy, orcamento_ms)), 200
+    except Exception as e:
+        current_app.logger.error(f"Erro na busca de CIDs por '{consulta}'. Erro: {str(e)}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
 @laudo_bp.route("/get_disease_by_cid/<string:cid_id>", methods=["GET"])
 def get_disease_by_cid(cid_id):
     try:
@@ -294,7 +328,7 @@ def get_laudo_pdf_data(avaliacao_id):
     # Dados do Laudo
     laudo_info = {
         "id": laudo.id,
-        "data_emissao": laudo.data.isoformat() if laudo.data else None,
+        "data_emissao": laudo.data,
         "parecer": laudo.parecer,
         "abordagem_terapeutica": laudo.abordagem_terapeutica,
         "medico": {
@@ -308,16 +342,12 @@ def get_laudo_pdf_data(avaliacao_id):
 
     # Dados do Paciente
     paciente_info = paciente.to_json() if paciente else {}
-    if 'data_nascimento' in paciente_info and paciente_info['data_nascimento']:
-         # Garantir que data_nascimento seja string se já não for
-        if not isinstance(paciente_info['data_nascimento'], str):
-            paciente_info['data_nascimento'] = paciente.data_nascimento.isoformat()
 
 
     # Dados da Avaliação
     avaliacao_info = {
         "id": avaliacao.id,
-        "data_inicio": avaliacao.data_inicio.isoformat() if avaliacao.data_inicio else None,
+        "data_inicio": avaliacao.data_inicio,
         "unidade_saude": {
             "nome": unidade_saude.nome if unidade_saude else None,
             "cnpj": unidade_saude.cnpj if unidade_saude else None,
@@ -333,7 +363,7 @@ def get_laudo_pdf_data(avaliacao_id):
             questionario_data = {
                 "questionario_id": bt.questionario.id,
                 "titulo": bt.questionario.titulo,
-                "data_aplicacao": bt.data_aplicacao.isoformat() if bt.data_aplicacao else None,
+                "data_aplicacao": bt.data_aplicacao,
                 "score": bt.respostas.get("pontuacao_total") if isinstance(bt.respostas, dict) else None, # Assumindo que 'pontuacao_total' está em respostas
                 "fontes_literatura_formatadas": format_fontes_literatura(bt.questionario.fontes_literatura)
             }
@@ -6,6 +6,7 @@ from flask import current_app
 from utils.mail import send_confirmation_email_and_set_password
 import jwt
 from utils.auth import token_required
+from utils import busca_pessoas, paginacao
 
 medico_bp = Blueprint('medico', __name__, url_prefix='/medicos')
 
@@ -14,6 +15,8 @@ medico_bp = Blueprint('medico', __name__, url_prefix='/medicos')
 @medico_bp.route('/<page>/<len>', methods=['GET'])
 def get_medicos(page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(Medico.query, [Medico.id], Medico.to_json, limite=len)
         page = int(page)
         len = int(len)
         pagination = Medico.query.paginate(page=page, per_page=len, error_out=False)
@@ -216,13 +219,7 @@ def  get_medico_by_email(email):
 def  get_medicos_by_name(name, page=1, len=10):
     
     try:
-        page = int(page)
-        len = int(len)
-        medicos = Medico.query.filter(Medico.nome.ilike(f'%{name}%')).paginate(
-            page=page,
-            per_page=len,
-            error_out=False)
-        return jsonify([medico.to_json() for medico in medicos.items]), 200
+        return busca_pessoas.filtrar_por_nome(Medico, name, int(page), int(len))
     except Exception as e:
         
         print(e)
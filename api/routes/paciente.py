@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from flask import Blueprint, config, request, jsonify, current_app
 from models import Paciente, User
+from utils import bateria_scores, busca_pessoas, paginacao, perfis, pontuacao, questionario_cache
 from utils.mail import send_confirmation_email_and_set_password
 from extensions import db
 import jwt
@@ -12,6 +13,8 @@ paciente_bp = Blueprint('pacientes', __name__)
 @token_required(roles=['admin', 'profissional_saude', 'colaborador'])
 def get_pacientes_paginated(page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(Paciente.query, [Paciente.nome, Paciente.id], Paciente.to_json, limite=len)
         page = int(page)
         len = int(len)
         pacientes = Paciente.query.order_by(Paciente.nome).paginate(page=page, per_page=len, error_out=False)
@@ -171,6 +174,64 @@ def delete_paciente(id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 400
 
+@paciente_bp.route('/<id>/evolucao', methods=['GET'])
+@token_required(roles=['admin', 'profissional_saude', 'medico'])
+def get_evolucao_paciente(id):
+    """
+    Retorna a evolução das pontuações do paciente em um questionário (?questionario_id=),
+    uma série por sessão graficável, ordenada por data_aplicacao. As pontuações vêm de
+    bateria_scores; ?incluir_incompletas=1 inclui baterias ainda não concluídas.
+    """
+    questionario_id = request.args.get('questionario_id')
+    if not questionario_id:
+        return jsonify({'error': 'questionario_id é obrigatório'}), 400
+    try:
+        if not db.session.query(Paciente.id).filter_by(id=id).first():
+            return jsonify({'error': 'Paciente não encontrado'}), 404
+        snapshot = questionario_cache.obter_snapshot(questionario_id)
+        if snapshot is None:
+            return jsonify({'error': 'Questionário não encontrado'}), 404
+
+        somente_completas = request.args.get('incluir_incompletas') not in ('1', 'true')
+        serie = bateria_scores.serie_do_paciente(id, snapshot, somente_completas)
+        compilado = pontuacao.obter_compilado(snapshot)
+        sessoes = {sessao['id']: sessao for sessao in snapshot.arvore['sessoes']}
+
+        return jsonify({
+            'paciente_id': id,
+            'questionario_id': questionario_id,
+            'questionario_titulo': snapshot.arvore['titulo'],
+            'baterias': [
+                {
+                    'bateria_id': bateria.id,
+                    'avaliacao_id': bateria.avaliacao_id,
+                    'data_aplicacao': bateria.data_aplicacao,
+                    'is_completo': bateria.is_completo
+                }
+                for bateria, _ in serie
+            ],
+            'sessoes': [
+                {
+                    'sessao_id': sessao_id,
+                    'titulo': sessoes[sessao_id]['titulo'],
+                    'pontuacao_maxima': float(compilado.maximo_sessao[s]),
+                    'serie': [
+                        {
+                            'bateria_id': bateria.id,
+                            'data_aplicacao': bateria.data_aplicacao,
+                            'pontuacao_obtida': pontuacoes[sessao_id]['total_pontuacao_obtida'],
+                            'percentual_aproveitamento': pontuacoes[sessao_id]['percentual_aproveitamento'],
+                            'media_pontuacao_obtida_por_pergunta_respondida': pontuacoes[sessao_id]['media_pontuacao_obtida_por_pergunta_respondida']
+                        }
+                        for bateria, pontuacoes in serie
+                    ]
+                }
+                for s, sessao_id in enumerate(compilado.sessao_ids)
+            ]
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @paciente_bp.route('/email/<email>', methods=['GET'])
 @token_required(roles=['admin', 'profissional_saude', 'colaborador'])
 def get_paciente_by_email(email):
@@ -187,19 +248,16 @@ def get_paciente_by_email(email):
 @token_required(roles=['admin', 'profissional_saude', 'colaborador'])
 def get_paciente_by_name(name, page=1, len=10):
     try:
-        pacientes = Paciente.query.filter(Paciente.nome.ilike(f'%{name}%')).paginate(
-            page=page, per_page=len, error_out=False
-        )
-        return jsonify([paciente.to_json() for paciente in pacientes.items]), 200
+        return busca_pessoas.filtrar_por_nome(Paciente, name, page, len)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     
 @paciente_bp.route('/get_paciente_by_user_id/<user_id>', methods=['GET'])
 def get_paciente_by_user_id(user_id):
     try:
-        paciente = Paciente.query.filter_by(user_id=user_id).first()
-        if not paciente:
+        dados = perfis.perfis_do_usuario(user_id)
+        if not dados or not dados['paciente']:
             return jsonify({'error': 'Paciente não encontrado'}), 404
-        return jsonify(paciente.to_json()), 200
+        return jsonify(dados['paciente']), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
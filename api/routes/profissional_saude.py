@@ -7,6 +7,7 @@ from flask import current_app
 from utils.mail import send_confirmation_email_and_set_password
 import jwt
 from utils.auth import token_required
+from utils import busca_pessoas, paginacao
 profissional_saude_bp = Blueprint('profissionais_saude', __name__)
 
 
@@ -15,6 +16,8 @@ profissional_saude_bp = Blueprint('profissionais_saude', __name__)
 @token_required(roles=['admin', 'profissional_saude', 'paciente'])
 def get_profissionais_saude(page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(ProfissionalSaude.query, [ProfissionalSaude.id], ProfissionalSaude.to_json, limite=len)
         page = int(page)
         len = int(len)
         pagination = ProfissionalSaude.query.paginate(page=page, per_page=len, error_out=False)
@@ -223,13 +226,7 @@ def  get_profissional_saude_by_email(email):
 def  get_profissionais_saude_by_name(name, page=1, len=10):
     
     try:
-        page = int(page)
-        len = int(len)
-        profissionais_saude = ProfissionalSaude.query.filter(ProfissionalSaude.nome.ilike(f'%{name}%')).paginate(
-            page=page,
-            per_page=len,
-            error_out=False)
-        return jsonify([profissional_saude.to_json() for profissional_saude in profissionais_saude.items]), 200
+        return busca_pessoas.filtrar_por_nome(ProfissionalSaude, name, int(page), int(len))
     except Exception as e:
         
         print(e)
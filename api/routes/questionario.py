@@ -1,10 +1,12 @@
+import re
 from itertools import count
+from datetime import datetime
 from flask import Blueprint, request, jsonify, current_app
 from sqlalchemy import func
-from models import Alternativa, Questionario, Sessao, Pergunta, BateriaTestes
+from models import Questionario, Sessao, Pergunta, BateriaTestes
 from extensions import db
-from sqlalchemy.orm import joinedload
 from utils.auth import token_required
+from utils import paginacao, questionario_busca, questionario_cache, questionario_copia, respostas_itens
 questionario_bp = Blueprint('questionario', __name__)
 
 # Rota para listar todos os questionários
@@ -13,9 +15,12 @@ questionario_bp = Blueprint('questionario', __name__)
 @token_required(roles=['admin', 'profissional_saude'])
 def get_questionarios(page=1, len=10):
     """
-    Lista todos os questionários com paginação.
+    Lista todos os questionários com paginação (page/len ou, com ?cursor=, por cursor;
+    ver utils/paginacao.py).
     """
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(Questionario.query, [Questionario.id], Questionario.to_json, limite=len)
         page = int(page)
         len = int(len)
         questionarios = Questionario.query.paginate(page=page, per_page=len, error_out=False)
@@ -126,36 +131,16 @@ def get_sessoes_by_questionario(questionario_id):
 @token_required(roles=['admin', 'profissional_saude'])
 def get_questionarios_detailed(page=1, len=10):
     """
-    Lista todos os questionarios com todas as sessoes utilizando joinedload para carregamento otimizado.
+    Lista todos os questionarios com todas as sessoes. Pagina apenas os ids e monta
+    as árvores a partir do cache versionado.
     """
     try:
-        # Paginação com carregamento otimizado
-        questionarios_pag = Questionario.query.options(
-            joinedload(Questionario.sessoes)
-            .joinedload(Sessao.perguntas)
-            .joinedload(Pergunta.alternativas)
-        ).paginate(page=page, per_page=len, error_out=False)
-
-        # Montar o JSON hierárquico
-        questionarios_json = []
-        for questionario in questionarios_pag.items:
-            questionario_json = questionario.to_json()
-            questionario_json['sessoes'] = []
-
-            for sessao in questionario.sessoes:
-                sessao_json = sessao.to_json()
-                sessao_json['perguntas'] = []
-
-                for pergunta in sessao.perguntas:
-                    pergunta_json = pergunta.to_json()
-                    pergunta_json['alternativas'] = [
-                        alternativa.to_json() for alternativa in pergunta.alternativas
-                    ]
-                    sessao_json['perguntas'].append(pergunta_json)
-
-                questionario_json['sessoes'].append(sessao_json)
-
-            questionarios_json.append(questionario_json)
+        questionarios_pag = db.session.query(Questionario.id).order_by(Questionario.id).paginate(
+            page=page, per_page=len, error_out=False
+        )
+        ids = [row.id for row in questionarios_pag.items]
+        snapshots = questionario_cache.obter_snapshots(ids)
+        questionarios_json = [snapshots[qid].arvore for qid in ids if qid in snapshots]
 
         # Retornar o JSON hierárquico
         return jsonify({
@@ -174,35 +159,16 @@ def get_questionarios_detailed(page=1, len=10):
 @token_required(roles=['admin', 'profissional_saude'])
 def get_questionario_detailed(id):
     """
-    Retorna um questionário específico (por ID) com todas as sessões, perguntas e alternativas utilizando joinedload.
+    Retorna um questionário específico (por ID) com todas as sessões, perguntas e alternativas.
+    A árvore vem do cache versionado (utils/questionario_cache.py).
     """
     try:
-        # Carregar o questionário com todas as relações
-        questionario = Questionario.query.options(
-            joinedload(Questionario.sessoes)
-            .joinedload(Sessao.perguntas)
-            .joinedload(Pergunta.alternativas)
-        ).get(id)
+        snapshot = questionario_cache.obter_snapshot(id)
 
-        if not questionario:
+        if not snapshot:
             return jsonify({'error': 'Questionário não encontrado'}), 404
 
-        # Montar o JSON hierárquico
-        questionario_json = questionario.to_json()
-        questionario_json['sessoes'] = []
-
-        for sessao in questionario.sessoes:
-            sessao_json = sessao.to_json()
-            sessao_json['perguntas'] = []
-
-            for pergunta in sessao.perguntas:
-                pergunta_json = pergunta.to_json()
-                pergunta_json['alternativas'] = [
-                    alternativa.to_json() for alternativa in pergunta.alternativas
-                ]
-                sessao_json['perguntas'].append(pergunta_json)
-
-            questionario_json['sessoes'].append(sessao_json)
+        questionario_json = snapshot.arvore
 
         # Retornar o JSON hierárquico
         return jsonify(questionario_json), 200
@@ -218,15 +184,14 @@ def get_questionario_detailed(id):
 @token_required(roles=['admin', 'profissional_saude'])
 def find_by_title_or_description(search, page=1, len=10):
     """
-    Retorna questionários que contêm o termo de pesquisa no título ou na descrição.
+    Retorna questionários que contêm os termos de pesquisa no título ou na descrição,
+    ordenados por relevância (índice em memória, ver utils/questionario_busca.py).
     """
     try:
-        search = f"%{search}%"
-        questionarios = Questionario.query.filter(
-            (Questionario.titulo.ilike(search)) | (Questionario.descricao.ilike(search))
-        ).paginate(page=page, per_page=len, error_out=False)
-
-        return jsonify([questionario.to_json() for questionario in questionarios.items]), 200
+        page = max(page, 1)
+        ids = questionario_busca.buscar(search)[(page - 1) * len:page * len]
+        por_id = {questionario.id: questionario for questionario in Questionario.query.filter(Questionario.id.in_(ids))} if ids else {}
+        return jsonify([por_id[questionario_id].to_json() for questionario_id in ids if questionario_id in por_id]), 200
     except Exception as e:
         print(f"Erro ao buscar questionários: {e}")
         return jsonify({'error': str(e)}), 500
@@ -279,12 +244,70 @@ def has_baterias(id):
             'has_baterias': False
         }), 200
 
+@questionario_bp.route('/<string:id>/respostas/agregado', methods=['GET'])
+@token_required(roles=['admin', 'profissional_saude', 'medico'])
+def get_respostas_agregadas(id):
+    """
+    Retorna, para cada pergunta do questionário, quantas vezes cada alternativa foi
+    escolhida (baterias completas ou não). A contagem é feita no banco sobre respostas_itens.
+    """
+    try:
+        snapshot = questionario_cache.obter_snapshot(id)
+        if not snapshot:
+            return jsonify({'error': 'Questionário não encontrado'}), 404
+
+        totais, linhas = respostas_itens.contagens_por_alternativa(id, somente_completas=False)
+        return jsonify(respostas_itens.montar_agregado(snapshot, totais, linhas)), 200
+    except Exception as e:
+        print(f"Erro ao agregar respostas do questionário: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@questionario_bp.route('/<string:id>/distribuicao', methods=['GET'])
+@token_required(roles=['admin', 'profissional_saude', 'medico'])
+def get_distribuicao_alternativas(id):
+    """
+    Distribuição das alternativas escolhidas em cada pergunta, considerando todas as
+    baterias completas do questionário. Filtros opcionais (query string):
+    data_inicio e data_fim (YYYY-MM-DD, sobre data_aplicacao), unidade_saude_id e medico_id.
+    """
+    try:
+        data_inicio = request.args.get('data_inicio')
+        data_fim = request.args.get('data_fim')
+        data_inicio = datetime.strptime(data_inicio, '%Y-%m-%d').date() if data_inicio else None
+        data_fim = datetime.strptime(data_fim, '%Y-%m-%d').date() if data_fim else None
+    except ValueError:
+        return jsonify({'error': 'Datas devem estar no formato YYYY-MM-DD'}), 400
+
+    try:
+        snapshot = questionario_cache.obter_snapshot(id)
+        if not snapshot:
+            return jsonify({'error': 'Questionário não encontrado'}), 404
+
+        filtros = {
+            'data_inicio': data_inicio,
+            'data_fim': data_fim,
+            'unidade_saude_id': request.args.get('unidade_saude_id'),
+            'medico_id': request.args.get('medico_id')
+        }
+        totais, linhas = respostas_itens.contagens_por_alternativa(id, **filtros)
+
+        distribuicao = respostas_itens.montar_agregado(snapshot, totais, linhas)
+        distribuicao['filtros'] = filtros
+        return jsonify(distribuicao), 200
+    except Exception as e:
+        print(f"Erro ao calcular distribuição das alternativas: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @questionario_bp.route('/duplicate/<string:id>', methods=['POST'])
 @token_required(roles=['admin', 'profissional_saude'])
 def duplicate_questionario(id):
     """
     Duplica um questionário existente, todas suas sessões, perguntas e alternativas.
-    Atualiza o título para incluir a versão e define a nova versão.
+    Atualiza o título para incluir a versão e define a nova versão. As regras de
+    visibilidade das sessões passam a apontar para as perguntas e alternativas copiadas
+    (ver utils/questionario_copia.py).
     """
     try:
         # Obter dados da requisição
@@ -294,19 +317,14 @@ def duplicate_questionario(id):
         if not nova_versao:
             return jsonify({'error': 'É necessário fornecer uma nova versão'}), 400
         
-        # Carregar o questionário original com todas as relações
-        questionario_original = Questionario.query.options(
-            joinedload(Questionario.sessoes)
-            .joinedload(Sessao.perguntas)
-            .joinedload(Pergunta.alternativas)
-        ).get(id)
+        # Árvore completa do questionário original
+        snapshot = questionario_cache.obter_snapshot(id)
         
-        if not questionario_original:
+        if snapshot is None:
             return jsonify({'error': 'Questionário não encontrado'}), 404
         
         # Extrai o título base (removendo qualquer "(versão: X)" existente)
-        import re
-        titulo_base = re.sub(r'\s*\(versão:\s*[^)]*\)\s*', '', questionario_original.titulo)
+        titulo_base = re.sub(r'\s*\(versão:\s*[^)]*\)\s*', '', snapshot.arvore['titulo'])
         
         # Verifica se já existe um questionário com esse título base e a mesma versão
         novo_titulo = f"{titulo_base} (versão: {nova_versao})"
@@ -318,107 +336,10 @@ def duplicate_questionario(id):
                 'questionario_id': questionario_existente.id
             }), 409
         
-        # Iniciar transação
-        db.session.begin_nested()  # Cria um savepoint
-        
-        # Criar o novo questionário com o título limpo + nova versão
-        novo_questionario = Questionario(
-            titulo=novo_titulo,
-            descricao=questionario_original.descricao,
-            versao=nova_versao,  # Define a nova versão
-            fontes_literatura=questionario_original.fontes_literatura,
-            is_active=questionario_original.is_active
-        )
-        
-        db.session.add(novo_questionario)
-        db.session.flush()
-        
-        # Mapeamento para rastrear IDs antigos para novos
-        sessoes_map = {}  # {id_antigo: id_novo}
-        perguntas_map = {}  # {id_antigo: id_novo}
-        
-        # Duplicar sessões
-        for sessao_original in questionario_original.sessoes:
-            nova_sessao = Sessao(
-                questionario_id=novo_questionario.id,
-                titulo=sessao_original.titulo,
-                descricao=sessao_original.descricao,
-                ordem=sessao_original.ordem
-            )
-            db.session.add(nova_sessao)
-            db.session.flush()
-            
-            sessoes_map[sessao_original.id] = nova_sessao.id
-            
-            # Duplicar perguntas da sessão
-            for pergunta_original in sessao_original.perguntas:
-                nova_pergunta = Pergunta(
-                    sessao_id=nova_sessao.id,
-                    texto=pergunta_original.texto,
-                    tipo_resposta=pergunta_original.tipo_resposta,
-                    metodo_pontuacao=pergunta_original.metodo_pontuacao,
-                    ordem=pergunta_original.ordem
-                )
-                db.session.add(nova_pergunta)
-                db.session.flush()
-                
-                perguntas_map[pergunta_original.id] = nova_pergunta.id
-                
-                # Duplicar alternativas
-                for alternativa_original in pergunta_original.alternativas:
-                    nova_alternativa = Alternativa(
-                        pergunta_id=nova_pergunta.id,
-                        texto=alternativa_original.texto,
-                        valor=alternativa_original.valor,
-                        ordem=alternativa_original.ordem
-                    )
-                    db.session.add(nova_alternativa)
-        
-        # Verificar e duplicar lógica condicional das sessões
-        for sessao_original in questionario_original.sessoes:
-            if sessao_original.pergunta_condicional:  # Verifica se há uma pergunta condicional definida
-                nova_sessao_id = sessoes_map.get(sessao_original.id)
-                if nova_sessao_id:
-                    nova_sessao = Sessao.query.get(nova_sessao_id)
-                    # Copia o JSON existente
-                    nova_pergunta_condicional = sessao_original.pergunta_condicional.copy() if isinstance(sessao_original.pergunta_condicional, dict) else sessao_original.pergunta_condicional
-                    # Se for um dicionário e conter o id da pergunta, atualiza esse id com o novo valor se existir no mapeamento
-                    if isinstance(nova_pergunta_condicional, dict) and "id" in nova_pergunta_condicional:
-                        old_id = nova_pergunta_condicional["id"]
-                        if old_id in perguntas_map:
-                            nova_pergunta_condicional["id"] = perguntas_map[old_id]
-                    nova_sessao.pergunta_condicional = nova_pergunta_condicional
-                    # Caso haja respostas condicionais, simplesmente copie o JSON
-                    if sessao_original.respostas_condicionais:
-                        nova_sessao.respostas_condicionais = sessao_original.respostas_condicionais
-        
-        # Commit da transação
+        # Um INSERT em lote por nível da árvore, com os ids gerados antes da gravação
+        questionario_json = questionario_copia.copiar_arvore(snapshot.arvore, titulo=novo_titulo, versao=nova_versao)
         db.session.commit()
         
-        # Carregar o novo questionário completo para retorno
-        novo_questionario_completo = Questionario.query.options(
-            joinedload(Questionario.sessoes)
-            .joinedload(Sessao.perguntas)
-            .joinedload(Pergunta.alternativas)
-        ).get(novo_questionario.id)
-        
-        # Montar o JSON hierárquico para retorno
-        questionario_json = novo_questionario_completo.to_json()
-        questionario_json['sessoes'] = []
-        
-        for sessao in novo_questionario_completo.sessoes:
-            sessao_json = sessao.to_json()
-            sessao_json['perguntas'] = []
-            
-            for pergunta in sessao.perguntas:
-                pergunta_json = pergunta.to_json()
-                pergunta_json['alternativas'] = [
-                    alternativa.to_json() for alternativa in pergunta.alternativas
-                ]
-                sessao_json['perguntas'].append(pergunta_json)
-            
-            questionario_json['sessoes'].append(sessao_json)
-        
         return jsonify(questionario_json), 201
         
     except Exception as e:
@@ -4,6 +4,7 @@ from flask import Blueprint, request, jsonify
 from extensions import db
 from flask import current_app
 from utils.auth import token_required
+from utils import paginacao
 
 unidade_saude_bp = Blueprint('unidade_saude', __name__, url_prefix='/unidades_saude')
 
@@ -100,6 +101,8 @@ def delete_unidade_saude(id):
 @token_required(roles=['admin', 'medico', 'paciente', 'profissional_saude'])
 def get_unidades_saude_by_name(name, page=1, len=10):
     try:
+        if paginacao.modo_cursor():
+            return paginacao.responder(UnidadeSaude.query.filter(UnidadeSaude.nome.ilike(f'%{name}%')), [UnidadeSaude.nome, UnidadeSaude.id], UnidadeSaude.to_json, limite=len)
         page = int(page)
         len = int(len)
         pagination = UnidadeSaude.query.filter(UnidadeSaude.nome.ilike(f'%{name}%')).paginate(
@@ -6,19 +6,11 @@ from PIL import Image
 import io
 from utils.auth import token_required
 from flask import Blueprint, request, jsonify
-from models import (
-    Avaliacao,
-    BateriaTestes,
-    Colaborador,
-    Laudo,
-    Medico,
-    Paciente,
-    ProfissionalSaude,
-    Questionario,
-    User,
-)
+from models import User
 from extensions import db
-from utils.auth import token_required
+from utils import admin_metrics as metricas_admin
+from utils import busca_pessoas, paginacao, perfis, senhas
+from utils.auth import emitir_token, token_required
 
 user_bp = Blueprint("user", __name__)
 
@@ -124,32 +116,43 @@ def login():
     except Exception:
         return jsonify({"error": "Requisição inválida"}), 400
 
-    user = User.query.filter_by(email=email).first()
+    # Usuário e perfis numa única consulta
+    user = perfis.carregar_usuario(email=email)
 
     # Combina a verificação de usuário e senha por segurança e eficiência.
-    # Evita a enumeração de usuários e só busca perfis se a senha estiver correta.
-    if user is None or not user.check_password(password):
-        return jsonify({"error": "Credenciais inválidas"}), 401
-
-    # Busca os perfis associados apenas após a autenticação bem-sucedida
-    paciente = Paciente.query.filter_by(user_id=user.id).first()
-    colaborador = Colaborador.query.filter_by(user_id=user.id).first()
-    profissional_saude = ProfissionalSaude.query.filter_by(user_id=user.id).first()
-    medico = Medico.query.filter_by(user_id=user.id).first()
-
-    result = {
-        "user": user.to_json(),
-        "paciente": paciente.to_json() if paciente else None,
-        "colaborador": colaborador.to_json() if colaborador else None,
-        "profissional_saude": (
-            profissional_saude.to_json() if profissional_saude else None
-        ),
-        "medico": medico.to_json() if medico else None,
-    }
+    # Evita a enumeração de usuários. A senha é conferida no pool de processos de utils/senhas.py.
+    try:
+        if user is None or not senhas.verificar_senha(user.password_hash, password):
+            return jsonify({"error": "Credenciais inválidas"}), 401
+    except senhas.SenhasOcupadas as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
+    result = dict(perfis.guardar(user))
+    result["user"] = {**result["user"], "token": emitir_token(user)}
+
+    # Hash com parâmetros antigos: troca pelo de SENHA_HASH_METODO, já que a senha é conhecida
+    if senhas.precisa_rehash(user.password_hash):
+        try:
+            user.password_hash = senhas.gerar_hash(password)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning(f"Rehash da senha do usuário {user.id} não realizado: {e}")
 
     return jsonify(result), 200
 
 
+@user_bp.route("/perfil", methods=["GET"])
+@token_required()
+def perfil_atual():
+    """
+    Usuário autenticado e seus perfis, no formato da resposta do login (sem o token),
+    a partir do cache de utils/perfis.py.
+    """
+    dados = perfis.perfis_do_usuario(request.user.get("id"))
+    if dados is None:
+        return jsonify({"error": "Usuário não encontrado"}), 404
+    return jsonify(dados), 200
 
 
 @user_bp.route("/<string:user_id>/upload", methods=["POST"])
@@ -260,7 +263,8 @@ def get_profile_picture(user_id):
 @user_bp.route("/set_password", methods=["PUT"])
 def set_password():
     """
-    Rota para definir a senha de um usuário.
+    Rota para definir a senha de um usuário. Não emite token: a rota não é
+    autenticada, então o frontend faz o login normal com a senha nova.
     """
     data = request.get_json()
     id = data.get("id")
@@ -286,89 +290,48 @@ def set_password():
 def admin_metrics():
     """
     Rota para obter métricas de administração.
+    Devolve o snapshot mantido por utils/admin_metrics.py (com `calculado_em`);
+    ?fresh=1 recalcula antes de responder.
     """
+    try:
+        fresh = request.args.get("fresh") in ("1", "true")
+        snapshot = metricas_admin.obter(current_app._get_current_object(), fresh=fresh)
+        return jsonify(
+            {
+                **snapshot["metricas"],
+                "calculado_em": snapshot["calculado_em"],
+                "duracao_calculo_ms": snapshot["duracao_ms"],
+            }
+        )
+    except Exception as e:
+        current_app.logger.error(f"Erro ao calcular admin_metrics: {e}")
+        return jsonify({"error": str(e)}), 500
 
-    numero_usuarios = User.query.count()
-    numero_pacientes = Paciente.query.count()
-    pacientes_ultimos_30_dias = Paciente.query.filter(
-        Paciente.created_at >= datetime.datetime.now() - datetime.timedelta(days=30)
-    ).count()
-    numero_colaboradores = Colaborador.query.count()
-    numero_profissionais_saude = ProfissionalSaude.query.count()
-    numero_medicos = Medico.query.count()
-    numero_usuarios = User.query.count()
-    numero_usuarios_sem_autenticacao = User.query.filter_by(is_active=False).count()
-    baterias_aplicadas_total = BateriaTestes.query.count()
-    baterias_ultimos_30_dias = BateriaTestes.query.filter(
-        BateriaTestes.data_aplicacao
-        >= datetime.datetime.now() - datetime.timedelta(days=30)
-    ).count()
-    baterias_respondidas_ultimos_30_dias = BateriaTestes.query.filter(
-        BateriaTestes.data_aplicacao
-        >= datetime.datetime.now() - datetime.timedelta(days=30),
-        BateriaTestes.is_completo == True,
-    ).count()
-    questionarios_cadastrados = Questionario.query.count()
-    avaliacoes_cadastrados = Avaliacao.query.count()
-    laudos_emitidos = Laudo.query.count()
-    laudos_emitidos_ultimos_30_dias = Laudo.query.filter(
-        Laudo.updated_at >= datetime.datetime.now() - datetime.timedelta(days=30)
-    ).count()
-
-    return jsonify(
-        {
-            "numero_usuarios": numero_usuarios,
-            "numero_pacientes": numero_pacientes,
-            "pacientes_ultimos_30_dias": pacientes_ultimos_30_dias,
-            "numero_colaboradores": numero_colaboradores,
-            "numero_profissionais_saude": numero_profissionais_saude,
-            "numero_medicos": numero_medicos,
-            "numero_usuarios": numero_usuarios,
-            "numero_usuarios_sem_autenticacao": numero_usuarios_sem_autenticacao,
-            "baterias_aplicadas_total": baterias_aplicadas_total,
-            "baterias_ultimos_30_dias": baterias_ultimos_30_dias,
-            "baterias_respondidas_ultimos_30_dias": baterias_respondidas_ultimos_30_dias,
-            "questionarios_cadastrados": questionarios_cadastrados,
-            "avaliacoes_cadastrados": avaliacoes_cadastrados,
-            "laudos_emitidos": laudos_emitidos,
-            "laudos_emitidos_ultimos_30_dias": laudos_emitidos_ultimos_30_dias,
-        }
-    )
+
+@user_bp.route("/startup_report", methods=["GET"])
+@token_required(roles=["admin"])
+def startup_report():
+    """
+    Tempos da inicialização (create_app) do worker que atendeu a requisição e a
+    memória residente ao fim do boot (ver utils/inicializacao.py).
+    """
+    relatorio = current_app.extensions.get("inicializacao")
+    if relatorio is None:
+        return jsonify({"error": "Relatório de inicialização indisponível"}), 404
+    return jsonify(relatorio.to_json()), 200
 
 
 @user_bp.route("/find_user_by_name/<string:substring>", methods=["GET"])
 @token_required(roles=["admin"])
 def find_user_by_name(substring):
     """
-    rota que pesquisa nos 4 tipos de usuários pelo nome e retorna os objetos com id, nome e role
+    rota que pesquisa nos 4 tipos de usuários pelo nome e retorna os objetos com id, nome e role,
+    ordenados por relevância (tabela de busca de pessoas, ver utils/busca_pessoas.py).
+    Com ?cursor= a resposta é paginada por cursor ({items, next_cursor, prev_cursor}).
     """
-    pacientes = Paciente.query.filter(Paciente.nome.like(f"%{substring}%")).all()
-    medicos = Medico.query.filter(Medico.nome.like(f"%{substring}%")).all()
-    colaboradores = Colaborador.query.filter(
-        Colaborador.nome.like(f"%{substring}%")
-    ).all()
-    profissionais = ProfissionalSaude.query.filter(
-        ProfissionalSaude.nome.like(f"%{substring}%")
-    ).all()
-
-    result = []
-
-    for paciente in pacientes:
-        result.append(
-            {"id": paciente.user_id, "nome": paciente.nome, "role": "paciente"}
-        )
-    for medico in medicos:
-        result.append({"id": medico.id, "nome": medico.nome, "role": "medico"})
-    for colaborador in colaboradores:
-        result.append(
-            {"id": colaborador.id, "nome": colaborador.nome, "role": "colaborador"}
-        )
-    for profissional in profissionais:
-        result.append(
-            {"id": profissional.id, "nome": profissional.nome, "role": "profissional"}
-        )
-
-    return jsonify(result), 200
+    if paginacao.modo_cursor():
+        return busca_pessoas.responder(substring)
+    return jsonify(busca_pessoas.buscar(substring)), 200
 
 
 @user_bp.route("/all_admins/<int:page>/<int:len>", methods=["GET"])
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from app import create_app
 from extensions import db
 from models import Alternativa, Pergunta
+from utils.auth import emitir_token
 
 
 class AlternativaTestCase(unittest.TestCase):
@@ -35,9 +36,8 @@ class AlternativaTestCase(unittest.TestCase):
             db.session.flush()  # Salva o usuário no banco sem commit
             self.user_id = user.id  # Salva o ID do usuário
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
             # Cria uma pergunta de teste
             pergunta = Pergunta(
@@ -0,0 +1,76 @@
+import os
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+import jwt
+from app import create_app
+from utils import auth
+from utils.auth import token_required
+
+
+class AuthTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: uma rota de teste protegida por token_required.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        @self.app.route('/teste/protegida')
+        @token_required(roles=['admin'])
+        def protegida():
+            from flask import request
+            request.user['alterado'] = True  # não pode vazar para o cache
+            return {'role': request.user['role']}
+
+        auth.limpar_cache()
+
+    def token(self, role='admin', exp=None):
+        exp = exp or datetime.now(timezone.utc) + timedelta(hours=12)
+        return jwt.encode({'user_id': '1', 'role': role, 'exp': exp}, self.app.config['SECRET_KEY'], algorithm='HS256')
+
+    def get(self, token):
+        return self.client.get('/teste/protegida', headers={'Authorization': f'Bearer {token}'})
+
+    def test_cache(self):
+        """
+        Testa se o mesmo token é decodificado uma única vez e se a role continua verificada.
+        """
+        token = self.token()
+        hits = auth.stats()['hits']
+        with mock.patch('utils.auth.jwt.decode', wraps=jwt.decode) as decode:
+            for _ in range(3):
+                self.assertEqual(self.get(token).status_code, 200)
+            self.assertEqual(decode.call_count, 1)
+        self.assertEqual(auth.stats()['hits'] - hits, 2)
+        with self.app.app_context():
+            self.assertNotIn('alterado', auth.decodificar_token(token))
+
+        paciente = self.token(role='paciente')
+        self.assertEqual(self.get(paciente).status_code, 403)
+        self.assertEqual(self.get(paciente).status_code, 403)
+
+    def test_expiracao(self):
+        """
+        Testa se um token guardado no cache deixa de valer quando `exp` passa.
+        """
+        exp = int(time.time()) + 1
+        token = self.token(exp=exp)
+        self.assertEqual(self.get(token).status_code, 200)
+        time.sleep(max(0, exp - time.time()) + 0.05)
+        self.assertEqual(self.get(token).status_code, 401)
+
+    def test_troca_da_chave(self):
+        """
+        Testa se trocar a SECRET_KEY invalida os tokens do cache.
+        """
+        token = self.token()
+        self.assertEqual(self.get(token).status_code, 200)
+        self.app.config['SECRET_KEY'] = 'outra'
+        self.assertEqual(self.get(token).status_code, 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,349 @@
+import unittest
+import os
+from datetime import date
+from unittest import mock
+import ulid
+from sqlalchemy import insert
+from app import create_app
+from extensions import db
+from models import Alternativa, BateriaScore, BateriaTestes, Paciente, Pergunta, Questionario, RespostaItem, Sessao, SketchPontuacao, User
+from utils import bateria_scores, linhas_travadas, percentis, pontuacao, questionario_cache, respostas_itens
+from utils.auth import emitir_token
+from utils.quantis import KLLSketch
+
+
+class BateriaScoresTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: questionário com uma sessão graficável de duas perguntas
+        e uma bateria de testes sem respostas.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            self.token = emitir_token(user)
+
+            paciente = Paciente(nome='Paciente Teste', cpf='12345678901', data_nascimento=date(1990, 1, 1))
+            questionario = Questionario(titulo='Questionario Teste', descricao='Descricao Teste', versao='1.0')
+            db.session.add_all([paciente, questionario])
+            db.session.flush()
+
+            sessao = Sessao(questionario_id=questionario.id, titulo='Sessao Teste', ordem=1)
+            db.session.add(sessao)
+            db.session.flush()
+
+            self.alternativas = {}
+            for ordem in (1, 2):
+                pergunta = Pergunta(sessao_id=sessao.id, texto=f'Pergunta {ordem}', tipo_resposta='booleano', ordem=ordem)
+                db.session.add(pergunta)
+                db.session.flush()
+                sim = Alternativa(pergunta_id=pergunta.id, texto='Sim', valor=1, ordem=1)
+                nao = Alternativa(pergunta_id=pergunta.id, texto='Não', valor=0, ordem=2)
+                db.session.add_all([sim, nao])
+                db.session.flush()
+                self.alternativas[pergunta.id] = (sim.id, nao.id)
+
+            bateria = BateriaTestes(
+                paciente_id=paciente.id,
+                questionario_id=questionario.id,
+                data_aplicacao=date(2025, 4, 1),
+                is_completo=False
+            )
+            db.session.add(bateria)
+            db.session.commit()
+            self.sessao_id = sessao.id
+            self.questionario_id = questionario.id
+            self.bateria_id = bateria.id
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_update_respostas_materializa_scores(self):
+        """
+        Testa se PUT /backend/baterias_testes/<id>/respostas grava e regrava bateria_scores.
+        """
+        (p1, (p1_sim, p1_nao)), (p2, (p2_sim, _)) = self.alternativas.items()
+        headers = {'Authorization': f'Bearer {self.token}'}
+
+        response = self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_sim}},
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            scores = BateriaScore.query.filter_by(bateria_id=self.bateria_id).all()
+            self.assertEqual(len(scores), 1)
+            self.assertEqual(scores[0].sessao_id, self.sessao_id)
+            self.assertEqual(scores[0].pontuacao_obtida, 2.0)
+            self.assertEqual(scores[0].percentual, 100.0)
+
+        response = self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_nao}},
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            scores = BateriaScore.query.filter_by(bateria_id=self.bateria_id).all()
+            self.assertEqual(len(scores), 1)
+            self.assertEqual(scores[0].pontuacao_obtida, 0.0)
+            self.assertEqual(scores[0].perguntas_respondidas, 1)
+
+    def test_respostas_itens_e_agregado(self):
+        """
+        Testa a sincronização de respostas_itens e o endpoint de respostas agregadas.
+        """
+        (p1, (p1_sim, _)), (p2, (_, p2_nao)) = self.alternativas.items()
+        headers = {'Authorization': f'Bearer {self.token}'}
+
+        response = self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_nao, 'pergunta_inexistente': 'x'}},
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            self.assertEqual(RespostaItem.query.filter_by(bateria_id=self.bateria_id).count(), 2)
+            questionario_id = BateriaTestes.query.get(self.bateria_id).questionario_id
+
+        response = self.client.get(f'/backend/questionario/{questionario_id}/respostas/agregado', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['total_baterias'], 1)
+        self.assertEqual(data['total_pacientes'], 1)
+        pergunta = data['sessoes'][0]['perguntas'][0]
+        self.assertEqual(pergunta['total_respostas'], 1)
+        self.assertEqual([alt['contagem_absoluta'] for alt in pergunta['alternativas']], [1, 0])
+
+    def test_distribuicao_considera_apenas_completas_e_filtros(self):
+        """
+        Testa GET /backend/questionario/<id>/distribuicao com e sem filtro de período.
+        """
+        (p1, (p1_sim, _)), _ = self.alternativas.items()
+        headers = {'Authorization': f'Bearer {self.token}'}
+        with self.app.app_context():
+            questionario_id = BateriaTestes.query.get(self.bateria_id).questionario_id
+        url = f'/backend/questionario/{questionario_id}/distribuicao'
+
+        self.client.put(f'/backend/baterias_testes/{self.bateria_id}/respostas', json={'respostas': {p1: p1_sim}}, headers=headers)
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['total_baterias'], 0)
+
+        with self.app.app_context():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            bateria.is_completo = True
+            respostas_itens.sincronizar([bateria])
+            db.session.commit()
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['total_baterias'], 1)
+        self.assertEqual(data['sessoes'][0]['perguntas'][0]['alternativas'][0]['contagem_relativa_percentual'], 100.0)
+
+        data = self.client.get(f'{url}?data_fim=2025-03-31', headers=headers).get_json()
+        self.assertEqual(data['total_baterias'], 0)
+        self.assertEqual(data['filtros']['data_fim'], '2025-03-31')
+
+        response = self.client.get(f'{url}?data_inicio=01/04/2025', headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_evolucao_paciente(self):
+        """
+        Testa GET /backend/pacientes/<id>/evolucao a partir de bateria_scores e com
+        pontuação na hora quando as linhas estão ausentes.
+        """
+        (p1, (p1_sim, _)), (p2, (_, p2_nao)) = self.alternativas.items()
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_nao}},
+            headers=headers
+        )
+        with self.app.app_context():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            paciente_id, questionario_id = bateria.paciente_id, bateria.questionario_id
+        url = f'/backend/pacientes/{paciente_id}/evolucao?questionario_id={questionario_id}'
+
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['baterias'], [])
+        data = self.client.get(f'{url}&incluir_incompletas=1', headers=headers).get_json()
+        self.assertEqual(len(data['sessoes']), 1)
+        ponto = data['sessoes'][0]['serie'][0]
+        self.assertEqual((ponto['data_aplicacao'], ponto['percentual_aproveitamento']), ('2025-04-01', 50.0))
+
+        with self.app.app_context():
+            BateriaScore.query.delete()
+            db.session.commit()
+        data = self.client.get(f'{url}&incluir_incompletas=1', headers=headers).get_json()
+        self.assertEqual(data['sessoes'][0]['serie'][0]['pontuacao_obtida'], 1.0)
+
+        response = self.client.get(f'/backend/pacientes/{paciente_id}/evolucao', headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_versao_pontuacao(self):
+        """
+        Testa se editar o texto de uma pergunta mantém as linhas válidas e se mudar o
+        valor de uma alternativa faz a bateria ser pontuada na hora.
+        """
+        (p1, (p1_sim, _)), (p2, (p2_sim, _)) = self.alternativas.items()
+        self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_sim}},
+            headers={'Authorization': f'Bearer {self.token}'}
+        )
+
+        def estatisticas():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            snapshots = questionario_cache.obter_snapshots([bateria.questionario_id])
+            with mock.patch.object(pontuacao.QuestionarioCompilado, 'pontuar_lote',
+                                   autospec=True, side_effect=pontuacao.QuestionarioCompilado.pontuar_lote) as pontuar:
+                resultado = bateria_scores.estatisticas_por_bateria([bateria], snapshots)
+            return resultado[bateria.id][self.sessao_id], pontuar.call_count
+
+        with self.app.app_context():
+            versao = questionario_cache.obter_snapshot(self.questionario_id).versao
+            Pergunta.query.get(p1).texto = 'Pergunta 1 (corrigida)'
+            db.session.commit()
+            self.assertNotEqual(questionario_cache.obter_snapshot(self.questionario_id).versao, versao)
+            sessao, recalculos = estatisticas()
+            self.assertEqual((sessao['total_pontuacao_obtida'], recalculos), (2.0, 0))
+
+            Alternativa.query.get(p1_sim).valor = 3
+            db.session.commit()
+            sessao, recalculos = estatisticas()
+            self.assertEqual((sessao['total_pontuacao_obtida'], recalculos), (4.0, 1))
+
+    def test_backfill_scores(self):
+        """
+        Testa o comando `flask backfill-scores` para baterias gravadas sem pontuação.
+        """
+        (p1, (p1_sim, _)), _ = self.alternativas.items()
+        with self.app.app_context():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            bateria.respostas = {p1: p1_sim}
+            db.session.commit()
+            self.assertEqual(BateriaScore.query.count(), 0)
+
+        result = self.app.test_cli_runner().invoke(args=['backfill-scores'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            score = BateriaScore.query.filter_by(bateria_id=self.bateria_id).one()
+            self.assertEqual(score.pontuacao_obtida, 1.0)
+            self.assertEqual(score.moda, [1.0])
+
+    def test_percentil_populacional(self):
+        """
+        Testa o registro da conclusão no sketch, o comando `flask rebuild-percentis` e o
+        percentil anexado às estatísticas de sessão.
+        """
+        (p1, (p1_sim, _)), (p2, (_, p2_nao)) = self.alternativas.items()
+        self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_nao}},
+            headers={'Authorization': f'Bearer {self.token}'}
+        )
+        with self.app.app_context():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            self.assertEqual(percentis.registrar_conclusoes([bateria]), 0)
+            bateria.is_completo = True
+            self.assertEqual(percentis.registrar_conclusoes([bateria]), 1)
+            db.session.commit()
+            self.assertEqual(SketchPontuacao.query.one().total_baterias, 1)
+
+        result = self.app.test_cli_runner().invoke(args=['rebuild-percentis'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            sketch = SketchPontuacao.query.one()
+            self.assertEqual(sketch.total_baterias, 1)
+            self.assertIsNotNone(sketch.reconstruido_em)
+
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            estatisticas = {bateria.id: {
+                self.sessao_id: {'percentual_aproveitamento': 50.0},
+                'sessao_sem_sketch': {'percentual_aproveitamento': 50.0}
+            }}
+            percentis.anexar_percentis([bateria], estatisticas)
+            self.assertEqual(estatisticas[bateria.id][self.sessao_id]['percentil_populacional'], 50.0)
+            self.assertEqual(estatisticas[bateria.id][self.sessao_id]['populacao_referencia'], 1)
+            self.assertIsNone(estatisticas[bateria.id]['sessao_sem_sketch']['percentil_populacional'])
+
+    def test_manutencao_noturna(self):
+        """
+        Testa se `flask rebuild-percentis` ignora linhas de uma versao_pontuacao antiga e se
+        `flask manutencao-noturna` repontua a bateria antes de reconstruir os sketches.
+        """
+        (p1, (p1_sim, _)), (p2, (p2_sim, _)) = self.alternativas.items()
+        self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_sim}},
+            headers={'Authorization': f'Bearer {self.token}'}
+        )
+        with self.app.app_context():
+            BateriaTestes.query.get(self.bateria_id).is_completo = True
+            Alternativa.query.get(p1_sim).valor = 3
+            db.session.commit()
+
+        runner = self.app.test_cli_runner()
+        result = runner.invoke(args=['rebuild-percentis'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            self.assertEqual(SketchPontuacao.query.count(), 0)
+
+        result = runner.invoke(args=['manutencao-noturna', '--uma-vez'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            compilado = pontuacao.obter_compilado(questionario_cache.obter_snapshot(self.questionario_id))
+            score = BateriaScore.query.filter_by(bateria_id=self.bateria_id).one()
+            self.assertEqual((score.versao_pontuacao, score.pontuacao_obtida), (compilado.versao_pontuacao, 4.0))
+            self.assertEqual(SketchPontuacao.query.one().total_baterias, 1)
+
+        result = runner.invoke(args=['backfill-scores', '--desatualizadas'])
+        self.assertIn('Concluído: 0 baterias', result.output)
+
+    def test_sketch_criado_por_outra_conclusao(self):
+        """
+        Testa a primeira conclusão de uma sessão quando outra conclusão concorrente cria
+        a linha do sketch antes do INSERT: as duas entram no mesmo sketch.
+        """
+        (p1, (p1_sim, _)), (p2, (_, p2_nao)) = self.alternativas.items()
+        self.client.put(
+            f'/backend/baterias_testes/{self.bateria_id}/respostas',
+            json={'respostas': {p1: p1_sim, p2: p2_nao}},
+            headers={'Authorization': f'Bearer {self.token}'}
+        )
+        inserir = linhas_travadas._inserir_ignorando
+
+        def concorrente(session, modelo, linhas):
+            sketch = KLLSketch()
+            sketch.update(100.0)
+            session.execute(insert(SketchPontuacao), [{
+                'id': str(ulid.ULID()), 'questionario_id': bateria.questionario_id, 'sessao_id': self.sessao_id,
+                'sketch': sketch.to_dict(), 'total_baterias': 1
+            }])
+            inserir(session, modelo, linhas)
+
+        with self.app.app_context():
+            bateria = BateriaTestes.query.get(self.bateria_id)
+            bateria.is_completo = True
+            with mock.patch.object(linhas_travadas, '_inserir_ignorando', side_effect=concorrente):
+                self.assertEqual(percentis.registrar_conclusoes([bateria]), 1)
+            db.session.commit()
+            linha = SketchPontuacao.query.one()
+            self.assertEqual(linha.total_baterias, 2)
+            self.assertEqual(KLLSketch.from_dict(linha.sketch).n, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import os
+from datetime import date
+from app import create_app
+from extensions import db
+from models import Colaborador, Medico, Paciente, PessoaBusca, PessoaBuscaTrigrama, User
+from utils import busca_pessoas
+from utils.auth import emitir_token
+
+
+class BuscaPessoasTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: pacientes, um médico e um colaborador com nomes parecidos.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            admin = User(email='admin@example.com', is_active=True, role='admin')
+            admin.set_password('password123')
+            usuario_paciente = User(email='maria@example.com', is_active=True, role='paciente')
+            db.session.add_all([admin, usuario_paciente])
+            db.session.flush()
+            self.token = emitir_token(admin)
+            self.usuario_paciente_id = usuario_paciente.id
+
+            db.session.add_all([
+                Paciente(nome='Maria José da Silva', cpf='00000000001', data_nascimento=date(1990, 1, 1), user_id=usuario_paciente.id),
+                Paciente(nome='Ana Maria Souza', cpf='00000000002', data_nascimento=date(1990, 1, 1)),
+                Paciente(nome='Mariana Lopes', cpf='00000000003', data_nascimento=date(1990, 1, 1)),
+                Paciente(nome='Damião Alves', cpf='00000000004', data_nascimento=date(1990, 1, 1)),
+                Medico(nome='Márcia Silva', crm='1234'),
+                Colaborador(nome='Marília Costa', cpf='00000000005'),
+            ])
+            db.session.commit()
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def _get(self, url):
+        return self.client.get(url, headers={'Authorization': f'Bearer {self.token}'})
+
+    def test_busca_ordenada_por_relevancia(self):
+        """
+        Testa acentos, termos fora de ordem, a ordem por relevância e o id de cada papel.
+        """
+        with self.app.app_context():
+            nomes = [pessoa['nome'] for pessoa in busca_pessoas.buscar('MARIA')]
+            self.assertEqual(nomes, ['Maria José da Silva', 'Mariana Lopes', 'Ana Maria Souza'])
+            self.assertEqual([p['nome'] for p in busca_pessoas.buscar('silva jose')], ['Maria José da Silva'])
+            self.assertEqual([p['nome'] for p in busca_pessoas.buscar('damia')], ['Damião Alves'])
+            self.assertEqual(busca_pessoas.buscar('xyz'), [])
+            self.assertEqual(busca_pessoas.buscar(' - '), [])
+            self.assertEqual([p['nome'] for p in busca_pessoas.buscar('ia', ['medico', 'colaborador'])], ['Márcia Silva', 'Marília Costa'])
+
+        resposta = self._get('/backend/user/find_user_by_name/silva')
+        self.assertEqual(resposta.status_code, 200)
+        por_role = {pessoa['role']: pessoa for pessoa in resposta.get_json()}
+        self.assertEqual(set(por_role), {'paciente', 'medico'})
+        self.assertEqual(por_role['paciente']['id'], self.usuario_paciente_id)
+
+        pagina = self._get('/backend/user/find_user_by_name/mar?cursor=&limit=2&count=1').get_json()
+        self.assertEqual(pagina['total'], 5)
+        self.assertEqual(len(pagina['items']), 2)
+        seguinte = self._get(f"/backend/user/find_user_by_name/mar?cursor={pagina['next_cursor']}&limit=10").get_json()
+        self.assertEqual(len(seguinte['items']), 3)
+
+    def test_sincronizacao_e_filter_by_name(self):
+        """
+        Testa a atualização da tabela de busca ao renomear e remover e as rotas filter_by_name.
+        """
+        with self.app.app_context():
+            paciente = Paciente.query.filter_by(nome='Mariana Lopes').first()
+            paciente.nome = 'Juliana Lopes'
+            db.session.delete(Paciente.query.filter_by(nome='Damião Alves').first())
+            db.session.commit()
+            self.assertEqual([p['nome'] for p in busca_pessoas.buscar('lopes')], ['Juliana Lopes'])
+            self.assertEqual(busca_pessoas.buscar('damiao'), [])
+            self.assertEqual(PessoaBusca.query.count(), 5)
+
+            PessoaBuscaTrigrama.query.delete()
+            PessoaBusca.query.delete()
+            self.assertEqual(busca_pessoas.reconstruir(tamanho_lote=2), 5)
+            db.session.commit()
+
+        resposta = self._get('/backend/pacientes/filter_by_name/maria/1/10')
+        self.assertEqual([p['nome'] for p in resposta.get_json()], ['Maria José da Silva', 'Ana Maria Souza'])
+        resposta = self._get('/backend/medicos/filter_by_name/silva')
+        self.assertEqual([m['crm'] for m in resposta.get_json()], ['1234'])
+        resposta = self._get('/backend/pacientes/filter_by_name/maria/0/10')
+        self.assertEqual([p['nome'] for p in resposta.get_json()], ['Maria José da Silva', 'Ana Maria Souza'])
+
+    def test_init_db_preenche_tabela_vazia(self):
+        """
+        Testa se o init_db preenche a tabela de busca de um banco que já tinha pessoas
+        e não mexe nela quando já está preenchida.
+        """
+        from extensions import init_db
+
+        with self.app.app_context():
+            PessoaBuscaTrigrama.query.delete()
+            PessoaBusca.query.delete()
+            db.session.commit()
+            self.assertEqual(busca_pessoas.buscar('maria'), [])
+
+            init_db()
+            self.assertEqual(PessoaBusca.query.count(), 6)
+            self.assertEqual(len(busca_pessoas.buscar('maria')), 3)
+            self.assertEqual(busca_pessoas.preencher_se_vazia(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
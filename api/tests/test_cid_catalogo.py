@@ -0,0 +1,80 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from extensions import db
+from models import CID, CargaCatalogo
+from utils import cid_index
+from utils.cid_catalogo import carregar_cids, iterar_json_array
+
+CIDS = [
+    {'cid': 'F20.0', 'descricao': 'Esquizofrenia paranóide', 'unidecode_descricao': 'esquizofrenia paranoide'},
+    {'cid': 'F32.0', 'descricao': 'Episódio depressivo leve', 'unidecode': 'episodio depressivo leve'},
+    {'cid': 'K83.0', 'descricao': 'Colangite'},
+    {'cid': '', 'descricao': 'sem código'},
+]
+
+
+class CidCatalogoTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: banco vazio e um arquivo de CIDs temporário.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        with self.app.app_context():
+            db.create_all()
+        self.diretorio = tempfile.mkdtemp()
+        self.caminho = os.path.join(self.diretorio, 'cids.json')
+        self._escrever(CIDS)
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        cid_index.invalidar()
+        shutil.rmtree(self.diretorio)
+
+    def _escrever(self, cids):
+        with open(self.caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(cids, arquivo, indent=4)
+
+    def test_iterar_json_array_em_blocos(self):
+        """
+        Testa a leitura incremental com blocos menores que os objetos.
+        """
+        texto = json.dumps(CIDS, indent=4, ensure_ascii=False)
+        self.assertEqual(list(iterar_json_array(io.StringIO(texto), tamanho_bloco=7)), CIDS)
+        self.assertEqual(list(iterar_json_array(io.StringIO(' [ ] '))), [])
+        with self.assertRaises(ValueError):
+            list(iterar_json_array(io.StringIO('[{"cid": "A00"}, '), tamanho_bloco=4))
+
+    def test_carga_idempotente(self):
+        """
+        Testa a carga em lotes, as chaves antigas, o checksum e a atualização do índice.
+        """
+        with self.app.app_context():
+            resumo = carregar_cids(self.caminho, tamanho_lote=2)
+            self.assertEqual((resumo['status'], resumo['inseridos'], resumo['ignorados']), ('carregado', 3, 1))
+            self.assertEqual(db.session.get(CID, 'F32.0').unidecode_descricao, 'episodio depressivo leve')
+            self.assertEqual(db.session.get(CID, 'K83.0').unidecode_descricao, 'colangite')
+            self.assertEqual(db.session.get(CargaCatalogo, 'cids').total, 3)
+            self.assertEqual([c['cid'] for c in cid_index.buscar('colangite')], ['K83.0'])
+
+            self.assertEqual(carregar_cids(self.caminho)['status'], 'inalterado')
+
+            self._escrever(CIDS[:2] + [{'cid': 'K83.0', 'descricao': 'Colangite aguda'}])
+            resumo = carregar_cids(self.caminho)
+            self.assertEqual((resumo['inseridos'], resumo['atualizados']), (0, 1))
+            self.assertEqual(CID.query.count(), 3)
+            self.assertEqual(cid_index.buscar('colangite')[0]['descricao'], 'Colangite aguda')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import os
+from itertools import chain, repeat
+from unittest import mock
+from app import create_app
+from extensions import db
+from models import CID
+from utils import cid_index
+from utils.cid_index import IndiceCID
+from utils.symspell import IndiceSymSpell, distancia
+
+CIDS = [
+    ('A00.0', 'Cólera devida a Vibrio cholerae 01, biótipo cholerae', 'colera devida a vibrio cholerae 01, biotipo cholerae'),
+    ('A00.9', 'Cólera não especificada', 'colera nao especificada'),
+    ('F32.0', 'Episódio depressivo leve', 'episodio depressivo leve'),
+    ('F32.1', 'Episódio depressivo moderado', 'episodio depressivo moderado'),
+    ('F33.0', 'Transtorno depressivo recorrente, episódio atual leve', 'transtorno depressivo recorrente, episodio atual leve'),
+    ('K83.0', 'Colangite', 'colangite'),
+    ('F20.0', 'Esquizofrenia paranóide', 'esquizofrenia paranoide'),
+]
+
+
+class IndiceCIDTestCase(unittest.TestCase):
+    def setUp(self):
+        self.indice = IndiceCID(CIDS)
+
+    def test_busca_por_descricao(self):
+        """
+        Testa acentos, termos fora de ordem, a ordenação por relevância e o limite.
+        """
+        self.assertEqual([c['cid'] for c in self.indice.buscar('Cólera')], ['A00.9', 'A00.0'])
+        self.assertEqual([c['cid'] for c in self.indice.buscar('leve depress')], ['F32.0', 'F33.0'])
+        self.assertEqual([c['cid'] for c in self.indice.buscar('col')], ['K83.0', 'A00.9', 'A00.0'])
+        self.assertEqual(len(self.indice.buscar('episodio', limite=2)), 2)
+        self.assertEqual(self.indice.buscar('inexistente'), [])
+        self.assertEqual(self.indice.buscar('  '), [])
+        self.assertEqual(self.indice.buscar('colera')[0]['unidecode_descricao'], 'colera nao especificada')
+
+    def test_busca_por_codigo(self):
+        """
+        Testa a busca por prefixo do código, com ou sem ponto.
+        """
+        self.assertEqual([c['cid'] for c in self.indice.buscar('F32')], ['F32.0', 'F32.1'])
+        self.assertEqual([c['cid'] for c in self.indice.buscar('f321')], ['F32.1'])
+        self.assertEqual([c['cid'] for c in self.indice.buscar('a00.0')], ['A00.0'])
+
+    def test_symspell(self):
+        """
+        Testa a distância (com transposição) e as sugestões, inclusive por prefixo.
+        """
+        self.assertEqual(distancia('esquisofrenia', 'esquizofrenia', 2), 1)
+        self.assertEqual(distancia('depersivo', 'depressivo', 2), 2)
+        self.assertEqual(distancia('colera', 'colangite', 2), 3)
+        corretor = IndiceSymSpell({'esquizofrenia': 5, 'esquizoide': 1, 'colera': 2})
+        self.assertEqual(corretor.sugestoes('esquisofrenia')[0], ('esquizofrenia', 1, 5))
+        self.assertEqual([p for p, *_ in corretor.sugestoes('esquiso', 1, prefixo=True)], ['esquizofrenia', 'esquizoide'])
+        self.assertEqual(corretor.sugestoes('xyz'), [])
+
+    def test_pesquisa_aproximada(self):
+        """
+        Testa a busca tolerante a erros, as correções sugeridas e o cache das respostas.
+        """
+        self.assertEqual(self.indice.pesquisar('esquisofrenia')['items'], [])
+        resposta = self.indice.pesquisar('esquisofrenia paranoid', fuzzy=True)
+        self.assertEqual([c['cid'] for c in resposta['items']], ['F20.0'])
+        self.assertEqual(resposta['correcoes'], {'esquisofrenia': 'esquizofrenia'})
+        self.assertFalse(resposta['parcial'])
+        resposta = self.indice.pesquisar('epizodio depresivo', fuzzy=True)
+        self.assertEqual([c['cid'] for c in resposta['items']], ['F32.0', 'F32.1', 'F33.0'])
+        # resultados exatos vêm primeiro e a resposta repetida sai do cache
+        self.assertEqual(self.indice.pesquisar('colangite', fuzzy=True)['items'][0]['cid'], 'K83.0')
+        self.indice.pesquisar('colangite', fuzzy=True)
+        self.assertEqual(self.indice.acertos_cache, 1)
+
+    def test_prazo_durante_as_alternativas(self):
+        """
+        Testa se o prazo que estoura no meio das alternativas de um termo marca o resultado como parcial.
+        """
+        # A primeira leitura do relógio (antes do termo) ainda está no prazo; as seguintes não
+        with mock.patch('utils.cid_index.time.perf_counter', side_effect=chain([0.0], repeat(20.0))):
+            documentos, _, parcial = self.indice.aproximados('depresivo', 10, prazo=10.0)
+        self.assertTrue(parcial)
+        self.assertEqual(documentos, [])
+        self.assertFalse(self.indice.aproximados('depresivo', 10, prazo=None)[2])
+
+
+class CidRouteTestCase(unittest.TestCase):
+    def setUp(self):
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            for cid, descricao, unidecode_descricao in CIDS:
+                db.session.add(CID(cid=cid, descricao=descricao, unidecode_descricao=unidecode_descricao))
+            db.session.commit()
+            cid_index.carregar()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        cid_index.invalidar()
+
+    def test_get_cid_by_description(self):
+        """
+        Testa a rota usando o índice e o parâmetro limit.
+        """
+        response = self.client.get('/backend/laudos/get_cid_by_description/depressivo?limit=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['cid'] for c in response.get_json()], ['F32.0', 'F32.1'])
+        for limite in ('x', '0', '-1', '201', '100000'):
+            response = self.client.get(f'/backend/laudos/get_cid_by_description/depressivo?limit={limite}')
+            self.assertEqual(response.status_code, 400, limite)
+
+    def test_cid_search(self):
+        """
+        Testa a rota de autocomplete com e sem o modo aproximado.
+        """
+        response = self.client.get('/backend/laudos/cid_search?q=esquisofrenia')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['items'], [])
+        response = self.client.get('/backend/laudos/cid_search?q=esquisofrenia&fuzzy=1&limit=5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['cid'] for c in response.get_json()['items']], ['F20.0'])
+        for limite in ('0', '-5', '100000'):
+            response = self.client.get(f'/backend/laudos/cid_search?q=esquisofrenia&limit={limite}')
+            self.assertEqual(response.status_code, 400, limite)
+
+
+if __name__ == '__main__':
+    unittest.main()
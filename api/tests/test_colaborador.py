@@ -3,6 +3,7 @@ import os
 from app import create_app
 from models import Colaborador, User
 from extensions import db
+from utils.auth import emitir_token
 
 class ColaboradorTestCase(unittest.TestCase):
     def setUp(self):
@@ -36,9 +37,8 @@ class ColaboradorTestCase(unittest.TestCase):
             db.session.add(colaborador)
             db.session.commit()
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
     def tearDown(self):
         """
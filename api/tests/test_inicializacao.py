@@ -0,0 +1,66 @@
+import os
+import unittest
+from app import create_app
+from extensions import db
+from models import Questionario, User
+from utils.auth import emitir_token
+
+
+class InicializacaoTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: o boot não cria tabelas; o teste as cria como os demais.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_startup_report(self):
+        """
+        Testa o relatório de inicialização na rota de administração.
+        """
+        relatorio = self.app.extensions['inicializacao']
+        self.assertIn('rotas', relatorio.fases)
+        self.assertNotIn('banco', relatorio.fases)
+        self.assertGreater(relatorio.total_ms, 0)
+
+        with self.app.app_context():
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.commit()
+            token = emitir_token(user)
+
+        resposta = self.client.get('/backend/user/startup_report', headers={'Authorization': f'Bearer {token}'})
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(resposta.get_json()['fases_ms'], relatorio.fases)
+
+    def test_seed(self):
+        """
+        Testa `flask seed` sem os CIDs: admin e questionários criados, e repetível.
+        """
+        runner = self.app.test_cli_runner()
+        resultado = runner.invoke(args=['seed', '--sem-cids'])
+        self.assertEqual(resultado.exit_code, 0, resultado.output)
+        self.assertIn('questionários: 28 importados', resultado.output)
+
+        resultado = runner.invoke(args=['seed', '--sem-cids'])
+        self.assertIn('0 importados', resultado.output)
+        with self.app.app_context():
+            self.assertEqual(User.query.filter_by(email='admin@admin.com').count(), 1)
+            self.assertEqual(Questionario.query.count(), 28)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import re
+import unittest
+from datetime import date
+from app import create_app
+from extensions import db
+from models import BateriaTestes, Paciente, Pergunta, ProfissionalSaude, Questionario, Sessao, User
+from utils import instrumentacao_sql
+from utils.auth import emitir_token
+
+
+def consultas(resposta):
+    return int(re.search(r'db-count;desc="[^"]*";dur=(\d+)', resposta.headers['Server-Timing']).group(1))
+
+
+class InstrumentacaoSqlTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: um paciente, um usuário admin e uma rota de teste com N+1.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        @self.app.route('/teste/n_mais_1')
+        def n_mais_1():
+            ids = [q.id for q in Questionario.query.all()]
+            return {'titulos': [Questionario.query.get(id).titulo for id in ids]}
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            paciente = Paciente(nome='Paciente Teste', data_nascimento=date(1990, 1, 1), cpf='00000000000')
+            db.session.add_all([user, paciente])
+            db.session.commit()
+            self.token = emitir_token(user)
+            self.paciente_id = paciente.id
+        instrumentacao_sql.resumo(zerar=True)
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def criar_baterias(self, quantidade):
+        with self.app.app_context():
+            for i in range(quantidade):
+                profissional = ProfissionalSaude(
+                    nome=f'Profissional {i}', registro_profissional=f'{quantidade}-{i}', tipo_registro='CRM',
+                    estado_registro='SP', cpf=f'{quantidade:05d}{i:06d}'
+                )
+                questionario = Questionario(titulo=f'Questionario {i}', descricao='Descricao', versao='1.0')
+                sessao = Sessao(questionario=questionario, titulo='Sessao', ordem=1)
+                db.session.add_all([profissional, questionario, sessao])
+                db.session.flush()
+                db.session.add_all([
+                    Pergunta(sessao_id=sessao.id, texto=f'Pergunta {n}', tipo_resposta='texto', ordem=n)
+                    for n in range(i + 1)
+                ])
+                db.session.add(BateriaTestes(
+                    profissional_saude_id=profissional.id, paciente_id=self.paciente_id,
+                    questionario_id=questionario.id, data_aplicacao=date(2025, 4, 1)
+                ))
+            db.session.commit()
+
+    def test_baterias_por_paciente_sem_n_mais_1(self):
+        """
+        Testa se a lista de baterias do paciente faz o mesmo número de consultas para 1 ou 6 baterias.
+        """
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.criar_baterias(1)
+        resposta = self.client.get(f'/backend/baterias_testes/paciente/{self.paciente_id}', headers=headers)
+        self.assertEqual(resposta.status_code, 200)
+        self.assertRegex(resposta.headers['Server-Timing'], r'^db;dur=[\d.]+, db-count;.*, app;dur=[\d.]+$')
+        uma = consultas(resposta)
+
+        self.criar_baterias(5)
+        resposta = self.client.get(f'/backend/baterias_testes/paciente/{self.paciente_id}', headers=headers)
+        self.assertEqual(consultas(resposta), uma)
+        dados = sorted(resposta.get_json(), key=lambda item: item['qtd_perguntas'])
+        self.assertEqual([item['qtd_perguntas'] for item in dados], [1, 1, 2, 3, 4, 5])
+        self.assertEqual(dados[-1]['nome_profissional'], 'Profissional 4')
+
+        resumo = instrumentacao_sql.resumo()['bateria_testes_bp.get_baterias_by_paciente']
+        self.assertEqual((resumo['requisicoes'], resumo['n_mais_1']), (2, 0))
+
+    def test_deteccao_n_mais_1(self):
+        """
+        Testa se consultas repetidas com o mesmo formato são apontadas como N+1 no log.
+        """
+        self.criar_baterias(6)
+        with self.assertLogs(self.app.logger, 'WARNING') as logs:
+            resposta = self.client.get('/teste/n_mais_1')
+        self.assertEqual(consultas(resposta), 7)
+        self.assertIn('Possível N+1 em n_mais_1: 6x SELECT', logs.output[0])
+        self.assertEqual(instrumentacao_sql.resumo()['n_mais_1']['n_mais_1'], 1)
+
+        with self.assertLogs(self.app.logger, 'INFO') as logs:
+            instrumentacao_sql.registrar_resumo(self.app.logger)
+        self.assertIn('SQL n_mais_1: 1 req, 7.0 consultas/req', logs.output[0])
+        self.assertEqual(instrumentacao_sql.resumo(), {})
+
+    def test_formato(self):
+        """
+        Testa a normalização do SQL: valores e listas IN de qualquer tamanho viram '?'.
+        """
+        self.assertEqual(
+            instrumentacao_sql.formato("SELECT a FROM t WHERE id IN (?, ?, ?) AND  x = 'abc' LIMIT 10"),
+            instrumentacao_sql.formato("SELECT a FROM t WHERE id IN (?) AND x = 'd''e' LIMIT 5")
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from app import create_app
+from extensions import db
+from models import Avaliacao, Paciente, TipoPagamentoEnum, User
+from utils import json_provider
+from utils.auth import emitir_token
+
+
+class JSONProviderTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial antes de cada teste.
+        """
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='admin@example.com', role='admin', is_active=True)
+            user.set_password('password123')
+            paciente = Paciente(nome='Paciente Teste', data_nascimento=date(1990, 1, 2), cpf='12345678901')
+            db.session.add_all([user, paciente])
+            db.session.flush()
+            avaliacao = Avaliacao(paciente_id=paciente.id, data_inicio=date(2025, 4, 1), pago=True,
+                                  valor_cobranca=150.5, tipo_pagamento=TipoPagamentoEnum.pix)
+            db.session.add(avaliacao)
+            db.session.commit()
+            self.avaliacao_id = avaliacao.id
+            self.token = emitir_token(user)
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_tipos_nativos(self):
+        """
+        Testa datas em ISO 8601, Enum, Decimal e chaves não-string, com orjson e sem ele.
+        """
+        dados = {
+            'data': date(2025, 4, 1),
+            'momento': datetime(2025, 4, 1, 10, 30, 0, 123000, tzinfo=timezone.utc),
+            'tipo': TipoPagamentoEnum.pix,
+            'valor': Decimal('10.50'),
+            'contagens': {1: 2, 3: 4},
+            'texto': 'Avaliação'
+        }
+        esperado = {
+            'data': '2025-04-01',
+            'momento': '2025-04-01T10:30:00.123000+00:00',
+            'tipo': 'PIX',
+            'valor': '10.50',
+            'contagens': {'1': 2, '3': 4},
+            'texto': 'Avaliação'
+        }
+        with self.app.app_context():
+            self.assertEqual(self.app.json.loads(self.app.json.dumps(dados)), esperado)
+            self.assertEqual(self.app.json.response(dados).get_json(), esperado)
+            with mock.patch('utils.json_provider.orjson', None):
+                self.assertEqual(self.app.json.loads(self.app.json.dumps(dados)), esperado)
+                self.assertEqual(self.app.json.response(dados).get_json(), esperado)
+
+    def test_to_json_sem_conversao(self):
+        """
+        Testa se os modelos devolvem datas e a resposta traz as mesmas strings de antes.
+        """
+        resposta = self.client.get(f'/backend/avaliacoes/{self.avaliacao_id}', headers={'Authorization': f'Bearer {self.token}'})
+        self.assertEqual(resposta.status_code, 200)
+        dados = resposta.get_json()
+        self.assertEqual(dados['data_inicio'], '2025-04-01')
+        self.assertEqual(dados['tipo_pagamento'], 'pix')
+        self.assertEqual(dados['created_at'], datetime.fromisoformat(dados['created_at']).isoformat())
+        with self.app.app_context():
+            self.assertIsInstance(db.session.get(Avaliacao, self.avaliacao_id).to_json()['data_inicio'], date)
+
+    def test_corpo_invalido(self):
+        """
+        Testa se um corpo JSON inválido continua respondendo 400.
+        """
+        resposta = self.client.post('/backend/user/login', data='{"email": ', content_type='application/json')
+        self.assertEqual(resposta.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+from app import create_app
+from extensions import db
+from models import User
+from utils import metricas
+from utils.auth import emitir_token
+
+
+def valor(texto, serie):
+    """
+    Valor de uma série (nome{rótulos}) no texto exposto, ou None.
+    """
+    encontrado = re.search(rf'^{re.escape(serie)} (\S+)$', texto, re.MULTILINE)
+    return float(encontrado.group(1)) if encontrado else None
+
+
+class MetricasTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: métricas de vários processos numa pasta temporária.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.pasta = tempfile.TemporaryDirectory()
+        os.environ['METRICAS_DIR'] = self.pasta.name
+        os.environ['METRICAS_TOKEN'] = 'segredo'
+        self.app = create_app()
+        del os.environ['METRICAS_DIR'], os.environ['METRICAS_TOKEN']
+        self.metricas = {'Authorization': 'Bearer segredo'}
+        self.client = self.app.test_client()
+        metricas.limpar()
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.commit()
+            self.token = emitir_token(user)
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        metricas.limpar()
+        self.pasta.cleanup()
+
+    def test_metricas_por_endpoint(self):
+        """
+        Testa contadores, histogramas de latência, tamanho e banco, e a espera do pool.
+        """
+        for _ in range(3):
+            resposta = self.client.get('/backend/user/', headers={'Authorization': f'Bearer {self.token}'})
+            self.assertEqual(resposta.status_code, 200)
+        self.client.get('/backend/hello')
+
+        resposta = self.client.get('/backend/metrics', headers=self.metricas)
+        self.assertEqual(resposta.status_code, 200)
+        self.assertTrue(resposta.content_type.startswith('text/plain; version=0.0.4'))
+        texto = resposta.get_data(as_text=True)
+
+        self.assertIn('# TYPE http_request_duration_seconds histogram', texto)
+        self.assertEqual(valor(texto, 'http_requests_total{endpoint="user_bp.get_users",method="GET",status="200"}'), 3)
+        self.assertEqual(valor(texto, 'http_requests_total{endpoint="hello",method="GET",status="200"}'), 1)
+        self.assertEqual(valor(texto, 'http_request_duration_seconds_count{endpoint="user_bp.get_users"}'), 3)
+        self.assertEqual(valor(texto, 'http_request_duration_seconds_bucket{endpoint="user_bp.get_users",le="+Inf"}'), 3)
+        self.assertEqual(valor(texto, 'http_response_size_bytes_count{endpoint="hello"}'), 1)
+        self.assertGreater(valor(texto, 'http_request_db_queries_total{endpoint="user_bp.get_users"}'), 0)
+        self.assertEqual(valor(texto, 'http_request_db_queries_total{endpoint="hello"}'), 0)
+        self.assertGreater(valor(texto, 'db_pool_checkout_wait_seconds_count'), 0)
+
+        # Buckets acumulados não diminuem
+        buckets = [float(n) for n in re.findall(r'^http_request_duration_seconds_bucket\{endpoint="user_bp.get_users",le="[^"]+"\} (\S+)$', texto, re.MULTILINE)]
+        self.assertEqual(buckets, sorted(buckets))
+
+    def test_soma_dos_processos(self):
+        """
+        Testa se a rota soma os arquivos gravados pelos outros workers.
+        """
+        self.client.get('/backend/hello')
+        outro = metricas.Registro()
+        outro.incrementar('http_requests_total', (('endpoint', 'hello'), ('method', 'GET'), ('status', '200')), 4)
+        outro.observar('http_request_duration_seconds', (('endpoint', 'hello'),), 0.3)
+        with open(os.path.join(self.pasta.name, 'metricas-1-outro.json'), 'w') as arquivo:
+            json.dump(outro.to_json(), arquivo)
+
+        texto = self.client.get('/backend/metrics', headers=self.metricas).get_data(as_text=True)
+        self.assertEqual(valor(texto, 'http_requests_total{endpoint="hello",method="GET",status="200"}'), 5)
+        self.assertEqual(valor(texto, 'http_request_duration_seconds_count{endpoint="hello"}'), 2)
+        self.assertEqual(valor(texto, 'http_request_duration_seconds_bucket{endpoint="hello",le="0.25"}'), 1)
+        self.assertEqual(len(os.listdir(self.pasta.name)), 2)
+
+        metricas.limpar_diretorio(self.pasta.name)
+        self.assertEqual(os.listdir(self.pasta.name), [])
+
+    def test_worker_encerrado(self):
+        """
+        Testa se os arquivos de um worker que terminou são juntados ao agregado sem
+        alterar a soma exposta.
+        """
+        for pid, quantidade in ((101, 4), (101, 1), (102, 2)):
+            outro = metricas.Registro()
+            outro.incrementar('http_requests_total', (('endpoint', 'hello'), ('method', 'GET'), ('status', '200')), quantidade)
+            with open(os.path.join(self.pasta.name, f'metricas-{pid}-{quantidade}.json'), 'w') as arquivo:
+                json.dump(outro.to_json(), arquivo)
+        serie = 'http_requests_total{endpoint="hello",method="GET",status="200"}'
+        texto = self.client.get('/backend/metrics', headers=self.metricas).get_data(as_text=True)
+        self.assertEqual(valor(texto, serie), 7)
+
+        self.assertEqual(metricas.incorporar_processo(self.pasta.name, 101), 2)
+        self.assertEqual(metricas.incorporar_processo(self.pasta.name, 102), 1)
+        self.assertEqual(metricas.incorporar_processo(self.pasta.name, 102), 0)
+        # Sobram o agregado e o arquivo deste processo
+        arquivos = os.listdir(self.pasta.name)
+        self.assertIn(metricas.ARQUIVO_AGREGADO, arquivos)
+        self.assertEqual(len(arquivos), 2)
+        texto = self.client.get('/backend/metrics', headers=self.metricas).get_data(as_text=True)
+        self.assertEqual(valor(texto, serie), 7)
+
+    def test_token(self):
+        """
+        Testa a exigência do token e a ausência da rota sem METRICAS_TOKEN.
+        """
+        self.assertEqual(self.client.get('/backend/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/backend/metrics', headers={'Authorization': 'Bearer outro'}).status_code, 401)
+        self.assertEqual(self.client.get('/backend/metrics', headers=self.metricas).status_code, 200)
+
+        sem_token = create_app().test_client()
+        self.assertEqual(sem_token.get('/backend/metrics').status_code, 404)
+        self.assertEqual(sem_token.get('/backend/metrics', headers=self.metricas).status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ from app import create_app
 from extensions import db
 from models import Paciente, User
 from datetime import date
+from utils.auth import emitir_token
 
 class PacienteTestCase(unittest.TestCase):
     def setUp(self):
@@ -27,9 +28,8 @@ class PacienteTestCase(unittest.TestCase):
             db.session.add(user)
             db.session.flush()
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
             # Cria um paciente de teste
             paciente = Paciente(
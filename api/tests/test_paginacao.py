@@ -0,0 +1,71 @@
+import unittest
+import os
+from datetime import date
+from app import create_app
+from extensions import db
+from models import Paciente, User
+from utils.auth import emitir_token
+
+
+class PaginacaoCursorTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: cinco pacientes, dois com o mesmo nome.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            self.token = emitir_token(user)
+
+            for i, nome in enumerate(['Bruno', 'Ana', 'Carla', 'Ana', 'Daniel']):
+                db.session.add(Paciente(nome=nome, cpf=f'0000000000{i}', data_nascimento=date(1990, 1, 1)))
+            db.session.commit()
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def _get(self, url):
+        return self.client.get(url, headers={'Authorization': f'Bearer {self.token}'})
+
+    def test_pacientes_por_cursor(self):
+        """
+        Testa a navegação para frente e para trás por (nome, id) e o total opcional.
+        """
+        primeira = self._get('/backend/pacientes/?cursor=&limit=2&count=1').get_json()
+        self.assertEqual([p['nome'] for p in primeira['items']], ['Ana', 'Ana'])
+        self.assertEqual(primeira['total'], 5)
+        self.assertIsNone(primeira['prev_cursor'])
+
+        segunda = self._get(f"/backend/pacientes/?cursor={primeira['next_cursor']}&limit=2").get_json()
+        self.assertEqual([p['nome'] for p in segunda['items']], ['Bruno', 'Carla'])
+        self.assertNotIn('total', segunda)
+
+        terceira = self._get(f"/backend/pacientes/?cursor={segunda['next_cursor']}&limit=2").get_json()
+        self.assertEqual([p['nome'] for p in terceira['items']], ['Daniel'])
+        self.assertIsNone(terceira['next_cursor'])
+
+        volta = self._get(f"/backend/pacientes/?cursor={segunda['prev_cursor']}&limit=2").get_json()
+        self.assertEqual([p['id'] for p in volta['items']], [p['id'] for p in primeira['items']])
+        self.assertIsNone(volta['prev_cursor'])
+
+        filtro = self._get('/backend/pacientes/filter_by_name/an/1/10?cursor=').get_json()
+        self.assertEqual([p['nome'] for p in filtro['items']], ['Ana', 'Ana', 'Daniel'])
+
+        self.assertEqual(self._get('/backend/pacientes/?cursor=invalido').status_code, 400)
+        self.assertIsInstance(self._get('/backend/pacientes/1/2').get_json()['items'], list)
+
+
+if __name__ == '__main__':
+    unittest.main()
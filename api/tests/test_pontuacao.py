@@ -0,0 +1,58 @@
+import unittest
+from utils.pontuacao import QuestionarioCompilado
+
+
+def _pergunta(id, tipo='escala_likert_3', valores=(0, 1, 2)):
+    return {
+        'id': id,
+        'texto': id,
+        'tipo_resposta': tipo,
+        'alternativas': [{'id': f'{id}A{v}', 'texto': str(v), 'valor': float(v)} for v in valores]
+    }
+
+
+class PontuacaoTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Questionário com uma sessão graficável e uma sessão de texto livre.
+        """
+        self.arvore = {
+            'id': 'Q1',
+            'sessoes': [
+                {'id': 'S1', 'perguntas': [_pergunta('P1'), _pergunta('P2'), _pergunta('P3'), _pergunta('P4')]},
+                {'id': 'S2', 'perguntas': [_pergunta('P5', tipo='texto_livre', valores=())]},
+            ]
+        }
+        self.compilado = QuestionarioCompilado(self.arvore)
+
+    def test_pontuar_bateria(self):
+        """
+        Testa as estatísticas de uma bateria (moda com empate na ordem de ocorrência).
+        """
+        estatisticas = self.compilado.pontuar({'P1': 'P1A2', 'P2': 'P2A0', 'P3': 'P3A0', 'P4': 'P4A2', 'P5': 'x'})
+        self.assertEqual(list(estatisticas), ['S1'])
+        self.assertEqual(estatisticas['S1'], {
+            'total_pontuacao_obtida': 4.0,
+            'total_pontuacao_maxima_possivel': 8.0,
+            'media_pontuacao_obtida_por_pergunta_respondida': 1.0,
+            'moda_pontuacao_obtida_nas_perguntas': [2.0, 0.0],
+            'percentual_aproveitamento': 50.0
+        })
+
+    def test_pontuar_lote_ignora_respostas_invalidas(self):
+        """
+        Testa o lote: bateria vazia e alternativa de outra pergunta não pontuam.
+        """
+        resultado = self.compilado.pontuar_lote([{}, {'P1': 'P2A2', 'P2': 'P2A1'}])
+        vazia = self.compilado.estatisticas(resultado, 0)['S1']
+        self.assertEqual(vazia['total_pontuacao_obtida'], 0.0)
+        self.assertEqual(vazia['media_pontuacao_obtida_por_pergunta_respondida'], 0.0)
+        self.assertEqual(vazia['moda_pontuacao_obtida_nas_perguntas'], [])
+
+        segunda = self.compilado.estatisticas(resultado, 1)['S1']
+        self.assertEqual(segunda['total_pontuacao_obtida'], 1.0)
+        self.assertEqual(segunda['moda_pontuacao_obtida_nas_perguntas'], [1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import os
 from app import create_app
 from extensions import db
 from models import ProfissionalSaude, User
+from utils.auth import emitir_token
 
 class ProfissionalSaudeTestCase(unittest.TestCase):
     def setUp(self):
@@ -22,9 +23,8 @@ class ProfissionalSaudeTestCase(unittest.TestCase):
             db.session.add(user)
             db.session.flush()
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
             profissional_saude = ProfissionalSaude(
                 nome='Profissional Teste',
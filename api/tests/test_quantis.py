@@ -0,0 +1,38 @@
+import random
+import unittest
+from utils.quantis import KLLSketch
+
+
+class QuantisTestCase(unittest.TestCase):
+    def test_sketch_exato_com_poucos_valores(self):
+        """
+        Testa o percentil (empates pela metade) e a serialização de um sketch pequeno.
+        """
+        sketch = KLLSketch()
+        for valor in (0, 50, 50, 100):
+            sketch.update(valor)
+        self.assertEqual(sketch.percentil(50), 50.0)
+        self.assertEqual(sketch.percentil(100), 87.5)
+        self.assertEqual(KLLSketch.from_dict(sketch.to_dict()).percentil(0), 12.5)
+        self.assertIsNone(KLLSketch().percentil(10))
+
+    def test_merge_mantem_erro_de_rank_pequeno(self):
+        """
+        Testa a mescla de dois sketches grandes contra o rank exato.
+        """
+        rnd = random.Random(7)
+        valores = [rnd.uniform(0, 100) for _ in range(20000)]
+        a, b = KLLSketch(rng=random.Random(1)), KLLSketch(rng=random.Random(2))
+        for valor in valores[:10000]:
+            a.update(valor)
+        for valor in valores[10000:]:
+            b.update(valor)
+        a.merge(b)
+        self.assertEqual(a.n, 20000)
+        for valor in (10, 25, 50, 75, 90):
+            exato = sum(1 for v in valores if v < valor) / len(valores) * 100
+            self.assertAlmostEqual(a.percentil(valor), exato, delta=2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
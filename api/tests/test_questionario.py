@@ -2,7 +2,8 @@ import unittest
 import os
 from app import create_app
 from extensions import db
-from models import Questionario, Sessao, User
+from models import Alternativa, Pergunta, Questionario, Sessao, User
+from utils.auth import emitir_token
 
 class QuestionarioTestCase(unittest.TestCase):
     def setUp(self):
@@ -22,9 +23,8 @@ class QuestionarioTestCase(unittest.TestCase):
             db.session.add(user)
             db.session.flush()
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
             # Cria um questionário de teste
             self.questionario = Questionario(
@@ -184,6 +184,92 @@ class QuestionarioTestCase(unittest.TestCase):
         self.assertEqual(len(data['sessoes']), 1)
         self.assertEqual(data['sessoes'][0]['titulo'], 'Sessao Teste')
 
+    def test_get_questionario_detailed_reflete_alteracoes(self):
+        """
+        Testa se a árvore em cache de /backend/questionario/detailed/<id> é invalidada
+        quando uma alternativa é alterada (individualmente ou em batch).
+        """
+        with self.app.app_context():
+            sessao = Sessao.query.filter_by(questionario_id=self.questionario_id).first()
+            pergunta = Pergunta(sessao_id=sessao.id, texto='Pergunta Teste', tipo_resposta='booleano', ordem=1)
+            db.session.add(pergunta)
+            db.session.flush()
+            alternativa = Alternativa(pergunta_id=pergunta.id, texto='Sim', valor=1, ordem=1)
+            db.session.add(alternativa)
+            db.session.commit()
+            pergunta_id, alternativa_id = pergunta.id, alternativa.id
+
+        headers = {'Authorization': f'Bearer {self.token}'}
+        url = f'/backend/questionario/detailed/{self.questionario_id}'
+
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['sessoes'][0]['perguntas'][0]['alternativas'][0]['texto'], 'Sim')
+
+        response = self.client.put(
+            f'/backend/alternativas/{alternativa_id}',
+            json={'pergunta_id': pergunta_id, 'texto': 'Talvez', 'valor': 0.5, 'ordem': 1},
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['sessoes'][0]['perguntas'][0]['alternativas'][0]['texto'], 'Talvez')
+
+        response = self.client.put(
+            '/backend/alternativas/batch',
+            json=[{'id': alternativa_id, 'texto': 'Não', 'valor': 0, 'ordem': 1}],
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        data = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(data['sessoes'][0]['perguntas'][0]['alternativas'][0]['texto'], 'Não')
+
+    def test_duplicate_questionario(self):
+        """
+        Testa a cópia da árvore e o remapeamento dos ids nas regras de visibilidade.
+        """
+        with self.app.app_context():
+            sessao = Sessao.query.filter_by(questionario_id=self.questionario_id).first()
+            pergunta = Pergunta(sessao_id=sessao.id, texto='Pergunta Teste', tipo_resposta='booleano', ordem=1)
+            db.session.add(pergunta)
+            db.session.flush()
+            alternativa = Alternativa(pergunta_id=pergunta.id, texto='Sim', valor=1, ordem=1)
+            db.session.add(alternativa)
+            db.session.flush()
+            db.session.add(Sessao(
+                questionario_id=self.questionario_id,
+                titulo='Sessao Condicional',
+                ordem=2,
+                regras_visibilidade=[
+                    {'tipo_regra': 'RESPOSTA_ESPECIFICA', 'pergunta_alvo_id': pergunta.id,
+                     'respostas_necessarias_ids': [alternativa.id], 'logica_respostas': 'OR'},
+                    {'tipo_regra': 'FAIXA_DE_PONTUACAO', 'perguntas_para_calculo_ids': [pergunta.id],
+                     'pontuacao_minima_exigida': 1, 'pontuacao_maxima_exigida': 2},
+                    {'tipo_regra': 'ROLE_USUARIO', 'roles_permitidos': ['paciente']}
+                ]
+            ))
+            db.session.commit()
+
+        headers = {'Authorization': f'Bearer {self.token}'}
+        response = self.client.post(f'/backend/questionario/duplicate/{self.questionario_id}', json={'versao': '2.0'}, headers=headers)
+        self.assertEqual(response.status_code, 201)
+        copia = response.get_json()
+        self.assertEqual((copia['titulo'], copia['versao']), ('Questionario Teste (versão: 2.0)', '2.0'))
+
+        nova_pergunta = copia['sessoes'][0]['perguntas'][0]
+        nova_alternativa = nova_pergunta['alternativas'][0]
+        regras = copia['sessoes'][1]['regras_visibilidade']
+        self.assertEqual(regras[0]['pergunta_alvo_id'], nova_pergunta['id'])
+        self.assertEqual(regras[0]['respostas_necessarias_ids'], [nova_alternativa['id']])
+        self.assertEqual(regras[1]['perguntas_para_calculo_ids'], [nova_pergunta['id']])
+        self.assertEqual(regras[2]['roles_permitidos'], ['paciente'])
+
+        # A árvore devolvida é a mesma que será lida do banco
+        lida = self.client.get(f"/backend/questionario/detailed/{copia['id']}", headers=headers).get_json()
+        self.assertEqual(lida, copia)
+
+        response = self.client.post(f'/backend/questionario/duplicate/{self.questionario_id}', json={'versao': '2.0'}, headers=headers)
+        self.assertEqual(response.status_code, 409)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
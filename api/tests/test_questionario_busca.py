@@ -0,0 +1,107 @@
+import unittest
+import os
+from datetime import date
+from app import create_app
+from extensions import db
+from models import BateriaTestes, Paciente, Questionario, User
+from utils import questionario_busca
+from utils.questionario_busca import IndiceQuestionarios
+from utils.auth import emitir_token
+
+QUESTIONARIOS = [
+    ('q1', 'Inventário de Depressão de Beck', 'Avalia a intensidade de sintomas depressivos.'),
+    ('q2', 'Escala de Ansiedade', 'Triagem de ansiedade e depressão na atenção primária.'),
+    ('q3', 'PHQ-9', 'Questionário sobre a saúde do paciente: depressão.'),
+    ('q4', 'Qualidade de Vida', 'WHOQOL abreviado.'),
+]
+
+
+class IndiceQuestionariosTestCase(unittest.TestCase):
+    def setUp(self):
+        self.indice = IndiceQuestionarios(QUESTIONARIOS)
+
+    def test_relevancia(self):
+        """
+        Testa acentos, o peso do título, prefixos e a exigência de todos os termos.
+        """
+        self.assertEqual(self.indice.buscar('DEPRESSÃO')[0], 'q1')
+        self.assertEqual(set(self.indice.buscar('depressao')), {'q1', 'q2', 'q3'})
+        self.assertEqual(self.indice.buscar('depress'), ['q1', 'q2', 'q3'])
+        self.assertEqual(self.indice.buscar('ansiedade depressao'), ['q2'])
+        self.assertEqual(self.indice.buscar('phq 9'), ['q3'])
+        self.assertEqual(self.indice.buscar('vida whoqol'), ['q4'])
+        self.assertEqual(self.indice.buscar('estresse'), [])
+        self.assertEqual(self.indice.buscar('  '), [])
+
+
+class QuestionarioBuscaRouteTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: questionários e baterias em datas diferentes.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+        questionario_busca.invalidar()
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            self.token = emitir_token(user)
+
+            paciente = Paciente(nome='Paciente Teste', cpf='12345678901', data_nascimento=date(1990, 1, 1))
+            db.session.add(paciente)
+            for questionario_id, titulo, descricao in QUESTIONARIOS:
+                db.session.add(Questionario(id=questionario_id, titulo=titulo, descricao=descricao))
+            db.session.flush()
+            for i, questionario_id in enumerate(['q1', 'q2', 'q4', 'q1']):
+                db.session.add(BateriaTestes(
+                    id=f'b{i}', paciente_id=paciente.id, questionario_id=questionario_id, data_aplicacao=date(2024, 1, 1 + i)
+                ))
+            db.session.commit()
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        questionario_busca.invalidar()
+
+    def _get(self, url):
+        return self.client.get(url, headers={'Authorization': f'Bearer {self.token}'})
+
+    def test_find_by_title_or_description(self):
+        """
+        Testa a ordem por relevância, a paginação e a atualização do índice após uma edição.
+        """
+        resposta = self._get('/backend/questionario/find_by_title_or_description/depressao')
+        self.assertEqual([q['id'] for q in resposta.get_json()], ['q1', 'q2', 'q3'])
+        resposta = self._get('/backend/questionario/find_by_title_or_description/depressao/0/2')
+        self.assertEqual([q['id'] for q in resposta.get_json()], ['q1', 'q2'])
+
+        with self.app.app_context():
+            questionario = db.session.get(Questionario, 'q4')
+            questionario.titulo = 'Qualidade de Vida e Depressão'
+            db.session.commit()
+        resposta = self._get('/backend/questionario/find_by_title_or_description/depressao/2/2')
+        self.assertEqual([q['id'] for q in resposta.get_json()], ['q2', 'q3'])
+
+    def test_baterias_por_titulo_descricao(self):
+        """
+        Testa a lista ordenada no banco e a versão paginada.
+        """
+        resposta = self._get('/backend/baterias_testes/titulo_descricao_questionario/depressao')
+        self.assertEqual([b['id'] for b in resposta.get_json()], ['b3', 'b1', 'b0'])
+        resposta = self._get('/backend/baterias_testes/titulo_descricao_questionario/depressao/2/2').get_json()
+        self.assertEqual(([b['id'] for b in resposta['items']], resposta['totalPages']), (['b0'], 2))
+        resposta = self._get('/backend/baterias_testes/titulo_descricao_questionario/estresse')
+        self.assertEqual(resposta.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import copy
+import os
+import unittest
+from app import create_app
+from extensions import db
+from fixtures.checkser import validate_questionario
+from models import Alternativa, Pergunta, Questionario, Sessao
+from utils import questionario_import
+
+QUESTIONARIO = {
+    'titulo': 'Escala Teste',
+    'descricao': 'Descrição',
+    'versao': '1.0',
+    'fontes_literatura': [{'titulo': 'Artigo', 'autores': 'Autor', 'ano': 2020}],
+    'is_active': True,
+    'sessoes': [{
+        'titulo': 'Sessão 1',
+        'descricao': None,
+        'ordem': 1,
+        'perguntas': [{
+            'texto': 'Pergunta 1',
+            'tipo_resposta': 'escala_likert_3',
+            'metodo_pontuacao': 'soma_item',
+            'ordem': 1,
+            'is_obrigatoria': True,
+            'alternativas': [{'texto': 'Nunca', 'valor': 0, 'ordem': 1}, {'texto': 'Sempre', 'valor': 2.0, 'ordem': 2}]
+        }]
+    }]
+}
+
+
+class QuestionarioImportTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: banco vazio.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_validacao_compilada(self):
+        """
+        Testa se o validador compilado dá os mesmos erros das regras de checkser.
+        """
+        invalido = copy.deepcopy(QUESTIONARIO)
+        del invalido['descricao']
+        invalido['sessoes'][0]['ordem'] = '1'
+        invalido['sessoes'][0]['perguntas'][0]['alternativas'][1]['valor'] = True
+        invalido['sessoes'][0]['perguntas'][0]['alternativas'].append('Talvez')
+
+        self.assertEqual(questionario_import.validar_questionario(QUESTIONARIO), [])
+        erros = questionario_import.validar_questionario(invalido)
+        self.assertEqual(len(erros), 4)
+        self.assertEqual(erros[:2], validate_questionario(invalido)[:2])
+        self.assertIn('Tipo incorreto para sessoes[0].perguntas[0].alternativas[1].valor', erros[2])
+
+    def test_importacao(self):
+        """
+        Testa a importação em lote, o relatório e a repetição sem duplicar.
+        """
+        invalido = copy.deepcopy(QUESTIONARIO)
+        invalido['titulo'] = 'Sem sessões'
+        del invalido['sessoes']
+
+        with self.app.app_context():
+            relatorio = questionario_import.importar([QUESTIONARIO, invalido])
+            self.assertEqual((relatorio['importados'], relatorio['invalidos']), (1, 1))
+            self.assertEqual(relatorio['linhas'], {'questionarios': 1, 'sessoes': 1, 'perguntas': 1, 'alternativas': 2})
+            self.assertEqual(relatorio['erros'][0]['titulo'], 'Sem sessões')
+            self.assertGreater(relatorio['linhas_por_segundo'], 0)
+
+            questionario = Questionario.query.one()
+            pergunta = questionario.sessoes[0].perguntas[0]
+            self.assertEqual([a.texto for a in pergunta.alternativas], ['Nunca', 'Sempre'])
+
+            relatorio = questionario_import.importar([QUESTIONARIO])
+            self.assertEqual((relatorio['importados'], relatorio['existentes']), (0, 1))
+
+            relatorio = questionario_import.importar_arquivos()
+            # a fixture repete três pares (título, versão)
+            self.assertEqual((relatorio['importados'], relatorio['existentes'], relatorio['invalidos']), (28, 3, 0))
+            self.assertEqual(Sessao.query.count(), relatorio['linhas']['sessoes'] + 1)
+            self.assertEqual(Pergunta.query.count(), relatorio['linhas']['perguntas'] + 1)
+            self.assertEqual(Alternativa.query.count(), relatorio['linhas']['alternativas'] + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
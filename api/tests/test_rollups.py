@@ -0,0 +1,175 @@
+import unittest
+import os
+from datetime import date
+from unittest import mock
+import ulid
+from sqlalchemy import insert
+from dateutil.relativedelta import relativedelta
+from app import create_app
+from extensions import db
+from models import BateriaTestes, Paciente, ProfissionalSaude, Questionario, RollupProfissionalDia, User
+from utils import linhas_travadas
+from utils.auth import emitir_token
+from utils.hyperloglog import HyperLogLog
+
+
+class RollupsTestCase(unittest.TestCase):
+    def setUp(self):
+        """
+        Configuração inicial: um profissional, dois pacientes e um questionário.
+        """
+        os.environ['FLASK_ENV'] = 'testing'
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+            user = User(email='admin@example.com', is_active=True, role='admin')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            self.token = emitir_token(user)
+
+            profissional = ProfissionalSaude(
+                nome='Profissional Teste', registro_profissional='123456', tipo_registro='CRM',
+                estado_registro='SP', cpf='98765432100'
+            )
+            pacientes = [
+                Paciente(nome=f'Paciente {i}', cpf=f'1234567890{i}', data_nascimento=date(1990, 1, 1))
+                for i in range(2)
+            ]
+            questionario = Questionario(titulo='Questionario Teste', descricao='Descricao Teste', versao='1.0')
+            db.session.add_all([profissional, questionario, *pacientes])
+            db.session.commit()
+            self.profissional_id = profissional.id
+            self.paciente_ids = [paciente.id for paciente in pacientes]
+            self.questionario_id = questionario.id
+
+    def tearDown(self):
+        """
+        Limpeza após cada teste.
+        """
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def _criar_bateria(self, paciente_id, data_aplicacao, is_completo=False):
+        bateria = BateriaTestes(
+            profissional_saude_id=self.profissional_id,
+            paciente_id=paciente_id,
+            questionario_id=self.questionario_id,
+            data_aplicacao=data_aplicacao,
+            is_completo=is_completo
+        )
+        db.session.add(bateria)
+        db.session.commit()
+        return bateria.id
+
+    def test_dashboard_lido_dos_rollups(self):
+        """
+        Testa a manutenção incremental dos rollups (criação, conclusão, exclusão) e o
+        dashboard, comparando com a reconstrução por `flask rebuild-rollups`.
+        """
+        hoje = date.today()
+        mes_passado = hoje - relativedelta(months=1)
+        with self.app.app_context():
+            aberta = self._criar_bateria(self.paciente_ids[0], hoje)
+            self._criar_bateria(self.paciente_ids[1], hoje, is_completo=True)
+            self._criar_bateria(self.paciente_ids[0], mes_passado)
+            removida = self._criar_bateria(self.paciente_ids[1], mes_passado)
+
+            BateriaTestes.query.get(aberta).is_completo = True
+            db.session.commit()
+            db.session.delete(BateriaTestes.query.get(removida))
+            db.session.commit()
+            linha = RollupProfissionalDia.query.filter_by(profissional_saude_id=self.profissional_id, dia=hoje).one()
+            self.assertEqual((linha.baterias_criadas, linha.baterias_completas), (2, 2))
+
+        headers = {'Authorization': f'Bearer {self.token}'}
+        url = f'/backend/baterias_testes/dashboard_profissional/{self.profissional_id}'
+        incremental = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(incremental['numero_total_baterias'], 3)
+        self.assertEqual(incremental['numero_total_baterias_abertas'], 1)
+        self.assertEqual(incremental['numero_baterias_ultimo_mes'], 2)
+        self.assertEqual(incremental['numero_baterias_abertas_ultimo_mes'], 0)
+        self.assertEqual(len(incremental['evolucao_pacientes']), 6)
+        self.assertEqual(incremental['evolucao_pacientes'][-1], {'mes': hoje.strftime('%Y-%m'), 'qtd_pacientes': 2})
+        self.assertNotIn('baterias_profissional', incremental)
+
+        result = self.app.test_cli_runner().invoke(args=['rebuild-rollups'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        reconstruido = self.client.get(url, headers=headers).get_json()
+        self.assertEqual(reconstruido['evolucao_pacientes'][-2]['qtd_pacientes'], 1)
+        self.assertEqual({k: v for k, v in reconstruido.items() if k != 'evolucao_pacientes'},
+                         {k: v for k, v in incremental.items() if k != 'evolucao_pacientes'})
+
+    def test_init_db_preenche_tabela_vazia(self):
+        """
+        Testa se o init_db reconstrói os rollups de um banco que já tinha baterias.
+        """
+        from extensions import init_db
+
+        hoje = date.today()
+        with self.app.app_context():
+            self._criar_bateria(self.paciente_ids[0], hoje, is_completo=True)
+            self._criar_bateria(self.paciente_ids[1], hoje)
+            RollupProfissionalDia.query.delete()
+            db.session.commit()
+
+            init_db()
+            linha = RollupProfissionalDia.query.filter_by(profissional_saude_id=self.profissional_id, dia=hoje).one()
+            self.assertEqual((linha.baterias_criadas, linha.baterias_completas), (2, 1))
+
+        dashboard = self.client.get(
+            f'/backend/baterias_testes/dashboard_profissional/{self.profissional_id}',
+            headers={'Authorization': f'Bearer {self.token}'}
+        ).get_json()
+        self.assertEqual(dashboard['numero_total_baterias'], 2)
+        self.assertEqual(dashboard['evolucao_pacientes'][-1]['qtd_pacientes'], 2)
+
+    def test_baterias_dashboard_paginadas(self):
+        """
+        Testa a listagem paginada das baterias do profissional.
+        """
+        with self.app.app_context():
+            for dia in range(1, 4):
+                self._criar_bateria(self.paciente_ids[0], date(2025, 4, dia))
+
+        response = self.client.get(
+            f'/backend/baterias_testes/dashboard_profissional/{self.profissional_id}/baterias/1/2',
+            headers={'Authorization': f'Bearer {self.token}'}
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['totalPages'], 2)
+        self.assertEqual([item['data_aplicacao'] for item in data['items']], ['2025-04-03', '2025-04-02'])
+
+    def test_linha_criada_por_outra_transacao(self):
+        """
+        Testa o primeiro flush do dia quando outro worker cria a linha de rollup antes
+        do INSERT: a bateria é gravada e os contadores somam as duas escritas.
+        """
+        dia = date(2025, 4, 1)
+        inserir = linhas_travadas._inserir_ignorando
+
+        def concorrente(session, modelo, linhas):
+            sketch = HyperLogLog()
+            sketch.add(self.paciente_ids[1])
+            session.execute(insert(RollupProfissionalDia), [{
+                'id': str(ulid.ULID()), 'profissional_saude_id': self.profissional_id, 'dia': dia,
+                'baterias_criadas': 1, 'baterias_completas': 1, 'pacientes_hll': sketch.to_dict()
+            }])
+            inserir(session, modelo, linhas)
+
+        with self.app.app_context():
+            with mock.patch.object(linhas_travadas, '_inserir_ignorando', side_effect=concorrente):
+                self._criar_bateria(self.paciente_ids[0], dia)
+            linha = RollupProfissionalDia.query.filter_by(profissional_saude_id=self.profissional_id, dia=dia).one()
+            self.assertEqual((linha.baterias_criadas, linha.baterias_completas), (2, 1))
+            self.assertEqual(HyperLogLog.from_dict(linha.pacientes_hll).count(), 2)
+            self.assertEqual(BateriaTestes.query.count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ from extensions import db
 from models import Sessao, Questionario, Pergunta, User
 from flask import Blueprint, jsonify
 from decorators import token_required
+from utils.auth import emitir_token
 
 backend_sessoes_bp = Blueprint('backend_sessoes', __name__)
 
@@ -48,9 +49,8 @@ class SessaoTestCase(unittest.TestCase):
             db.session.add(user)
             db.session.flush()
 
-            # Gera o token JWT usando o método to_json()
-            user_json = user.to_json()
-            self.token = user_json['token']
+            # Gera o token JWT com utils.auth.emitir_token
+            self.token = emitir_token(user)
 
             # Cria um questionário de teste
             questionario = Questionario(
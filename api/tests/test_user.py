@@ -1,7 +1,15 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import mock
+import jwt
 from app import create_app
 from extensions import db
-from models import User
+from models import Paciente, User
+from werkzeug.security import generate_password_hash
+from utils import senhas
+from utils.auth import emitir_token
 
 class UserTestCase(unittest.TestCase):
     def setUp(self):
@@ -25,7 +33,7 @@ class UserTestCase(unittest.TestCase):
             db.session.commit()
 
             # Gera o token JWT
-            self.token = self.user.to_json()['token']
+            self.token = emitir_token(self.user)
 
     def tearDown(self):
         """
@@ -128,4 +136,135 @@ class UserTestCase(unittest.TestCase):
             }   
         )
         self.assertEqual(response.status_code, 200)
-        
\ No newline at end of file
+
+    def test_token_somente_no_login(self):
+        """
+        Testa se a listagem não traz tokens e se o login devolve um token reaproveitado.
+        """
+        usuarios = self.client.get('/backend/user/', headers={'Authorization': f'Bearer {self.token}'}).get_json()
+        self.assertNotIn('token', usuarios[0])
+
+        credenciais = {"email": "admin@example.com", "password": "password123"}
+        with mock.patch('utils.auth.jwt.encode', wraps=jwt.encode) as encode:
+            primeiro = self.client.post('/backend/user/login', json=credenciais).get_json()['user']
+            segundo = self.client.post('/backend/user/login', json=credenciais).get_json()['user']
+            self.assertEqual(encode.call_count, 0)
+            self.assertEqual(primeiro['token'], self.token)
+            self.assertEqual(segundo['token'], self.token)
+
+            # Trocar a senha (rota sem autenticação) não devolve token, mas força um novo no login
+            resposta = self.client.put('/backend/user/set_password', json={"id": self.user.id, "password": "nova123"})
+            self.assertEqual(resposta.status_code, 200)
+            self.assertEqual(resposta.get_json(), {"message": "Senha atualizada com sucesso"})
+            self.assertEqual(encode.call_count, 0)
+            resposta = self.client.post('/backend/user/login', json={"email": "admin@example.com", "password": "nova123"})
+            self.assertEqual(encode.call_count, 1)
+        novo = resposta.get_json()['user']['token']
+        resposta = self.client.get('/backend/user/', headers={'Authorization': f'Bearer {novo}'})
+        self.assertEqual(resposta.status_code, 200)
+
+    def test_update_user_descarta_token(self):
+        """
+        Testa se trocar a senha por PUT /user/<id> também força um token novo no login.
+        """
+        with mock.patch('utils.auth.jwt.encode', wraps=jwt.encode) as encode:
+            resposta = self.client.put(f'/backend/user/{self.user.id}', json={"senha": "nova123"},
+                                       headers={'Authorization': f'Bearer {self.token}'})
+            self.assertEqual(resposta.status_code, 200)
+            resposta = self.client.post('/backend/user/login', json={"email": "admin@example.com", "password": "nova123"})
+            self.assertEqual(resposta.status_code, 200)
+            self.assertEqual(encode.call_count, 1)
+
+    def test_set_password_anonimo_sem_token(self):
+        """
+        Testa se PUT /set_password sem autenticação não devolve token nem dados do usuário.
+        """
+        resposta = self.client.put('/backend/user/set_password', json={"id": self.user.id, "password": "nova123"})
+        self.assertEqual(resposta.status_code, 200)
+        dados = resposta.get_json()
+        self.assertEqual(dados, {"message": "Senha atualizada com sucesso"})
+        self.assertNotIn('token', resposta.get_data(as_text=True))
+
+    def test_login_com_perfil(self):
+        """
+        Testa o login numa única consulta, o cache de perfis em /perfil e a sua invalidação.
+        """
+        with self.app.app_context():
+            user = User(email='paciente@example.com', role='paciente', is_active=True)
+            user.set_password('senha123')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Paciente(nome='Paciente Teste', data_nascimento=date(1990, 1, 1), cpf='12345678901', user_id=user.id))
+            db.session.commit()
+
+        resposta = self.client.post('/backend/user/login', json={"email": "paciente@example.com", "password": "senha123"})
+        self.assertEqual(resposta.status_code, 200)
+        self.assertIn('db-count;desc="consultas SQL";dur=1,', resposta.headers['Server-Timing'])
+        dados = resposta.get_json()
+        self.assertEqual(dados['paciente']['nome'], 'Paciente Teste')
+        self.assertIsNone(dados['medico'])
+
+        headers = {'Authorization': f'Bearer {dados["user"]["token"]}'}
+        perfil = self.client.get('/backend/user/perfil', headers=headers)
+        self.assertEqual(perfil.get_json()['paciente']['nome'], 'Paciente Teste')
+        self.assertIn('db-count;desc="consultas SQL";dur=0,', perfil.headers['Server-Timing'])
+
+        with self.app.app_context():
+            Paciente.query.filter_by(cpf='12345678901').one().nome = 'Nome Novo'
+            db.session.commit()
+        perfil = self.client.get('/backend/user/perfil', headers=headers).get_json()
+        self.assertEqual(perfil['paciente']['nome'], 'Nome Novo')
+        self.assertNotIn('token', perfil['user'])
+
+    def test_login_com_pool_de_senhas_ocupado(self):
+        """
+        Testa se o login responde 503 quando a verificação de senha não sai a tempo.
+        """
+        self.app.config['SENHA_TIMEOUT'] = 0.05
+        lento = ThreadPoolExecutor(max_workers=1)
+        with mock.patch('utils.senhas._executor', return_value=lento), \
+                mock.patch('utils.senhas.check_password_hash', side_effect=lambda *args: time.sleep(0.3) or True):
+            resposta = self.client.post('/backend/user/login', json={"email": "admin@example.com", "password": "password123"})
+        self.assertEqual(resposta.status_code, 503)
+        self.assertEqual(resposta.headers['Retry-After'], '1')
+
+    def test_rehash_no_login(self):
+        """
+        Testa se o login troca um hash com parâmetros antigos pelo de SENHA_HASH_METODO.
+        """
+        with self.app.app_context():
+            user = db.session.get(User, self.user.id)
+            user.password_hash = generate_password_hash('password123', 'pbkdf2:sha256:1000')
+            db.session.commit()
+
+        credenciais = {"email": "admin@example.com", "password": "password123"}
+        self.assertEqual(self.client.post('/backend/user/login', json=credenciais).status_code, 200)
+        with self.app.app_context():
+            password_hash = db.session.get(User, self.user.id).password_hash
+            self.assertTrue(password_hash.startswith('scrypt:32768:8:1$'))
+            self.assertFalse(senhas.precisa_rehash(password_hash))
+            self.assertTrue(senhas.verificar_senha(password_hash, 'password123'))
+            self.assertEqual(len(set(senhas.gerar_hashes(['a', 'a', 'b']))), 3)
+        self.assertEqual(self.client.post('/backend/user/login', json=credenciais).status_code, 200)
+
+    def test_admin_metrics_snapshot(self):
+        """
+        Testa se GET /backend/user/admin_metrics devolve o snapshot e se ?fresh=1 recalcula.
+        """
+        from utils import admin_metrics
+        admin_metrics.limpar()
+        self.app.config['ADMIN_METRICS_INTERVALO'] = 0
+        headers = {'Authorization': f'Bearer {self.token}'}
+
+        primeiro = self.client.get('/backend/user/admin_metrics', headers=headers).get_json()
+        with self.app.app_context():
+            db.session.add(User(email='inativo@example.com', role='paciente', is_active=False))
+            db.session.commit()
+
+        segundo = self.client.get('/backend/user/admin_metrics', headers=headers).get_json()
+        self.assertEqual(segundo['calculado_em'], primeiro['calculado_em'])
+        self.assertEqual(segundo['numero_usuarios'], primeiro['numero_usuarios'])
+
+        fresco = self.client.get('/backend/user/admin_metrics?fresh=1', headers=headers).get_json()
+        self.assertEqual(fresco['numero_usuarios'], primeiro['numero_usuarios'] + 1)
+        self.assertEqual(fresco['numero_usuarios_sem_autenticacao'], primeiro['numero_usuarios_sem_autenticacao'] + 1)
@@ -0,0 +1,149 @@
+"""
+Métricas do painel de administração (rota /backend/user/admin_metrics).
+
+As contagens são feitas com uma consulta agregada por família de tabelas (contagens
+condicionais com SUM(CASE ...) em vez de um COUNT(*) por filtro) e guardadas em um
+snapshot em memória, por processo. Uma thread de fundo recalcula o snapshot a cada
+ADMIN_METRICS_INTERVALO segundos (0 desliga a thread; o snapshot passa então a ser
+recalculado na leitura quando tem mais de INTERVALO_PADRAO segundos). A rota devolve
+o snapshot na hora, com a data do cálculo, e aceita ?fresh=1 para forçar o recálculo.
+"""
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import case, func, select
+
+from extensions import db
+from models import Avaliacao, BateriaTestes, Colaborador, Laudo, Medico, Paciente, ProfissionalSaude, Questionario, User
+
+INTERVALO_PADRAO = 60
+
+_lock = threading.Lock()
+_snapshot = None
+_atualizador = None
+
+
+def _contar_se(condicao):
+    return func.coalesce(func.sum(case((condicao, 1), else_=0)), 0)
+
+
+def calcular():
+    """
+    Calcula as métricas no banco: uma consulta por tabela com filtros e uma única
+    consulta com as contagens simples das demais tabelas.
+    """
+    agora = datetime.now()
+    limite = agora - timedelta(days=30)
+    limite_data = date.today() - timedelta(days=30)
+
+    usuarios, usuarios_inativos = db.session.execute(
+        select(func.count(User.id), _contar_se(User.is_active.is_(False)))
+    ).one()
+    pacientes, pacientes_recentes = db.session.execute(
+        select(func.count(Paciente.id), _contar_se(Paciente.created_at >= limite))
+    ).one()
+    baterias, baterias_recentes, baterias_respondidas_recentes = db.session.execute(
+        select(
+            func.count(BateriaTestes.id),
+            _contar_se(BateriaTestes.data_aplicacao >= limite_data),
+            _contar_se((BateriaTestes.data_aplicacao >= limite_data) & BateriaTestes.is_completo.is_(True))
+        )
+    ).one()
+    laudos, laudos_recentes = db.session.execute(
+        select(func.count(Laudo.id), _contar_se(Laudo.updated_at >= limite))
+    ).one()
+    colaboradores, profissionais, medicos, questionarios, avaliacoes = db.session.execute(
+        select(*(
+            select(func.count(modelo.id)).scalar_subquery()
+            for modelo in (Colaborador, ProfissionalSaude, Medico, Questionario, Avaliacao)
+        ))
+    ).one()
+
+    return {
+        "numero_usuarios": usuarios,
+        "numero_pacientes": pacientes,
+        "pacientes_ultimos_30_dias": int(pacientes_recentes),
+        "numero_colaboradores": colaboradores,
+        "numero_profissionais_saude": profissionais,
+        "numero_medicos": medicos,
+        "numero_usuarios_sem_autenticacao": int(usuarios_inativos),
+        "baterias_aplicadas_total": baterias,
+        "baterias_ultimos_30_dias": int(baterias_recentes),
+        "baterias_respondidas_ultimos_30_dias": int(baterias_respondidas_recentes),
+        "questionarios_cadastrados": questionarios,
+        "avaliacoes_cadastrados": avaliacoes,
+        "laudos_emitidos": laudos,
+        "laudos_emitidos_ultimos_30_dias": int(laudos_recentes),
+    }
+
+
+def atualizar():
+    """
+    Recalcula e publica o snapshot. Retorna o novo snapshot.
+    """
+    global _snapshot
+    inicio = time.perf_counter()
+    metricas = calcular()
+    snapshot = {
+        "metricas": metricas,
+        "calculado_em": datetime.now(timezone.utc),
+        "duracao_ms": round((time.perf_counter() - inicio) * 1000, 1),
+        "_monotonic": time.monotonic(),
+    }
+    with _lock:
+        _snapshot = snapshot
+    return snapshot
+
+
+def obter(app, fresh=False):
+    """
+    Retorna o snapshot atual, iniciando o atualizador de fundo na primeira chamada.
+    Recalcula na hora com `fresh`, se ainda não houver snapshot ou se ele tiver mais
+    de duas vezes o intervalo (thread parada ou desligada).
+    """
+    intervalo = app.config.get("ADMIN_METRICS_INTERVALO", INTERVALO_PADRAO)
+    iniciar_atualizador(app)
+    idade_maxima = 2 * intervalo if intervalo else INTERVALO_PADRAO
+    with _lock:
+        snapshot = _snapshot
+    if fresh or snapshot is None or time.monotonic() - snapshot["_monotonic"] > idade_maxima:
+        snapshot = atualizar()
+    return snapshot
+
+
+def iniciar_atualizador(app):
+    """
+    Inicia (uma vez por processo) a thread que recalcula o snapshot a cada
+    ADMIN_METRICS_INTERVALO segundos. Retorna False se o intervalo for 0.
+    """
+    global _atualizador
+    intervalo = app.config.get("ADMIN_METRICS_INTERVALO", INTERVALO_PADRAO)
+    if not intervalo:
+        return False
+    with _lock:
+        if _atualizador is not None and _atualizador.is_alive():
+            return True
+
+        def executar():
+            while True:
+                time.sleep(intervalo)
+                try:
+                    with app.app_context():
+                        atualizar()
+                        db.session.remove()
+                except Exception as e:
+                    app.logger.error(f"Erro ao atualizar admin_metrics em segundo plano: {e}")
+
+        _atualizador = threading.Thread(target=executar, name="admin-metrics", daemon=True)
+        _atualizador.start()
+    return True
+
+
+def limpar():
+    """
+    Descarta o snapshot (usado nos testes).
+    """
+    global _snapshot
+    with _lock:
+        _snapshot = None
@@ -1,7 +1,102 @@
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
 from functools import wraps
 from flask import request, jsonify, abort
 import jwt
 from flask import current_app
+from utils.cache import LRUCache
+
+# Claims já verificados, por processo: hash(SECRET_KEY + token) -> (exp, claims).
+# O mesmo token de 12 horas chega em quase toda requisição; a verificação da
+# assinatura e o parse do JSON só são refeitos quando ele sai do cache.
+_tokens = LRUCache(maxsize=4096)
+
+
+def _chave_token(token):
+    # A SECRET_KEY entra na chave: trocar a chave invalida o que estiver no cache
+    return hashlib.sha256(f"{current_app.config['SECRET_KEY']}\0{token}".encode()).digest()
+
+
+def decodificar_token(token):
+    """
+    Claims de um token válido, do cache enquanto `exp` não passar. Levanta as mesmas
+    exceções de jwt.decode; tokens sem `exp` não são guardados.
+    """
+    chave = _chave_token(token)
+    cacheado = _tokens.get(chave)
+    if cacheado is not None:
+        if time.time() < cacheado[0]:
+            return cacheado[1]
+        _tokens.pop(chave)  # expirado: jwt.decode abaixo dá o erro
+
+    data = jwt.decode(
+        token,
+        current_app.config['SECRET_KEY'],
+        algorithms=["HS256"]
+    )
+    if isinstance(data.get('exp'), (int, float)):
+        _tokens.set(chave, (data['exp'], data))
+    return data
+
+
+VALIDADE_TOKEN = timedelta(hours=12)
+# Um token emitido é reaproveitado (logins repetidos do mesmo usuário) enquanto
+# ainda tiver pelo menos metade da validade; depois disso outro é assinado.
+VALIDADE_MINIMA_REUSO = VALIDADE_TOKEN / 2
+
+# Tokens emitidos, por processo: (user_id, role) -> (exp, email, SECRET_KEY, token)
+_emitidos = LRUCache(maxsize=4096)
+
+
+def emitir_token(user):
+    """
+    Token de acesso do usuário (12 horas), usado apenas no login e ao definir a senha.
+    Reaproveita o último token emitido para o mesmo (user_id, role) enquanto ele
+    tiver ao menos VALIDADE_MINIMA_REUSO pela frente.
+    """
+    secret_key = current_app.config['SECRET_KEY']
+    chave = (user.id, user.role)
+    agora = datetime.now(timezone.utc)
+    emitido = _emitidos.get(chave)
+    if emitido is not None:
+        exp, email, chave_emitida, token = emitido
+        if email == user.email and chave_emitida == secret_key and exp - agora >= VALIDADE_MINIMA_REUSO:
+            return token
+
+    exp = agora + VALIDADE_TOKEN
+    token = jwt.encode(
+        {
+            'id': user.id,
+            'email': user.email,
+            'exp': exp,
+            'role': user.role,
+        },
+        secret_key,
+        algorithm='HS256'
+    )
+    _emitidos.set(chave, (exp, user.email, secret_key, token))
+    return token
+
+
+def descartar_token_emitido(user):
+    """
+    Faz o próximo emitir_token do usuário assinar um token novo (ex.: troca de senha).
+    """
+    _emitidos.pop((user.id, user.role))
+
+
+def stats():
+    """
+    Tamanho e taxa de acertos do cache de tokens deste processo.
+    """
+    return _tokens.stats()
+
+
+def limpar_cache():
+    _tokens.clear()
+    _emitidos.clear()
+
 
 def token_required(roles=None):
     """
@@ -22,19 +117,15 @@ def token_required(roles=None):
                 abort(401, description="Token não fornecido")
 
             try:
-                # Decodifica o token usando a SECRET_KEY do Flask
-                data = jwt.decode(
-                    token, 
-                    current_app.config['SECRET_KEY'], 
-                    algorithms=["HS256"]
-                )
+                # Decodifica o token usando a SECRET_KEY do Flask (ou pega do cache)
+                data = decodificar_token(token)
 
                 # Verifica se a role do usuário está permitida
                 if roles and data.get('role') not in roles:
                     abort(403, description="Usuário não autorizado")
 
                 # Adiciona os dados do token ao request para uso posterior
-                request.user = data
+                request.user = dict(data)  # cópia: o dict do cache é compartilhado
 
             except jwt.ExpiredSignatureError:
                 abort(401, description="Token expirado")
@@ -0,0 +1,209 @@
+"""
+Materialização das pontuações por sessão das baterias de testes (tabela bateria_scores).
+
+As linhas são recalculadas pelo motor vetorizado (utils/pontuacao.py) sempre que as
+respostas de uma bateria são gravadas, dentro da mesma transação. Cada linha guarda
+a versao_pontuacao do questionário compilado (utils/pontuacao.py), um hash só do que
+altera as pontuações: editar textos ou a ordem de exibição não invalida as linhas.
+Linhas de uma versão antiga são ignoradas na leitura e a bateria é pontuada na hora
+até ser recalculada; o comando `flask manutencao-noturna` repontua essas baterias
+todas as noites (`flask backfill-scores --desatualizadas`).
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import ulid
+from sqlalchemy import delete, insert, select
+
+from extensions import db
+from models import BateriaScore, BateriaTestes
+from utils import pontuacao, questionario_cache
+
+
+def agrupar_por_questionario(baterias):
+    """
+    Agrupa as baterias por questionario_id (ignorando as que não têm questionário).
+    """
+    grupos = defaultdict(list)
+    for bateria in baterias:
+        if bateria.questionario_id:
+            grupos[bateria.questionario_id].append(bateria)
+    return grupos
+
+
+def materializar(baterias):
+    """
+    Recalcula as linhas de bateria_scores das baterias informadas, na transação
+    corrente (o commit fica a cargo de quem chamou). Retorna a quantidade de linhas gravadas.
+    As baterias precisam ter id (use db.session.flush() antes, se forem novas).
+    """
+    baterias = [bateria for bateria in baterias if bateria.id]
+    if not baterias:
+        return 0
+
+    grupos = agrupar_por_questionario(baterias)
+    snapshots = questionario_cache.obter_snapshots(grupos.keys())
+    agora = datetime.now(timezone.utc)
+
+    linhas = []
+    for questionario_id, grupo in grupos.items():
+        snapshot = snapshots.get(questionario_id)
+        if snapshot is None:
+            continue
+        compilado = pontuacao.obter_compilado(snapshot)
+        if not compilado.sessao_ids:
+            continue
+        resultado = compilado.pontuar_lote([bateria.respostas or {} for bateria in grupo])
+        for i, bateria in enumerate(grupo):
+            for s, sessao_id in enumerate(compilado.sessao_ids):
+                linhas.append({
+                    'id': str(ulid.ULID()),
+                    'bateria_id': bateria.id,
+                    'sessao_id': sessao_id,
+                    'questionario_id': questionario_id,
+                    'versao_pontuacao': compilado.versao_pontuacao,
+                    'pontuacao_obtida': float(resultado.total[i, s]),
+                    'pontuacao_maxima': float(compilado.maximo_sessao[s]),
+                    'media': float(resultado.media[i, s]),
+                    'moda': resultado.moda[i][s],
+                    'percentual': float(resultado.percentual[i, s]),
+                    'perguntas_respondidas': int(resultado.respondidas[i, s]),
+                    'created_at': agora,
+                    'updated_at': agora
+                })
+
+    db.session.execute(
+        delete(BateriaScore).where(BateriaScore.bateria_id.in_([bateria.id for bateria in baterias])),
+        execution_options={'synchronize_session': False}
+    )
+    if linhas:
+        db.session.execute(insert(BateriaScore), linhas)
+    return len(linhas)
+
+
+def versoes_atuais(questionario_ids):
+    """
+    Retorna {questionario_id: versao_pontuacao} dos questionários informados que têm
+    sessões pontuáveis (os demais não geram linhas em bateria_scores).
+    """
+    versoes = {}
+    for questionario_id, snapshot in questionario_cache.obter_snapshots(questionario_ids).items():
+        compilado = pontuacao.obter_compilado(snapshot)
+        if compilado.sessao_ids:
+            versoes[questionario_id] = compilado.versao_pontuacao
+    return versoes
+
+
+def consulta_desatualizadas(questionario_id, versao_pontuacao):
+    """
+    Consulta ORM das baterias respondidas de um questionário que não têm linhas
+    calculadas com a versao_pontuacao informada (ausentes ou de uma versão antiga).
+    """
+    atualizadas = select(BateriaScore.id).where(
+        BateriaScore.bateria_id == BateriaTestes.id,
+        BateriaScore.versao_pontuacao == versao_pontuacao
+    )
+    return BateriaTestes.query.filter(
+        BateriaTestes.questionario_id == questionario_id,
+        BateriaTestes.respostas.isnot(None),
+        ~atualizadas.exists()
+    )
+
+
+def _linhas_atualizadas(linhas, compilado):
+    """
+    Indica se as linhas de bateria_scores de uma bateria cobrem todas as sessões
+    graficáveis e foram calculadas com a versao_pontuacao atual do questionário.
+    """
+    return (
+        bool(linhas)
+        and len(linhas) == len(compilado.sessao_ids)
+        and all(linha.versao_pontuacao == compilado.versao_pontuacao for linha in linhas)
+        and {linha.sessao_id for linha in linhas} == set(compilado.sessao_ids)
+    )
+
+
+def estatisticas_por_bateria(baterias, snapshots):
+    """
+    Retorna {bateria_id: {sessao_id: estatisticas_sessao}} a partir de bateria_scores.
+    Baterias sem linhas (ou com linhas de outra versao_pontuacao) são pontuadas
+    na hora pelo motor vetorizado, sem gravar nada.
+    """
+    baterias = [bateria for bateria in baterias if bateria.id]
+    if not baterias:
+        return {}
+
+    linhas_por_bateria = defaultdict(list)
+    for score in BateriaScore.query.filter(BateriaScore.bateria_id.in_([b.id for b in baterias])):
+        linhas_por_bateria[score.bateria_id].append(score)
+
+    resultado = {}
+    pendentes = []
+    for bateria in baterias:
+        snapshot = snapshots.get(bateria.questionario_id)
+        if snapshot is None:
+            resultado[bateria.id] = {}
+            continue
+        compilado = pontuacao.obter_compilado(snapshot)
+        linhas = linhas_por_bateria.get(bateria.id, [])
+        if _linhas_atualizadas(linhas, compilado):
+            resultado[bateria.id] = {linha.sessao_id: linha.estatisticas_sessao() for linha in linhas}
+        else:
+            pendentes.append(bateria)
+
+    for questionario_id, grupo in agrupar_por_questionario(pendentes).items():
+        compilado = pontuacao.obter_compilado(snapshots[questionario_id])
+        lote = compilado.pontuar_lote([bateria.respostas or {} for bateria in grupo])
+        for i, bateria in enumerate(grupo):
+            resultado[bateria.id] = compilado.estatisticas(lote, i)
+
+    return resultado
+
+
+def serie_do_paciente(paciente_id, snapshot, somente_completas=True):
+    """
+    Pontuações por sessão das baterias de um paciente em um questionário, em ordem de
+    data_aplicacao: [(bateria, {sessao_id: estatisticas_sessao})], onde bateria tem
+    id, avaliacao_id, data_aplicacao e is_completo.
+    Lê apenas colunas leves das baterias e as linhas de bateria_scores (duas consultas
+    indexadas por paciente); o JSON de respostas só é carregado para as baterias cujas
+    linhas estão ausentes ou desatualizadas, que são pontuadas na hora.
+    """
+    compilado = pontuacao.obter_compilado(snapshot)
+    consulta = select(
+        BateriaTestes.id, BateriaTestes.avaliacao_id, BateriaTestes.data_aplicacao, BateriaTestes.is_completo
+    ).where(
+        BateriaTestes.paciente_id == paciente_id,
+        BateriaTestes.questionario_id == snapshot.questionario_id
+    ).order_by(BateriaTestes.data_aplicacao, BateriaTestes.id)
+    if somente_completas:
+        consulta = consulta.where(BateriaTestes.is_completo.is_(True))
+    baterias = db.session.execute(consulta).all()
+    if not baterias:
+        return []
+
+    linhas_por_bateria = defaultdict(list)
+    for score in BateriaScore.query.join(BateriaTestes, BateriaTestes.id == BateriaScore.bateria_id).filter(
+        BateriaTestes.paciente_id == paciente_id,
+        BateriaScore.questionario_id == snapshot.questionario_id
+    ):
+        linhas_por_bateria[score.bateria_id].append(score)
+
+    pontuacoes = {}
+    pendentes = []
+    for bateria in baterias:
+        linhas = linhas_por_bateria.get(bateria.id, [])
+        if _linhas_atualizadas(linhas, compilado):
+            pontuacoes[bateria.id] = {linha.sessao_id: linha.estatisticas_sessao() for linha in linhas}
+        else:
+            pendentes.append(bateria.id)
+
+    if pendentes:
+        respostas = dict(db.session.execute(
+            select(BateriaTestes.id, BateriaTestes.respostas).where(BateriaTestes.id.in_(pendentes))
+        ).all())
+        lote = compilado.pontuar_lote([respostas.get(bateria_id) or {} for bateria_id in pendentes])
+        for i, bateria_id in enumerate(pendentes):
+            pontuacoes[bateria_id] = compilado.estatisticas(lote, i)
+
+    return [(bateria, pontuacoes[bateria.id]) for bateria in baterias]
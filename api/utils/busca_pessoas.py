@@ -0,0 +1,295 @@
+"""
+Busca de pessoas (pacientes, médicos, colaboradores e profissionais de saúde) por nome.
+
+Em vez de um LIKE '%nome%' em cada tabela, os nomes ficam numa tabela lateral
+(pessoas_busca) já normalizados (sem acentos, minúsculos, pontuação trocada por
+espaço), com um índice invertido de trigramas (pessoas_busca_trigramas). Cada termo
+da busca deve aparecer como trecho do nome, em qualquer ordem. A consulta parte do
+trigrama mais raro da busca, usando o índice, e confirma os candidatos com LIKE na
+tabela lateral. Os resultados são ordenados por relevância (nome igual, começa com
+a busca, busca no início de uma palavra, demais), depois pelo nome, e paginados por
+cursor (utils/paginacao.py). Buscas só com termos de 1 ou 2 letras não têm
+trigramas: percorrem a tabela lateral na ordem do nome, sem relevância.
+
+A tabela é atualizada no mesmo flush em que as pessoas são criadas, renomeadas ou
+removidas pelo ORM (listener after_flush). Escritas que contornam o ORM (ex.: ON
+DELETE CASCADE a partir de users) são corrigidas por `flask rebuild-busca-pessoas`,
+e as rotas ignoram linhas cujas entidades não existem mais. Num banco que já tinha
+pessoas antes da tabela existir, o init_db a preenche (preencher_se_vazia).
+"""
+import re
+from collections import defaultdict
+
+import ulid
+import unidecode
+from flask import jsonify, request
+from sqlalchemy import case, delete, event, false, func, insert, inspect, literal, select
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models import Colaborador, Medico, Paciente, PessoaBusca, PessoaBuscaTrigrama, ProfissionalSaude
+from utils import paginacao
+
+PAPEIS = {
+    Paciente: 'paciente',
+    Medico: 'medico',
+    Colaborador: 'colaborador',
+    ProfissionalSaude: 'profissional_saude',
+}
+# Nome do papel nas respostas de /user/find_user_by_name
+ROLES = {'profissional_saude': 'profissional'}
+
+MAXIMO_TRIGRAMAS = 12
+LIMITE_CONTAGEM = 2000
+
+_SEPARADORES = re.compile(r'[^a-z0-9]+')
+
+
+def normalizar(nome):
+    """
+    Minúsculas, sem acentos, pontuação trocada por espaço e espaços simples.
+    """
+    return ' '.join(_SEPARADORES.split(unidecode.unidecode(nome or '').lower())).strip()
+
+
+def _trigramas(texto):
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+def _remover(conexao, pares):
+    """
+    Remove as linhas das pessoas [(papel, entidade_id)].
+    """
+    por_papel = defaultdict(set)
+    for papel, entidade_id in pares:
+        por_papel[papel].add(entidade_id)
+    for papel, ids in por_papel.items():
+        pessoas = select(PessoaBusca.id).where(PessoaBusca.papel == papel, PessoaBusca.entidade_id.in_(ids))
+        conexao.execute(delete(PessoaBuscaTrigrama).where(PessoaBuscaTrigrama.pessoa_busca_id.in_(pessoas)))
+        conexao.execute(delete(PessoaBusca).where(PessoaBusca.papel == papel, PessoaBusca.entidade_id.in_(ids)))
+
+
+def _inserir(conexao, pessoas):
+    """
+    Insere as pessoas [(papel, entidade_id, user_id, nome)] e os trigramas dos seus nomes.
+    """
+    linhas = []
+    trigramas = []
+    for papel, entidade_id, user_id, nome in pessoas:
+        pessoa_id = str(ulid.ULID())
+        nome_normalizado = normalizar(nome)[:100]
+        linhas.append({
+            'id': pessoa_id,
+            'papel': papel,
+            'entidade_id': entidade_id,
+            'user_id': user_id,
+            'nome': nome,
+            'nome_normalizado': nome_normalizado
+        })
+        trigramas.extend(
+            {'trigrama': trigrama, 'papel': papel, 'pessoa_busca_id': pessoa_id}
+            for trigrama in _trigramas(nome_normalizado)
+        )
+    if linhas:
+        conexao.execute(insert(PessoaBusca), linhas)
+    if trigramas:
+        conexao.execute(insert(PessoaBuscaTrigrama), trigramas)
+
+
+@event.listens_for(Session, 'after_flush')
+def _sincronizar_pessoas(session, flush_context):
+    """
+    Reflete na tabela lateral as pessoas novas, renomeadas e removidas do flush.
+    """
+    atualizar = []
+    remover = []
+    for entidade in session.new:
+        if type(entidade) in PAPEIS:
+            atualizar.append(entidade)
+    for entidade in session.dirty:
+        if type(entidade) not in PAPEIS or entidade in session.deleted:
+            continue
+        estado = inspect(entidade)
+        if estado.attrs.nome.history.has_changes() or estado.attrs.user_id.history.has_changes():
+            atualizar.append(entidade)
+            remover.append((PAPEIS[type(entidade)], entidade.id))
+    for entidade in session.deleted:
+        if type(entidade) in PAPEIS:
+            remover.append((PAPEIS[type(entidade)], entidade.id))
+    if not atualizar and not remover:
+        return
+
+    conexao = session.connection()
+    if remover:
+        _remover(conexao, remover)
+    _inserir(conexao, [
+        (PAPEIS[type(entidade)], entidade.id, entidade.user_id, entidade.nome)
+        for entidade in atualizar
+    ])
+
+
+def consulta(texto, papeis=None):
+    """
+    Consulta (ORM) das pessoas cujo nome contém todos os termos de `texto`, com a
+    coluna `relevancia`. Retorna (consulta, colunas da ordenação), ou (None, None) se
+    a busca não tiver termos.
+    """
+    busca = normalizar(texto)
+    if not busca:
+        return None, None
+    termos = busca.split()
+    trigramas = sorted(set().union(*(_trigramas(termo) for termo in termos)))[:MAXIMO_TRIGRAMAS]
+
+    if trigramas:
+        relevancia = case(
+            (PessoaBusca.nome_normalizado == busca, 0),
+            (PessoaBusca.nome_normalizado.like(f'{busca}%'), 1),
+            (PessoaBusca.nome_normalizado.like(f'% {busca}%'), 2),
+            else_=3
+        ).label('relevancia')
+        ordem = [relevancia, PessoaBusca.nome_normalizado, PessoaBusca.id]
+    else:
+        # buscas de 1 ou 2 letras casam com muitos nomes: só a ordem alfabética, pelo índice
+        relevancia = literal(3).label('relevancia')
+        ordem = [PessoaBusca.nome_normalizado, PessoaBusca.id]
+    resultado = db.session.query(
+        PessoaBusca.id,
+        PessoaBusca.papel,
+        PessoaBusca.entidade_id,
+        PessoaBusca.user_id,
+        PessoaBusca.nome,
+        PessoaBusca.nome_normalizado,
+        relevancia
+    ).filter(*(PessoaBusca.nome_normalizado.like(f'%{termo}%') for termo in termos))
+
+    if not trigramas:
+        if papeis:
+            resultado = resultado.filter(PessoaBusca.papel.in_(papeis))
+        return resultado, ordem
+
+    # Candidatos = pessoas com o trigrama mais raro da busca (contagens limitadas a
+    # LIMITE_CONTAGEM para que trigramas comuns não custem uma leitura longa do índice)
+    def filtro_trigrama(trigrama):
+        condicoes = [PessoaBuscaTrigrama.trigrama == trigrama]
+        if papeis:
+            condicoes.append(PessoaBuscaTrigrama.papel.in_(papeis))
+        return condicoes
+
+    frequencias = db.session.execute(select(*(
+        select(func.count()).select_from(
+            select(PessoaBuscaTrigrama.pessoa_busca_id).where(*filtro_trigrama(trigrama)).limit(LIMITE_CONTAGEM).subquery()
+        ).scalar_subquery()
+        for trigrama in trigramas
+    ))).one()
+    if min(frequencias) == 0:
+        # algum trigrama da busca não aparece em nenhum nome
+        return resultado.filter(false()), ordem
+    mais_raro = min(zip(frequencias, trigramas))[1]
+    resultado = resultado.filter(PessoaBusca.id.in_(
+        select(PessoaBuscaTrigrama.pessoa_busca_id).where(*filtro_trigrama(mais_raro))
+    ))
+    return resultado, ordem
+
+
+def _json(linha):
+    """
+    Resultado da busca com o papel. Como em find_user_by_name, o id de um paciente é o
+    do usuário e o das demais pessoas é o da própria entidade.
+    """
+    return {
+        'id': linha.user_id if linha.papel == 'paciente' else linha.entidade_id,
+        'nome': linha.nome,
+        'role': ROLES.get(linha.papel, linha.papel),
+        'entidade_id': linha.entidade_id
+    }
+
+
+def buscar(texto, papeis=None):
+    """
+    Todas as pessoas encontradas, ordenadas por relevância, como JSON com o papel.
+    """
+    resultado, colunas = consulta(texto, papeis)
+    if resultado is None:
+        return []
+    return [_json(linha) for linha in resultado.order_by(*colunas)]
+
+
+def responder(texto, papeis=None, limite=paginacao.LIMITE_PADRAO):
+    """
+    Resposta paginada por cursor (cursor, limit, count de request.args) da busca com papel.
+    """
+    resultado, colunas = consulta(texto, papeis)
+    if resultado is None:
+        return jsonify({'items': [], 'next_cursor': None, 'prev_cursor': None}), 200
+    return paginacao.responder(resultado, colunas, _json, limite=limite)
+
+
+def _entidades(modelo, linhas):
+    """
+    Carrega numa consulta as entidades das linhas, na ordem das linhas.
+    """
+    ids = [linha.entidade_id for linha in linhas]
+    por_id = {entidade.id: entidade for entidade in modelo.query.filter(modelo.id.in_(ids))} if ids else {}
+    return [por_id[entidade_id] for entidade_id in ids if entidade_id in por_id]
+
+
+def filtrar_por_nome(modelo, texto, page=1, limite=10):
+    """
+    Rotas filter_by_name (page/len): JSON das entidades do modelo encontradas pelo nome.
+    Em modo cursor (?cursor=) devolve a resposta paginada por cursor.
+    """
+    resultado, colunas = consulta(texto, [PAPEIS[modelo]])
+    if paginacao.modo_cursor():
+        if resultado is None:
+            return jsonify({'items': [], 'next_cursor': None, 'prev_cursor': None}), 200
+        try:
+            pagina = paginacao.paginar(
+                resultado,
+                colunas,
+                limite=request.args.get('limit', limite),
+                cursor=request.args.get('cursor'),
+                contar=request.args.get('count') in ('1', 'true')
+            )
+        except (paginacao.CursorInvalido, ValueError) as e:
+            return jsonify({'error': str(e)}), 400
+        pagina['items'] = [entidade.to_json() for entidade in _entidades(modelo, pagina['items'])]
+        return jsonify(pagina), 200
+
+    if resultado is None:
+        return jsonify([]), 200
+    page = max(page, 1)
+    linhas = resultado.order_by(*colunas).offset((page - 1) * limite).limit(limite).all()
+    return jsonify([entidade.to_json() for entidade in _entidades(modelo, linhas)]), 200
+
+
+def reconstruir(tamanho_lote=2000):
+    """
+    Refaz a tabela lateral a partir das tabelas das pessoas. Retorna a quantidade de pessoas.
+    """
+    conexao = db.session.connection()
+    conexao.execute(delete(PessoaBuscaTrigrama))
+    conexao.execute(delete(PessoaBusca))
+    total = 0
+    for modelo, papel in PAPEIS.items():
+        ultimo_id = ''
+        while True:
+            lote = conexao.execute(
+                select(modelo.id, modelo.user_id, modelo.nome)
+                .where(modelo.id > ultimo_id).order_by(modelo.id).limit(tamanho_lote)
+            ).all()
+            if not lote:
+                break
+            _inserir(conexao, [(papel, entidade_id, user_id, nome) for entidade_id, user_id, nome in lote])
+            total += len(lote)
+            ultimo_id = lote[-1][0]
+    return total
+
+
+def preencher_se_vazia(tamanho_lote=2000):
+    """
+    Reconstrói a tabela lateral se ela estiver vazia (banco criado antes dela, com a
+    tabela recém-criada pelo create_all). Retorna a quantidade de pessoas incluídas.
+    """
+    if db.session.execute(select(PessoaBusca.id).limit(1)).first() is not None:
+        return 0
+    return reconstruir(tamanho_lote)
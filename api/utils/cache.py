@@ -0,0 +1,59 @@
+from collections import OrderedDict
+import threading
+
+
+class LRUCache:
+    """
+    Cache LRU simples, limitado por quantidade de itens e seguro para uso entre threads.
+    Cada processo (worker do gunicorn) mantém a sua própria instância.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, chave, default=None):
+        with self._lock:
+            if chave not in self._dados:
+                self.misses += 1
+                return default
+            self._dados.move_to_end(chave)
+            self.hits += 1
+            return self._dados[chave]
+
+    def set(self, chave, valor):
+        with self._lock:
+            self._dados[chave] = valor
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.maxsize:
+                self._dados.popitem(last=False)
+
+    def pop(self, chave, default=None):
+        with self._lock:
+            return self._dados.pop(chave, default)
+
+    def clear(self):
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self):
+        return len(self._dados)
+
+    def __contains__(self, chave):
+        return chave in self._dados
+
+    def stats(self):
+        """
+        Retorna tamanho atual, capacidade e taxa de acertos do cache.
+        """
+        total = self.hits + self.misses
+        return {
+            'tamanho': len(self._dados),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0
+        }
@@ -0,0 +1,158 @@
+"""
+Carga do catálogo de CIDs (tabela cids) a partir de fixtures/cids.json.
+
+O arquivo é lido em fluxo, um objeto por vez (`iterar_json_array`), e gravado em
+lotes de tamanho fixo: os CIDs novos são inseridos e os que mudaram de descrição são
+atualizados, com um commit por lote. A carga é idempotente e é pulada quando o
+checksum do arquivo é o mesmo da última carga concluída (tabela cargas_catalogo).
+Ao final, o índice de busca em memória é refeito neste processo. Os demais
+processos percebem a troca do checksum e refazem o deles (ver utils/cid_index.py).
+"""
+import hashlib
+import json
+import os
+
+import unidecode
+from sqlalchemy import insert, select, update
+
+from extensions import db
+from models import CID, CargaCatalogo
+from utils import cid_index
+
+NOME_CATALOGO = 'cids'
+CAMINHO_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'cids.json')
+TAMANHO_LOTE_PADRAO = 1000
+TAMANHO_BLOCO = 64 * 1024
+
+_ESPACOS = ' \t\r\n'
+
+
+def iterar_json_array(arquivo, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Percorre os elementos de um array JSON (de objetos) lendo o arquivo texto em
+    blocos, sem carregar o documento inteiro.
+    """
+    decodificador = json.JSONDecoder()
+    buffer = arquivo.read(tamanho_bloco)
+    fim_do_arquivo = not buffer
+    posicao = 0
+    aberto = False
+    while True:
+        while posicao < len(buffer) and (buffer[posicao] in _ESPACOS or (aberto and buffer[posicao] == ',')):
+            posicao += 1
+        if posicao < len(buffer):
+            if not aberto:
+                if buffer[posicao] != '[':
+                    raise ValueError('O arquivo não contém um array JSON')
+                aberto = True
+                posicao += 1
+                continue
+            if buffer[posicao] == ']':
+                return
+            try:
+                elemento, fim = decodificador.raw_decode(buffer, posicao)
+            except json.JSONDecodeError:
+                if fim_do_arquivo:
+                    raise
+            else:
+                if fim < len(buffer) or fim_do_arquivo:
+                    yield elemento
+                    posicao = fim
+                    continue
+        elif fim_do_arquivo:
+            raise ValueError('Array JSON incompleto')
+        bloco = arquivo.read(tamanho_bloco)
+        fim_do_arquivo = not bloco
+        buffer = buffer[posicao:] + bloco
+        posicao = 0
+
+
+def calcular_checksum(caminho):
+    """
+    SHA-256 do arquivo, lido em blocos.
+    """
+    soma = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(TAMANHO_BLOCO), b''):
+            soma.update(bloco)
+    return soma.hexdigest()
+
+
+def _normalizar(item):
+    """
+    Linha da tabela cids a partir de um item do arquivo, ou None se for inválido.
+    Aceita a chave antiga 'unidecode' e calcula a descrição sem acentos se faltar.
+    """
+    cid = str(item.get('cid') or '').strip()
+    descricao = str(item.get('descricao') or '').strip()
+    if not cid or not descricao or len(cid) > 26 or len(descricao) > 255:
+        return None
+    unidecode_descricao = item.get('unidecode_descricao') or item.get('unidecode') or unidecode.unidecode(descricao).lower()
+    return {'cid': cid, 'descricao': descricao, 'unidecode_descricao': unidecode_descricao[:255]}
+
+
+def _gravar_lote(lote, resumo):
+    """
+    Insere os CIDs novos do lote e atualiza os que mudaram. O lote é {cid: linha}.
+    """
+    existentes = {
+        cid: (descricao, unidecode_descricao)
+        for cid, descricao, unidecode_descricao in db.session.execute(
+            select(CID.cid, CID.descricao, CID.unidecode_descricao).where(CID.cid.in_(list(lote)))
+        )
+    }
+    novos = [linha for cid, linha in lote.items() if cid not in existentes]
+    alterados = [
+        linha for cid, linha in lote.items()
+        if cid in existentes and existentes[cid] != (linha['descricao'], linha['unidecode_descricao'])
+    ]
+    if novos:
+        db.session.execute(insert(CID), novos)
+    if alterados:
+        db.session.execute(update(CID), alterados)
+    db.session.commit()
+    resumo['inseridos'] += len(novos)
+    resumo['atualizados'] += len(alterados)
+
+
+def carregar_cids(caminho=None, tamanho_lote=TAMANHO_LOTE_PADRAO, forcar=False):
+    """
+    Carrega o arquivo na tabela cids, se o checksum mudou desde a última carga (ou com
+    `forcar`). Retorna um resumo {'status', 'lidos', 'inseridos', 'atualizados', 'ignorados'}.
+    CIDs que saíram do arquivo não são removidos (podem estar ligados a laudos).
+    """
+    caminho = caminho or CAMINHO_PADRAO
+    checksum = calcular_checksum(caminho)
+    resumo = {'status': 'inalterado', 'checksum': checksum, 'lidos': 0, 'inseridos': 0, 'atualizados': 0, 'ignorados': 0}
+
+    carga = db.session.get(CargaCatalogo, NOME_CATALOGO)
+    if carga is not None and carga.checksum == checksum and not forcar:
+        return resumo
+
+    lote = {}
+    with open(caminho, encoding='utf-8') as arquivo:
+        for item in iterar_json_array(arquivo):
+            resumo['lidos'] += 1
+            linha = _normalizar(item) if isinstance(item, dict) else None
+            if linha is None:
+                resumo['ignorados'] += 1
+                continue
+            lote[linha['cid']] = linha
+            if len(lote) >= tamanho_lote:
+                _gravar_lote(lote, resumo)
+                lote = {}
+    if lote:
+        _gravar_lote(lote, resumo)
+
+    # O checksum só é gravado no fim: uma carga interrompida é refeita na próxima vez
+    carga = db.session.get(CargaCatalogo, NOME_CATALOGO)
+    if carga is None:
+        carga = CargaCatalogo(nome=NOME_CATALOGO)
+        db.session.add(carga)
+    carga.checksum = checksum
+    carga.total = resumo['lidos'] - resumo['ignorados']
+    db.session.commit()
+
+    cid_index.carregar()
+    resumo['status'] = 'carregado'
+    return resumo
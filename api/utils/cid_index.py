@@ -0,0 +1,402 @@
+"""
+Índice em memória para a busca de CIDs (autocomplete do laudo).
+
+A tabela cids (~12 mil linhas) muda só quando a carga de CIDs é executada, então o
+índice é montado uma vez a partir dela (numa thread logo após a inicialização, na
+própria inicialização ou na primeira busca, conforme CID_INDEX_WARMUP) e consultado
+sem ir ao banco:
+- índice invertido de trigramas sobre unidecode_descricao: cada termo da busca com 3+
+  caracteres restringe os candidatos à interseção das listas dos seus trigramas, e os
+  candidatos são confirmados por substring (mesma semântica do antigo LIKE '%termo%');
+- índice de prefixo do código (lista ordenada + bisect), para buscas como "F32" ou "f32.1".
+
+Buscas com vários termos exigem todos (em qualquer ordem) e são ordenadas por
+relevância: palavra inteira > início de palavra > meio de palavra, depois descrições
+mais curtas. `carregar()` refaz o índice; a carga do catálogo (utils/cid_catalogo.py)
+chama-o no próprio processo, e os demais processos refazem o seu quando percebem que
+o checksum da última carga mudou (verificado a cada INTERVALO_VERIFICACAO segundos).
+
+`pesquisar()` (rota /laudos/cid_search) acrescenta o modo tolerante a erros de
+digitação ("esquisofrenia"): cada termo é trocado pelas palavras do vocabulário das
+descrições a poucas edições dele (índice SymSpell, montado junto com o índice em
+`carregar()`) e os documentos que contêm essas palavras completam o resultado
+exato. A busca aproximada respeita um orçamento de tempo (resultado marcado como
+parcial se estourar) e as respostas das consultas mais frequentes ficam num LRU
+limitado, descartado junto com o índice.
+"""
+import heapq
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+import unidecode
+from sqlalchemy import select
+
+from extensions import db
+from models import CID, CargaCatalogo
+from utils.symspell import IndiceSymSpell
+
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 200  # ?limit= aceito pelas rotas de busca
+ORCAMENTO_PADRAO_MS = 50
+TAMANHO_CACHE = 1024
+INTERVALO_VERIFICACAO = 60
+
+_PADRAO_CODIGO = re.compile(r'^[a-z]\d[\d.]*$')
+_SEPARADORES = re.compile(r'[^a-z0-9]+')
+
+_lock = threading.Lock()
+_construcao = threading.Lock()
+_aquecimento = None
+_indice = None
+_versao = None
+_verificado_em = 0.0
+
+
+def normalizar(texto):
+    """
+    Minúsculas, sem acentos e com pontuação trocada por espaço.
+    """
+    return _SEPARADORES.sub(' ', unidecode.unidecode(texto or '').lower()).strip()
+
+
+def _codigo_normalizado(codigo):
+    return codigo.replace('.', '').upper()
+
+
+def _trigramas(termo):
+    return {termo[i:i + 3] for i in range(len(termo) - 2)}
+
+
+def _distancia_tolerada(termo):
+    """
+    Erros de digitação aceitos por termo: nenhum até 3 letras, 1 até 6, depois 2.
+    """
+    if len(termo) <= 3:
+        return 0
+    return 1 if len(termo) <= 6 else 2
+
+
+class IndiceCID:
+    """
+    Índice imutável sobre uma lista de CIDs [(cid, descricao, unidecode_descricao)].
+    """
+
+    def __init__(self, linhas):
+        self.cids = []
+        self.descricoes = []
+        self.unidecode_descricoes = []
+        self.textos = []
+        postings = {}
+        for documento, (cid, descricao, unidecode_descricao) in enumerate(linhas):
+            texto = ' ' + normalizar(unidecode_descricao or descricao) + ' '
+            self.cids.append(cid)
+            self.descricoes.append(descricao)
+            self.unidecode_descricoes.append(unidecode_descricao)
+            self.textos.append(texto)
+            for trigrama in _trigramas(texto):
+                postings.setdefault(trigrama, []).append(documento)
+        self.postings = {trigrama: array('I', documentos) for trigrama, documentos in postings.items()}
+        self.codigos = sorted((_codigo_normalizado(cid), documento) for documento, cid in enumerate(self.cids))
+        self._lock = threading.Lock()
+        self._palavras = None
+        self._corretor = None
+        self._cache = OrderedDict()
+        self.acertos_cache = 0
+        self.faltas_cache = 0
+
+    def __len__(self):
+        return len(self.cids)
+
+    def json(self, documento):
+        return {
+            'cid': self.cids[documento],
+            'descricao': self.descricoes[documento],
+            'unidecode_descricao': self.unidecode_descricoes[documento]
+        }
+
+    def por_codigo(self, prefixo, limite):
+        """
+        Documentos cujo código começa com o prefixo (ignorando pontos e maiúsculas).
+        """
+        prefixo = _codigo_normalizado(prefixo)
+        inicio = bisect_left(self.codigos, (prefixo, -1))
+        resultado = []
+        for codigo, documento in self.codigos[inicio:]:
+            if not codigo.startswith(prefixo) or len(resultado) >= limite:
+                break
+            resultado.append(documento)
+        return resultado
+
+    def _candidatos(self, termos):
+        """
+        Interseção das listas de trigramas dos termos (None = todos os documentos,
+        quando nenhum termo tem 3 caracteres).
+        """
+        listas = [
+            self.postings.get(trigrama, ())
+            for termo in termos
+            for trigrama in _trigramas(termo)
+        ]
+        if not listas:
+            return None
+        listas.sort(key=len)
+        candidatos = set(listas[0])
+        for lista in listas[1:]:
+            if not candidatos:
+                break
+            candidatos.intersection_update(lista)
+        return candidatos
+
+    def por_descricao(self, termos, limite):
+        """
+        Documentos que contêm todos os termos, ordenados por relevância.
+        """
+        candidatos = self._candidatos(termos)
+        if candidatos is None:
+            candidatos = range(len(self.textos))
+
+        # textos com espaço nas pontas: ' termo ' é palavra inteira, ' termo' início de palavra
+        termos = [(termo, ' ' + termo, ' ' + termo + ' ') for termo in termos]
+        pontuados = []
+        for documento in candidatos:
+            texto = self.textos[documento]
+            pontuacao = 0
+            for termo, inicio, palavra in termos:
+                if termo not in texto:
+                    break
+                if palavra in texto:
+                    pontuacao += 3
+                elif inicio in texto:
+                    pontuacao += 2
+                else:
+                    pontuacao += 1
+            else:
+                pontuados.append((-pontuacao, len(texto), self.cids[documento], documento))
+        return [documento for *_, documento in heapq.nsmallest(limite, pontuados)]
+
+    def _documentos(self, consulta, limite):
+        termos = normalizar(consulta).split()
+        if not termos or limite <= 0:
+            return []
+
+        documentos = []
+        compacta = (consulta or '').strip().lower()
+        if _PADRAO_CODIGO.match(compacta):
+            documentos = self.por_codigo(compacta, limite)
+        vistos = set(documentos)
+        for documento in self.por_descricao(termos, limite):
+            if len(documentos) >= limite:
+                break
+            if documento not in vistos:
+                documentos.append(documento)
+        return documentos
+
+    def buscar(self, consulta, limite=LIMITE_PADRAO):
+        """
+        Busca por código (quando a consulta parece um código CID) e por descrição.
+        Retorna os JSONs dos CIDs, no máximo `limite`.
+        """
+        return [self.json(documento) for documento in self._documentos(consulta, limite)]
+
+    def _estruturas_aproximadas(self):
+        """
+        Palavras das descrições (palavra -> documentos) e o índice SymSpell sobre elas,
+        construídos na primeira busca aproximada.
+        """
+        if self._corretor is None:
+            with self._lock:
+                if self._corretor is None:
+                    palavras = {}
+                    for documento, texto in enumerate(self.textos):
+                        for palavra in set(texto.split()):
+                            palavras.setdefault(palavra, []).append(documento)
+                    self._palavras = {palavra: array('I', documentos) for palavra, documentos in palavras.items()}
+                    self._corretor = IndiceSymSpell({palavra: len(documentos) for palavra, documentos in palavras.items()})
+        return self._palavras, self._corretor
+
+    def _alternativas(self, termo, prefixo):
+        """
+        Palavras do vocabulário aceitas para o termo: {palavra: distancia}. O último
+        termo da consulta (`prefixo`) também casa com o começo das palavras.
+        """
+        palavras, corretor = self._estruturas_aproximadas()
+        alternativas = {}
+        if termo in palavras:
+            alternativas[termo] = 0
+        if prefixo:
+            inicio = bisect_left(corretor.palavras, termo)
+            for palavra in corretor.palavras[inicio:]:
+                if not palavra.startswith(termo):
+                    break
+                alternativas[palavra] = 0
+        maximo = _distancia_tolerada(termo)
+        if maximo:
+            for palavra, d, _ in corretor.sugestoes(termo, maximo, prefixo=prefixo):
+                alternativas.setdefault(palavra, d)
+        return alternativas
+
+    def aproximados(self, consulta, limite, prazo=None, ignorar=()):
+        """
+        Busca tolerante a erros de digitação. Retorna (documentos, correcoes, parcial):
+        documentos com todos os termos (ou uma correção de cada) ordenados pelo total
+        de edições, as correções {termo: palavra} sugeridas e se o prazo
+        (time.perf_counter()) estourou antes do fim.
+        """
+        termos = normalizar(consulta).split()
+        if not termos or limite <= 0:
+            return [], {}, False
+        palavras, _ = self._estruturas_aproximadas()
+        prefixo_final = not (consulta or '').endswith(' ')
+
+        correcoes = {}
+        distancias = None
+        parcial = False
+        for i, termo in enumerate(termos):
+            if prazo is not None and time.perf_counter() > prazo:
+                parcial = True
+                break
+            alternativas = self._alternativas(termo, prefixo_final and i == len(termos) - 1)
+            if alternativas and min(alternativas.values()) > 0:
+                correcoes[termo] = min(alternativas, key=lambda palavra: (alternativas[palavra], -len(palavras[palavra])))
+            do_termo = {}
+            for palavra, d in alternativas.items():
+                # termos curtos por prefixo têm milhares de alternativas: o prazo vale aqui também
+                if prazo is not None and time.perf_counter() > prazo:
+                    parcial = True
+                    break
+                for documento in palavras[palavra]:
+                    if distancias is None or documento in distancias:
+                        if d < do_termo.get(documento, d + 1):
+                            do_termo[documento] = d
+            if distancias is None:
+                distancias = do_termo
+            else:
+                distancias = {documento: distancias[documento] + d for documento, d in do_termo.items()}
+            if not distancias or parcial:
+                break
+
+        pontuados = (
+            (d, len(self.textos[documento]), self.cids[documento], documento)
+            for documento, d in (distancias or {}).items()
+            if documento not in ignorar
+        )
+        return [documento for *_, documento in heapq.nsmallest(limite, pontuados)], correcoes, parcial
+
+    def pesquisar(self, consulta, limite=LIMITE_PADRAO, fuzzy=False, orcamento_ms=ORCAMENTO_PADRAO_MS):
+        """
+        Resultado exato (como `buscar`) completado, com `fuzzy`, pela busca aproximada.
+        Retorna {'items', 'correcoes', 'parcial'}; respostas completas ficam no LRU.
+        """
+        chave = (normalizar(consulta), (consulta or '').endswith(' '), limite, bool(fuzzy))
+        with self._lock:
+            resposta = self._cache.get(chave)
+            if resposta is not None:
+                self._cache.move_to_end(chave)
+                self.acertos_cache += 1
+                return resposta
+            self.faltas_cache += 1
+
+        prazo = time.perf_counter() + orcamento_ms / 1000
+        documentos = self._documentos(consulta, limite)
+        correcoes, parcial = {}, False
+        if fuzzy and len(documentos) < limite:
+            extras, correcoes, parcial = self.aproximados(
+                consulta, limite - len(documentos), prazo=prazo, ignorar=set(documentos)
+            )
+            documentos += extras
+        resposta = {
+            'items': [self.json(documento) for documento in documentos],
+            'correcoes': correcoes,
+            'parcial': parcial
+        }
+        if not parcial:
+            with self._lock:
+                self._cache[chave] = resposta
+                if len(self._cache) > TAMANHO_CACHE:
+                    self._cache.popitem(last=False)
+        return resposta
+
+
+def _versao_catalogo():
+    """
+    Checksum da última carga do catálogo de CIDs (None se nunca foi carregado por arquivo).
+    """
+    return db.session.execute(
+        select(CargaCatalogo.checksum).where(CargaCatalogo.nome == 'cids')
+    ).scalar()
+
+
+def carregar():
+    """
+    (Re)constrói o índice a partir da tabela cids. Retorna a quantidade de CIDs indexados.
+    """
+    global _indice, _versao, _verificado_em
+    versao = _versao_catalogo()
+    linhas = db.session.query(CID.cid, CID.descricao, CID.unidecode_descricao).order_by(CID.cid).all()
+    novo = IndiceCID(linhas)
+    novo._estruturas_aproximadas()
+    with _lock:
+        _indice, _versao, _verificado_em = novo, versao, time.monotonic()
+    return len(novo)
+
+
+def obter_indice():
+    """
+    Retorna o índice, construindo-o na primeira chamada e refazendo-o se outra carga
+    do catálogo foi concluída desde então.
+    """
+    global _verificado_em
+    if _indice is None:
+        # Uma só construção por vez: quem chega durante o aquecimento espera por ela
+        with _construcao:
+            if _indice is None:
+                carregar()
+    elif time.monotonic() - _verificado_em > INTERVALO_VERIFICACAO:
+        _verificado_em = time.monotonic()
+        if _versao_catalogo() != _versao:
+            carregar()
+    return _indice
+
+
+def aquecer_em_segundo_plano(app):
+    """
+    Constrói o índice numa thread (uma vez por processo), para que a inicialização do
+    worker não espere a leitura da tabela cids. Buscas feitas antes do fim esperam a
+    construção em obter_indice().
+    """
+    global _aquecimento
+    with _lock:
+        if _aquecimento is not None:
+            return
+
+        def executar():
+            try:
+                with app.app_context():
+                    obter_indice()
+                    db.session.remove()
+            except Exception as e:
+                app.logger.warning(f"Índice de CIDs não carregado em segundo plano: {e}")
+
+        _aquecimento = threading.Thread(target=executar, name="cid-index", daemon=True)
+        _aquecimento.start()
+
+
+def buscar(consulta, limite=LIMITE_PADRAO):
+    return obter_indice().buscar(consulta, limite)
+
+
+def pesquisar(consulta, limite=LIMITE_PADRAO, fuzzy=False, orcamento_ms=ORCAMENTO_PADRAO_MS):
+    return obter_indice().pesquisar(consulta, limite, fuzzy, orcamento_ms)
+
+
+def invalidar():
+    """
+    Descarta o índice; o próximo uso reconstrói a partir do banco.
+    """
+    global _indice
+    with _lock:
+        _indice = None
@@ -0,0 +1,77 @@
+"""
+Relatório de tempo da inicialização da aplicação (create_app).
+
+Cada fase do create_app é medida com `relatorio.fase(nome)`. Ao final o relatório
+guarda o tempo de importação do módulo app, o total e a memória residente (RSS) do
+processo. Ele fica em app.extensions['inicializacao'] e sai numa linha do log. É
+consultado em GET /backend/user/startup_report e `flask startup-report`, para que
+regressões no boot dos workers fiquem visíveis.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+def rss_bytes():
+    """
+    Memória residente atual do processo (pico, se /proc não estiver disponível), ou None.
+    """
+    try:
+        with open('/proc/self/statm') as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+class RelatorioInicializacao:
+    """
+    Tempos (ms) das fases da inicialização de um processo.
+    """
+
+    def __init__(self, importacao_ms=None):
+        self.iniciado_em = datetime.now(timezone.utc)
+        self.importacao_ms = importacao_ms
+        self.fases = {}
+        self.total_ms = None
+        self.rss_bytes = None
+        self._inicio = time.perf_counter()
+
+    @contextmanager
+    def fase(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases[nome] = round((time.perf_counter() - inicio) * 1000, 1)
+
+    def concluir(self):
+        self.total_ms = round((time.perf_counter() - self._inicio) * 1000, 1)
+        self.rss_bytes = rss_bytes()
+        return self
+
+    def resumo(self):
+        """
+        Uma linha para o log.
+        """
+        fases = ', '.join(f'{nome} {ms:.0f} ms' for nome, ms in self.fases.items())
+        rss = f', RSS {self.rss_bytes / 2 ** 20:.0f} MiB' if self.rss_bytes else ''
+        importacao = f'importação {self.importacao_ms:.0f} ms + ' if self.importacao_ms is not None else ''
+        return f'Inicialização em {importacao}{self.total_ms:.0f} ms ({fases}){rss}'
+
+    def to_json(self):
+        return {
+            'pid': os.getpid(),
+            'iniciado_em': self.iniciado_em.isoformat(),
+            'importacao_ms': self.importacao_ms,
+            'fases_ms': self.fases,
+            'total_ms': self.total_ms,
+            'rss_bytes': self.rss_bytes
+        }
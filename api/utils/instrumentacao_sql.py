@@ -0,0 +1,192 @@
+"""
+Instrumentação de SQL por requisição.
+
+Hooks do SQLAlchemy (before/after_cursor_execute) contam as instruções executadas
+e o tempo gasto no banco durante cada requisição, guardados em flask.g. Consultas
+feitas fora de uma requisição (comandos do CLI, threads de aquecimento) não são
+contadas.
+
+Ao fim da requisição:
+- a resposta ganha o cabeçalho Server-Timing (db;dur, db-count, app;dur), visível no
+  painel de rede do navegador;
+- instruções com o mesmo formato (o SQL sem os valores) repetidas SQL_N_MAIS_1_LIMITE
+  vezes ou mais são registradas no log como suspeitas de N+1;
+- os números entram no resumo por endpoint, escrito no log a cada
+  SQL_RESUMO_INTERVALO segundos (0 desliga o resumo periódico).
+
+Desligue tudo com SQL_INSTRUMENTACAO=false.
+"""
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_CHAVE_INICIO = 'instrumentacao_sql.inicio'
+
+_lock = threading.Lock()
+_por_endpoint = {}
+_ultimo_resumo = time.monotonic()
+_hooks_registrados = False
+
+_RE_LISTA_PARAMETROS = re.compile(r'\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)')
+_RE_TEXTO = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMERO = re.compile(r'\b\d+(?:\.\d+)?\b')
+_RE_ESPACOS = re.compile(r'\s+')
+
+
+def formato(sql):
+    """
+    Formato de uma instrução: o SQL sem valores literais, com listas IN de qualquer
+    tamanho reduzidas a (?) e espaços normalizados.
+    """
+    sql = _RE_TEXTO.sub('?', sql)
+    sql = _RE_NUMERO.sub('?', sql)
+    sql = _RE_LISTA_PARAMETROS.sub('(?)', sql)
+    return _RE_ESPACOS.sub(' ', sql).strip()
+
+
+class EstadoRequisicao:
+    """
+    Instruções e tempo de banco de uma requisição.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.db_ms = 0.0
+        self.formatos = Counter()
+
+    def registrar(self, sql, duracao_ms):
+        self.consultas += 1
+        self.db_ms += duracao_ms
+        self.formatos[formato(sql)] += 1
+
+    def suspeitas_n_mais_1(self, limite):
+        """
+        [(formato, repetições)] das instruções repetidas `limite` vezes ou mais.
+        """
+        return [(sql, n) for sql, n in self.formatos.most_common() if n >= limite]
+
+
+def _estado():
+    if not has_app_context():
+        return None
+    return g.get('instrumentacao_sql')
+
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    if _estado() is not None:
+        conn.info.setdefault(_CHAVE_INICIO, []).append(time.perf_counter())
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    estado = _estado()
+    inicios = conn.info.get(_CHAVE_INICIO)
+    if estado is None or not inicios:
+        return
+    estado.registrar(statement, (time.perf_counter() - inicios.pop()) * 1000)
+
+
+def _erro_ao_executar(contexto):
+    # Instrução com erro não passa por after_cursor_execute: descarta o início dela
+    inicios = contexto.connection.info.get(_CHAVE_INICIO) if contexto.connection is not None else None
+    if inicios:
+        inicios.pop()
+
+
+def _iniciar_requisicao():
+    g.instrumentacao_sql = EstadoRequisicao()
+
+
+def _finalizar_requisicao(app, resposta):
+    estado = g.get('instrumentacao_sql')
+    if estado is None:
+        return resposta
+    app_ms = (time.perf_counter() - estado.inicio) * 1000
+    resposta.headers.add(
+        'Server-Timing',
+        f'db;dur={estado.db_ms:.1f}, db-count;desc="consultas SQL";dur={estado.consultas}, app;dur={app_ms:.1f}'
+    )
+
+    endpoint = request.endpoint or 'desconhecido'
+    suspeitas = estado.suspeitas_n_mais_1(app.config['SQL_N_MAIS_1_LIMITE'])
+    for sql, repeticoes in suspeitas:
+        app.logger.warning(f"Possível N+1 em {endpoint}: {repeticoes}x {sql[:300]}")
+    _acumular(endpoint, estado, app_ms, bool(suspeitas))
+
+    intervalo = app.config['SQL_RESUMO_INTERVALO']
+    if intervalo and time.monotonic() - _ultimo_resumo >= intervalo:
+        registrar_resumo(app.logger)
+    return resposta
+
+
+def _acumular(endpoint, estado, app_ms, n_mais_1):
+    with _lock:
+        dados = _por_endpoint.setdefault(endpoint, {
+            'requisicoes': 0, 'consultas': 0, 'max_consultas': 0, 'db_ms': 0.0, 'app_ms': 0.0, 'n_mais_1': 0
+        })
+        dados['requisicoes'] += 1
+        dados['consultas'] += estado.consultas
+        dados['max_consultas'] = max(dados['max_consultas'], estado.consultas)
+        dados['db_ms'] += estado.db_ms
+        dados['app_ms'] += app_ms
+        dados['n_mais_1'] += n_mais_1
+
+
+def resumo(zerar=False):
+    """
+    {endpoint: {'requisicoes', 'consultas_media', 'max_consultas', 'db_ms_medio',
+    'app_ms_medio', 'n_mais_1'}} desde o último resumo, ordenado pelo tempo de banco.
+    Com `zerar`, recomeça a contagem.
+    """
+    global _ultimo_resumo
+    with _lock:
+        itens = sorted(_por_endpoint.items(), key=lambda item: item[1]['db_ms'], reverse=True)
+        if zerar:
+            _por_endpoint.clear()
+            _ultimo_resumo = time.monotonic()
+    return {
+        endpoint: {
+            'requisicoes': dados['requisicoes'],
+            'consultas_media': round(dados['consultas'] / dados['requisicoes'], 1),
+            'max_consultas': dados['max_consultas'],
+            'db_ms_medio': round(dados['db_ms'] / dados['requisicoes'], 1),
+            'app_ms_medio': round(dados['app_ms'] / dados['requisicoes'], 1),
+            'n_mais_1': dados['n_mais_1']
+        }
+        for endpoint, dados in itens
+    }
+
+
+def registrar_resumo(logger):
+    """
+    Escreve o resumo por endpoint no log (uma linha por endpoint) e recomeça a contagem.
+    """
+    dados = resumo(zerar=True)
+    for endpoint, d in dados.items():
+        logger.info(
+            f"SQL {endpoint}: {d['requisicoes']} req, {d['consultas_media']} consultas/req "
+            f"(máx. {d['max_consultas']}), db {d['db_ms_medio']} ms/req, app {d['app_ms_medio']} ms/req, "
+            f"N+1 em {d['n_mais_1']} req"
+        )
+    return dados
+
+
+def registrar(app):
+    """
+    Liga a instrumentação na aplicação. Os hooks do Engine são globais e registrados
+    uma única vez por processo; cada aplicação registra seus before/after_request.
+    """
+    global _hooks_registrados
+    if not _hooks_registrados:
+        event.listen(Engine, 'before_cursor_execute', _antes_de_executar)
+        event.listen(Engine, 'after_cursor_execute', _depois_de_executar)
+        event.listen(Engine, 'handle_error', _erro_ao_executar)
+        _hooks_registrados = True
+
+    app.before_request(_iniciar_requisicao)
+    app.after_request(lambda resposta: _finalizar_requisicao(app, resposta))
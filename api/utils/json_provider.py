@@ -0,0 +1,85 @@
+"""
+Provider de JSON da aplicação (app.json), usado por jsonify e request.get_json.
+
+Com o orjson instalado, respostas e corpos de requisição são serializados por ele,
+bem mais rápido que o módulo json da biblioteca padrão nos payloads grandes
+(estatísticas de avaliações, questionários detalhados). Sem o orjson, vale o
+provider padrão do Flask com a mesma conversão de tipos, então a resposta não muda:
+- date, datetime e time em ISO 8601 ('2025-04-01', '2025-04-01T10:00:00+00:00'),
+  igual ao .isoformat() (o provider padrão do Flask usaria o formato de cabeçalho HTTP);
+- Enum pelo valor (o orjson não permite outro formato; para devolver o nome da
+  chave, como o tipo_pagamento das avaliações, converta no to_json);
+- Decimal e UUID como string, dataclasses como dict;
+- chaves não-string (int, None, datas) convertidas para string.
+
+Diferenças do orjson em relação ao módulo json: a saída é sempre UTF-8 (sem escapes
+\\uXXXX), NaN/Infinity viram null e inteiros acima de 64 bits não são aceitos.
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date, time
+from enum import Enum
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - o orjson está no requirements.txt
+    orjson = None
+
+# Argumentos de dumps que o orjson atende; com outros, usa o módulo json
+_ARGUMENTOS_ORJSON = frozenset(('sort_keys', 'indent', 'separators', 'ensure_ascii'))
+
+
+def padrao(objeto):
+    """
+    Conversão dos tipos que o serializador não conhece (default do json.dumps/orjson.dumps).
+    """
+    if isinstance(objeto, (date, time)):
+        return objeto.isoformat()
+    if isinstance(objeto, Enum):
+        return objeto.value
+    if isinstance(objeto, (decimal.Decimal, uuid.UUID)):
+        return str(objeto)
+    if dataclasses.is_dataclass(objeto) and not isinstance(objeto, type):
+        return dataclasses.asdict(objeto)
+    if hasattr(objeto, '__html__'):
+        return str(objeto.__html__())
+    raise TypeError(f"Object of type {type(objeto).__name__} is not JSON serializable")
+
+
+class JSONProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider com orjson quando disponível e datas em ISO 8601.
+    """
+    default = staticmethod(padrao)
+
+    def _opcoes(self, sort_keys, indentar):
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        if indentar:
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or not _ARGUMENTOS_ORJSON.issuperset(kwargs):
+            return super().dumps(obj, **kwargs)
+        opcoes = self._opcoes(kwargs.get('sort_keys', self.sort_keys), kwargs.get('indent'))
+        return orjson.dumps(obj, default=padrao, option=opcoes).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        # orjson.JSONDecodeError herda de ValueError, como o erro do módulo json
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indentar = (self.compact is None and self._app.debug) or self.compact is False
+        opcoes = self._opcoes(self.sort_keys, indentar) | orjson.OPT_APPEND_NEWLINE
+        # Os bytes do orjson vão direto para a resposta, sem passar por str
+        return self._app.response_class(orjson.dumps(obj, default=padrao, option=opcoes), mimetype=self.mimetype)
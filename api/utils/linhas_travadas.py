@@ -0,0 +1,62 @@
+"""
+Linhas de agregado (rollups, sketches) criadas e atualizadas sob concorrência.
+
+Um SELECT ... FOR UPDATE só trava linhas que já existem: duas transações que
+atualizam ao mesmo tempo a mesma chave ainda sem linha veriam as duas "nenhuma
+linha" e inseririam as duas, e a segunda falharia na restrição única (ou num
+deadlock de gap lock no MySQL). `travar_ou_criar` primeiro insere as linhas vazias
+ignorando as que já existem (INSERT ... ON DUPLICATE KEY UPDATE no MySQL, ON
+CONFLICT DO NOTHING no SQLite e no PostgreSQL) e só então trava todas com
+SELECT ... FOR UPDATE, na ordem da chave, para que os deltas sejam aplicados numa
+linha que com certeza existe e está travada.
+"""
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+
+def _inserir_ignorando(session, modelo, linhas):
+    dialeto = session.get_bind(modelo).dialect.name
+    if dialeto == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as insert_mysql
+        # "id = id" não altera a linha existente; só evita o erro de chave duplicada
+        session.execute(insert_mysql(modelo).values(linhas).on_duplicate_key_update(id=modelo.__table__.c.id))
+    elif dialeto == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as insert_sqlite
+        session.execute(insert_sqlite(modelo).values(linhas).on_conflict_do_nothing())
+    elif dialeto == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as insert_postgresql
+        session.execute(insert_postgresql(modelo).values(linhas).on_conflict_do_nothing())
+    else:
+        for linha in linhas:
+            try:
+                with session.begin_nested():
+                    session.execute(insert(modelo), [linha])
+            except IntegrityError:
+                pass
+
+
+def travar_ou_criar(session, modelo, colunas_chave, vazias):
+    """
+    Garante e trava as linhas de `modelo` das chaves informadas.
+
+    `colunas_chave` são os nomes das colunas da restrição única e `vazias` é
+    {chave: dict com todas as colunas da linha vazia}, com chave = tupla dos valores
+    de colunas_chave. Retorna {chave: linha} com as linhas já travadas e recarregadas
+    do banco (os valores gravados por outras transações já confirmadas).
+    """
+    if not vazias:
+        return {}
+    chaves = sorted(vazias)
+    _inserir_ignorando(session, modelo, [vazias[chave] for chave in chaves])
+
+    colunas = [getattr(modelo, nome) for nome in colunas_chave]
+    consulta = session.query(modelo).filter(
+        *(coluna.in_({chave[i] for chave in chaves}) for i, coluna in enumerate(colunas))
+    ).order_by(*colunas).with_for_update().populate_existing()
+
+    travadas = {}
+    for linha in consulta:
+        chave = tuple(getattr(linha, nome) for nome in colunas_chave)
+        if chave in vazias:
+            travadas[chave] = linha
+    return travadas
@@ -0,0 +1,387 @@
+"""
+Métricas HTTP no formato de texto do Prometheus (rota GET /backend/metrics).
+
+Por endpoint do Flask são registrados: o número de requisições (por método e
+status), o histograma do tempo de resposta, o do tamanho das respostas e o do tempo
+gasto no banco, com a contagem de consultas (estes dois vêm de
+utils/instrumentacao_sql.py e exigem SQL_INSTRUMENTACAO ligado). Há ainda o
+histograma da espera pela conexão do pool: o tempo entre a sessão precisar do banco
+(do_orm_execute/before_flush) e a transação começar numa conexão (after_begin), que
+inclui abrir a conexão quando o pool não tem uma livre.
+
+Cada processo acumula as métricas em memória. Com METRICAS_DIR definido, um thread
+grava o acumulado do processo em METRICAS_DIR/metricas-<pid>-<ulid>.json a cada
+segundo, e a rota soma os arquivos de todos os processos: a resposta é a mesma
+qualquer que seja o worker do gunicorn que a atenda. Quando um worker termina, o
+gunicorn.conf.py junta os seus arquivos ao metricas-agregado.json (incorporar_processo):
+os contadores não voltam para trás e a pasta não cresce a cada worker reciclado.
+O gunicorn.conf.py também esvazia a pasta quando o servidor sobe. Sem METRICAS_DIR, a
+rota mostra só o processo que respondeu.
+
+A rota fica sob o prefixo público /backend e expõe nomes de endpoints, contagens de
+status e latências, por isso só é registrada com METRICAS_TOKEN definido e exige
+`Authorization: Bearer <METRICAS_TOKEN>`. Sem o token a coleta continua (nada é
+exposto) e /backend/metrics responde 404. Configuração de coleta no Prometheus:
+
+    scrape_configs:
+      - job_name: questionario-saude
+        metrics_path: /backend/metrics
+        authorization:
+          type: Bearer
+          credentials_file: /etc/prometheus/metricas_token  # o valor de METRICAS_TOKEN
+        static_configs:
+          - targets: ['api:5000']
+"""
+import glob
+import hmac
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import ulid
+from flask import Response, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows, onde o gunicorn não roda
+    fcntl = None
+
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_TAMANHO = (100, 1000, 10000, 100000, 1000000, 10000000)
+BUCKETS_ESPERA = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# nome: (tipo, descrição, buckets)
+METRICAS = {
+    'http_requests_total': ('counter', 'Requisições atendidas por endpoint, método e status.', None),
+    'http_request_duration_seconds': ('histogram', 'Tempo de resposta por endpoint.', BUCKETS_LATENCIA),
+    'http_response_size_bytes': ('histogram', 'Tamanho do corpo das respostas por endpoint.', BUCKETS_TAMANHO),
+    'http_request_db_seconds': ('histogram', 'Tempo em consultas SQL por requisição, por endpoint.', BUCKETS_LATENCIA),
+    'http_request_db_queries_total': ('counter', 'Consultas SQL executadas por endpoint.', None),
+    'db_pool_checkout_wait_seconds': ('histogram', 'Espera pela conexão do pool no início das transações.', BUCKETS_ESPERA),
+}
+
+INTERVALO_GRAVACAO = 1.0
+ARQUIVO_AGREGADO = 'metricas-agregado.json'
+
+_CHAVE_ESPERA = 'metricas.espera_conexao'
+
+_lock = threading.Lock()
+_lock_arquivo = threading.Lock()
+_gravado = None  # (arquivo, conteúdo) da última gravação
+_diretorio = None
+_processo = None  # (pid, registro, caminho do arquivo) do processo atual
+_pid_gravador = None
+
+
+class Registro:
+    """
+    Valores das métricas de um processo (ou a soma de vários). Contadores guardam um
+    número; histogramas guardam [contagem por bucket (sem acumular, + o +Inf), soma, contagem].
+    """
+
+    def __init__(self):
+        self.valores = {}
+
+    def incrementar(self, nome, rotulos, valor=1):
+        chave = (nome, rotulos)
+        self.valores[chave] = self.valores.get(chave, 0) + valor
+
+    def observar(self, nome, rotulos, valor):
+        chave = (nome, rotulos)
+        serie = self.valores.get(chave)
+        if serie is None:
+            serie = self.valores[chave] = [[0] * (len(METRICAS[nome][2]) + 1), 0.0, 0]
+        buckets = METRICAS[nome][2]
+        posicao = next((i for i, limite in enumerate(buckets) if valor <= limite), len(buckets))
+        serie[0][posicao] += 1
+        serie[1] += valor
+        serie[2] += 1
+
+    def to_json(self):
+        return [[nome, list(rotulos), valor] for (nome, rotulos), valor in self.valores.items()]
+
+    def somar(self, dados):
+        """
+        Soma ao registro os valores de outro, no formato de to_json.
+        """
+        for nome, rotulos, valor in dados:
+            if nome not in METRICAS:
+                continue
+            chave = (nome, tuple(tuple(par) for par in rotulos))
+            if METRICAS[nome][0] == 'counter':
+                self.valores[chave] = self.valores.get(chave, 0) + valor
+                continue
+            serie = self.valores.get(chave)
+            if serie is None:
+                self.valores[chave] = [list(valor[0]), valor[1], valor[2]]
+            else:
+                serie[0] = [a + b for a, b in zip(serie[0], valor[0])]
+                serie[1] += valor[1]
+                serie[2] += valor[2]
+
+    def expor(self):
+        """
+        Texto no formato de exposição do Prometheus (versão 0.0.4).
+        """
+        linhas = []
+        for nome, (tipo, descricao, buckets) in METRICAS.items():
+            series = sorted((rotulos, valor) for (n, rotulos), valor in self.valores.items() if n == nome)
+            linhas.append(f'# HELP {nome} {descricao}')
+            linhas.append(f'# TYPE {nome} {tipo}')
+            for rotulos, valor in series:
+                if tipo == 'counter':
+                    linhas.append(f'{nome}{_rotulos(rotulos)} {_numero(valor)}')
+                    continue
+                contagens, soma, contagem = valor
+                acumulado = 0
+                for limite, n in zip(buckets + ('+Inf',), contagens):
+                    acumulado += n
+                    linhas.append(f'{nome}_bucket{_rotulos(rotulos + (("le", _numero(limite)),))} {acumulado}')
+                linhas.append(f'{nome}_sum{_rotulos(rotulos)} {_numero(soma)}')
+                linhas.append(f'{nome}_count{_rotulos(rotulos)} {contagem}')
+        return '\n'.join(linhas) + '\n'
+
+
+def _numero(valor):
+    if isinstance(valor, str):
+        return valor
+    return repr(float(valor))
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _rotulos(rotulos):
+    if not rotulos:
+        return ''
+    return '{' + ','.join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos) + '}'
+
+
+def _registro():
+    """
+    Registro do processo atual. Depois de um fork (workers do gunicorn) o filho
+    recomeça do zero, com o seu próprio arquivo e thread de gravação.
+    """
+    global _processo, _pid_gravador
+    pid = os.getpid()
+    processo = _processo
+    if processo is not None and processo[0] == pid:
+        return processo[1]
+    with _lock:
+        if _processo is None or _processo[0] != pid:
+            caminho = os.path.join(_diretorio, f'metricas-{pid}-{ulid.ULID()}.json') if _diretorio else None
+            _processo = (pid, Registro(), caminho)
+            if caminho and _pid_gravador != pid:
+                threading.Thread(target=_gravar_periodicamente, name='metricas', daemon=True).start()
+                _pid_gravador = pid
+        return _processo[1]
+
+
+def gravar():
+    """
+    Grava o acumulado do processo no seu arquivo (troca atômica). Sem METRICAS_DIR, não faz nada.
+    """
+    processo = _processo
+    if processo is None or processo[0] != os.getpid() or not processo[2]:
+        return
+    global _gravado
+    with _lock:
+        dados = json.dumps(processo[1].to_json())
+    with _lock_arquivo:
+        if _gravado == (processo[2], dados):
+            return  # nada mudou desde a última gravação
+        temporario = f'{processo[2]}.tmp'
+        with open(temporario, 'w') as arquivo:
+            arquivo.write(dados)
+        os.replace(temporario, processo[2])
+        _gravado = (processo[2], dados)
+
+
+def _gravar_periodicamente():
+    while True:
+        time.sleep(INTERVALO_GRAVACAO)
+        try:
+            gravar()
+        except OSError:
+            pass
+
+
+def coletar():
+    """
+    Registro com a soma de todos os processos (ou só o atual, sem METRICAS_DIR).
+    """
+    registro = _registro()
+    if not _diretorio:
+        with _lock:
+            return _copia(registro)
+    gravar()
+    total = Registro()
+    with _travado(_diretorio, exclusivo=False):
+        for caminho in glob.glob(os.path.join(_diretorio, 'metricas-*.json')):
+            _somar_arquivo(total, caminho)
+    return total
+
+
+def _somar_arquivo(registro, caminho):
+    try:
+        with open(caminho) as arquivo:
+            registro.somar(json.load(arquivo))
+    except (OSError, ValueError):
+        pass  # arquivo removido ou de outra versão
+
+
+@contextmanager
+def _travado(diretorio, exclusivo):
+    """
+    flock na própria pasta: a leitura dos arquivos (coletar) não vê um worker já
+    somado ao agregado e ainda não apagado (incorporar_processo).
+    """
+    if fcntl is None:
+        yield
+        return
+    descritor = os.open(diretorio, os.O_RDONLY)
+    try:
+        fcntl.flock(descritor, fcntl.LOCK_EX if exclusivo else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(descritor)
+
+
+def incorporar_processo(diretorio, pid):
+    """
+    Soma os arquivos de um processo que terminou ao ARQUIVO_AGREGADO e os apaga
+    (chamado pelo gunicorn no child_exit). Retorna a quantidade de arquivos incorporados.
+    """
+    arquivos = glob.glob(os.path.join(diretorio, f'metricas-{pid}-*.json'))
+    if not arquivos:
+        return 0
+    agregado = os.path.join(diretorio, ARQUIVO_AGREGADO)
+    with _travado(diretorio, exclusivo=True):
+        total = Registro()
+        for caminho in [agregado] + arquivos:
+            _somar_arquivo(total, caminho)
+        temporario = f'{agregado}.tmp'
+        with open(temporario, 'w') as arquivo:
+            json.dump(total.to_json(), arquivo)
+        os.replace(temporario, agregado)
+        for caminho in arquivos + glob.glob(os.path.join(diretorio, f'metricas-{pid}-*.json.tmp')):
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+    return len(arquivos)
+
+
+def _copia(registro):
+    copia = Registro()
+    copia.somar(registro.to_json())
+    return copia
+
+
+def limpar_diretorio(diretorio):
+    """
+    Apaga os arquivos de métricas de uma pasta (chamado pelo gunicorn ao subir).
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    for caminho in glob.glob(os.path.join(diretorio, 'metricas-*.json*')):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+def limpar():
+    """
+    Zera as métricas do processo (usado nos testes).
+    """
+    global _processo
+    with _lock:
+        _processo = None
+
+
+def _iniciar_requisicao():
+    g.metricas_inicio = time.perf_counter()
+
+
+def _registrar_requisicao(resposta):
+    inicio = g.get('metricas_inicio')
+    if inicio is None:
+        return resposta
+    duracao = time.perf_counter() - inicio
+    endpoint = request.endpoint or 'desconhecido'
+    por_endpoint = (('endpoint', endpoint),)
+    tamanho = resposta.content_length
+    estado_sql = g.get('instrumentacao_sql')
+
+    registro = _registro()
+    with _lock:
+        registro.incrementar('http_requests_total', (
+            ('endpoint', endpoint), ('method', request.method), ('status', str(resposta.status_code))
+        ))
+        registro.observar('http_request_duration_seconds', por_endpoint, duracao)
+        if tamanho is not None:
+            registro.observar('http_response_size_bytes', por_endpoint, tamanho)
+        if estado_sql is not None:
+            registro.observar('http_request_db_seconds', por_endpoint, estado_sql.db_ms / 1000)
+            registro.incrementar('http_request_db_queries_total', por_endpoint, estado_sql.consultas)
+    return resposta
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _antes_de_executar(orm_execute_state):
+    orm_execute_state.session.info[_CHAVE_ESPERA] = time.perf_counter()
+
+
+@event.listens_for(Session, 'before_flush')
+def _antes_do_flush(session, flush_context, instances):
+    session.info[_CHAVE_ESPERA] = time.perf_counter()
+
+
+@event.listens_for(Session, 'after_begin')
+def _conexao_obtida(session, transaction, connection):
+    inicio = session.info.pop(_CHAVE_ESPERA, None)
+    if inicio is None:
+        return
+    registro = _registro()
+    with _lock:
+        registro.observar('db_pool_checkout_wait_seconds', (), time.perf_counter() - inicio)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _fim_da_transacao(session, transaction):
+    # Execuções com a conexão já obtida não passam por after_begin
+    session.info.pop(_CHAVE_ESPERA, None)
+
+
+def expor_metricas():
+    """
+    GET /backend/metrics: métricas de todos os workers no formato do Prometheus.
+    """
+    token = current_app.config.get('METRICAS_TOKEN')
+    enviado = request.headers.get('Authorization', '').removeprefix('Bearer ')
+    if not token or not hmac.compare_digest(enviado.encode(), token.encode()):
+        return Response('Token inválido\n', status=401, mimetype='text/plain')
+    return Response(coletar().expor(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+
+def registrar(app):
+    """
+    Liga a coleta de métricas na aplicação e, com METRICAS_TOKEN definido, a rota
+    /backend/metrics.
+    """
+    global _diretorio
+    diretorio = app.config.get('METRICAS_DIR') or None
+    if diretorio != _diretorio:
+        limpar()
+        _diretorio = diretorio
+    if _diretorio:
+        os.makedirs(_diretorio, exist_ok=True)
+    app.before_request(_iniciar_requisicao)
+    app.after_request(_registrar_requisicao)
+    if app.config.get('METRICAS_TOKEN'):
+        app.add_url_rule('/backend/metrics', 'metricas', expor_metricas, methods=['GET'])
@@ -0,0 +1,123 @@
+"""
+Paginação por cursor (keyset) para as listagens.
+
+Em vez de OFFSET/LIMIT + COUNT(*) (paginate() do Flask-SQLAlchemy), cada página é
+buscada a partir da chave da última linha vista: WHERE chave > cursor ORDER BY chave
+LIMIT n, que custa o mesmo em qualquer profundidade. A chave é o id (ULID, ordenável
+pelo tempo) ou (nome, id) nas listagens por nome. Os cursores next_cursor/prev_cursor
+são opacos (base64 de um JSON) e o total só é contado com ?count=1.
+
+As rotas page/len continuam iguais; o modo cursor é ativado quando a requisição traz o
+parâmetro `cursor` (vazio para a primeira página):
+    GET /backend/pacientes/?cursor=&limit=20
+    GET /backend/pacientes/?cursor=<next_cursor>&limit=20&count=1
+"""
+import base64
+import binascii
+import json
+
+from flask import jsonify, request
+from sqlalchemy import and_, or_
+
+LIMITE_PADRAO = 10
+LIMITE_MAXIMO = 100
+
+
+class CursorInvalido(ValueError):
+    """
+    Cursor malformado ou gerado para outra ordenação.
+    """
+
+
+def modo_cursor():
+    """
+    Indica se a requisição atual pediu paginação por cursor.
+    """
+    return 'cursor' in request.args
+
+
+def codificar_cursor(valores, direcao, colunas):
+    dados = {'v': list(valores), 'd': direcao, 'k': [coluna.key for coluna in colunas]}
+    return base64.urlsafe_b64encode(json.dumps(dados, separators=(',', ':')).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor, colunas):
+    """
+    Retorna (valores, direcao) de um cursor; cursor vazio significa a primeira página.
+    """
+    if not cursor:
+        return None, 'n'
+    try:
+        dados = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        valores, direcao, chaves = dados['v'], dados['d'], dados['k']
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise CursorInvalido('Cursor inválido')
+    if direcao not in ('n', 'p') or chaves != [coluna.key for coluna in colunas] or len(valores) != len(colunas):
+        raise CursorInvalido('Cursor inválido para esta listagem')
+    return valores, direcao
+
+
+def _depois_de(colunas, valores, direcao):
+    """
+    Condição (c1, c2, ...) > (v1, v2, ...) (ou < para trás), expandida em OR/AND para
+    que o banco use o índice da chave: c1 > v1 OR (c1 = v1 AND c2 > v2) ...
+    """
+    alternativas = []
+    for i, coluna in enumerate(colunas):
+        iguais = [colunas[j] == valores[j] for j in range(i)]
+        comparacao = coluna > valores[i] if direcao == 'n' else coluna < valores[i]
+        alternativas.append(and_(*iguais, comparacao))
+    return or_(*alternativas)
+
+
+def paginar(consulta, colunas, limite=LIMITE_PADRAO, cursor=None, contar=False):
+    """
+    Busca uma página de `consulta` ordenada pelas `colunas` (a última deve ser única,
+    normalmente o id). Retorna {'items': [objetos], 'next_cursor', 'prev_cursor'} e,
+    com `contar`, 'total'.
+    """
+    limite = max(1, min(int(limite), LIMITE_MAXIMO))
+    valores, direcao = decodificar_cursor(cursor, colunas)
+
+    pagina = consulta
+    if valores is not None:
+        pagina = pagina.filter(_depois_de(colunas, valores, direcao))
+    ordem = colunas if direcao == 'n' else [coluna.desc() for coluna in colunas]
+    linhas = pagina.order_by(*ordem).limit(limite + 1).all()
+    ha_mais = len(linhas) > limite
+    linhas = linhas[:limite]
+    if direcao == 'p':
+        linhas.reverse()
+
+    def chave(linha):
+        return [getattr(linha, coluna.key) for coluna in colunas]
+
+    tem_seguinte = ha_mais if direcao == 'n' else valores is not None
+    tem_anterior = valores is not None if direcao == 'n' else ha_mais
+    resultado = {
+        'items': linhas,
+        'next_cursor': codificar_cursor(chave(linhas[-1]), 'n', colunas) if linhas and tem_seguinte else None,
+        'prev_cursor': codificar_cursor(chave(linhas[0]), 'p', colunas) if linhas and tem_anterior else None,
+    }
+    if contar:
+        resultado['total'] = consulta.order_by(None).count()
+    return resultado
+
+
+def responder(consulta, colunas, serializar, limite=LIMITE_PADRAO):
+    """
+    Monta a resposta de uma rota em modo cursor a partir de request.args (cursor,
+    limit, count). `limite` é o tamanho padrão da página (ex.: o <len> da rota).
+    """
+    try:
+        pagina = paginar(
+            consulta,
+            colunas,
+            limite=request.args.get('limit', limite),
+            cursor=request.args.get('cursor'),
+            contar=request.args.get('count') in ('1', 'true')
+        )
+    except (CursorInvalido, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    pagina['items'] = [serializar(item) for item in pagina['items']]
+    return jsonify(pagina), 200
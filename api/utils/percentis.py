@@ -0,0 +1,158 @@
+"""
+Percentil populacional das pontuações de sessão (tabela sketches_pontuacao).
+
+Para cada (questionário, sessão) é mantido um sketch KLL (utils/quantis.py) com o
+percentual de aproveitamento das baterias completas. Quando uma bateria é concluída,
+o sketch recebe as pontuações já materializadas em bateria_scores, na mesma transação;
+assim o percentil de um paciente é consultado sem varrer as baterias. Respostas
+alteradas depois da conclusão não são retiradas do sketch; o comando
+`flask rebuild-percentis` (rodado toda madrugada por `flask manutencao-noturna`)
+reconstrói tudo a partir de bateria_scores e corrige esse desvio.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import ulid
+from sqlalchemy import delete, insert, select
+
+from extensions import db
+from models import BateriaScore, BateriaTestes, SketchPontuacao
+from utils import bateria_scores
+from utils.linhas_travadas import travar_ou_criar
+from utils.quantis import KLLSketch
+
+
+def registrar_conclusoes(baterias):
+    """
+    Acrescenta aos sketches as pontuações das baterias recém-concluídas (use depois de
+    bateria_scores.materializar, antes do commit). Baterias incompletas são ignoradas.
+    Retorna a quantidade de valores inseridos.
+    """
+    ids = [bateria.id for bateria in baterias if bateria.id and bateria.is_completo]
+    if not ids:
+        return 0
+
+    valores = defaultdict(list)
+    for questionario_id, sessao_id, percentual in db.session.execute(
+        select(BateriaScore.questionario_id, BateriaScore.sessao_id, BateriaScore.percentual)
+        .where(BateriaScore.bateria_id.in_(ids))
+    ):
+        valores[(questionario_id, sessao_id)].append(percentual)
+    if not valores:
+        return 0
+
+    # A primeira conclusão de uma sessão cria a linha vazia antes do FOR UPDATE, sem
+    # disputar a restrição única com outra conclusão concorrente (utils/linhas_travadas.py)
+    agora = datetime.now(timezone.utc)
+    vazias = {
+        chave: {
+            'id': str(ulid.ULID()),
+            'questionario_id': chave[0],
+            'sessao_id': chave[1],
+            'sketch': KLLSketch().to_dict(),
+            'total_baterias': 0,
+            'updated_at': agora
+        }
+        for chave in valores
+    }
+    linhas = travar_ou_criar(db.session, SketchPontuacao, ('questionario_id', 'sessao_id'), vazias)
+
+    for chave, percentuais in valores.items():
+        linha = linhas[chave]
+        sketch = KLLSketch.from_dict(linha.sketch)
+        for percentual in percentuais:
+            sketch.update(percentual)
+        linha.sketch = sketch.to_dict()
+        linha.total_baterias = (linha.total_baterias or 0) + len(percentuais)
+
+    return sum(len(percentuais) for percentuais in valores.values())
+
+
+def carregar_sketches(pares):
+    """
+    Retorna {(questionario_id, sessao_id): KLLSketch} para os pares informados, em uma consulta.
+    """
+    pares = set(pares)
+    if not pares:
+        return {}
+    linhas = SketchPontuacao.query.filter(
+        SketchPontuacao.questionario_id.in_({questionario_id for questionario_id, _ in pares}),
+        SketchPontuacao.sessao_id.in_({sessao_id for _, sessao_id in pares})
+    )
+    return {
+        (linha.questionario_id, linha.sessao_id): KLLSketch.from_dict(linha.sketch)
+        for linha in linhas
+        if (linha.questionario_id, linha.sessao_id) in pares
+    }
+
+
+def anexar_percentis(baterias, estatisticas):
+    """
+    Acrescenta `percentil_populacional` (0 a 100, ou None sem população de referência) e
+    `populacao_referencia` a cada estatisticas_sessao de {bateria_id: {sessao_id: estatisticas_sessao}}.
+    """
+    pares = {
+        (bateria.questionario_id, sessao_id)
+        for bateria in baterias
+        for sessao_id in (estatisticas.get(bateria.id) or {})
+    }
+    sketches = carregar_sketches(pares)
+    for bateria in baterias:
+        for sessao_id, estatisticas_sessao in (estatisticas.get(bateria.id) or {}).items():
+            sketch = sketches.get((bateria.questionario_id, sessao_id))
+            percentil = sketch.percentil(estatisticas_sessao['percentual_aproveitamento']) if sketch else None
+            estatisticas_sessao['percentil_populacional'] = round(percentil, 1) if percentil is not None else None
+            estatisticas_sessao['populacao_referencia'] = sketch.n if sketch else 0
+    return estatisticas
+
+
+def reconstruir(questionario_id=None, tamanho_lote=5000):
+    """
+    Reconstrói os sketches a partir de bateria_scores das baterias completas, lendo as
+    linhas em fluxo (yield_per). Só entram as linhas calculadas com a versao_pontuacao
+    atual de cada questionário; as de versões antigas são ignoradas até a bateria ser
+    repontuada (`flask backfill-scores --desatualizadas`).
+    Retorna {(questionario_id, sessao_id): total_baterias}.
+    """
+    if questionario_id:
+        questionario_ids = [questionario_id]
+    else:
+        questionario_ids = db.session.scalars(select(BateriaScore.questionario_id).distinct()).all()
+
+    sketches = {}
+    for questionario, versao in bateria_scores.versoes_atuais(questionario_ids).items():
+        consulta = (
+            select(BateriaScore.sessao_id, BateriaScore.percentual)
+            .join(BateriaTestes, BateriaTestes.id == BateriaScore.bateria_id)
+            .where(
+                BateriaTestes.is_completo.is_(True),
+                BateriaScore.questionario_id == questionario,
+                BateriaScore.versao_pontuacao == versao
+            )
+        )
+        for sessao_id, percentual in db.session.execute(consulta.execution_options(yield_per=tamanho_lote)):
+            sketch = sketches.get((questionario, sessao_id))
+            if sketch is None:
+                sketch = sketches[(questionario, sessao_id)] = KLLSketch()
+            sketch.update(percentual)
+
+    remocao = delete(SketchPontuacao)
+    if questionario_id:
+        remocao = remocao.where(SketchPontuacao.questionario_id == questionario_id)
+    db.session.execute(remocao, execution_options={'synchronize_session': False})
+
+    agora = datetime.now(timezone.utc)
+    if sketches:
+        db.session.execute(insert(SketchPontuacao), [
+            {
+                'id': str(ulid.ULID()),
+                'questionario_id': questionario,
+                'sessao_id': sessao_id,
+                'sketch': sketch.to_dict(),
+                'total_baterias': sketch.n,
+                'reconstruido_em': agora,
+                'updated_at': agora
+            }
+            for (questionario, sessao_id), sketch in sketches.items()
+        ])
+    return {chave: sketch.n for chave, sketch in sketches.items()}
@@ -0,0 +1,126 @@
+"""
+Perfis de um usuário (paciente, colaborador, profissional de saúde, médico).
+
+`carregar_usuario(email=..., user_id=...)` busca o usuário e os seus perfis numa
+única consulta (LEFT JOIN nas quatro tabelas, todas com user_id único), em vez de
+uma consulta por perfil. `perfis_do_usuario(user_id)` devolve o JSON desses dados a
+partir de um cache por processo com validade curta (PERFIL_CACHE_TTL segundos), usado
+pelo login e pelas rotas que precisam do perfil do usuário atual. Escritas em
+usuários e perfis descartam a entrada do cache no commit (no worker que escreveu;
+nos outros, a entrada expira pelo TTL).
+
+Os dicts devolvidos são compartilhados entre requisições: trate-os como somente leitura.
+"""
+import time
+from itertools import chain
+
+from flask import current_app
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, joinedload
+
+from extensions import db
+from models import Colaborador, Medico, Paciente, ProfissionalSaude, User
+from utils.cache import LRUCache
+
+# Atributos de User com os perfis, na ordem da resposta do login
+PERFIS = ('paciente', 'colaborador', 'profissional_saude', 'medico')
+
+_MODELOS_PERFIL = (Paciente, Colaborador, ProfissionalSaude, Medico)
+
+TTL_PADRAO = 30
+
+_perfis = LRUCache(maxsize=2048)
+
+# Chave usada em session.info para acumular os user_ids alterados até o commit
+_CHAVE_ALTERADOS = 'perfis.alterados'
+
+
+def carregar_usuario(email=None, user_id=None):
+    """
+    Usuário (por e-mail ou id) com os perfis já carregados, numa consulta; ou None.
+    """
+    consulta = select(User).options(*(joinedload(getattr(User, perfil)) for perfil in PERFIS))
+    if email is not None:
+        consulta = consulta.where(User.email == email)
+    else:
+        consulta = consulta.where(User.id == user_id)
+    return db.session.execute(consulta).unique().scalar_one_or_none()
+
+
+def serializar(user):
+    """
+    {'user': ..., 'paciente': ..., 'colaborador': ..., 'profissional_saude': ..., 'medico': ...}
+    de um usuário carregado por carregar_usuario.
+    """
+    dados = {'user': user.to_json()}
+    for perfil in PERFIS:
+        objeto = getattr(user, perfil)
+        dados[perfil] = objeto.to_json() if objeto else None
+    return dados
+
+
+def guardar(user):
+    """
+    Serializa o usuário e guarda no cache. Retorna os dados.
+    """
+    dados = serializar(user)
+    _perfis.set(user.id, (time.monotonic() + _ttl(), dados))
+    return dados
+
+
+def perfis_do_usuario(user_id):
+    """
+    Dados de serializar() do usuário, do cache enquanto valerem; None se ele não existir.
+    """
+    cacheado = _perfis.get(user_id)
+    if cacheado is not None:
+        if time.monotonic() < cacheado[0]:
+            return cacheado[1]
+        _perfis.pop(user_id)
+    user = carregar_usuario(user_id=user_id)
+    return guardar(user) if user else None
+
+
+def _ttl():
+    return current_app.config.get('PERFIL_CACHE_TTL', TTL_PADRAO)
+
+
+def invalidar(user_id=None):
+    """
+    Descarta o cache de um usuário ou, sem argumento, de todos.
+    """
+    if user_id is None:
+        _perfis.clear()
+    else:
+        _perfis.pop(user_id)
+
+
+def stats():
+    return _perfis.stats()
+
+
+@event.listens_for(Session, 'before_flush')
+def _registrar_alteracoes(session, flush_context, instances):
+    user_ids = set()
+    pendentes = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in chain(pendentes, session.deleted, session.new):
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+        elif isinstance(obj, _MODELOS_PERFIL):
+            # user_id atual e o anterior, se o perfil mudou de usuário
+            historico = inspect(obj).attrs.user_id.history
+            user_ids.update(chain(historico.added or (), historico.unchanged or (), historico.deleted or ()))
+    user_ids.discard(None)
+    if user_ids:
+        session.info.setdefault(_CHAVE_ALTERADOS, set()).update(user_ids)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidar_apos_commit(session):
+    for user_id in session.info.pop(_CHAVE_ALTERADOS, ()):
+        _perfis.pop(user_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _descartar_apos_rollback(session):
+    session.info.pop(_CHAVE_ALTERADOS, None)
@@ -0,0 +1,231 @@
+"""
+Motor de pontuação vetorizado das baterias de testes.
+
+Cada versão de questionário (Snapshot de utils/questionario_cache.py) é compilada
+uma única vez em arrays NumPy:
+- índice alternativa_id -> (coluna da pergunta, valor);
+- coluna -> sessão (para somar as pontuações por sessão);
+- pontuação máxima possível por sessão;
+- valores distintos possíveis por sessão (para o cálculo da moda);
+- versao_pontuacao: hash só do que altera as pontuações (sessões pontuáveis,
+  perguntas de cada sessão e valores das alternativas). Corrigir o texto de uma
+  pergunta muda a versão do snapshot, mas não a versao_pontuacao.
+
+Com isso uma bateria (ou milhares de dicts `respostas`) é pontuada em uma única
+passada, produzindo os mesmos campos de `estatisticas_sessao` que o laço original
+de _build_detailed_bateria_json.
+"""
+import hashlib
+import json
+from collections import namedtuple
+
+import numpy as np
+
+from utils.cache import LRUCache
+
+# Tipos de resposta que consideramos graficáveis (e, portanto, pontuáveis)
+TIPOS_RESPOSTA_GRAFICAVEIS = [
+    'booleano',
+    'escala_likert_3',
+    'escala_likert_4',
+    'escala_likert_5',
+    'escala_likert_10',
+    'multipla_escolha_unica',
+    'escolha_personalizada'  # Escolha com alternativas personalizadas
+]
+
+# Quantidade de baterias processadas por bloco no cálculo da moda (limita a memória)
+TAMANHO_BLOCO_MODA = 4096
+
+ResultadoLote = namedtuple('ResultadoLote', [
+    'valores',      # (n, perguntas) valor escolhido em cada pergunta pontuável; NaN se não respondida
+    'total',        # (n, sessoes) soma das pontuações obtidas
+    'respondidas',  # (n, sessoes) quantidade de perguntas respondidas com valor
+    'media',        # (n, sessoes) média por pergunta respondida (0.0 se nenhuma)
+    'percentual',   # (n, sessoes) percentual de aproveitamento (0.0 se o máximo for 0)
+    'moda',         # lista (n) de listas (sessoes) com as modas de cada sessão
+])
+
+_compilados = LRUCache(maxsize=256)
+
+
+def sessao_plotavel(sessao, tipos_graficaveis=TIPOS_RESPOSTA_GRAFICAVEIS):
+    """
+    Uma sessão é graficável quando todas as perguntas têm o mesmo tipo de resposta,
+    esse tipo é graficável e todas as perguntas possuem alternativas.
+    """
+    perguntas = sessao['perguntas']
+    if not perguntas:
+        return False
+    primeiro_tipo = perguntas[0]['tipo_resposta']
+    return (
+        primeiro_tipo in tipos_graficaveis
+        and all(p['tipo_resposta'] == primeiro_tipo for p in perguntas)
+        and all(p['alternativas'] for p in perguntas)
+    )
+
+
+class QuestionarioCompilado:
+    """
+    Representação compilada (somente leitura) de uma versão de questionário.
+    """
+
+    def __init__(self, arvore, tipos_graficaveis=TIPOS_RESPOSTA_GRAFICAVEIS):
+        self.questionario_id = arvore['id']
+        self.sessao_ids = []        # sessões plotáveis, na ordem do questionário
+        self.pergunta_ids = []      # perguntas pontuáveis (colunas), na ordem do questionário
+        self.indice_pergunta = {}   # pergunta_id -> coluna
+        self.alternativas = {}      # alternativa_id -> (coluna, valor)
+        self.maximo_pergunta = []   # pontuação máxima possível de cada coluna
+        # alternativa_id -> (pergunta_id, alternativa) para todas as perguntas (pontuáveis ou não)
+        self.indice_alternativas = {
+            str(alt['id']): (str(pergunta['id']), alt)
+            for sessao in arvore['sessoes']
+            for pergunta in sessao['perguntas']
+            for alt in pergunta['alternativas']
+        }
+
+        sessao_da_coluna = []
+        valores_sessao = []
+        for sessao in arvore['sessoes']:
+            if not sessao_plotavel(sessao, tipos_graficaveis):
+                continue
+            indice_sessao = len(self.sessao_ids)
+            self.sessao_ids.append(sessao['id'])
+            valores_possiveis = set()
+            for pergunta in sessao['perguntas']:
+                coluna = len(self.pergunta_ids)
+                self.pergunta_ids.append(str(pergunta['id']))
+                self.indice_pergunta[str(pergunta['id'])] = coluna
+                sessao_da_coluna.append(indice_sessao)
+                valores = [float(alt['valor']) for alt in pergunta['alternativas'] if alt['valor'] is not None]
+                self.maximo_pergunta.append(max(valores) if valores else 0.0)
+                valores_possiveis.update(valores)
+                for alt in pergunta['alternativas']:
+                    if alt['valor'] is not None:
+                        self.alternativas[str(alt['id'])] = (coluna, float(alt['valor']))
+            valores_sessao.append(np.array(sorted(valores_possiveis), dtype=np.float64))
+
+        self.sessao_da_coluna = np.array(sessao_da_coluna, dtype=np.intp)
+        self.maximo_pergunta = np.array(self.maximo_pergunta, dtype=np.float64)
+        # Matriz de pertinência (perguntas x sessões): V @ M soma as colunas de cada sessão
+        self.pertinencia = np.zeros((len(self.pergunta_ids), len(self.sessao_ids)), dtype=np.float64)
+        self.pertinencia[np.arange(len(self.pergunta_ids)), self.sessao_da_coluna] = 1.0
+        self.maximo_sessao = self.maximo_pergunta @ self.pertinencia
+        self.colunas_sessao = [np.flatnonzero(self.sessao_da_coluna == s) for s in range(len(self.sessao_ids))]
+        self.valores_sessao = valores_sessao
+        self.versao_pontuacao = hashlib.blake2b(json.dumps([
+            self.sessao_ids,
+            self.pergunta_ids,
+            self.sessao_da_coluna.tolist(),
+            sorted(self.alternativas.items()),
+        ], separators=(',', ':')).encode('utf-8'), digest_size=16).hexdigest()
+
+    def alternativa_escolhida(self, pergunta_id, alternativa_id):
+        """
+        Retorna a alternativa (dict da árvore) escolhida para a pergunta, ou None se o id
+        não existir ou pertencer a outra pergunta.
+        """
+        if not alternativa_id:
+            return None
+        encontrada = self.indice_alternativas.get(str(alternativa_id))
+        if encontrada is None or encontrada[0] != str(pergunta_id):
+            return None
+        return encontrada[1]
+
+    def matriz_valores(self, lista_respostas):
+        """
+        Converte uma lista de dicts `respostas` (pergunta_id -> alternativa_id) na matriz
+        (n, perguntas) de valores escolhidos. Respostas a perguntas não pontuáveis ou com
+        alternativas que não pertencem à pergunta são ignoradas (NaN).
+        """
+        valores = np.full((len(lista_respostas), len(self.pergunta_ids)), np.nan, dtype=np.float64)
+        indice_pergunta = self.indice_pergunta
+        alternativas = self.alternativas
+        for linha, respostas in enumerate(lista_respostas):
+            if not respostas:
+                continue
+            for pergunta_id, alternativa_id in respostas.items():
+                if not alternativa_id:
+                    continue
+                coluna = indice_pergunta.get(str(pergunta_id))
+                if coluna is None:
+                    continue
+                escolhida = alternativas.get(str(alternativa_id))
+                if escolhida is not None and escolhida[0] == coluna:
+                    valores[linha, coluna] = escolhida[1]
+        return valores
+
+    def _modas(self, valores):
+        """
+        Moda das pontuações obtidas por sessão. Em caso de empate, as modas seguem a
+        ordem da primeira ocorrência nas perguntas (mesmo comportamento do Counter).
+        """
+        n = valores.shape[0]
+        modas = [[[] for _ in self.sessao_ids] for _ in range(n)]
+        for s, colunas in enumerate(self.colunas_sessao):
+            possiveis = self.valores_sessao[s]
+            if not len(colunas) or not len(possiveis):
+                continue
+            for inicio in range(0, n, TAMANHO_BLOCO_MODA):
+                bloco = valores[inicio:inicio + TAMANHO_BLOCO_MODA][:, colunas]
+                iguais = bloco[:, :, None] == possiveis[None, None, :]   # (b, perguntas, valores)
+                contagem = iguais.sum(axis=1)                              # (b, valores)
+                primeira = np.where(iguais.any(axis=1), iguais.argmax(axis=1), len(colunas))
+                maxima = contagem.max(axis=1)
+                e_moda = (contagem == maxima[:, None]) & (maxima[:, None] > 0)
+                # Ordena os valores de cada linha pela primeira ocorrência; as modas ficam no início
+                ordem = np.argsort(np.where(e_moda, primeira, len(colunas) + 1), axis=1, kind='stable')
+                valores_ordenados = possiveis[ordem].tolist()
+                qtd_modas = e_moda.sum(axis=1).tolist()
+                for i, qtd in enumerate(qtd_modas):
+                    if qtd:
+                        modas[inicio + i][s] = valores_ordenados[i][:qtd]
+        return modas
+
+    def pontuar_lote(self, lista_respostas, calcular_moda=True):
+        """
+        Pontua várias baterias deste questionário de uma vez.
+        """
+        valores = self.matriz_valores(lista_respostas)
+        respondidas_mask = ~np.isnan(valores)
+        total = np.where(respondidas_mask, valores, 0.0) @ self.pertinencia
+        respondidas = respondidas_mask.astype(np.float64) @ self.pertinencia
+        with np.errstate(divide='ignore', invalid='ignore'):
+            media = np.where(respondidas > 0, total / respondidas, 0.0)
+            percentual = np.where(self.maximo_sessao > 0, total / self.maximo_sessao * 100, 0.0)
+        moda = self._modas(valores) if calcular_moda else None
+        return ResultadoLote(valores, total, respondidas.astype(np.int64), media, percentual, moda)
+
+    def estatisticas(self, resultado, linha):
+        """
+        Monta {sessao_id: estatisticas_sessao} para uma linha de um ResultadoLote.
+        """
+        return {
+            sessao_id: {
+                "total_pontuacao_obtida": float(resultado.total[linha, s]),
+                "total_pontuacao_maxima_possivel": float(self.maximo_sessao[s]),
+                "media_pontuacao_obtida_por_pergunta_respondida": float(resultado.media[linha, s]),
+                "moda_pontuacao_obtida_nas_perguntas": resultado.moda[linha][s] if resultado.moda is not None else [],
+                "percentual_aproveitamento": float(resultado.percentual[linha, s])
+            }
+            for s, sessao_id in enumerate(self.sessao_ids)
+        }
+
+    def pontuar(self, respostas):
+        """
+        Pontua uma única bateria: retorna {sessao_id: estatisticas_sessao}.
+        """
+        return self.estatisticas(self.pontuar_lote([respostas]), 0)
+
+
+def obter_compilado(snapshot):
+    """
+    Retorna o QuestionarioCompilado de um Snapshot, compilando apenas uma vez por versão.
+    """
+    chave = (snapshot.questionario_id, snapshot.versao)
+    compilado = _compilados.get(chave)
+    if compilado is None:
+        compilado = QuestionarioCompilado(snapshot.arvore)
+        _compilados.set(chave, compilado)
+    return compilado
@@ -0,0 +1,151 @@
+"""
+Sketch de quantis KLL (Karnin, Lang e Liberty) para distribuições de pontuação.
+
+Guarda uma amostra ponderada de tamanho O(k) de um fluxo de valores, com erro de
+rank de ~1/k, e permite:
+- inserir valores um a um (update) ou mesclar sketches (merge), em qualquer ordem;
+- consultar o rank/percentil de um valor e o valor de um quantil;
+- serializar para um dict JSON compacto (to_dict/from_dict).
+
+Com poucos valores (até a capacidade do primeiro compactador) o sketch é exato.
+"""
+import math
+import random
+from bisect import bisect_left, bisect_right
+
+K_PADRAO = 200
+_FATOR_CAPACIDADE = 2 / 3
+_CASAS_DECIMAIS = 4
+
+
+class KLLSketch:
+    """
+    Sketch KLL: compactores[h] guarda valores com peso 2**h. Quando o tamanho total
+    passa da capacidade, o nível mais baixo cheio é ordenado e metade dos seus valores
+    (alternados, com deslocamento aleatório) sobe para o nível seguinte.
+    """
+
+    def __init__(self, k=K_PADRAO, rng=None):
+        self.k = k
+        self.n = 0
+        self.compactores = [[]]
+        self._rng = rng or random.Random()
+        self._tamanho = 0
+        self._tamanho_maximo = self._capacidade_total()
+
+    def _capacidade(self, nivel):
+        altura = len(self.compactores)
+        return int(math.ceil(self.k * _FATOR_CAPACIDADE ** (altura - nivel - 1))) + 1
+
+    def _capacidade_total(self):
+        return sum(self._capacidade(nivel) for nivel in range(len(self.compactores)))
+
+    def _crescer(self):
+        self.compactores.append([])
+        self._tamanho_maximo = self._capacidade_total()
+
+    def _compactar(self):
+        while self._tamanho >= self._tamanho_maximo:
+            for nivel, itens in enumerate(self.compactores):
+                if len(itens) >= self._capacidade(nivel):
+                    if nivel + 1 >= len(self.compactores):
+                        self._crescer()
+                    itens.sort()
+                    # Com quantidade ímpar, o último valor fica no nível atual
+                    sobra = [itens.pop()] if len(itens) % 2 else []
+                    promovidos = itens[self._rng.randint(0, 1)::2]
+                    self.compactores[nivel + 1].extend(promovidos)
+                    self.compactores[nivel] = sobra
+                    self._tamanho -= len(itens) - len(promovidos)
+                    break
+            else:
+                break
+
+    def update(self, valor):
+        """
+        Insere um valor no sketch.
+        """
+        self.compactores[0].append(float(valor))
+        self.n += 1
+        self._tamanho += 1
+        if self._tamanho >= self._tamanho_maximo:
+            self._compactar()
+
+    def merge(self, outro):
+        """
+        Incorpora outro sketch (a ordem das mesclas não importa).
+        """
+        while len(self.compactores) < len(outro.compactores):
+            self._crescer()
+        for nivel, itens in enumerate(outro.compactores):
+            self.compactores[nivel].extend(itens)
+        self.n += outro.n
+        self._tamanho = sum(len(itens) for itens in self.compactores)
+        self._compactar()
+        return self
+
+    def _contagens(self, valor):
+        """
+        Retorna (peso dos valores < valor, peso dos valores <= valor).
+        """
+        menores = 0
+        menores_ou_iguais = 0
+        for nivel, itens in enumerate(self.compactores):
+            if not itens:
+                continue
+            ordenados = sorted(itens)
+            peso = 1 << nivel
+            menores += peso * bisect_left(ordenados, valor)
+            menores_ou_iguais += peso * bisect_right(ordenados, valor)
+        return menores, menores_ou_iguais
+
+    def percentil(self, valor):
+        """
+        Percentil (0 a 100) de um valor na distribuição, contando empates pela metade.
+        Retorna None se o sketch estiver vazio.
+        """
+        menores, menores_ou_iguais = self._contagens(float(valor))
+        total = sum(len(itens) << nivel for nivel, itens in enumerate(self.compactores))
+        if not total:
+            return None
+        return (menores + menores_ou_iguais) / 2 / total * 100
+
+    def quantil(self, q):
+        """
+        Valor aproximado do quantil q (0 a 1). Retorna None se o sketch estiver vazio.
+        """
+        ponderados = sorted(
+            (valor, 1 << nivel) for nivel, itens in enumerate(self.compactores) for valor in itens
+        )
+        if not ponderados:
+            return None
+        total = sum(peso for _, peso in ponderados)
+        alvo = q * total
+        acumulado = 0
+        for valor, peso in ponderados:
+            acumulado += peso
+            if acumulado >= alvo:
+                return valor
+        return ponderados[-1][0]
+
+    def to_dict(self):
+        """
+        Forma serializável (JSON) do sketch.
+        """
+        return {
+            'k': self.k,
+            'n': self.n,
+            'compactores': [[round(valor, _CASAS_DECIMAIS) for valor in itens] for itens in self.compactores]
+        }
+
+    @classmethod
+    def from_dict(cls, dados, rng=None):
+        """
+        Reconstrói um sketch a partir de to_dict().
+        """
+        sketch = cls(k=dados.get('k', K_PADRAO), rng=rng)
+        sketch.compactores = [list(itens) for itens in dados.get('compactores') or [[]]] or [[]]
+        sketch.n = dados.get('n', 0)
+        sketch._tamanho = sum(len(itens) for itens in sketch.compactores)
+        sketch._tamanho_maximo = sketch._capacidade_total()
+        return sketch
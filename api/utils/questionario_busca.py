@@ -0,0 +1,140 @@
+"""
+Busca textual nos títulos e descrições dos questionários (índice invertido em memória).
+
+Os questionários são poucos e mudam pouco, então cada processo mantém um índice
+invertido (palavra normalizada -> questionários) montado a partir de
+(id, titulo, descricao). A cada busca uma consulta barata confere a assinatura da
+tabela (quantidade de questionários e maior updated_at). Se ela mudou, por exemplo
+numa edição feita em outro worker, o índice é refeito. Toda escrita na árvore
+do questionário toca o updated_at (ver utils/questionario_cache.py).
+
+Cada termo da busca casa com as palavras iguais a ele ou que começam com ele, sem
+acentos nem maiúsculas. Todos os termos são exigidos. A relevância soma, por termo,
+o idf da palavra vezes as ocorrências (com peso maior no título), com meio peso
+para casamentos por prefixo e um bônus quando a busca inteira aparece no título.
+"""
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+import unidecode
+from sqlalchemy import func, select
+
+from extensions import db
+from models import Questionario
+
+PESO_TITULO = 3.0
+PESO_PREFIXO = 0.5
+BONUS_FRASE_TITULO = 5.0
+
+_SEPARADORES = re.compile(r'[^a-z0-9]+')
+
+_lock = threading.Lock()
+_indice = None
+_assinatura = None
+
+
+def normalizar(texto):
+    """
+    Minúsculas, sem acentos, pontuação trocada por espaço e espaços simples.
+    """
+    return ' '.join(_SEPARADORES.split(unidecode.unidecode(texto or '').lower())).strip()
+
+
+class IndiceQuestionarios:
+    """
+    Índice imutável sobre [(id, titulo, descricao)].
+    """
+
+    def __init__(self, linhas):
+        self.ids = []
+        self.titulos = []
+        # palavra -> {documento: (ocorrencias no titulo, ocorrencias na descricao)}
+        postings = defaultdict(dict)
+        for documento, (questionario_id, titulo, descricao) in enumerate(linhas):
+            titulo = normalizar(titulo)
+            self.ids.append(questionario_id)
+            self.titulos.append(titulo)
+            for campo, texto in ((0, titulo), (1, normalizar(descricao))):
+                for palavra in texto.split():
+                    contagem = postings[palavra].get(documento, (0, 0))
+                    postings[palavra][documento] = (contagem[0] + (campo == 0), contagem[1] + (campo == 1))
+        self.postings = dict(postings)
+        self.vocabulario = sorted(self.postings)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _palavras(self, termo):
+        """
+        Palavras do vocabulário que casam com o termo: [(palavra, peso)].
+        """
+        inicio = bisect_left(self.vocabulario, termo)
+        palavras = []
+        for palavra in self.vocabulario[inicio:]:
+            if not palavra.startswith(termo):
+                break
+            palavras.append((palavra, 1.0 if palavra == termo else PESO_PREFIXO))
+        return palavras
+
+    def buscar(self, texto):
+        """
+        Ids dos questionários com todos os termos, do mais para o menos relevante.
+        """
+        busca = normalizar(texto)
+        if not busca:
+            return []
+
+        pontuacao = None
+        for termo in busca.split():
+            do_termo = defaultdict(float)
+            for palavra, peso in self._palavras(termo):
+                documentos = self.postings[palavra]
+                idf = math.log(1 + len(self.ids) / len(documentos))
+                for documento, (no_titulo, na_descricao) in documentos.items():
+                    do_termo[documento] = max(do_termo[documento], peso * idf * (PESO_TITULO * no_titulo + na_descricao))
+            if pontuacao is None:
+                pontuacao = dict(do_termo)
+            else:
+                pontuacao = {documento: valor + do_termo[documento] for documento, valor in pontuacao.items() if documento in do_termo}
+            if not pontuacao:
+                return []
+
+        for documento in pontuacao:
+            if busca in self.titulos[documento]:
+                pontuacao[documento] += BONUS_FRASE_TITULO
+        ordem = sorted(pontuacao, key=lambda documento: (-pontuacao[documento], self.titulos[documento], self.ids[documento]))
+        return [self.ids[documento] for documento in ordem]
+
+
+def obter_indice():
+    """
+    Retorna o índice, refazendo-o se a tabela de questionários mudou desde a montagem.
+    """
+    global _indice, _assinatura
+    assinatura = tuple(db.session.execute(
+        select(func.count(Questionario.id), func.max(Questionario.updated_at))
+    ).one())
+    with _lock:
+        if _indice is not None and assinatura == _assinatura:
+            return _indice
+    linhas = db.session.execute(select(Questionario.id, Questionario.titulo, Questionario.descricao)).all()
+    indice = IndiceQuestionarios(linhas)
+    with _lock:
+        _indice, _assinatura = indice, assinatura
+    return indice
+
+
+def buscar(texto):
+    """
+    Ids dos questionários encontrados, do mais para o menos relevante.
+    """
+    return obter_indice().buscar(texto)
+
+
+def invalidar():
+    global _indice, _assinatura
+    with _lock:
+        _indice, _assinatura = None, None
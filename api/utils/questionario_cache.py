@@ -0,0 +1,231 @@
+"""
+Cache em memória (por processo) da árvore completa dos questionários
+(Questionario -> Sessao -> Pergunta -> Alternativa).
+
+Cada snapshot é identificado pelo id do questionário e pela sua versão (o campo
+updated_at). Toda escrita em sessões, perguntas ou alternativas "toca" o updated_at
+do questionário pai dentro da mesma transação, de forma que os outros workers
+percebam a mudança ao comparar a versão. No worker que fez a escrita o snapshot
+é descartado pelo hook after_commit do SQLAlchemy.
+
+Os snapshots são compartilhados entre requisições: trate-os como somente leitura.
+"""
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, selectinload
+
+from extensions import db
+from models import Alternativa, Pergunta, Questionario, Sessao
+from utils.cache import LRUCache
+
+Snapshot = namedtuple('Snapshot', ['questionario_id', 'versao', 'arvore'])
+
+_snapshots = LRUCache(maxsize=256)
+
+# Chaves usadas em session.info para acumular as invalidações até o commit
+_CHAVE_ALTERADOS = 'questionario_cache.alterados'
+_CHAVE_INVALIDAR_TUDO = 'questionario_cache.invalidar_tudo'
+
+_MODELOS_ARVORE = (Questionario, Sessao, Pergunta, Alternativa)
+
+
+def serializar_arvore(questionario):
+    """
+    Monta o JSON hierárquico de um questionário já carregado com suas relações.
+    """
+    questionario_json = questionario.to_json()
+    questionario_json['sessoes'] = []
+    for sessao in questionario.sessoes:
+        sessao_json = sessao.to_json()
+        sessao_json['perguntas'] = []
+        for pergunta in sessao.perguntas:
+            pergunta_json = pergunta.to_json()
+            pergunta_json['alternativas'] = [alternativa.to_json() for alternativa in pergunta.alternativas]
+            sessao_json['perguntas'].append(pergunta_json)
+        questionario_json['sessoes'].append(sessao_json)
+    return questionario_json
+
+
+def sem_filhos(no, chave):
+    """
+    Retorna uma cópia rasa de um nó da árvore sem a lista de filhos indicada
+    (ex.: o questionário sem 'sessoes', equivalente ao to_json() do modelo).
+    """
+    return {k: v for k, v in no.items() if k != chave}
+
+
+def obter_snapshots(questionario_ids):
+    """
+    Retorna {questionario_id: Snapshot} para os ids informados.
+    Faz uma única consulta de versões; só reconstrói as árvores desatualizadas.
+    Ids inexistentes não aparecem no resultado.
+    """
+    ids = {qid for qid in questionario_ids if qid}
+    if not ids:
+        return {}
+
+    versoes = dict(db.session.execute(
+        select(Questionario.id, Questionario.updated_at).where(Questionario.id.in_(ids))
+    ).all())
+
+    resultado = {}
+    desatualizados = []
+    for qid, versao in versoes.items():
+        snapshot = _snapshots.get(qid)
+        if snapshot is not None and snapshot.versao == versao:
+            resultado[qid] = snapshot
+        else:
+            desatualizados.append(qid)
+
+    if desatualizados:
+        questionarios = Questionario.query.options(
+            selectinload(Questionario.sessoes)
+            .selectinload(Sessao.perguntas)
+            .selectinload(Pergunta.alternativas)
+        ).filter(Questionario.id.in_(desatualizados)).all()
+        for questionario in questionarios:
+            # A versão vem do banco (e não do objeto da sessão) para ser comparável entre workers
+            snapshot = Snapshot(questionario.id, versoes[questionario.id], serializar_arvore(questionario))
+            _snapshots.set(questionario.id, snapshot)
+            resultado[questionario.id] = snapshot
+
+    return resultado
+
+
+def obter_snapshot(questionario_id):
+    """
+    Retorna o Snapshot de um questionário ou None se ele não existir.
+    """
+    return obter_snapshots([questionario_id]).get(questionario_id)
+
+
+def invalidar(questionario_id=None):
+    """
+    Descarta o snapshot de um questionário (ou todos, se nenhum id for informado).
+    """
+    if questionario_id is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(questionario_id)
+
+
+def stats():
+    return _snapshots.stats()
+
+
+def proxima_versao(versao_atual):
+    """
+    Novo valor de updated_at para um questionário alterado. O DATETIME do MySQL guarda
+    apenas segundos: garante que a nova versão seja estritamente maior que a atual,
+    mesmo com duas alterações no mesmo segundo.
+    """
+    agora = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    if versao_atual is not None:
+        versao_atual = versao_atual.replace(tzinfo=None, microsecond=0)
+        if agora <= versao_atual:
+            agora = versao_atual + timedelta(seconds=1)
+    return agora
+
+
+def marcar_alterados(session, questionario_ids=(), sessao_ids=(), pergunta_ids=(), alternativa_ids=()):
+    """
+    Registra que a árvore dos questionários afetados mudou: resolve o questionário pai
+    de sessões/perguntas/alternativas, atualiza o updated_at de cada um na transação corrente e
+    agenda a invalidação local para o after_commit.
+    Deve ser chamado explicitamente por escritas em lote que não passam pelo flush
+    da sessão (ex.: bulk_update_mappings).
+    """
+    questionario_ids = set(questionario_ids)
+    sessao_ids = set(sessao_ids)
+    pergunta_ids = set(pergunta_ids)
+    alternativa_ids = {aid for aid in alternativa_ids if aid}
+
+    with session.no_autoflush:
+        if alternativa_ids:
+            pergunta_ids.update(session.scalars(
+                select(Alternativa.pergunta_id).where(Alternativa.id.in_(alternativa_ids))
+            ))
+        pergunta_ids.discard(None)
+        if pergunta_ids:
+            sessao_ids.update(session.scalars(
+                select(Pergunta.sessao_id).where(Pergunta.id.in_(pergunta_ids))
+            ))
+        sessao_ids.discard(None)
+        if sessao_ids:
+            questionario_ids.update(session.scalars(
+                select(Sessao.questionario_id).where(Sessao.id.in_(sessao_ids))
+            ))
+        questionario_ids.discard(None)
+
+        for qid in questionario_ids:
+            questionario = session.get(Questionario, qid)
+            if questionario is not None and questionario not in session.deleted:
+                questionario.updated_at = proxima_versao(questionario.updated_at)
+
+    session.info.setdefault(_CHAVE_ALTERADOS, set()).update(questionario_ids)
+
+
+def _valores_fk(obj, atributo, relacao, atributo_pai):
+    """
+    Valores atual e anterior de uma chave estrangeira. Quando a FK ainda não foi
+    preenchida, usa o objeto pai já associado pela relação (sem disparar lazy load).
+    """
+    valores = set()
+    historico = inspect(obj).attrs[atributo].history
+    valores.update(v for v in chain(historico.added, historico.unchanged, historico.deleted) if v)
+    if not valores:
+        pai = inspect(obj).dict.get(relacao)
+        if pai is not None and getattr(pai, atributo_pai, None):
+            valores.add(getattr(pai, atributo_pai))
+    return valores
+
+
+@event.listens_for(Session, 'before_flush')
+def _registrar_alteracoes_arvore(session, flush_context, instances):
+    questionario_ids, sessao_ids, pergunta_ids = set(), set(), set()
+    pendentes = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in chain(session.new, pendentes, session.deleted):
+        if not isinstance(obj, _MODELOS_ARVORE):
+            continue
+        if isinstance(obj, Questionario):
+            if obj not in session.new:
+                questionario_ids.add(obj.id)
+        elif isinstance(obj, Sessao):
+            questionario_ids.update(_valores_fk(obj, 'questionario_id', 'questionario', 'id'))
+        elif isinstance(obj, Pergunta):
+            sessao_ids.update(_valores_fk(obj, 'sessao_id', 'sessao', 'id'))
+        elif isinstance(obj, Alternativa):
+            pergunta_ids.update(_valores_fk(obj, 'pergunta_id', 'pergunta', 'id'))
+
+    if questionario_ids or sessao_ids or pergunta_ids:
+        marcar_alterados(session, questionario_ids, sessao_ids, pergunta_ids)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _registrar_escritas_em_lote(orm_execute_state):
+    # query.update()/query.delete() não passam pelo flush: sem saber quais
+    # questionários foram afetados, invalida todo o cache local no commit.
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _MODELOS_ARVORE):
+        orm_execute_state.session.info[_CHAVE_INVALIDAR_TUDO] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidar_apos_commit(session):
+    alterados = session.info.pop(_CHAVE_ALTERADOS, None)
+    if session.info.pop(_CHAVE_INVALIDAR_TUDO, False):
+        _snapshots.clear()
+    elif alterados:
+        for qid in alterados:
+            _snapshots.pop(qid)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _descartar_apos_rollback(session):
+    session.info.pop(_CHAVE_ALTERADOS, None)
+    session.info.pop(_CHAVE_INVALIDAR_TUDO, None)
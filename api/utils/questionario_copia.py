@@ -0,0 +1,159 @@
+"""
+Cópia profunda de um questionário (sessões, perguntas e alternativas) em lote.
+
+Os ids (ULID) da cópia são gerados aqui mesmo, antes de qualquer escrita. Assim não
+é preciso um flush por sessão/pergunta para descobrir o id gerado. Cada nível da
+árvore é gravado com um único INSERT em lote (executemany): são quatro comandos,
+qualquer que seja o tamanho do questionário. As regras de visibilidade das sessões
+apontam para perguntas e alternativas do próprio questionário: esses ids são
+trocados pelos das cópias. A árvore devolvida é montada a partir das linhas gravadas,
+sem uma nova leitura, no mesmo formato de questionario_cache.serializar_arvore.
+
+A origem é lida do snapshot de utils/questionario_cache.py. Os INSERTs em lote não
+passam pelo flush, mas a cópia é um questionário novo, sem snapshot a invalidar.
+"""
+import ulid
+from sqlalchemy import insert
+
+from extensions import db
+from models import Alternativa, Pergunta, Questionario, Sessao
+from utils import questionario_cache
+
+# Chaves das regras de visibilidade que guardam ids de perguntas ou de alternativas
+CHAVES_PERGUNTAS = ('pergunta_alvo_id', 'perguntas_para_calculo_ids')
+CHAVES_ALTERNATIVAS = ('respostas_necessarias_ids',)
+
+
+def _novo_id():
+    return str(ulid.ULID())
+
+
+def _trocar(valor, mapa):
+    """
+    Troca um id (ou uma lista de ids) pelo correspondente no mapa. Ids de fora da
+    árvore copiada são mantidos.
+    """
+    if isinstance(valor, list):
+        return [mapa.get(item, item) if isinstance(item, str) else item for item in valor]
+    if isinstance(valor, str):
+        return mapa.get(valor, valor)
+    return valor
+
+
+def remapear_regras(regras, perguntas_map, alternativas_map):
+    """
+    Cópia das regras de visibilidade (lista de regras, uma regra ou None) com os ids
+    de perguntas e alternativas trocados pelos das cópias.
+    """
+    if isinstance(regras, list):
+        return [remapear_regras(regra, perguntas_map, alternativas_map) for regra in regras]
+    if not isinstance(regras, dict):
+        return regras
+    copia = {}
+    for chave, valor in regras.items():
+        if chave in CHAVES_PERGUNTAS:
+            copia[chave] = _trocar(valor, perguntas_map)
+        elif chave in CHAVES_ALTERNATIVAS:
+            copia[chave] = _trocar(valor, alternativas_map)
+        elif isinstance(valor, (list, dict)):
+            copia[chave] = remapear_regras(valor, perguntas_map, alternativas_map)
+        else:
+            copia[chave] = valor
+    return copia
+
+
+def copiar_arvore(arvore, **campos):
+    """
+    Grava uma cópia da árvore (no formato de serializar_arvore) como um novo
+    questionário, com `campos` sobrescrevendo os do questionário (ex.: titulo, versao).
+    Não faz commit. Retorna a árvore da cópia.
+    """
+    agora = questionario_cache.proxima_versao(None)
+    carimbo = {'created_at': agora, 'updated_at': agora}
+
+    questionario = {
+        'id': _novo_id(),
+        'titulo': arvore['titulo'],
+        'descricao': arvore.get('descricao'),
+        'versao': arvore.get('versao'),
+        'fontes_literatura': arvore.get('fontes_literatura'),
+        'is_active': arvore.get('is_active', True),
+        **campos,
+        **carimbo
+    }
+
+    # Primeiro os ids de todas as cópias, para remapear as regras de qualquer sessão
+    perguntas_map = {}
+    alternativas_map = {}
+    for sessao in arvore['sessoes']:
+        for pergunta in sessao['perguntas']:
+            perguntas_map[pergunta['id']] = _novo_id()
+            for alternativa in pergunta['alternativas']:
+                alternativas_map[alternativa['id']] = _novo_id()
+
+    sessoes, perguntas, alternativas = [], [], []
+    for sessao in arvore['sessoes']:
+        sessao_id = _novo_id()
+        sessoes.append({
+            'id': sessao_id,
+            'questionario_id': questionario['id'],
+            'titulo': sessao['titulo'],
+            'descricao': sessao.get('descricao'),
+            'ordem': sessao['ordem'],
+            'regras_visibilidade': remapear_regras(sessao.get('regras_visibilidade'), perguntas_map, alternativas_map),
+            **carimbo
+        })
+        for pergunta in sessao['perguntas']:
+            pergunta_id = perguntas_map[pergunta['id']]
+            perguntas.append({
+                'id': pergunta_id,
+                'sessao_id': sessao_id,
+                'texto': pergunta['texto'],
+                'tipo_resposta': pergunta['tipo_resposta'],
+                'metodo_pontuacao': pergunta.get('metodo_pontuacao'),
+                'ordem': pergunta['ordem'],
+                'is_obrigatoria': pergunta.get('is_obrigatoria', True),
+                **carimbo
+            })
+            for alternativa in pergunta['alternativas']:
+                alternativas.append({
+                    'id': alternativas_map[alternativa['id']],
+                    'pergunta_id': pergunta_id,
+                    'texto': alternativa['texto'],
+                    'valor': alternativa['valor'],
+                    'ordem': alternativa['ordem'],
+                    **carimbo
+                })
+
+    inserir_arvore(questionario, sessoes, perguntas, alternativas)
+    return _montar_arvore(questionario, sessoes, perguntas, alternativas)
+
+
+def inserir_arvore(questionario, sessoes, perguntas, alternativas):
+    """
+    Grava as linhas (dicts com os ids já preenchidos) de uma árvore de questionário:
+    um INSERT em lote por nível, dos pais para os filhos. Não faz commit.
+    """
+    for modelo, linhas in ((Questionario, [questionario]), (Sessao, sessoes), (Pergunta, perguntas), (Alternativa, alternativas)):
+        if linhas:
+            db.session.execute(insert(modelo), linhas)
+
+
+def _montar_arvore(questionario, sessoes, perguntas, alternativas):
+    """
+    JSON hierárquico (como o to_json dos modelos) a partir das linhas inseridas.
+    As linhas já estão na ordem da árvore de origem, que segue o campo ordem.
+    """
+    por_pergunta = {}
+    for alternativa in alternativas:
+        por_pergunta.setdefault(alternativa['pergunta_id'], []).append(dict(alternativa))
+    por_sessao = {}
+    for pergunta in perguntas:
+        por_sessao.setdefault(pergunta['sessao_id'], []).append(
+            {**pergunta, 'alternativas': por_pergunta.get(pergunta['id'], [])}
+        )
+    return {
+        **questionario,
+        'sessoes': [{**sessao, 'perguntas': por_sessao.get(sessao['id'], [])} for sessao in sessoes]
+    }
+
@@ -0,0 +1,211 @@
+"""
+Importação em lote de questionários a partir de arquivos JSON (ex.: fixtures/questionario.json).
+
+Cada arquivo tem a forma {"questionarios": [...]} ou é a própria lista. Os
+questionários são validados com as regras de fixtures/checkser.py, compiladas uma
+única vez em funções de validação. A árvore de cada questionário válido é montada em
+memória com os ids já gerados e gravada com um INSERT em lote por nível
+(utils/questionario_copia.py), numa transação por questionário. Questionários com o
+mesmo título e versão de um já existente são pulados, então a importação pode ser
+repetida.
+"""
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import get_args
+
+import ulid
+from sqlalchemy import select
+
+from extensions import db
+from fixtures.checkser import (
+    expected_alternativa,
+    expected_fontes_literatura,
+    expected_pergunta,
+    expected_sessao,
+    expected_structure,
+)
+from models import Questionario
+from utils.questionario_copia import inserir_arvore
+
+CAMINHO_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'questionario.json')
+
+NIVEIS = ('questionarios', 'sessoes', 'perguntas', 'alternativas')
+
+
+def compilar(esperado, filhos=None):
+    """
+    Compila as regras {chave: tipo} de checkser numa função validar(dado, caminho) que
+    devolve a lista de erros, com as mensagens de checkser. `filhos` liga as chaves que
+    são listas ao validador dos seus elementos. Como em JSON, bool não vale como número.
+    """
+    regras = []
+    for chave, tipo in esperado.items():
+        tipos = tuple(t if t is not None else type(None) for t in (get_args(tipo) or (tipo,)))
+        regras.append((chave, tipo, tipos, bool in tipos))
+    filhos = tuple((filhos or {}).items())
+
+    def validar(dado, caminho=''):
+        if not isinstance(dado, dict):
+            return [f"Elemento na posição {caminho.rstrip('.')} não é um dicionário."]
+        erros = []
+        for chave, tipo, tipos, aceita_bool in regras:
+            if chave not in dado:
+                erros.append(f"Chave ausente: {caminho}{chave}")
+                continue
+            valor = dado[chave]
+            if not isinstance(valor, tipos) or (isinstance(valor, bool) and not aceita_bool):
+                erros.append(f"Tipo incorreto para {caminho}{chave}: esperado {tipo}, encontrado {type(valor)}")
+        for chave, validar_filho in filhos:
+            itens = dado.get(chave)
+            if isinstance(itens, list):
+                for i, item in enumerate(itens):
+                    erros.extend(validar_filho(item, f"{caminho}{chave}[{i}]."))
+        return erros
+
+    return validar
+
+
+validar_questionario = compilar(expected_structure, {
+    'fontes_literatura': compilar(expected_fontes_literatura),
+    'sessoes': compilar(expected_sessao, {
+        'perguntas': compilar(expected_pergunta, {
+            'alternativas': compilar(expected_alternativa)
+        })
+    })
+})
+
+
+def ler_arquivo(caminho):
+    """
+    Lista de questionários de um arquivo JSON.
+    """
+    with open(caminho, encoding='utf-8') as arquivo:
+        dados = json.load(arquivo)
+    if isinstance(dados, dict):
+        dados = dados.get('questionarios', [])
+    if not isinstance(dados, list):
+        raise ValueError(f'{caminho}: esperado um array de questionários')
+    return dados
+
+
+def montar_linhas(dados):
+    """
+    Linhas (questionario, sessoes, perguntas, alternativas) de um questionário validado,
+    com os ids gerados.
+    """
+    agora = datetime.now(timezone.utc)
+    carimbo = {'created_at': agora, 'updated_at': agora}
+    questionario = {
+        'id': str(ulid.ULID()),
+        'titulo': dados['titulo'],
+        'descricao': dados['descricao'],
+        'versao': dados['versao'],
+        'fontes_literatura': dados['fontes_literatura'],
+        'is_active': dados['is_active'],
+        **carimbo
+    }
+    sessoes, perguntas, alternativas = [], [], []
+    for dados_sessao in dados['sessoes']:
+        sessao_id = str(ulid.ULID())
+        sessoes.append({
+            'id': sessao_id,
+            'questionario_id': questionario['id'],
+            'titulo': dados_sessao['titulo'],
+            'descricao': dados_sessao['descricao'],
+            'ordem': dados_sessao['ordem'],
+            'regras_visibilidade': dados_sessao.get('regras_visibilidade'),
+            **carimbo
+        })
+        for dados_pergunta in dados_sessao['perguntas']:
+            pergunta_id = str(ulid.ULID())
+            perguntas.append({
+                'id': pergunta_id,
+                'sessao_id': sessao_id,
+                'texto': dados_pergunta['texto'],
+                'tipo_resposta': dados_pergunta['tipo_resposta'],
+                'metodo_pontuacao': dados_pergunta['metodo_pontuacao'],
+                'ordem': dados_pergunta['ordem'],
+                'is_obrigatoria': dados_pergunta['is_obrigatoria'],
+                **carimbo
+            })
+            alternativas.extend({
+                'id': str(ulid.ULID()),
+                'pergunta_id': pergunta_id,
+                'texto': dados_alternativa['texto'],
+                'valor': dados_alternativa['valor'],
+                'ordem': dados_alternativa['ordem'],
+                **carimbo
+            } for dados_alternativa in dados_pergunta['alternativas'])
+    return questionario, sessoes, perguntas, alternativas
+
+
+def _novo_relatorio():
+    return {
+        'importados': 0,
+        'existentes': 0,
+        'invalidos': 0,
+        'linhas': dict.fromkeys(NIVEIS, 0),
+        'erros': [],
+        'segundos': 0.0,
+        'linhas_por_segundo': 0.0
+    }
+
+
+def importar(questionarios, relatorio=None):
+    """
+    Importa uma lista de questionários (dicts no formato das fixtures). Retorna o
+    relatório {'importados', 'existentes', 'invalidos', 'linhas' (por nível), 'erros',
+    'segundos', 'linhas_por_segundo'}; `relatorio` acumula várias chamadas.
+    """
+    relatorio = relatorio or _novo_relatorio()
+    inicio = time.perf_counter()
+
+    # Uma consulta para os pares (título, versão) já gravados
+    titulos = {dados['titulo'] for dados in questionarios if isinstance(dados, dict) and isinstance(dados.get('titulo'), str)}
+    existentes = set(db.session.execute(
+        select(Questionario.titulo, Questionario.versao).where(Questionario.titulo.in_(titulos))
+    ).all()) if titulos else set()
+
+    for posicao, dados in enumerate(questionarios):
+        erros = validar_questionario(dados)
+        titulo = dados.get('titulo') if isinstance(dados, dict) else None
+        if erros:
+            relatorio['invalidos'] += 1
+            relatorio['erros'].append({'posicao': posicao, 'titulo': titulo, 'erros': erros})
+            continue
+        if (dados['titulo'], dados['versao']) in existentes:
+            relatorio['existentes'] += 1
+            continue
+
+        linhas = montar_linhas(dados)
+        try:
+            inserir_arvore(*linhas)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            relatorio['invalidos'] += 1
+            relatorio['erros'].append({'posicao': posicao, 'titulo': titulo, 'erros': [str(e)]})
+            continue
+        existentes.add((dados['titulo'], dados['versao']))
+        relatorio['importados'] += 1
+        relatorio['linhas']['questionarios'] += 1
+        for nivel, linhas_nivel in zip(NIVEIS[1:], linhas[1:]):
+            relatorio['linhas'][nivel] += len(linhas_nivel)
+
+    relatorio['segundos'] += time.perf_counter() - inicio
+    total = sum(relatorio['linhas'].values())
+    relatorio['linhas_por_segundo'] = total / relatorio['segundos'] if relatorio['segundos'] else 0.0
+    return relatorio
+
+
+def importar_arquivos(caminhos=None):
+    """
+    Importa os questionários dos arquivos (padrão: fixtures/questionario.json) e
+    retorna o relatório somado.
+    """
+    relatorio = _novo_relatorio()
+    for caminho in caminhos or [CAMINHO_PADRAO]:
+        importar(ler_arquivo(caminho), relatorio)
+    return relatorio
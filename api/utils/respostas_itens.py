@@ -0,0 +1,154 @@
+"""
+Tabela normalizada respostas_itens (bateria x pergunta -> alternativa, valor).
+
+BateriaTestes.respostas continua sendo a fonte das respostas; esta tabela é regravada
+na mesma transação sempre que as respostas de uma bateria mudam, permitindo agregações
+entre pacientes com GROUP BY no banco. Baterias antigas são normalizadas pelo comando
+`flask explode-respostas`.
+"""
+from sqlalchemy import delete, distinct, func, insert, select
+
+from extensions import db
+from models import Avaliacao, BateriaTestes, RespostaItem
+from utils import pontuacao, questionario_cache
+from utils.bateria_scores import agrupar_por_questionario
+
+
+def sincronizar(baterias):
+    """
+    Regrava as linhas de respostas_itens das baterias informadas, na transação corrente.
+    Somente respostas que apontam para uma alternativa da própria pergunta são
+    normalizadas. Retorna a quantidade de linhas gravadas.
+    """
+    baterias = [bateria for bateria in baterias if bateria.id]
+    if not baterias:
+        return 0
+
+    grupos = agrupar_por_questionario(baterias)
+    snapshots = questionario_cache.obter_snapshots(grupos.keys())
+
+    linhas = []
+    for questionario_id, grupo in grupos.items():
+        snapshot = snapshots.get(questionario_id)
+        if snapshot is None:
+            continue
+        compilado = pontuacao.obter_compilado(snapshot)
+        for bateria in grupo:
+            for pergunta_id, alternativa_id in (bateria.respostas or {}).items():
+                alternativa = compilado.alternativa_escolhida(pergunta_id, alternativa_id)
+                if alternativa is None:
+                    continue
+                linhas.append({
+                    'bateria_id': bateria.id,
+                    'pergunta_id': str(pergunta_id),
+                    'alternativa_id': alternativa['id'],
+                    'questionario_id': questionario_id,
+                    'valor': alternativa['valor'],
+                    'is_completo': bool(bateria.is_completo),
+                    'data_aplicacao': bateria.data_aplicacao,
+                    'avaliacao_id': bateria.avaliacao_id
+                })
+
+    db.session.execute(
+        delete(RespostaItem).where(RespostaItem.bateria_id.in_([bateria.id for bateria in baterias])),
+        execution_options={'synchronize_session': False}
+    )
+    if linhas:
+        db.session.execute(insert(RespostaItem), linhas)
+    return len(linhas)
+
+
+def condicoes_coorte(modelo, data_inicio=None, data_fim=None, unidade_saude_id=None, medico_id=None,
+                     somente_completas=True):
+    """
+    Monta os filtros de coorte sobre `modelo` (BateriaTestes ou RespostaItem, que têm
+    is_completo, data_aplicacao e avaliacao_id). Unidade de saúde e médico vêm da
+    avaliação à qual a bateria pertence.
+    """
+    condicoes = []
+    if somente_completas:
+        condicoes.append(modelo.is_completo.is_(True))
+    if data_inicio:
+        condicoes.append(modelo.data_aplicacao >= data_inicio)
+    if data_fim:
+        condicoes.append(modelo.data_aplicacao <= data_fim)
+    if unidade_saude_id or medico_id:
+        avaliacoes = select(Avaliacao.id)
+        if unidade_saude_id:
+            avaliacoes = avaliacoes.where(Avaliacao.unidade_saude_id == unidade_saude_id)
+        if medico_id:
+            avaliacoes = avaliacoes.where(Avaliacao.medico_id == medico_id)
+        condicoes.append(modelo.avaliacao_id.in_(avaliacoes))
+    return condicoes
+
+
+def contagens_por_alternativa(questionario_id, **filtros):
+    """
+    Agrega as respostas de um questionário no banco (GROUP BY pergunta, alternativa),
+    sem JOIN: os filtros de coorte (ver condicoes_coorte) usam as colunas copiadas
+    da bateria e o índice ix_respostas_itens_coorte.
+    Retorna (totais, linhas):
+    - totais: {'baterias': n, 'pacientes': n} da coorte, contados em baterias_testes
+    - linhas: [(pergunta_id, alternativa_id, respostas)]
+    """
+    totais = db.session.execute(
+        select(func.count(BateriaTestes.id), func.count(distinct(BateriaTestes.paciente_id)))
+        .where(BateriaTestes.questionario_id == questionario_id, *condicoes_coorte(BateriaTestes, **filtros))
+    ).one()
+
+    linhas = db.session.execute(
+        select(RespostaItem.pergunta_id, RespostaItem.alternativa_id, func.count())
+        .where(RespostaItem.questionario_id == questionario_id, *condicoes_coorte(RespostaItem, **filtros))
+        .group_by(RespostaItem.pergunta_id, RespostaItem.alternativa_id)
+    ).all()
+
+    return {'baterias': totais[0], 'pacientes': totais[1]}, [tuple(linha) for linha in linhas]
+
+
+def montar_agregado(snapshot, totais, linhas):
+    """
+    Combina o resultado de contagens_por_alternativa com a árvore do questionário,
+    na ordem das sessões/perguntas/alternativas (alternativas sem respostas aparecem com 0).
+    """
+    contagens = {(pergunta_id, alternativa_id): respostas for pergunta_id, alternativa_id, respostas in linhas}
+
+    sessoes = []
+    for sessao in snapshot.arvore['sessoes']:
+        perguntas = []
+        for pergunta in sessao['perguntas']:
+            contagens_pergunta = [contagens.get((pergunta['id'], alt['id']), 0) for alt in pergunta['alternativas']]
+            total_respostas = sum(contagens_pergunta)
+            soma_valores = sum(
+                respostas * alt['valor']
+                for respostas, alt in zip(contagens_pergunta, pergunta['alternativas'])
+                if alt['valor'] is not None
+            )
+            perguntas.append({
+                'pergunta_id': pergunta['id'],
+                'pergunta_texto': pergunta['texto'],
+                'tipo_resposta': pergunta['tipo_resposta'],
+                'total_respostas': total_respostas,
+                'media_valor': (soma_valores / total_respostas) if total_respostas else None,
+                'alternativas': [
+                    {
+                        'alternativa_id': alt['id'],
+                        'alternativa_texto': alt['texto'],
+                        'valor': alt['valor'],
+                        'contagem_absoluta': respostas,
+                        'contagem_relativa_percentual': (respostas / total_respostas * 100) if total_respostas else 0.0
+                    }
+                    for respostas, alt in zip(contagens_pergunta, pergunta['alternativas'])
+                ]
+            })
+        sessoes.append({
+            'sessao_id': sessao['id'],
+            'titulo': sessao['titulo'],
+            'perguntas': perguntas
+        })
+
+    return {
+        'questionario_id': snapshot.questionario_id,
+        'total_baterias': totais['baterias'],
+        'total_pacientes': totais['pacientes'],
+        'sessoes': sessoes
+    }
@@ -0,0 +1,239 @@
+"""
+Rollups diários das baterias por profissional de saúde (tabela rollups_profissional_dia).
+
+Cada linha agrega as baterias de um profissional com a mesma data_aplicacao. As
+linhas são atualizadas no mesmo flush em que baterias são criadas, concluídas,
+movidas ou removidas pelo ORM (listener before_flush), com a linha criada se
+preciso e travada (utils/linhas_travadas.py) antes de receber os contadores e o
+sketch de pacientes distintos. O dashboard do profissional lê só um total
+agregado e as linhas dos últimos meses. O HyperLogLog não sabe remover pacientes, e escritas que
+contornam o ORM (exclusões em lote, ON DELETE CASCADE) não passam pelo listener.
+O comando `flask rebuild-rollups` reconstrói tudo a partir de baterias_testes; num
+banco que já tinha baterias antes da tabela existir, o init_db faz isso uma vez
+(preencher_se_vazia).
+"""
+from datetime import date, datetime, timezone
+
+import ulid
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import case, delete, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models import BateriaTestes, RollupProfissionalDia
+from utils.hyperloglog import HyperLogLog
+from utils.linhas_travadas import travar_ou_criar
+
+_ATRIBUTOS = ('profissional_saude_id', 'data_aplicacao', 'is_completo', 'paciente_id')
+
+
+def _como_data(valor):
+    return valor.date() if isinstance(valor, datetime) else valor
+
+
+def _estado(bateria, anterior=False):
+    """
+    (profissional_saude_id, dia, is_completo, paciente_id) atuais da bateria ou,
+    com anterior=True, os valores antes das alterações pendentes.
+    """
+    if not anterior:
+        valores = [getattr(bateria, atributo) for atributo in _ATRIBUTOS]
+    else:
+        valores = []
+        for atributo in _ATRIBUTOS:
+            historico = inspect(bateria).attrs[atributo].history
+            antigos = historico.deleted or historico.unchanged
+            valores.append(antigos[0] if antigos else None)
+    profissional_id, dia, completo, paciente_id = valores
+    return profissional_id, _como_data(dia), bool(completo), paciente_id
+
+
+def _acumular(deltas, estado, sinal):
+    profissional_id, dia, completo, paciente_id = estado
+    if not profissional_id or not dia:
+        return
+    delta = deltas.setdefault((profissional_id, dia), {'criadas': 0, 'completas': 0, 'pacientes': set()})
+    delta['criadas'] += sinal
+    if completo:
+        delta['completas'] += sinal
+    if sinal > 0 and paciente_id:
+        delta['pacientes'].add(paciente_id)
+
+
+def _aplicar(session, deltas):
+    """
+    Grava os deltas {(profissional_id, dia): {'criadas', 'completas', 'pacientes'}} nas linhas de rollup.
+    As linhas que faltam são criadas vazias antes do FOR UPDATE (utils/linhas_travadas.py),
+    então os deltas sempre caem numa linha travada, mesmo no primeiro flush do dia.
+    """
+    agora = datetime.now(timezone.utc)
+    vazias = {
+        chave: {
+            'id': str(ulid.ULID()),
+            'profissional_saude_id': chave[0],
+            'dia': chave[1],
+            'baterias_criadas': 0,
+            'baterias_completas': 0,
+            'pacientes_hll': HyperLogLog().to_dict(),
+            'updated_at': agora
+        }
+        for chave in deltas
+    }
+    linhas = travar_ou_criar(session, RollupProfissionalDia, ('profissional_saude_id', 'dia'), vazias)
+    for chave, delta in deltas.items():
+        linha = linhas[chave]
+        # Contadores nunca negativos: exclusões de baterias anteriores aos rollups
+        # caem numa linha recém-criada, até o próximo `flask rebuild-rollups`
+        if delta['criadas']:
+            linha.baterias_criadas = max(linha.baterias_criadas + delta['criadas'], 0)
+        if delta['completas']:
+            linha.baterias_completas = max(linha.baterias_completas + delta['completas'], 0)
+        if delta['pacientes']:
+            sketch = HyperLogLog.from_dict(linha.pacientes_hll)
+            for paciente_id in delta['pacientes']:
+                sketch.add(paciente_id)
+            linha.pacientes_hll = sketch.to_dict()
+
+
+@event.listens_for(Session, 'before_flush')
+def _registrar_escritas_baterias(session, flush_context, instances):
+    """
+    Converte as baterias novas, alteradas e removidas do flush em deltas de rollup.
+    """
+    deltas = {}
+    for bateria in session.new:
+        if isinstance(bateria, BateriaTestes):
+            _acumular(deltas, _estado(bateria), 1)
+    for bateria in session.deleted:
+        if isinstance(bateria, BateriaTestes):
+            _acumular(deltas, _estado(bateria, anterior=True), -1)
+    for bateria in session.dirty:
+        if not isinstance(bateria, BateriaTestes) or bateria in session.deleted:
+            continue
+        estado = inspect(bateria)
+        if any(estado.attrs[atributo].history.has_changes() for atributo in _ATRIBUTOS):
+            _acumular(deltas, _estado(bateria, anterior=True), -1)
+            _acumular(deltas, _estado(bateria), 1)
+
+    deltas = {
+        chave: delta for chave, delta in deltas.items()
+        if delta['criadas'] or delta['completas'] or delta['pacientes']
+    }
+    if deltas:
+        with session.no_autoflush:
+            _aplicar(session, deltas)
+
+
+def resumo_profissional(profissional_id, hoje=None, meses=6):
+    """
+    Estatísticas do dashboard do profissional a partir dos rollups: um total agregado
+    no banco e as linhas diárias dos últimos `meses` meses (no máximo ~31 por mês).
+    """
+    hoje = hoje or date.today()
+    mes_atual = hoje.replace(day=1)
+    primeiro_mes = mes_atual - relativedelta(months=meses - 1)
+
+    total_baterias, total_completas = db.session.execute(
+        select(
+            func.coalesce(func.sum(RollupProfissionalDia.baterias_criadas), 0),
+            func.coalesce(func.sum(RollupProfissionalDia.baterias_completas), 0)
+        ).where(RollupProfissionalDia.profissional_saude_id == profissional_id)
+    ).one()
+
+    pacientes_por_mes = {}
+    baterias_mes_atual = 0
+    completas_mes_atual = 0
+    linhas = db.session.execute(
+        select(
+            RollupProfissionalDia.dia,
+            RollupProfissionalDia.baterias_criadas,
+            RollupProfissionalDia.baterias_completas,
+            RollupProfissionalDia.pacientes_hll
+        ).where(
+            RollupProfissionalDia.profissional_saude_id == profissional_id,
+            RollupProfissionalDia.dia >= primeiro_mes
+        )
+    )
+    for dia, criadas, completas, pacientes_hll in linhas:
+        mes = dia.replace(day=1)
+        if dia >= mes_atual:
+            baterias_mes_atual += criadas
+            completas_mes_atual += completas
+        if mes <= mes_atual:
+            pacientes_por_mes.setdefault(mes, HyperLogLog()).merge(HyperLogLog.from_dict(pacientes_hll))
+
+    evolucao_pacientes = []
+    for i in reversed(range(meses)):
+        mes = mes_atual - relativedelta(months=i)
+        sketch = pacientes_por_mes.get(mes)
+        evolucao_pacientes.append({'mes': mes.strftime('%Y-%m'), 'qtd_pacientes': sketch.count() if sketch else 0})
+
+    total_abertas = total_baterias - total_completas
+    return {
+        'numero_total_baterias': total_baterias,
+        'numero_total_baterias_abertas': total_abertas,
+        'numero_total_baterias_por_profissional': total_baterias,
+        'numero_total_baterias_abertas_por_profissional': total_abertas,
+        'numero_baterias_ultimo_mes': baterias_mes_atual,
+        'numero_baterias_abertas_ultimo_mes': baterias_mes_atual - completas_mes_atual,
+        'evolucao_pacientes': evolucao_pacientes
+    }
+
+
+def reconstruir(profissional_id=None, tamanho_lote=5000):
+    """
+    Reconstrói os rollups a partir de baterias_testes: contadores com GROUP BY no banco
+    e sketches a partir dos pares (profissional, dia, paciente) distintos, lidos em fluxo.
+    Retorna a quantidade de linhas gravadas.
+    """
+    condicoes = [BateriaTestes.profissional_saude_id.isnot(None)]
+    if profissional_id:
+        condicoes.append(BateriaTestes.profissional_saude_id == profissional_id)
+
+    contagens = db.session.execute(
+        select(
+            BateriaTestes.profissional_saude_id,
+            BateriaTestes.data_aplicacao,
+            func.count(BateriaTestes.id),
+            func.coalesce(func.sum(case((BateriaTestes.is_completo.is_(True), 1), else_=0)), 0)
+        ).where(*condicoes).group_by(BateriaTestes.profissional_saude_id, BateriaTestes.data_aplicacao)
+    ).all()
+
+    sketches = {}
+    pares = select(
+        BateriaTestes.profissional_saude_id, BateriaTestes.data_aplicacao, BateriaTestes.paciente_id
+    ).where(*condicoes).distinct()
+    for profissional, dia, paciente_id in db.session.execute(pares.execution_options(yield_per=tamanho_lote)):
+        sketches.setdefault((profissional, _como_data(dia)), HyperLogLog()).add(paciente_id)
+
+    remocao = delete(RollupProfissionalDia)
+    if profissional_id:
+        remocao = remocao.where(RollupProfissionalDia.profissional_saude_id == profissional_id)
+    db.session.execute(remocao, execution_options={'synchronize_session': False})
+
+    agora = datetime.now(timezone.utc)
+    linhas = [
+        {
+            'id': str(ulid.ULID()),
+            'profissional_saude_id': profissional,
+            'dia': _como_data(dia),
+            'baterias_criadas': criadas,
+            'baterias_completas': int(completas),
+            'pacientes_hll': (sketches.get((profissional, _como_data(dia))) or HyperLogLog()).to_dict(),
+            'updated_at': agora
+        }
+        for profissional, dia, criadas, completas in contagens
+    ]
+    if linhas:
+        db.session.execute(insert(RollupProfissionalDia), linhas)
+    return len(linhas)
+
+
+def preencher_se_vazia(tamanho_lote=5000):
+    """
+    Reconstrói os rollups se a tabela estiver vazia (banco criado antes dela, com a
+    tabela recém-criada pelo create_all). Retorna a quantidade de linhas gravadas.
+    """
+    if db.session.execute(select(RollupProfissionalDia.id).limit(1)).first() is not None:
+        return 0
+    return reconstruir(tamanho_lote=tamanho_lote)
@@ -0,0 +1,129 @@
+"""
+Hash e verificação de senhas num pool de processos.
+
+Cada hash (scrypt do werkzeug) custa dezenas de milissegundos de CPU e 32 MiB de
+memória. As operações vão para um pool de SENHA_WORKERS processos por worker do
+gunicorn, criado na primeira senha, e não ocupam o GIL do worker:
+- `gerar_hash` e `verificar_senha` são usados nas requisições; a espera pela vez é
+  limitada a SENHA_TIMEOUT segundos, depois disso `SenhasOcupadas` é levantada e o
+  login responde 503 em vez de acumular requisições presas;
+- `gerar_hashes` distribui um lote entre todos os processos (cadastros em massa,
+  fixtures).
+
+O custo do hash vem de SENHA_HASH_METODO, no formato do werkzeug (ex.:
+'scrypt:32768:8:1', 'pbkdf2:sha256:600000'). Hashes com outros parâmetros continuam
+válidos e `precisa_rehash` os aponta: o login troca o hash do usuário pelo atual
+depois de uma senha correta.
+
+Fora de um contexto da aplicação (scripts) valem os padrões abaixo.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from functools import lru_cache
+from itertools import repeat
+
+from flask import current_app, has_app_context
+from werkzeug.security import check_password_hash, generate_password_hash
+
+METODO_PADRAO = 'scrypt:32768:8:1'  # padrão do werkzeug 3.1
+WORKERS_PADRAO = min(4, os.cpu_count() or 1)
+TIMEOUT_PADRAO = 5.0
+
+_lock = threading.Lock()
+_pool = None  # (pid, executor)
+
+
+class SenhasOcupadas(Exception):
+    """
+    O pool de senhas não atendeu dentro de SENHA_TIMEOUT.
+    """
+
+
+def _config(nome, padrao):
+    return current_app.config.get(nome, padrao) if has_app_context() else padrao
+
+
+def metodo():
+    return _config('SENHA_HASH_METODO', METODO_PADRAO)
+
+
+def _executor():
+    global _pool
+    pid = os.getpid()
+    pool = _pool
+    if pool is not None and pool[0] == pid:
+        return pool[1]
+    with _lock:
+        # Um pool por processo: depois de um fork (workers do gunicorn) o do pai não serve.
+        # Os processos do pool são criados com 'spawn', sem herdar as threads do worker.
+        if _pool is None or _pool[0] != pid:
+            _pool = (pid, ProcessPoolExecutor(
+                max_workers=_config('SENHA_WORKERS', WORKERS_PADRAO),
+                mp_context=multiprocessing.get_context('spawn')
+            ))
+        return _pool[1]
+
+
+def _resultado(futuro):
+    try:
+        return futuro.result(timeout=_config('SENHA_TIMEOUT', TIMEOUT_PADRAO))
+    except TimeoutError:
+        futuro.cancel()
+        raise SenhasOcupadas('Verificação de senha indisponível no momento')
+
+
+def gerar_hash(senha):
+    """
+    Hash da senha com SENHA_HASH_METODO.
+    """
+    return _resultado(_executor().submit(generate_password_hash, senha, metodo()))
+
+
+def gerar_hashes(senhas):
+    """
+    Hashes de várias senhas, em paralelo em todos os processos do pool, na mesma ordem.
+    """
+    senhas = list(senhas)
+    if not senhas:
+        return []
+    workers = _config('SENHA_WORKERS', WORKERS_PADRAO)
+    lote = max(1, len(senhas) // (workers * 4))
+    return list(_executor().map(generate_password_hash, senhas, repeat(metodo()), chunksize=lote))
+
+
+def verificar_senha(password_hash, senha):
+    """
+    Confere a senha com o hash. False se não houver hash.
+    """
+    if password_hash is None:
+        return False
+    return _resultado(_executor().submit(check_password_hash, password_hash, senha))
+
+
+@lru_cache(maxsize=8)
+def _prefixo(metodo_hash):
+    # O werkzeug completa os parâmetros omitidos ('pbkdf2:sha256' -> 'pbkdf2:sha256:1000000'):
+    # o prefixo de referência sai de um hash de verdade
+    return generate_password_hash('', metodo_hash).split('$', 1)[0]
+
+
+def precisa_rehash(password_hash):
+    """
+    True se o hash foi gerado com parâmetros diferentes de SENHA_HASH_METODO.
+    """
+    if not password_hash:
+        return False
+    return password_hash.split('$', 1)[0] != _prefixo(metodo())
+
+
+def encerrar():
+    """
+    Encerra o pool deste processo (usado nos testes e benchmarks).
+    """
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None and pool[0] == os.getpid():
+        pool[1].shutdown(cancel_futures=True)
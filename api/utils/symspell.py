@@ -0,0 +1,131 @@
+"""
+Índice de correção ortográfica por deleções (algoritmo SymSpell).
+
+Para cada palavra do vocabulário são guardadas as variantes obtidas apagando até
+`distancia_maxima` letras do seu prefixo de `tamanho_prefixo` letras. Uma palavra
+digitada errado gera as próprias deleções; as palavras do vocabulário que
+compartilham alguma delas são as candidatas, confirmadas pela distância de edição
+(Damerau-Levenshtein restrita: inserção, remoção, troca e transposição de letras
+vizinhas). Só o prefixo entra nas deleções para manter o índice pequeno; a
+distância é calculada sobre a palavra inteira (ou sobre o começo dela, no
+autocomplete).
+"""
+
+
+def _ultima_linha(a, b, maximo):
+    """
+    Última linha da matriz de distâncias entre `a` e os começos de `b`, ou None se
+    todas as células de alguma linha passarem de `maximo`.
+    """
+    anterior2 = None
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        atual = [i] + [0] * len(b)
+        menor = i
+        for j in range(1, len(b) + 1):
+            custo = a[i - 1] != b[j - 1]
+            valor = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + custo)
+            if anterior2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                valor = min(valor, anterior2[j - 2] + 1)
+            atual[j] = valor
+            menor = min(menor, valor)
+        if menor > maximo:
+            return None
+        anterior2, anterior = anterior, atual
+    return anterior
+
+
+def distancia(a, b, maximo):
+    """
+    Distância de edição entre `a` e `b`, ou maximo + 1 se passar de `maximo`.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > maximo:
+        return maximo + 1
+    linha = _ultima_linha(a, b, maximo)
+    return linha[-1] if linha is not None and linha[-1] <= maximo else maximo + 1
+
+
+def distancia_prefixo(termo, palavra, maximo):
+    """
+    Menor distância entre `termo` e algum começo de `palavra` (autocomplete), ou
+    maximo + 1 se passar de `maximo`.
+    """
+    linha = _ultima_linha(termo, palavra[:len(termo) + maximo], maximo)
+    if linha is None:
+        return maximo + 1
+    return min(min(linha[max(0, len(termo) - maximo):]), maximo + 1)
+
+
+def delecoes(palavra, distancia_maxima):
+    """
+    A palavra e todas as variantes com até `distancia_maxima` letras apagadas.
+    """
+    variantes = {palavra}
+    nivel = {palavra}
+    for _ in range(distancia_maxima):
+        nivel = {variante[:i] + variante[i + 1:] for variante in nivel for i in range(len(variante))}
+        variantes |= nivel
+    return variantes
+
+
+class IndiceSymSpell:
+    """
+    Índice imutável sobre um vocabulário {palavra: frequencia}.
+    """
+
+    def __init__(self, vocabulario, distancia_maxima=2, tamanho_prefixo=7):
+        self.distancia_maxima = distancia_maxima
+        self.tamanho_prefixo = tamanho_prefixo
+        self.palavras = sorted(vocabulario)
+        self.frequencias = [vocabulario[palavra] for palavra in self.palavras]
+        # deleção -> id da palavra (int) ou tupla de ids, para economizar memória
+        indice = {}
+        for id_palavra, palavra in enumerate(self.palavras):
+            for variante in delecoes(palavra[:tamanho_prefixo], distancia_maxima):
+                existente = indice.get(variante)
+                if existente is None:
+                    indice[variante] = id_palavra
+                elif isinstance(existente, int):
+                    indice[variante] = (existente, id_palavra)
+                else:
+                    indice[variante] = existente + (id_palavra,)
+        self.delecoes = indice
+
+    def __len__(self):
+        return len(self.palavras)
+
+    def _candidatas(self, termo, distancia_maxima):
+        ids = set()
+        for variante in delecoes(termo[:self.tamanho_prefixo], distancia_maxima):
+            encontrado = self.delecoes.get(variante)
+            if encontrado is None:
+                continue
+            if isinstance(encontrado, int):
+                ids.add(encontrado)
+            else:
+                ids.update(encontrado)
+        return ids
+
+    def sugestoes(self, termo, distancia_maxima=None, prefixo=False):
+        """
+        Palavras do vocabulário a até `distancia_maxima` edições de `termo`, como
+        [(palavra, distancia, frequencia)] ordenadas por distância e frequência.
+        Com `prefixo`, `termo` é o começo de uma palavra (autocomplete) e a
+        distância é medida contra o começo de mesmo tamanho das candidatas.
+        """
+        if distancia_maxima is None:
+            distancia_maxima = self.distancia_maxima
+        distancia_maxima = min(distancia_maxima, self.distancia_maxima)
+        resultado = []
+        for id_palavra in self._candidatas(termo, distancia_maxima):
+            palavra = self.palavras[id_palavra]
+            if prefixo:
+                d = distancia_prefixo(termo, palavra, distancia_maxima)
+            else:
+                d = distancia(termo, palavra, distancia_maxima)
+            if d <= distancia_maxima:
+                resultado.append((palavra, d, self.frequencias[id_palavra]))
+        resultado.sort(key=lambda sugestao: (sugestao[1], -sugestao[2], sugestao[0]))
+        return resultado
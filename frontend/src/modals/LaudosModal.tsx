@@ -99,12 +99,12 @@ const LaudoCadastroModal: React.FC<LaudoCadastroModalProps> = ({
     const baseUrl = import.meta.env.VITE_BACKEND_URL;
     const token = localStorage.getItem('@App:token');
     try {
-      const response = await fetch(`${baseUrl}/laudos/get_cid_by_description/${searchTerm}`, {
+      const response = await fetch(`${baseUrl}/laudos/cid_search?q=${encodeURIComponent(searchTerm)}&fuzzy=1&limit=50`, {
         headers: { 'Authorization': `Bearer ${token}` }
       });
       if (response.ok) {
-        const data: CidOption[] = await response.json();
-        setCidOptions(data);
+        const data: { items: CidOption[] } = await response.json();
+        setCidOptions(data.items);
       } else {
         setCidOptions([]);
       }
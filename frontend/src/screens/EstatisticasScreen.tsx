@@ -52,6 +52,8 @@ interface EstatisticasSessao {
     media_pontuacao_obtida_por_pergunta_respondida: number;
     moda_pontuacao_obtida_nas_perguntas: number[];
     percentual_aproveitamento: number;
+    percentil_populacional?: number | null;
+    populacao_referencia?: number;
 }
 
 interface SessaoDetalhada {
@@ -422,6 +424,10 @@ export default function EstatisticasScreen() {
 
                                     {renderStatChip("Moda",
                                         getModaLabel(sessao.estatisticas_sessao.moda_pontuacao_obtida_nas_perguntas))}
+
+                                    {sessao.estatisticas_sessao.percentil_populacional != null &&
+                                        renderStatChip("Percentil",
+                                            `${sessao.estatisticas_sessao.percentil_populacional.toFixed(0)} (n=${sessao.estatisticas_sessao.populacao_referencia})`, "secondary")}
                                 </Stack>
                             </Box>
 